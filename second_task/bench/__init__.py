@@ -0,0 +1,6 @@
+"""
+Пакет с бенчмарками циклических очередей из пакета cqueue.
+
+Скрипты запускаются из каталога second_task, например:
+python -m bench.blocking
+"""
@@ -0,0 +1,81 @@
+"""
+Бенчмарк aio - пропускная способность асинхронной очереди CAIOQueue в сравнении с asyncio.Queue.
+
+Производители и потребители - задачи одного цикла событий. Измеряется количество
+переданных элементов в секунду для поэлементного pop() и пакетного pop_many().
+
+Запуск (из каталога second_task):
+python -m bench.aio [--items N] [--size N] [--tasks N] [--batch N]
+"""
+
+import argparse
+import asyncio
+import timeit
+from typing import Any,Callable
+
+from cqueue import CAQueue,CDQueue,CAIOQueue
+
+
+async def run(make_queue:Callable[[],Any],tasks:int,items:int,batch:int = 0)->float:
+    """
+    Передает items элементов через очередь и возвращает пропускную способность.
+
+    param:
+    make_queue (Callable[[],Any]): Фабрика очереди
+    tasks (int): Количество производителей (и потребителей)
+    items (int): Общее количество элементов
+    batch (int): Размер пакета pop_many() у потребителей, 0 - поэлементное извлечение
+
+    return:
+    (float): Элементов в секунду
+    """
+    q = make_queue()
+    per_task = items//tasks
+    put = q.put if isinstance(q,asyncio.Queue) else q.push
+    get = q.get if isinstance(q,asyncio.Queue) else q.pop
+
+    async def producer()->None:
+        for i in range(per_task):
+            await put(i)
+
+    async def consumer()->None:
+        if batch:
+            left = per_task
+            while left:
+                left-=len(await q.pop_many(min(batch,left)))
+        else:
+            for _ in range(per_task):
+                await get()
+
+    start = timeit.default_timer()
+    await asyncio.gather(*[producer() for _ in range(tasks)],*[consumer() for _ in range(tasks)])
+    return per_task*tasks/(timeit.default_timer()-start)
+
+
+def main()->None:
+    """
+    Запускает бенчмарк и печатает таблицу результатов.
+    """
+    parser = argparse.ArgumentParser(description=__doc__,formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items",type=int,default=200000,help="Количество элементов")
+    parser.add_argument("--size",type=int,default=1024,help="Размер очереди")
+    parser.add_argument("--tasks",type=int,default=4,help="Количество производителей и потребителей")
+    parser.add_argument("--batch",type=int,default=64,help="Размер пакета pop_many()")
+    args = parser.parse_args()
+
+    cases:dict[str,tuple[Callable[[],Any],int]] = {
+        "asyncio.Queue": (lambda: asyncio.Queue(args.size),0),
+        "CAIOQueue(CDQueue)": (lambda: CAIOQueue(args.size,CDQueue),0),
+        "CAIOQueue(CAQueue)": (lambda: CAIOQueue(args.size,CAQueue),0),
+        f"CAIOQueue(CDQueue).pop_many({args.batch})": (lambda: CAIOQueue(args.size,CDQueue),args.batch),
+    }
+
+    print(f"| {'Очередь':<32} | {'Элементов/с':>12} |")
+    print(f"|{'-'*34}|{'-'*14}|")
+    for name,(make_queue,batch) in cases.items():
+        rate = asyncio.run(run(make_queue,args.tasks,args.items,batch))
+        print(f"| {name:<32} | {round(rate/1000):>10}k |")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Бенчмарк alloc - выделения памяти на операцию в CLLQueue без пула узлов и с пулом.
+
+Для каждого сценария считается количество созданных узлов Node на операцию,
+при помощи tracemalloc измеряется пик памяти, выделенной модулем cllqueue, и время выполнения.
+"До" - очередь с pool_limit=0 (каждый push создает узел), "после" - пул по умолчанию.
+
+Запуск (из каталога second_task):
+python -m bench.alloc [--size N]
+"""
+
+import argparse
+import timeit
+import tracemalloc
+from typing import Callable
+
+from cqueue import CLLQueue
+from cqueue import cllqueue
+
+
+class CountingNode(cllqueue.Node):
+    """
+    Узел, считающий количество созданных экземпляров.
+    """
+    __slots__ = ()
+    created = 0
+
+    def __init__(self,value)->None:
+        CountingNode.created+=1
+        super().__init__(value)
+
+
+def allocations(scenario:Callable[[],None])->tuple[int,int]:
+    """
+    Выполняет сценарий и возвращает количество созданных узлов и пик выделенной памяти.
+
+    param:
+    scenario (Callable[[],None]): Сценарий
+
+    return:
+    (tuple[int,int]): Количество созданных узлов и пик памяти в байтах
+    """
+    node = cllqueue.Node
+    cllqueue.Node = CountingNode
+    CountingNode.created = 0
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    base,_ = tracemalloc.get_traced_memory()
+    scenario()
+    _,peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    cllqueue.Node = node
+    return CountingNode.created,peak-base
+
+
+def main()->None:
+    """
+    Запускает бенчмарк и печатает таблицу результатов.
+    """
+    parser = argparse.ArgumentParser(description=__doc__,formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size",type=int,default=100000,help="Размер очереди и количество операций")
+    args = parser.parse_args()
+    size = args.size
+
+    def refill(queue:CLLQueue[int])->Callable[[],None]:
+        # Очередь уже заполнялась и была опустошена: push повторно заполняет ее
+        queue.push_many(range(size))
+        queue.pop_many(size)
+        def scenario()->None:
+            for i in range(size):
+                queue.push(i)
+        return scenario
+
+    def replace(queue:CLLQueue[int])->Callable[[],None]:
+        # Заполненная очередь, push с вытеснением первого элемента
+        queue.push_many(range(size))
+        def scenario()->None:
+            for i in range(size):
+                queue.push(i,replace=True)
+        return scenario
+
+    def cycle(queue:CLLQueue[int])->Callable[[],None]:
+        # Чередование push/pop в наполовину заполненной очереди
+        queue.push_many(range(size//2))
+        def scenario()->None:
+            for i in range(size):
+                queue.push(i)
+                queue.pop()
+        return scenario
+
+    scenarios = {"push после опустошения":refill,"push(replace=True)":replace,"push+pop":cycle}
+    print(f"| {'Сценарий':<24} | {'Пул':<5} | {'Узлов/операцию':>14} | {'Пик памяти':>10} | {'Время':>8} |")
+    print(f"|{'-'*26}|{'-'*7}|{'-'*16}|{'-'*12}|{'-'*10}|")
+    for name,prepare in scenarios.items():
+        for label,pool_limit in (("нет",0),("да",None)):
+            created,peak = allocations(prepare(CLLQueue[int](size,pool_limit=pool_limit)))
+            elapsed = timeit.timeit(prepare(CLLQueue[int](size,pool_limit=pool_limit)),number=1)
+            print(f"| {name:<24} | {label:<5} | {created/size:>14.2f} | {round(peak/1024):>8}KB | {elapsed:>7.3f}s |")
+
+
+if __name__ == "__main__":
+    main()
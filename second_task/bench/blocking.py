@@ -0,0 +1,89 @@
+"""
+Бенчмарк blocking - пропускная способность блокирующей очереди CBQueue в сравнении с queue.Queue.
+
+Для 1/2/4/8 потоков-производителей и столько же потоков-потребителей измеряется
+количество переданных элементов в секунду.
+
+Запуск (из каталога second_task):
+python -m bench.blocking [--items N] [--size N] [--batch N]
+"""
+
+import argparse
+import queue
+import threading
+import timeit
+from typing import Any,Callable
+
+from cqueue import CAQueue,CDQueue,CLLQueue,CBQueue
+
+THREADS = (1,2,4,8) # Количество производителей и потребителей
+
+
+def run(make_queue:Callable[[],Any],threads:int,items:int,batch:int = 0)->float:
+    """
+    Передает items элементов через очередь и возвращает пропускную способность.
+
+    param:
+    make_queue (Callable[[],Any]): Фабрика очереди с методами put()/get()
+    threads (int): Количество производителей (и потребителей)
+    items (int): Общее количество элементов
+    batch (int): Размер пакета get_many() у потребителей, 0 - поэлементный get()
+
+    return:
+    (float): Элементов в секунду
+    """
+    q = make_queue()
+    per_thread = items//threads
+
+    def producer()->None:
+        put = q.put
+        for i in range(per_thread):
+            put(i)
+
+    def consumer()->None:
+        if batch:
+            left = per_thread
+            while left:
+                left-=len(q.get_many(min(batch,left)))
+        else:
+            get = q.get
+            for _ in range(per_thread):
+                get()
+
+    workers = [threading.Thread(target=producer) for _ in range(threads)]
+    workers+= [threading.Thread(target=consumer) for _ in range(threads)]
+    start = timeit.default_timer()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return per_thread*threads/(timeit.default_timer()-start)
+
+
+def main()->None:
+    """
+    Запускает бенчмарк и печатает таблицу результатов.
+    """
+    parser = argparse.ArgumentParser(description=__doc__,formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items",type=int,default=200000,help="Количество элементов")
+    parser.add_argument("--size",type=int,default=1024,help="Размер очереди")
+    parser.add_argument("--batch",type=int,default=64,help="Размер пакета get_many()")
+    args = parser.parse_args()
+
+    cases:dict[str,tuple[Callable[[],Any],int]] = {
+        "queue.Queue": (lambda: queue.Queue(args.size),0),
+        "CBQueue(CDQueue)": (lambda: CBQueue(args.size,CDQueue),0),
+        "CBQueue(CAQueue)": (lambda: CBQueue(args.size,CAQueue),0),
+        "CBQueue(CLLQueue)": (lambda: CBQueue(args.size,CLLQueue),0),
+        f"CBQueue(CDQueue).get_many({args.batch})": (lambda: CBQueue(args.size,CDQueue),args.batch),
+    }
+
+    print(f"| {'Очередь':<32} |"+"|".join(f" {n}x{n} ".center(12) for n in THREADS)+"|")
+    print(f"|{'-'*34}|"+"|".join("-"*12 for _ in THREADS)+"|")
+    for name,(make_queue,batch) in cases.items():
+        row = [run(make_queue,n,args.items,batch) for n in THREADS]
+        print(f"| {name:<32} |"+"|".join(f"{round(r/1000)}k/s".center(12) for r in row)+"|")
+
+
+if __name__ == "__main__":
+    main()
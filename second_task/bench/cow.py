@@ -0,0 +1,154 @@
+"""
+Бенчмарк cow - замедление производителя читателями, которые обходят всю очередь, пока производитель добавляет элементы.
+
+Производитель добавляет items элементов в заполненную CBQueue размера size (put(replace=True)).
+Читатели (0/1/2/4 потока) в цикле обходят все элементы очереди, пока производитель не закончит:
+- "aslist()" - копия элементов под блокировкой очереди (производитель ждет все время копирования), обход копии
+- "snapshot()" - снимок CVQueue за O(1) под блокировкой, обход снимка без блокировки
+Печатается пропускная способность производителя, его замедление относительно работы без читателей,
+99-й процентиль и максимум времени одного put() (простой производителя на блокировке) и количество обходов читателей.
+На одном процессоре с GIL читатели отнимают у производителя процессорное время при любой блокировке,
+поэтому снимок уменьшает прежде всего простои put(), а не общую пропускную способность.
+Отдельно печатается время, которое один обход держит блокировку очереди (aslist() против snapshot()).
+
+Запуск (из каталога second_task):
+python -m bench.cow [--items N] [--size N] [--chunk N]
+"""
+
+import argparse
+import statistics
+import threading
+import timeit
+from typing import Callable
+
+from cqueue import CDQueue,CVQueue,CBQueue
+
+READERS = (0,1,2,4) # Количество потоков-читателей
+
+
+def read_copy(q:CBQueue)->None:
+    """
+    Обходит копию элементов очереди (копирование под блокировкой).
+
+    param:
+    q (CBQueue): Очередь
+    """
+    for _ in q.aslist():
+        pass
+
+
+def read_snapshot(q:CBQueue)->None:
+    """
+    Обходит снимок очереди без блокировки.
+
+    param:
+    q (CBQueue): Очередь с бэкендом CVQueue
+    """
+    with q.snapshot() as view:
+        for _ in view:
+            pass
+
+
+def run(make_queue:Callable[[],CBQueue],read:Callable[[CBQueue],None],readers:int,items:int)->tuple[float,float,float,int]:
+    """
+    Добавляет items элементов в заполненную очередь при работающих читателях.
+
+    param:
+    make_queue (Callable[[],CBQueue]): Фабрика очереди
+    read (Callable[[CBQueue],None]): Один обход очереди читателем
+    readers (int): Количество читателей
+    items (int): Количество добавляемых элементов
+
+    return:
+    (tuple[float,float,float,int]): Элементов производителя в секунду, 99-й процентиль и максимум put() в микросекундах,
+    количество обходов
+    """
+    q = make_queue()
+    while not q.is_full():
+        q.put(0)
+    done = threading.Event()
+    passes = [0]*readers
+
+    def reader(n:int)->None:
+        while not done.is_set():
+            read(q)
+            passes[n]+=1
+
+    workers = [threading.Thread(target=reader,args=(n,)) for n in range(readers)]
+    for worker in workers:
+        worker.start()
+    put = q.put
+    clock = timeit.default_timer
+    latencies = [0.0]*items
+    start = clock()
+    for i in range(items):
+        t = clock()
+        put(i,replace=True)
+        latencies[i] = clock()-t
+    elapsed = clock()-start
+    done.set()
+    for worker in workers:
+        worker.join()
+    p99 = statistics.quantiles(latencies,n=100)[98]
+    return items/elapsed,p99*1e6,max(latencies)*1e6,sum(passes)
+
+
+def hold(make_queue:Callable[[],CBQueue],locked:Callable[[CBQueue],object],repeat:int = 20)->float:
+    """
+    Возвращает медиану времени, которое читатель держит блокировку заполненной очереди, в микросекундах.
+
+    param:
+    make_queue (Callable[[],CBQueue]): Фабрика очереди
+    locked (Callable[[CBQueue],object]): Действие читателя под блокировкой (aslist() или snapshot())
+    repeat (int): Количество повторов
+
+    return:
+    (float): Микросекунды
+    """
+    q = make_queue()
+    while not q.is_full():
+        q.put(0)
+    times = []
+    for _ in range(repeat):
+        start = timeit.default_timer()
+        locked(q)
+        times.append(timeit.default_timer()-start)
+    return statistics.median(times)*1e6
+
+
+def main()->None:
+    """
+    Запускает бенчмарк и печатает таблицу результатов.
+    """
+    parser = argparse.ArgumentParser(description=__doc__,formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items",type=int,default=300000,help="Количество добавляемых элементов")
+    parser.add_argument("--size",type=int,default=100000,help="Размер очереди")
+    parser.add_argument("--chunk",type=int,default=256,help="Размер отрезка CVQueue")
+    args = parser.parse_args()
+
+    cases:dict[str,tuple[Callable[[],CBQueue],Callable[[CBQueue],None]]] = {
+        "CBQueue(CDQueue).aslist()": (lambda: CBQueue(args.size,CDQueue),read_copy),
+        "CBQueue(CVQueue).aslist()": (lambda: CBQueue(args.size,CVQueue,chunk_size=args.chunk),read_copy),
+        "CBQueue(CVQueue).snapshot()": (lambda: CBQueue(args.size,CVQueue,chunk_size=args.chunk),read_snapshot),
+    }
+
+    print(f"Производитель: элементов в секунду (замедление), p99/max put() в мкс, обходов читателей; очередь {args.size}")
+    print()
+    print(f"| {'Читатели':<27} |"+"|".join(f" {n} ".center(34) for n in READERS)+"|")
+    print(f"|{'-'*29}|"+"|".join("-"*34 for _ in READERS)+"|")
+    for name,(make_queue,read) in cases.items():
+        rows = [run(make_queue,read,n,args.items) for n in READERS]
+        base = rows[0][0]
+        cells = []
+        for rate,p99,worst,passes in rows:
+            cell = f"{round(rate/1000)}k/s (-{100*(1-rate/base):.0f}%), {p99:.0f}/{worst:.0f}, {passes}"
+            cells.append(cell.center(34))
+        print(f"| {name:<27} |"+"|".join(cells)+"|")
+    print()
+    copy = hold(lambda: CBQueue(args.size,CDQueue),CBQueue.aslist)
+    view = hold(lambda: CBQueue(args.size,CVQueue,chunk_size=args.chunk),lambda q: q.snapshot().close())
+    print(f"Блокировка одного обхода: CBQueue(CDQueue).aslist() {copy:.0f} мкс, CBQueue(CVQueue).snapshot() {view:.1f} мкс")
+
+
+if __name__ == "__main__":
+    main()
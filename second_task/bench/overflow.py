@@ -0,0 +1,133 @@
+"""
+Бенчмарк overflow - стоимость политик переполнения coverflow.
+
+"Быстрый путь" - push() в незаполненную очередь без политики и с политикой: политика вызывается
+только из ветки переполнения, поэтому время должно совпадать. "Перегрузка" - push() в заполненную
+очередь: replace=True и try/except QFullError (способы сброса без политики) против DropOldest,
+DropNewest и Sample.
+
+Запуск (из каталога second_task):
+python -m bench.overflow [--items N] [--size N] [--repeat N]
+"""
+
+import argparse
+import timeit
+from typing import Any,Callable
+
+from cqueue import CAQueue,CDQueue,CLLQueue,CPLLQueue,CSQueue,CNQueue,QFullError
+from cqueue import DropNewest,DropOldest,Sample
+
+
+def fast_path(make_queue:Callable[[],Any],items:int)->Callable[[],None]:
+    """
+    Сценарий: items вызовов push() в незаполненную очередь.
+
+    param:
+    make_queue (Callable[[],Any]): Фабрика очереди размера items
+    items (int): Количество элементов
+
+    return:
+    (Callable[[],None]): Сценарий
+    """
+    def run()->None:
+        push = make_queue().push
+        for i in range(items):
+            push(i)
+    return run
+
+
+def overload(make_queue:Callable[[],Any],items:int,replace:bool = False)->Callable[[],None]:
+    """
+    Сценарий: items вызовов push() в заполненную очередь.
+
+    param:
+    make_queue (Callable[[],Any]): Фабрика заполненной очереди
+    items (int): Количество элементов
+    replace (bool): Параметр replace для push()
+
+    return:
+    (Callable[[],None]): Сценарий
+    """
+    def run()->None:
+        push = make_queue().push
+        for i in range(items):
+            push(i,replace)
+    return run
+
+
+def overload_except(make_queue:Callable[[],Any],items:int)->Callable[[],None]:
+    """
+    Сценарий: items вызовов push() в заполненную очередь с перехватом QFullError (сброс нового элемента без политики).
+
+    param:
+    make_queue (Callable[[],Any]): Фабрика заполненной очереди
+    items (int): Количество элементов
+
+    return:
+    (Callable[[],None]): Сценарий
+    """
+    def run()->None:
+        push = make_queue().push
+        dropped = 0
+        for i in range(items):
+            try:
+                push(i)
+            except QFullError:
+                dropped+=1
+    return run
+
+
+def measure(scenario:Callable[[],None],items:int,repeat:int)->float:
+    """
+    Возвращает лучшее время сценария в наносекундах на операцию.
+
+    param:
+    scenario (Callable[[],None]): Сценарий
+    items (int): Количество операций в сценарии
+    repeat (int): Количество повторов
+
+    return:
+    (float): Наносекунд на операцию
+    """
+    return min(timeit.repeat(scenario,number=1,repeat=repeat))/items*1e9
+
+
+def main()->None:
+    """
+    Запускает бенчмарк и печатает таблицу результатов.
+    """
+    parser = argparse.ArgumentParser(description=__doc__,formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items",type=int,default=200000,help="Количество операций")
+    parser.add_argument("--size",type=int,default=1024,help="Размер заполненной очереди")
+    parser.add_argument("--repeat",type=int,default=5,help="Количество повторов")
+    args = parser.parse_args()
+    n,size = args.items,args.size
+
+    def full(cls:Callable[...,Any],**kwargs:Any)->Callable[[],Any]:
+        def make()->Any:
+            queue = cls(size,**kwargs)
+            queue.push_many(range(size))
+            return queue
+        return make
+
+    columns = ["push()","DropNewest","replace=True","DropOldest","QFullError","DropNewest","Sample(10)"]
+    print("Нс на операцию: первые два столбца - push() в незаполненную очередь без политики и с политикой,")
+    print("остальные - push() в заполненную очередь (QFullError - перехват исключения без политики)")
+    print()
+    print(f"| {'Очередь':<10} | "+" | ".join(f"{c:>13}" for c in columns)+" |")
+    print(f"|{'-'*12}|"+"|".join("-"*15 for _ in columns)+"|")
+    for cls in (CAQueue,CDQueue,CLLQueue,CPLLQueue,CSQueue,CNQueue):
+        results = [
+            measure(fast_path(lambda: cls(n),n),n,args.repeat),
+            measure(fast_path(lambda: cls(n,overflow=DropNewest()),n),n,args.repeat),
+            measure(overload(full(cls),n,replace=True),n,args.repeat),
+            measure(overload(full(cls,overflow=DropOldest()),n),n,args.repeat),
+            measure(overload_except(full(cls),n),n,args.repeat),
+            measure(overload(full(cls,overflow=DropNewest()),n),n,args.repeat),
+            measure(overload(full(cls,overflow=Sample(10)),n),n,args.repeat),
+        ]
+        print(f"| {cls.__name__:<10} | "+" | ".join(f"{r:>13.0f}" for r in results)+" |")
+
+
+if __name__ == "__main__":
+    main()
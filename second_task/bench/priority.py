@@ -0,0 +1,154 @@
+"""
+Бенчмарк priority - многополосная очередь CPQueue против heapq при небольшом количестве приоритетов K.
+
+"Пакет" - items вызовов push() со случайными приоритетами, затем items вызовов pop().
+"Поток" - в очереди size элементов, items пар push()/pop() (установившийся режим).
+heapq хранит кортежи (приоритет, номер, элемент): номер сохраняет порядок FIFO внутри приоритета.
+
+Запуск (из каталога second_task):
+python -m bench.priority [--items N] [--size N] [--repeat N]
+"""
+
+import argparse
+import heapq
+import random
+import timeit
+from itertools import count
+from typing import Any,Callable
+
+from cqueue import CPQueue,CDQueue,CSQueue
+
+
+def heap_burst(priorities:list[int])->Callable[[],None]:
+    """
+    Сценарий "пакет" для heapq.
+
+    param:
+    priorities (list[int]): Приоритеты добавляемых элементов
+
+    return:
+    (Callable[[],None]): Сценарий
+    """
+    def run()->None:
+        heap:list[tuple[int,int,int]] = []
+        seq = count()
+        for i,priority in enumerate(priorities):
+            heapq.heappush(heap,(priority,next(seq),i))
+        for _ in priorities:
+            heapq.heappop(heap)
+    return run
+
+
+def heap_steady(priorities:list[int],size:int)->Callable[[],None]:
+    """
+    Сценарий "поток" для heapq.
+
+    param:
+    priorities (list[int]): Приоритеты добавляемых элементов
+    size (int): Количество элементов в очереди
+
+    return:
+    (Callable[[],None]): Сценарий
+    """
+    def run()->None:
+        seq = count()
+        heap = [(priority,next(seq),0) for priority in priorities[:size]]
+        heapq.heapify(heap)
+        for i,priority in enumerate(priorities):
+            heapq.heappush(heap,(priority,next(seq),i))
+            heapq.heappop(heap)
+    return run
+
+
+def lanes_burst(make_queue:Callable[[],Any],priorities:list[int])->Callable[[],None]:
+    """
+    Сценарий "пакет" для CPQueue.
+
+    param:
+    make_queue (Callable[[],Any]): Фабрика очереди
+    priorities (list[int]): Приоритеты добавляемых элементов
+
+    return:
+    (Callable[[],None]): Сценарий
+    """
+    def run()->None:
+        queue = make_queue()
+        push,pop = queue.push,queue.pop
+        for i,priority in enumerate(priorities):
+            push(i,priority)
+        for _ in priorities:
+            pop()
+    return run
+
+
+def lanes_steady(make_queue:Callable[[],Any],priorities:list[int],size:int)->Callable[[],None]:
+    """
+    Сценарий "поток" для CPQueue.
+
+    param:
+    make_queue (Callable[[],Any]): Фабрика очереди
+    priorities (list[int]): Приоритеты добавляемых элементов
+    size (int): Количество элементов в очереди
+
+    return:
+    (Callable[[],None]): Сценарий
+    """
+    def run()->None:
+        queue = make_queue()
+        push,pop = queue.push,queue.pop
+        for priority in priorities[:size]:
+            push(0,priority)
+        for i,priority in enumerate(priorities):
+            push(i,priority)
+            pop()
+    return run
+
+
+def measure(scenario:Callable[[],None],items:int,repeat:int)->float:
+    """
+    Возвращает лучшее время сценария в наносекундах на пару push()/pop().
+
+    param:
+    scenario (Callable[[],None]): Сценарий
+    items (int): Количество пар в сценарии
+    repeat (int): Количество повторов
+
+    return:
+    (float): Наносекунд на пару
+    """
+    return min(timeit.repeat(scenario,number=1,repeat=repeat))/items*1e9
+
+
+def main()->None:
+    """
+    Запускает бенчмарк и печатает таблицу результатов.
+    """
+    parser = argparse.ArgumentParser(description=__doc__,formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items",type=int,default=200000,help="Количество пар push()/pop()")
+    parser.add_argument("--size",type=int,default=1000,help="Количество элементов в очереди в сценарии \"поток\"")
+    parser.add_argument("--repeat",type=int,default=5,help="Количество повторов")
+    args = parser.parse_args()
+    n,size = args.items,args.size
+
+    columns = ["heapq","CPQueue","CPQueue CSQ","CPQueue WRR"]
+    print("Нс на пару push()/pop()")
+    print()
+    print(f"| {'K':>2} | {'Сценарий':<8} | "+" | ".join(f"{c:>11}" for c in columns)+" |")
+    print(f"|{'-'*4}|{'-'*10}|"+"|".join("-"*13 for _ in columns)+"|")
+    for k in (2,4,8):
+        priorities = [random.randrange(k) for _ in range(n)]
+        factories = [
+            lambda: CPQueue(n,k,CDQueue),
+            lambda: CPQueue(n,k,CSQueue),
+            lambda: CPQueue(n,k,CDQueue,weights=[k-i for i in range(k)]),
+        ]
+        burst = [measure(heap_burst(priorities),n,args.repeat)]
+        burst+=[measure(lanes_burst(make,priorities),n,args.repeat) for make in factories]
+        steady = [measure(heap_steady(priorities,size),n,args.repeat)]
+        steady+=[measure(lanes_steady(make,priorities,size),n,args.repeat) for make in factories]
+        print(f"| {k:>2} | {'пакет':<8} | "+" | ".join(f"{r:>11.0f}" for r in burst)+" |")
+        print(f"| {k:>2} | {'поток':<8} | "+" | ".join(f"{r:>11.0f}" for r in steady)+" |")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Бенчмарк sharded - пропускная способность шардированной очереди CWQueue в зависимости от количества шардов.
+
+threads потоков-производителей и столько же потоков-потребителей передают items элементов.
+Производитель добавляет элементы в свой шард, потребитель извлекает их из своего шарда, а при его
+опустошении перехватывает элементы других шардов. 1 шард - одна общая блокировка на все потоки.
+Потребители не ждут на условной переменной: при QEmptyError поток уступает процессор (time.sleep(0)).
+
+Запуск (из каталога second_task):
+python -m bench.sharded [--items N] [--threads N] [--batch N] [--repeat N]
+"""
+
+import argparse
+import threading
+import time
+import timeit
+from typing import Any,Callable
+
+from cqueue import CAQueue,CDQueue,CWQueue,QEmptyError
+
+SHARDS = (1,2,4,8) # Количество шардов
+
+
+def run(make_queue:Callable[[],Any],threads:int,items:int,batch:int = 0)->tuple[float,int]:
+    """
+    Передает items элементов через очередь и возвращает пропускную способность и количество перехватов.
+
+    param:
+    make_queue (Callable[[],Any]): Фабрика очереди
+    threads (int): Количество производителей (и потребителей)
+    items (int): Общее количество элементов
+    batch (int): Размер пакета pop_many() у потребителей, 0 - поэлементный pop()
+
+    return:
+    (tuple[float,int]): Элементов в секунду и количество перехватов
+    """
+    q = make_queue()
+    per_thread = items//threads
+    total = per_thread*threads
+    done = threading.Event()
+    consumed = [0]*threads
+
+    def producer()->None:
+        push = q.push
+        for i in range(per_thread):
+            push(i)
+
+    def consumer(index:int)->None:
+        pop,pop_many = q.pop,q.pop_many
+        received = 0
+        while True:
+            try:
+                if batch:
+                    received+=len(pop_many(batch))
+                else:
+                    pop()
+                    received+=1
+            except QEmptyError:
+                if done.is_set() and q.empty():
+                    break
+                time.sleep(0)
+        consumed[index] = received
+
+    producers = [threading.Thread(target=producer) for _ in range(threads)]
+    consumers = [threading.Thread(target=consumer,args=(i,)) for i in range(threads)]
+    start = timeit.default_timer()
+    for worker in producers+consumers:
+        worker.start()
+    for worker in producers:
+        worker.join()
+    done.set()
+    for worker in consumers:
+        worker.join()
+    elapsed = timeit.default_timer()-start
+    assert sum(consumed)==total,"Потеряны элементы"
+    return total/elapsed,q.steals
+
+
+def main()->None:
+    """
+    Запускает бенчмарк и печатает таблицу результатов.
+    """
+    parser = argparse.ArgumentParser(description=__doc__,formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items",type=int,default=400000,help="Общее количество элементов")
+    parser.add_argument("--threads",type=int,default=4,help="Количество производителей (и потребителей)")
+    parser.add_argument("--batch",type=int,default=0,help="Размер пакета pop_many() у потребителей, 0 - поэлементный pop()")
+    parser.add_argument("--repeat",type=int,default=3,help="Количество повторов (берется лучший результат)")
+    args = parser.parse_args()
+
+    print(f"Тысяч элементов в секунду, {args.threads} производителей и {args.threads} потребителей"
+          f"{', pop_many('+str(args.batch)+')' if args.batch else ''} (в скобках - количество перехватов)")
+    print()
+    print(f"| {'Шарды':>5} | "+" | ".join(f"{backend.__name__:>16}" for backend in (CAQueue,CDQueue))+" |")
+    print(f"|{'-'*7}|"+"|".join("-"*18 for _ in (CAQueue,CDQueue))+"|")
+    for shards in SHARDS:
+        cells = []
+        for backend in (CAQueue,CDQueue):
+            make = lambda: CWQueue(args.items,shards,backend)
+            best,steals = max(run(make,args.threads,args.items,args.batch) for _ in range(args.repeat))
+            cells.append(f"{best/1000:>8.0f} ({steals:>5})")
+        print(f"| {shards:>5} | "+" | ".join(f"{cell:>16}" for cell in cells)+" |")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Бенчмарк shm - передача записей между процессами через CSHMQueue в сравнении с multiprocessing.Queue.
+
+Дочерний процесс-производитель отправляет записи фиксированного размера (метка времени + данные),
+родительский процесс-потребитель их принимает. Измеряются:
+- пропускная способность (сообщений в секунду) при непрерывной отправке;
+- задержка доставки (перцентили p50/p90/p99) при отправке по одному сообщению,
+  когда производитель ждет, пока предыдущее сообщение будет прочитано.
+
+Запуск (из каталога second_task):
+python -m bench.shm [--items N] [--size N] [--payload N]
+"""
+
+import argparse
+import multiprocessing
+import time
+from typing import Any
+
+import numpy as np
+
+from cqueue import CSHMQueue,QFullError,QEmptyError
+
+
+def record_dtype(payload:int)->np.dtype:
+    """
+    Возвращает тип записи: метка времени в наносекундах и данные фиксированного размера.
+
+    param:
+    payload (int): Размер данных в байтах
+
+    return:
+    (np.dtype): Структурный тип записи
+    """
+    return np.dtype([("ts",np.int64),("payload",f"S{payload}")])
+
+
+def shm_producer(name:str,payload:int,items:int,paced:bool)->None:
+    """
+    Производитель для CSHMQueue: подключается к очереди и отправляет items записей.
+    """
+    queue = CSHMQueue.attach(name,record_dtype(payload))
+    data = b"x"*payload
+    for _ in range(items):
+        while paced and not queue.empty():
+            time.sleep(0)
+        while True:
+            try:
+                queue.push((time.perf_counter_ns(),data))
+                break
+            except QFullError:
+                time.sleep(0)
+    queue.close()
+
+
+def mp_producer(queue:Any,payload:int,items:int,paced:bool)->None:
+    """
+    Производитель для multiprocessing.Queue: отправляет items кортежей (метка времени, данные).
+    """
+    data = b"x"*payload
+    for _ in range(items):
+        while paced and not queue.empty():
+            time.sleep(0)
+        queue.put((time.perf_counter_ns(),data))
+
+
+def shm_run(args:argparse.Namespace,items:int,paced:bool)->tuple[float,np.ndarray]:
+    """
+    Передает items записей через CSHMQueue.
+
+    return:
+    (tuple[float,np.ndarray]): Сообщений в секунду и задержки доставки в микросекундах
+    """
+    with CSHMQueue(args.size,record_dtype(args.payload)) as queue:
+        latency = np.empty(items,dtype=np.int64)
+        process = multiprocessing.Process(target=shm_producer,args=(queue.name,args.payload,items,paced))
+        process.start()
+        received = 0
+        start = None
+        while received<items:
+            try:
+                records = queue.pop_many(args.size)
+            except QEmptyError:
+                time.sleep(0)
+                continue
+            now = time.perf_counter_ns()
+            start = start or now
+            latency[received:received+len(records)] = now-records["ts"]
+            received+=len(records)
+        elapsed = (time.perf_counter_ns()-start)/1e9
+        process.join()
+    return items/elapsed,latency/1000
+
+
+def mp_run(args:argparse.Namespace,items:int,paced:bool)->tuple[float,np.ndarray]:
+    """
+    Передает items записей через multiprocessing.Queue.
+
+    return:
+    (tuple[float,np.ndarray]): Сообщений в секунду и задержки доставки в микросекундах
+    """
+    queue = multiprocessing.Queue(args.size)
+    latency = np.empty(items,dtype=np.int64)
+    process = multiprocessing.Process(target=mp_producer,args=(queue,args.payload,items,paced))
+    process.start()
+    start = None
+    for i in range(items):
+        ts,_ = queue.get()
+        now = time.perf_counter_ns()
+        start = start or now
+        latency[i] = now-ts
+    elapsed = (time.perf_counter_ns()-start)/1e9
+    process.join()
+    return items/elapsed,latency/1000
+
+
+def main()->None:
+    """
+    Запускает бенчмарк и печатает таблицу результатов.
+    """
+    parser = argparse.ArgumentParser(description=__doc__,formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items",type=int,default=200000,help="Количество сообщений для пропускной способности")
+    parser.add_argument("--paced",type=int,default=2000,help="Количество сообщений для измерения задержки")
+    parser.add_argument("--size",type=int,default=1024,help="Размер очереди")
+    parser.add_argument("--payload",type=int,default=56,help="Размер данных сообщения в байтах")
+    args = parser.parse_args()
+
+    print(f"| {'Очередь':<22} | {'Сообщений/с':>12} | {'p50, мкс':>9} | {'p90, мкс':>9} | {'p99, мкс':>9} |")
+    print(f"|{'-'*24}|{'-'*14}|{'-'*11}|{'-'*11}|{'-'*11}|")
+    for name,run in (("multiprocessing.Queue",mp_run),("CSHMQueue",shm_run)):
+        rate,_ = run(args,args.items,False)
+        _,latency = run(args,args.paced,True)
+        p50,p90,p99 = np.percentile(latency,[50,90,99])
+        print(f"| {name:<22} | {round(rate/1000):>11}k | {p50:>9.1f} | {p90:>9.1f} | {p99:>9.1f} |")
+
+
+if __name__ == "__main__":
+    main()
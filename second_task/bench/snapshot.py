@@ -0,0 +1,120 @@
+"""
+Бенчмарк snapshot - время и размер снимка очереди: pickle состояния по умолчанию против __getstate__ и dump()/load().
+
+Очередь размера size заполнена наполовину (items элементов int, для CNQueue - int64) и пересекает границу массива.
+"По умолчанию" - pickle словаря атрибутов объекта (object.__getstate__), как pickle сохранял очереди
+без __getstate__: весь массив с пустыми ячейками, цепочки узлов и блоков (RecursionError - pickle не справился).
+"pickle" - pickle.dumps() протокола 5 с __getstate__ очереди (в поток).
+"dump" - csnapshot: pickle протокола 5 с внеполосными буферами в файл, "load" - восстановление из файла.
+
+Запуск (из каталога second_task):
+python -m bench.snapshot [--size N] [--repeat N]
+"""
+
+import argparse
+import os
+import pickle
+import tempfile
+import timeit
+from typing import Any,Callable,Optional
+
+import numpy as np
+
+from cqueue import CAQueue,CDQueue,CLLQueue,CPLLQueue,CSQueue,CNQueue,dump,load
+
+BACKENDS = (CAQueue,CDQueue,CLLQueue,CPLLQueue,CSQueue,CNQueue)
+
+
+def make(backend:type,size:int)->Any:
+    """
+    Создает очередь размера size с size//2 элементами, пересекающими границу массива.
+
+    param:
+    backend (type): Класс очереди
+    size (int): Размер очереди
+
+    return:
+    (Any): Очередь
+    """
+    items = size//2
+    if backend is CNQueue:
+        queue = CNQueue[int](size,dtype=np.int64)
+        queue.push_many(np.arange(size))
+        queue.pop_many(size-items//2)
+        queue.push_many(np.arange(items-items//2))
+        return queue
+    queue = backend(size)
+    queue.push_many(range(size))
+    queue.pop_many(size-items//2)
+    queue.push_many(range(items-items//2))
+    return queue
+
+
+def measure(action:Callable[[],Any],repeat:int)->tuple[float,Any]:
+    """
+    Возвращает лучшее время действия в миллисекундах и результат последнего запуска.
+
+    param:
+    action (Callable[[],Any]): Действие
+    repeat (int): Количество повторов
+
+    return:
+    (tuple[float,Any]): Миллисекунды и результат
+    """
+    best,result = float("inf"),None
+    for _ in range(repeat):
+        start = timeit.default_timer()
+        result = action()
+        best = min(best,timeit.default_timer()-start)
+    return best*1000,result
+
+
+def default_pickle(queue:Any,repeat:int)->Optional[tuple[float,int]]:
+    """
+    Время и размер pickle словаря атрибутов очереди (сохранение по умолчанию).
+
+    param:
+    queue (Any): Очередь
+    repeat (int): Количество повторов
+
+    return:
+    (Optional[tuple[float,int]]): Миллисекунды и байты или None, если pickle не справился с вложенностью
+    """
+    try:
+        elapsed,data = measure(lambda: pickle.dumps(object.__getstate__(queue),5),repeat)
+    except RecursionError:
+        return None
+    return elapsed,len(data)
+
+
+def main()->None:
+    """
+    Запускает бенчмарк и печатает таблицу результатов.
+    """
+    parser = argparse.ArgumentParser(description=__doc__,formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size",type=int,default=2000000,help="Размер очереди (заполняется наполовину)")
+    parser.add_argument("--repeat",type=int,default=3,help="Количество повторов")
+    args = parser.parse_args()
+
+    print(f"Миллисекунды и мегабайты, очередь {args.size}, элементов {args.size//2}")
+    print()
+    print(f"| {'Очередь':<10} | {'По умолчанию':>16} | {'pickle':>14} | {'dump':>14} | {'load':>6} |")
+    print(f"|{'-'*12}|{'-'*18}|{'-'*16}|{'-'*16}|{'-'*8}|")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp,"queue.snap")
+        for backend in BACKENDS:
+            queue = make(backend,args.size)
+            default = default_pickle(queue,args.repeat)
+            cell = "RecursionError" if default is None else f"{default[0]:.0f} ({default[1]/2**20:.1f})"
+            pickled,data = measure(lambda: pickle.dumps(queue,5),args.repeat)
+            dumped,written = measure(lambda: dump(queue,path),args.repeat)
+            loaded,restored = measure(lambda: load(path),args.repeat)
+            assert restored.length()==queue.length(),"Снимок не совпадает с очередью"
+            pickled = f"{pickled:.0f} ({len(data)/2**20:.1f})"
+            dumped = f"{dumped:.0f} ({written/2**20:.1f})"
+            print(f"| {backend.__name__:<10} | {cell:>16} | {pickled:>14} | {dumped:>14} | {loaded:>6.0f} |")
+            del queue,restored
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Бенчмарк stats - затраты сбора статистики CIQueue по сравнению с очередью без обертки.
+
+Очередь размера size заполняется и опустошается items раз поэлементно (push()/pop()) и пакетами
+по batch элементов (push_many()/pop_many()). "Без статистики" - очередь пакета напрямую,
+CIQueue - с замером времени ожидания у каждого sample-го элемента (0 - только счетчики).
+
+Запуск (из каталога second_task):
+python -m bench.stats [--items N] [--size N] [--batch N]
+"""
+
+import argparse
+import timeit
+from typing import Any,Callable
+
+from cqueue import CAQueue,CDQueue,CIQueue
+
+SAMPLES = (0,16,1) # Частота выборки времени ожидания
+
+
+def single(queue:Any,items:int,size:int)->None:
+    """
+    Поэлементно заполняет и опустошает очередь, пока не будет передано items элементов.
+
+    param:
+    queue (Any): Очередь
+    items (int): Количество элементов
+    size (int): Размер очереди
+    """
+    push,pop = queue.push,queue.pop
+    for _ in range(items//size):
+        for i in range(size):
+            push(i)
+        for _ in range(size):
+            pop()
+
+
+def batch(queue:Any,items:int,size:int,k:int)->None:
+    """
+    Заполняет и опустошает очередь пакетами по k элементов, пока не будет передано items элементов.
+
+    param:
+    queue (Any): Очередь
+    items (int): Количество элементов
+    size (int): Размер очереди
+    k (int): Размер пакета
+    """
+    values = list(range(k))
+    for _ in range(items//size):
+        for _ in range(size//k):
+            queue.push_many(values)
+        for _ in range(size//k):
+            queue.pop_many(k)
+
+
+def measure(action:Callable[[],None],items:int,repeat:int = 5)->float:
+    """
+    Возвращает лучшее время действия в наносекундах на элемент.
+
+    param:
+    action (Callable[[],None]): Действие
+    items (int): Количество элементов в действии
+    repeat (int): Количество повторов
+
+    return:
+    (float): Наносекунд на элемент
+    """
+    return min(timeit.repeat(action,number=1,repeat=repeat))/items*1e9
+
+
+def main()->None:
+    """
+    Запускает бенчмарк и печатает таблицу результатов.
+    """
+    parser = argparse.ArgumentParser(description=__doc__,formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items",type=int,default=200000,help="Количество элементов")
+    parser.add_argument("--size",type=int,default=1000,help="Размер очереди")
+    parser.add_argument("--batch",type=int,default=100,help="Размер пакета push_many()/pop_many()")
+    args = parser.parse_args()
+
+    print(f"Наносекунд на элемент (push+pop), очередь {args.size}, пакет {args.batch}")
+    print()
+    print(f"| {'Очередь':<28} | {'push()/pop()':>12} | {'push_many()/pop_many()':>22} |")
+    print(f"|{'-'*30}|{'-'*14}|{'-'*24}|")
+    for backend in (CDQueue,CAQueue):
+        cases:dict[str,Callable[[],Any]] = {f"{backend.__name__} без статистики": lambda: backend(args.size)}
+        for sample in SAMPLES:
+            cases[f"CIQueue({backend.__name__}, sample={sample})"] = lambda sample=sample: CIQueue(args.size,backend,sample=sample)
+        for name,make in cases.items():
+            one = measure(lambda: single(make(),args.items,args.size),args.items)
+            many = measure(lambda: batch(make(),args.items,args.size,args.batch),args.items)
+            print(f"| {name:<28} | {one:>12.0f} | {many:>22.1f} |")
+
+
+if __name__ == "__main__":
+    main()
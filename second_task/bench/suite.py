@@ -0,0 +1,567 @@
+"""
+Бенчмарк suite - набор замеров реализаций очередей отдельно от модульных тестов.
+
+Для каждой реализации, операции (push, pop, cycle, insert, remove, resize, iterate, batch, getitem,
+to_list, to_numpy, pickle), размера очереди и типа элементов (int, str, object) выполняются прогревочные и повторные запуски. Повторы
+идут кругами по всем замерам (круг - по одному замеру каждого случая), поэтому медленный дрейф машины
+(частота процессора, соседние процессы) распределяется по всем случаям, а не попадает в один.
+Перед каждым запуском очередь готовится заново (без учета времени), запуск повторяется, пока суммарное время
+не достигнет --min-time, во время замера сборщик мусора отключен.
+Результат - наносекунды на операцию: медиана и межквартильный размах (IQR) повторов (минимум печатается
+для справки: на шумной машине он менее устойчив, чем медиана).
+
+- --json PATH: записывает результаты в JSON (параметры запуска и список замеров)
+- --baseline PATH: сравнивает медианы с сохраненным JSON; регрессия - медиана выросла больше чем на
+  --threshold (по умолчанию 50%: повторные запуски неизмененного кода расходятся по медиане до ~30%), а первый квартиль нового замера выше третьего квартиля базового (распределения
+  не пересекаются, шум соседних запусков не считается регрессией); при регрессиях выход с кодом 1.
+  Базовая линия сравнима только с запусками на той же машине: после смены машины ее нужно перезаписать
+  (--json bench/baseline.json)
+- --readme PATH: заменяет таблицы между метками <!-- bench.suite:start --> и <!-- bench.suite:end -->
+
+Запуск (из каталога second_task):
+python -m bench.suite [--sizes N ...] [--types T ...] [--backends B ...] [--ops O ...]
+                      [--repeat N] [--warmup N] [--min-time S] [--threshold F] [--json PATH] [--baseline PATH] [--readme PATH]
+"""
+
+import argparse
+import gc
+import json
+import pickle
+import platform
+import statistics
+import sys
+import time
+from typing import Any,Callable
+
+import numpy as np
+
+from cqueue import CAQueue,CDQueue,CLLQueue,CPLLQueue,CSQueue,CNQueue,CVQueue
+
+START = "<!-- bench.suite:start -->" # Метка начала таблиц в README
+END = "<!-- bench.suite:end -->"     # Метка конца таблиц в README
+LIMIT = 100 # Количество вставок и удалений по значению (O(n) на операцию)
+BATCH = 1000 # Размер пакета push_many()/pop_many()
+
+
+class Item:
+    """
+    Элемент очереди - экземпляр пользовательского класса.
+    """
+    __slots__ = ("value",)
+
+    def __init__(self,value:int)->None:
+        self.value = value
+
+
+TYPES:dict[str,Callable[[int],list[Any]]] = {
+    "int": lambda n: list(range(n)),
+    "str": lambda n: [f"item{i}" for i in range(n)],
+    "object": lambda n: [Item(i) for i in range(n)],
+}
+
+BACKENDS:dict[str,Callable[[int,str],Any]] = {
+    "CAQueue": lambda size,kind: CAQueue(size),
+    "CDQueue": lambda size,kind: CDQueue(size),
+    "CLLQueue": lambda size,kind: CLLQueue(size),
+    "CPLLQueue": lambda size,kind: CPLLQueue(size),
+    "CSQueue": lambda size,kind: CSQueue(size),
+    "CNQueue": lambda size,kind: CNQueue(size,dtype=np.int64 if kind=="int" else object),
+    "CVQueue": lambda size,kind: CVQueue(size),
+}
+
+
+def op_push(queue:Any,values:list[Any])->tuple[Callable[[],None],int]:
+    """
+    Добавление элементов по одному в пустую очередь.
+
+    param:
+    queue (Any): Пустая очередь размера len(values)
+    values (list[Any]): Элементы
+
+    return:
+    (tuple[Callable[[],None],int]): Замеряемое действие и количество операций в нем
+    """
+    push = queue.push
+    def run()->None:
+        for value in values:
+            push(value)
+    return run,len(values)
+
+
+def op_pop(queue:Any,values:list[Any])->tuple[Callable[[],None],int]:
+    """
+    Удаление элементов по одному из заполненной очереди.
+
+    param:
+    queue (Any): Пустая очередь размера len(values)
+    values (list[Any]): Элементы
+
+    return:
+    (tuple[Callable[[],None],int]): Замеряемое действие и количество операций в нем
+    """
+    queue.push_many(values)
+    pop = queue.pop
+    n = len(values)
+    def run()->None:
+        for _ in range(n):
+            pop()
+    return run,n
+
+
+def op_cycle(queue:Any,values:list[Any])->tuple[Callable[[],None],int]:
+    """
+    Добавление с вытеснением первого элемента (push(replace=True)) в заполненную очередь.
+
+    param:
+    queue (Any): Пустая очередь размера len(values)
+    values (list[Any]): Элементы
+
+    return:
+    (tuple[Callable[[],None],int]): Замеряемое действие и количество операций в нем
+    """
+    queue.push_many(values)
+    push = queue.push
+    def run()->None:
+        for value in values:
+            push(value,True)
+    return run,len(values)
+
+
+def op_insert(queue:Any,values:list[Any])->tuple[Callable[[],None],int]:
+    """
+    Вставка по индексу в середину заполненной наполовину очереди (не больше LIMIT вставок).
+
+    param:
+    queue (Any): Пустая очередь размера len(values)
+    values (list[Any]): Элементы
+
+    return:
+    (tuple[Callable[[],None],int]): Замеряемое действие и количество операций в нем
+    """
+    half = len(values)//2
+    queue.push_many(values[:half])
+    extra = values[half:half+LIMIT]
+    insert = queue.insert
+    index = half//2
+    def run()->None:
+        for value in extra:
+            insert(index,value)
+    return run,len(extra)
+
+
+def op_remove(queue:Any,values:list[Any])->tuple[Callable[[],None],int]:
+    """
+    Удаление по значению элементов из середины заполненной очереди (не больше LIMIT удалений).
+
+    param:
+    queue (Any): Пустая очередь размера len(values)
+    values (list[Any]): Элементы
+
+    return:
+    (tuple[Callable[[],None],int]): Замеряемое действие и количество операций в нем
+    """
+    queue.push_many(values)
+    half = len(values)//2
+    targets = values[half:half+LIMIT]
+    remove = queue.remove
+    def run()->None:
+        for value in targets:
+            remove(value)
+    return run,len(targets)
+
+
+def op_resize(queue:Any,values:list[Any])->tuple[Callable[[],None],int]:
+    """
+    Увеличение заполненной очереди вдвое и уменьшение обратно (две операции).
+
+    param:
+    queue (Any): Пустая очередь размера len(values)
+    values (list[Any]): Элементы
+
+    return:
+    (tuple[Callable[[],None],int]): Замеряемое действие и количество операций в нем
+    """
+    queue.push_many(values)
+    n = len(values)
+    def run()->None:
+        queue.resize(2*n)
+        queue.resize(n)
+    return run,2
+
+
+def op_iterate(queue:Any,values:list[Any])->tuple[Callable[[],None],int]:
+    """
+    Обход всех элементов заполненной очереди (одна операция - один элемент).
+
+    param:
+    queue (Any): Пустая очередь размера len(values)
+    values (list[Any]): Элементы
+
+    return:
+    (tuple[Callable[[],None],int]): Замеряемое действие и количество операций в нем
+    """
+    queue.push_many(values)
+    def run()->None:
+        for _ in queue:
+            pass
+    return run,len(values)
+
+
+def op_batch(queue:Any,values:list[Any])->tuple[Callable[[],None],int]:
+    """
+    Пакетное добавление и удаление (push_many()/pop_many() по BATCH элементов) в заполненной наполовину очереди.
+
+    param:
+    queue (Any): Пустая очередь размера len(values)
+    values (list[Any]): Элементы
+
+    return:
+    (tuple[Callable[[],None],int]): Замеряемое действие и количество элементов в нем
+    """
+    half = len(values)//2
+    k = max(1,min(BATCH,half))
+    queue.push_many(values[:half])
+    batches = [values[i:i+k] for i in range(0,len(values)-k+1,k)]
+    push_many,pop_many = queue.push_many,queue.pop_many
+    def run()->None:
+        for batch in batches:
+            push_many(batch)
+            pop_many(k)
+    return run,k*len(batches)
+
+
+def op_getitem(queue:Any,values:list[Any])->tuple[Callable[[],None],int]:
+    """
+    Доступ по индексу к 200 элементам по всей длине заполненной очереди, первый элемент которой
+    находится не в начале хранилища.
+
+    param:
+    queue (Any): Пустая очередь размера len(values)
+    values (list[Any]): Элементы
+
+    return:
+    (tuple[Callable[[],None],int]): Замеряемое действие и количество операций в нем
+    """
+    n = len(values)
+    queue.push_many(values)
+    queue.pop_many(n//3)
+    queue.push_many(values[:n//3])
+    queue[0] # Индекс опорных узлов CLLQueue строится при первом обращении
+    indices = list(range(0,n,max(1,n//200)))
+    def run()->None:
+        for i in indices:
+            queue[i]
+    return run,len(indices)
+
+
+def op_to_list(queue:Any,values:list[Any])->tuple[Callable[[],None],int]:
+    """
+    Выгрузка в список заполненной очереди, которая переходит через конец хранилища (одна операция - один элемент).
+
+    param:
+    queue (Any): Пустая очередь размера len(values)
+    values (list[Any]): Элементы
+
+    return:
+    (tuple[Callable[[],None],int]): Замеряемое действие и количество элементов в нем
+    """
+    n = len(values)
+    queue.push_many(values)
+    queue.pop_many(n//2)
+    queue.push_many(values[:n//2])
+    def run()->None:
+        queue.to_list()
+    return run,n
+
+
+def op_to_numpy(queue:Any,values:list[Any])->tuple[Callable[[],None],int]:
+    """
+    Выгрузка в массив NumPy (int64 для целых, иначе object) заполненной очереди, которая переходит
+    через конец хранилища (одна операция - один элемент).
+
+    param:
+    queue (Any): Пустая очередь размера len(values)
+    values (list[Any]): Элементы
+
+    return:
+    (tuple[Callable[[],None],int]): Замеряемое действие и количество элементов в нем
+    """
+    n = len(values)
+    queue.push_many(values)
+    queue.pop_many(n//2)
+    queue.push_many(values[:n//2])
+    dtype = np.int64 if isinstance(values[0],int) else object
+    def run()->None:
+        queue.to_numpy(dtype)
+    return run,n
+
+
+def op_pickle(queue:Any,values:list[Any])->tuple[Callable[[],None],int]:
+    """
+    Сохранение и восстановление через pickle (протокол 5) заполненной очереди (одна операция - один элемент).
+
+    param:
+    queue (Any): Пустая очередь размера len(values)
+    values (list[Any]): Элементы
+
+    return:
+    (tuple[Callable[[],None],int]): Замеряемое действие и количество элементов в нем
+    """
+    queue.push_many(values)
+    def run()->None:
+        pickle.loads(pickle.dumps(queue,5))
+    return run,len(values)
+
+
+OPERATIONS:dict[str,Callable[[Any,list[Any]],tuple[Callable[[],None],int]]] = {
+    "push": op_push,
+    "pop": op_pop,
+    "cycle": op_cycle,
+    "insert": op_insert,
+    "remove": op_remove,
+    "resize": op_resize,
+    "iterate": op_iterate,
+    "batch": op_batch,
+    "getitem": op_getitem,
+    "to_list": op_to_list,
+    "to_numpy": op_to_numpy,
+    "pickle": op_pickle,
+}
+
+# Метод, без которого реализация не поддерживает операцию
+REQUIRES:dict[str,str] = {"insert":"insert","remove":"remove","resize":"resize","getitem":"__getitem__",
+                          "to_list":"to_list","to_numpy":"to_numpy"}
+
+
+def supported(backend:str,operation:str,kind:str)->bool:
+    """
+    Проверяет, поддерживает ли реализация операцию.
+
+    param:
+    backend (str): Имя реализации из BACKENDS
+    operation (str): Имя операции из OPERATIONS
+    kind (str): Тип элементов из TYPES
+
+    return:
+    (bool): True, если у реализации есть нужный метод
+    """
+    return operation not in REQUIRES or hasattr(BACKENDS[backend](1,kind),REQUIRES[operation])
+
+
+def sample(backend:str,operation:str,values:list[Any],kind:str,min_time:float = 0.0)->float:
+    """
+    Выполняет один замер операции и возвращает наносекунды на операцию.
+    Замер повторяет подготовку и действие, пока суммарное время действий не достигнет min_time,
+    поэтому короткие операции (resize, getitem на малой очереди) не меряются одним запуском в микросекунды.
+
+    param:
+    backend (str): Имя реализации из BACKENDS
+    operation (str): Имя операции из OPERATIONS
+    values (list[Any]): Элементы (их количество - размер очереди)
+    kind (str): Тип элементов из TYPES
+    min_time (float): Минимальное время замера в секундах
+
+    return:
+    (float): Наносекунд на операцию
+    """
+    make = BACKENDS[backend]
+    elapsed,total = 0,0
+    while total==0 or elapsed<min_time*1e9:
+        run,ops = OPERATIONS[operation](make(len(values),kind),values)
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter_ns()
+            run()
+            elapsed+=time.perf_counter_ns()-start
+        finally:
+            gc.enable()
+        total+=ops
+    return elapsed/total
+
+
+def measure(cases:list[tuple[str,str,int,str]],repeat:int,warmup:int,min_time:float = 0.0)->list[dict[str,Any]]:
+    """
+    Замеряет случаи (реализация, операция, размер, тип) и возвращает минимум, медиану и IQR наносекунд на операцию.
+    Повторы идут кругами по всем случаям: замеры одного случая разнесены по всему запуску, поэтому
+    кратковременная нагрузка машины искажает отдельные замеры, а не все замеры одного случая.
+
+    param:
+    cases (list[tuple[str,str,int,str]]): Случаи (реализация, операция, размер, тип)
+    repeat (int): Количество замеряемых кругов
+    warmup (int): Количество прогревочных кругов
+    min_time (float): Минимальное время одного замера в секундах
+
+    return:
+    (list[dict[str,Any]]): Замеры в порядке случаев
+    """
+    values = {(size,kind):TYPES[kind](size) for _,_,size,kind in cases}
+    samples:list[list[float]] = [[] for _ in cases]
+    for n in range(warmup+repeat):
+        for i,(backend,operation,size,kind) in enumerate(cases):
+            elapsed = sample(backend,operation,values[(size,kind)],kind,min_time)
+            if n>=warmup:
+                samples[i].append(elapsed)
+        print(f"круг {n+1}/{warmup+repeat}{' (прогрев)' if n<warmup else ''}",file=sys.stderr,flush=True)
+    results = []
+    for (backend,operation,size,kind),times in zip(cases,samples):
+        q1,_,q3 = quartiles(times)
+        results.append({"backend":backend,"operation":operation,"size":size,"type":kind,"min_ns":min(times),
+                        "median_ns":statistics.median(times),"iqr_ns":q3-q1,"q1_ns":q1,"q3_ns":q3,"samples_ns":times})
+    return results
+
+
+def quartiles(samples:list[float])->tuple[float,float,float]:
+    """
+    Возвращает первый квартиль, медиану и третий квартиль замеров.
+
+    param:
+    samples (list[float]): Замеры
+
+    return:
+    (tuple[float,float,float]): Q1, медиана, Q3
+    """
+    if len(samples)==1:
+        return samples[0],samples[0],samples[0]
+    q1,median,q3 = statistics.quantiles(samples,n=4,method="inclusive")
+    return q1,median,q3
+
+
+def key(result:dict[str,Any])->str:
+    """
+    Возвращает ключ замера для сравнения с базовой линией.
+
+    param:
+    result (dict[str,Any]): Замер
+
+    return:
+    (str): Реализация/операция/размер/тип
+    """
+    return f"{result['backend']}/{result['operation']}/{result['size']}/{result['type']}"
+
+
+def compare(results:list[dict[str,Any]],baseline:list[dict[str,Any]],threshold:float)->list[str]:
+    """
+    Сравнивает замеры с базовой линией и возвращает описания регрессий.
+
+    param:
+    results (list[dict[str,Any]]): Текущие замеры
+    baseline (list[dict[str,Any]]): Замеры базовой линии
+    threshold (float): Допустимый относительный рост медианы
+
+    return:
+    (list[str]): Регрессии (пустой список, если их нет)
+    """
+    base = {key(result):result for result in baseline}
+    regressions = []
+    for result in results:
+        old = base.get(key(result))
+        if old is None:
+            continue
+        new_median,old_median = result["median_ns"],old["median_ns"]
+        if new_median>old_median*(1+threshold) and result["q1_ns"]>old["q3_ns"]:
+            regressions.append(f"{key(result)}: {old_median:.1f} -> {new_median:.1f} нс (+{100*(new_median/old_median-1):.0f}%)")
+    return regressions
+
+
+def render(results:list[dict[str,Any]],kind:str)->str:
+    """
+    Строит таблицы Markdown (по одной на размер): операции по строкам, реализации по столбцам.
+
+    param:
+    results (list[dict[str,Any]]): Замеры
+    kind (str): Тип элементов для таблиц
+
+    return:
+    (str): Таблицы Markdown
+    """
+    backends = [name for name in BACKENDS if any(result["backend"]==name for result in results)]
+    operations = [name for name in OPERATIONS if any(result["operation"]==name for result in results)]
+    cells = {key(result):f"{result['median_ns']:.0f} ± {result['iqr_ns']:.0f}" for result in results}
+    tables = []
+    for size in sorted({result["size"] for result in results if result["type"]==kind}):
+        rows = [[operation]+[cells.get(f"{backend}/{operation}/{size}/{kind}","-") for backend in backends]
+                for operation in operations]
+        header = ["Операция"]+backends
+        widths = [max(len(row[i]) for row in rows+[header]) for i in range(len(header))]
+        lines = [f"Очередь {size}, элементы {kind}, наносекунд на операцию (медиана ± IQR):","",
+                 "| "+" | ".join(cell.ljust(widths[i]) if i==0 else cell.rjust(widths[i]) for i,cell in enumerate(header))+" |",
+                 "|"+"|".join("-"*(width+2) for width in widths)+"|"]
+        for row in rows:
+            lines.append("| "+" | ".join(cell.ljust(widths[i]) if i==0 else cell.rjust(widths[i]) for i,cell in enumerate(row))+" |")
+        tables.append("\n".join(lines))
+    return "\n\n".join(tables)
+
+
+def update_readme(path:str,tables:str)->None:
+    """
+    Заменяет содержимое между метками START и END в README.
+
+    raise:
+    (ValueError): Если меток нет в файле
+
+    param:
+    path (str): Путь к README
+    tables (str): Новые таблицы
+    """
+    with open(path,encoding="utf-8") as file:
+        text = file.read()
+    start,end = text.find(START),text.find(END)
+    if start<0 or end<start:
+        raise ValueError(f"В {path} нет меток {START} и {END}")
+    text = text[:start+len(START)]+"\n\n"+tables+"\n\n"+text[end:]
+    with open(path,"w",encoding="utf-8") as file:
+        file.write(text)
+
+
+def main()->None:
+    """
+    Запускает набор замеров, печатает таблицы, записывает JSON, сравнивает с базовой линией и обновляет README.
+    """
+    parser = argparse.ArgumentParser(description=__doc__,formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes",type=int,nargs="+",default=[1000,100000],help="Размеры очереди")
+    parser.add_argument("--types",nargs="+",choices=list(TYPES),default=list(TYPES),help="Типы элементов")
+    parser.add_argument("--backends",nargs="+",choices=list(BACKENDS),default=list(BACKENDS),help="Реализации")
+    parser.add_argument("--ops",nargs="+",choices=list(OPERATIONS),default=list(OPERATIONS),help="Операции")
+    parser.add_argument("--repeat",type=int,default=9,help="Количество замеряемых запусков")
+    parser.add_argument("--warmup",type=int,default=1,help="Количество прогревочных запусков")
+    parser.add_argument("--min-time",type=float,default=0.01,help="Минимальное время одного замера в секундах")
+    parser.add_argument("--json",help="Файл для записи результатов")
+    parser.add_argument("--baseline",help="JSON базовой линии для поиска регрессий")
+    parser.add_argument("--threshold",type=float,default=0.5,help="Допустимый рост медианы относительно базовой линии")
+    parser.add_argument("--readme",help="README, в котором обновляются таблицы между метками")
+    parser.add_argument("--readme-type",choices=list(TYPES),default="int",help="Тип элементов для таблиц README")
+    args = parser.parse_args()
+    assert args.repeat>0,"Количество запусков должно быть больше 0"
+
+    cases = [(backend,operation,size,kind) for kind in args.types for size in args.sizes for operation in args.ops
+             for backend in args.backends if supported(backend,operation,kind)]
+    results = measure(cases,args.repeat,args.warmup,args.min_time)
+    for result in results:
+        print(f"{key(result):<32} {result['min_ns']:>12.1f} мин, {result['median_ns']:>12.1f} ± {result['iqr_ns']:.1f} нс")
+
+    tables = render(results,args.readme_type)
+    print()
+    print(tables)
+    if args.json:
+        report = {"python":platform.python_version(),"platform":platform.platform(),"time":time.strftime("%Y-%m-%dT%H:%M:%S"),
+                  "repeat":args.repeat,"warmup":args.warmup,"min_time":args.min_time,"results":results}
+        with open(args.json,"w",encoding="utf-8") as file:
+            json.dump(report,file,ensure_ascii=False,indent=1)
+    if args.readme:
+        update_readme(args.readme,tables)
+    if args.baseline:
+        with open(args.baseline,encoding="utf-8") as file:
+            baseline = json.load(file)["results"]
+        regressions = compare(results,baseline,args.threshold)
+        print()
+        if regressions:
+            print(f"РЕГРЕССИИ относительно {args.baseline} ({len(regressions)}):")
+            for regression in regressions:
+                print(f"  {regression}")
+            sys.exit(1)
+        print(f"Регрессий относительно {args.baseline} нет")
+
+
+if __name__ == "__main__":
+    main()
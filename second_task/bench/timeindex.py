@@ -0,0 +1,145 @@
+"""
+Бенчмарк timeindex - запросы по времени: CTQueue против CAQueue пар (метка, событие) с просмотром aslist().
+
+Очередь размера size заполнена событиями с возрастающими метками (переход через конец массива),
+запрос since() возвращает последние k событий, range() - k событий из середины очереди,
+evict_older_than() удаляет k первых событий (очередь перед каждым запросом заполняется заново, вне замера).
+
+Запуск (из каталога second_task):
+python -m bench.timeindex [--size N] [--k N] [--queries N] [--repeat N]
+"""
+
+import argparse
+import timeit
+from typing import Any,Callable
+
+from cqueue import CAQueue,CTQueue
+
+
+def fill(size:int)->tuple[CAQueue,CTQueue]:
+    """
+    Создает очереди с size событиями и метками 0..size-1 (половина элементов после перехода через конец массива).
+
+    param:
+    size (int): Размер очереди
+
+    return:
+    (tuple[CAQueue,CTQueue]): Очередь пар (метка, событие) и очередь с метками
+    """
+    pairs = CAQueue[tuple[float,int]](size)
+    timed = CTQueue[int](size)
+    for i in range(size+size//2):
+        pairs.push((float(i),i),True)
+        timed.push(i,True,float(i))
+    return pairs,timed
+
+
+def scan_since(queue:CAQueue,t:float)->list[Any]:
+    """
+    Запрос since() просмотром всех элементов aslist().
+
+    param:
+    queue (CAQueue): Очередь пар (метка, событие)
+    t (float): Момент времени
+
+    return:
+    (list[Any]): События с метками не раньше t
+    """
+    return [event for ts,event in queue.aslist() if ts>=t]
+
+
+def scan_range(queue:CAQueue,t0:float,t1:float)->list[Any]:
+    """
+    Запрос range() просмотром всех элементов aslist().
+
+    param:
+    queue (CAQueue): Очередь пар (метка, событие)
+    t0 (float): Начало интервала (включительно)
+    t1 (float): Конец интервала (не включительно)
+
+    return:
+    (list[Any]): События интервала
+    """
+    return [event for ts,event in queue.aslist() if t0<=ts<t1]
+
+
+def scan_evict(queue:CAQueue,t:float)->int:
+    """
+    Удаление событий старше t: pop() первых элементов, пока метка раньше t.
+
+    param:
+    queue (CAQueue): Очередь пар (метка, событие)
+    t (float): Момент времени
+
+    return:
+    (int): Количество удаленных событий
+    """
+    k = 0
+    while not queue.empty() and queue.front()[0]<t:
+        queue.pop()
+        k+=1
+    return k
+
+
+def measure(query:Callable[[],Any],queries:int,repeat:int,setup:Callable[[],None] = lambda: None)->float:
+    """
+    Возвращает лучшее время запроса в микросекундах.
+
+    param:
+    query (Callable[[],Any]): Запрос
+    queries (int): Количество запросов в одном замере
+    repeat (int): Количество повторов
+    setup (Callable[[],None]): Подготовка перед каждым запросом (не входит в замер)
+
+    return:
+    (float): Микросекунд на запрос
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        total = 0.0
+        for _ in range(queries):
+            setup()
+            start = timeit.default_timer()
+            query()
+            total+=timeit.default_timer()-start
+        best = min(best,total)
+    return best/queries*1e6
+
+
+def main()->None:
+    """
+    Запускает бенчмарк и печатает таблицу результатов.
+    """
+    parser = argparse.ArgumentParser(description=__doc__,formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size",type=int,default=100000,help="Размер очереди")
+    parser.add_argument("--k",type=int,default=100,help="Количество событий в ответе запроса")
+    parser.add_argument("--queries",type=int,default=50,help="Количество запросов в замере")
+    parser.add_argument("--repeat",type=int,default=3,help="Количество повторов")
+    args = parser.parse_args()
+    size,k = args.size,args.k
+    last = float(size+size//2-1) # Метка последнего события
+    queues:dict[str,Any] = {}
+
+    def refill()->None:
+        queues["pairs"],queues["timed"] = fill(size)
+
+    refill()
+    rows = [
+        ("since()",lambda: scan_since(queues["pairs"],last-k+1),lambda: queues["timed"].since(last-k+1),None),
+        ("range()",lambda: scan_range(queues["pairs"],last-size/2,last-size/2+k),
+                   lambda: queues["timed"].range(last-size/2,last-size/2+k),None),
+        ("evict_older_than()",lambda: scan_evict(queues["pairs"],last-size+1+k),
+                              lambda: queues["timed"].evict_older_than(last-size+1+k),refill),
+    ]
+    print(f"Микросекунд на запрос, очередь {size}, в ответе {k} событий")
+    print()
+    print(f"| {'Запрос':<20} | {'CAQueue + aslist()':>18} | {'CTQueue':>10} |")
+    print(f"|{'-'*22}|{'-'*20}|{'-'*12}|")
+    for name,scan,indexed,setup in rows:
+        queries = args.queries if setup is None else max(1,args.queries//10)
+        cells = [measure(query,queries,args.repeat,setup or (lambda: None)) for query in (scan,indexed)]
+        print(f"| {name:<20} | {cells[0]:>18.1f} | {cells[1]:>10.1f} |")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Бенчмарк window - агрегаты скользящего окна: CSWQueue против aslist() и sum()/min()/max() на каждый запрос.
+
+"Запрос на элемент" - после каждого push(replace=True) запрашиваются сумма, минимум и максимум окна.
+"Пакет NumPy" - push_many() массивов по batch вещественных элементов в окно на CNQueue и запрос после пакета.
+
+Запуск (из каталога second_task):
+python -m bench.window [--items N] [--size N] [--batch N] [--repeat N]
+"""
+
+import argparse
+import random
+import timeit
+from typing import Callable
+
+import numpy as np
+
+from cqueue import CAQueue,CNQueue,CSWQueue
+
+
+def rescan(values:list[float],size:int)->Callable[[],None]:
+    """
+    Сценарий: CAQueue с push(replace=True), агрегаты через aslist() и встроенные функции (O(size) на запрос).
+
+    param:
+    values (list[float]): Добавляемые элементы
+    size (int): Размер окна
+
+    return:
+    (Callable[[],None]): Сценарий
+    """
+    def run()->None:
+        queue = CAQueue[float](size)
+        for value in values:
+            queue.push(value,True)
+            window = queue.aslist()
+            sum(window),min(window),max(window)
+    return run
+
+
+def running(values:list[float],size:int)->Callable[[],None]:
+    """
+    Сценарий: CSWQueue, агрегаты за O(1).
+
+    param:
+    values (list[float]): Добавляемые элементы
+    size (int): Размер окна
+
+    return:
+    (Callable[[],None]): Сценарий
+    """
+    def run()->None:
+        queue = CSWQueue[float](size)
+        for value in values:
+            queue.push(value,True)
+            queue.sum(),queue.min(),queue.max()
+    return run
+
+
+def batches(values:np.ndarray,size:int,batch:int,vectorized:bool)->Callable[[],None]:
+    """
+    Сценарий: пакеты массива NumPy в окно на CNQueue, агрегаты после каждого пакета.
+
+    param:
+    values (np.ndarray): Добавляемые элементы
+    size (int): Размер окна
+    batch (int): Размер пакета
+    vectorized (bool): push_many() массива (True) или push() каждого элемента (False)
+
+    return:
+    (Callable[[],None]): Сценарий
+    """
+    def run()->None:
+        queue = CSWQueue[float](size,CNQueue)
+        for start in range(0,len(values),batch):
+            chunk = values[start:start+batch]
+            if vectorized:
+                queue.push_many(chunk,True)
+            else:
+                for value in chunk:
+                    queue.push(value,True)
+            queue.mean(),queue.min(),queue.max(),queue.std()
+    return run
+
+
+def measure(scenario:Callable[[],None],items:int,repeat:int)->float:
+    """
+    Возвращает лучшее время сценария в наносекундах на элемент.
+
+    param:
+    scenario (Callable[[],None]): Сценарий
+    items (int): Количество элементов в сценарии
+    repeat (int): Количество повторов
+
+    return:
+    (float): Наносекунд на элемент
+    """
+    return min(timeit.repeat(scenario,number=1,repeat=repeat))/items*1e9
+
+
+def main()->None:
+    """
+    Запускает бенчмарк и печатает таблицу результатов.
+    """
+    parser = argparse.ArgumentParser(description=__doc__,formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items",type=int,default=100000,help="Количество элементов")
+    parser.add_argument("--size",type=int,default=1000,help="Размер окна")
+    parser.add_argument("--batch",type=int,default=1000,help="Размер пакета NumPy")
+    parser.add_argument("--repeat",type=int,default=3,help="Количество повторов")
+    args = parser.parse_args()
+    values = [random.random() for _ in range(args.items)]
+    array = np.array(values)
+
+    print(f"Нс на элемент, окно {args.size}")
+    print()
+    print(f"| {'Сценарий':<40} | Нс на элемент |")
+    print(f"|{'-'*42}|---------------|")
+    rows = [
+        ("aslist() + sum/min/max на элемент",rescan(values,args.size)),
+        ("CSWQueue на элемент",running(values,args.size)),
+        (f"CNQueue push() по одному, пакет {args.batch}",batches(array,args.size,args.batch,False)),
+        (f"CNQueue push_many(), пакет {args.batch}",batches(array,args.size,args.batch,True)),
+    ]
+    for name,scenario in rows:
+        print(f"| {name:<40} | {measure(scenario,args.items,args.repeat):>13.0f} |")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,26 @@
 - CDQueue: Реализация циклической очереди на основе deque из модуля collections.
 - CAQueue: Реализация циклической очереди на основе массива.
 - CLLQueue: Реализация циклической очереди на основе связанного списка (не проинициализированная связь).
+- CPLLQueue: Реализация циклической очереди на основе связанного списка (проинициализированное кольцо узлов).
+- CSQueue: Реализация циклической очереди на основе кольца блоков фиксированного размера (как collections.deque).
+- CNQueue: Реализация циклической очереди на основе типизированного массива NumPy.
+- CBQueue: Потокобезопасная блокирующая очередь поверх перечисленных реализаций.
+- CAIOQueue: Асинхронная очередь для asyncio поверх перечисленных реализаций.
+- CSHMQueue: Очередь одного производителя и одного потребителя в общей памяти процессов.
+- CMMQueue: Персистентная очередь в файле, отображенном в память (mmap).
+- CHQueue: Гибридная очередь: кольцо в памяти поверх перечисленных реализаций и сегменты на диске.
+- CByteQueue: Циклический буфер байтов поверх bytearray с чтением и записью через memoryview.
+- CPQueue: Многополосная очередь с приоритетами (строгий приоритет или взвешенный обход) поверх перечисленных реализаций.
+- CWQueue: Потокобезопасная очередь из шардов с блокировкой на шард и перехватом работы (work stealing).
+- CSWQueue: Скользящее окно с суммой, средним, минимумом, максимумом и дисперсией за O(1) поверх перечисленных реализаций.
+- CTQueue: Циклическая очередь на основе массива с метками времени и выборкой по интервалу времени за O(log n + k).
+- CVQueue: Циклическая очередь из отрезков со снимками за O(1) (copy-on-write) для читателей при работающем писателе.
+- CIQueue: Очередь со статистикой (счетчики, максимальная длина, изменения размера, гистограмма времени ожидания) поверх любой реализации.
+- CEQueue: Эластичная очередь, увеличивающая и уменьшающая размер поверх перечисленных реализаций.
+- CapacityPolicy: Политика изменения размера эластичной очереди (множитель, предел, порог уменьшения).
+- OverflowPolicy: Базовый класс политики переполнения со счетчиками отброшенных элементов.
+- DropNewest, DropOldest, Reject, Sample: Политики переполнения (параметр overflow всех реализаций).
+- dump, load: Компактный снимок очереди в файл (pickle протокола 5 с внеполосными буферами) и восстановление.
 - QEmptyError: Исключение, возникающее при попытке выполнить операции с пустой очередью.
 - QFullError: Исключение, возникающее при попытке вставки элемента в заполненную очередь.
 
@@ -15,8 +35,27 @@ from .cdqueue import CDQueue
 from .caqueue import CAQueue
 from .qexception import QEmptyError, QFullError
 from .cllqueue import CLLQueue
-
-
-
-
-__all__ = ['CDQueue', 'CAQueue', 'QEmptyError', 'QFullError','CLLQueue']
+from .cpllqueue import CPLLQueue
+from .csqueue import CSQueue
+from .cnqueue import CNQueue
+from .cbqueue import CBQueue
+from .caioqueue import CAIOQueue
+from .cshmqueue import CSHMQueue
+from .cmmqueue import CMMQueue
+from .cequeue import CEQueue, CapacityPolicy
+from .chqueue import CHQueue
+from .cpqueue import CPQueue
+from .cwqueue import CWQueue
+from .cswqueue import CSWQueue
+from .ctqueue import CTQueue
+from .cvqueue import CVQueue, CVSnapshot
+from .ciqueue import CIQueue
+from .cbytequeue import CByteQueue
+from .coverflow import OverflowPolicy, DropNewest, DropOldest, Reject, Sample
+from .csnapshot import dump, load
+
+
+
+
+__all__ = ['CDQueue', 'CAQueue', 'QEmptyError', 'QFullError','CLLQueue','CPLLQueue','CSQueue','CNQueue','CBQueue','CAIOQueue','CSHMQueue','CMMQueue','CEQueue','CapacityPolicy','CHQueue','CByteQueue','CPQueue','CWQueue','CSWQueue','CTQueue','CVQueue','CVSnapshot','CIQueue',
+           'OverflowPolicy','DropNewest','DropOldest','Reject','Sample','dump','load']
@@ -0,0 +1,270 @@
+"""
+Модуль caioqueue, реализует циклическую очередь для asyncio поверх существующих очередей пакета.
+
+Класса CAIOQueue, представляет асинхронную циклическую очередь для одного цикла событий.
+Очередь предоставляет возможности:
+- добавления элемента с ожиданием свободного места (await push())
+- добавления элемента с заменой первого без ожидания (push(replace=True))
+- удаления элемента и его возврат с ожиданием появления элемента (await pop())
+- пакетное удаление элементов с ожиданием (await pop_many())
+- добавление и удаление без ожидания
+- проверка на пустоту
+- проверка на заполненость
+- колличество элементов
+- очищение очереди
+"""
+
+import asyncio
+from collections import deque
+from typing import TypeVar,Generic,Any,Callable
+try:
+    from qexception import QFullError,QEmptyError
+    from cdqueue import CDQueue
+except ImportError:
+    from .qexception import QFullError,QEmptyError
+    from .cdqueue import CDQueue
+
+T = TypeVar("T") # Обобщенный тип данных
+
+
+class CAIOQueue(Generic[T]):
+
+    """
+    Асинхронная циклическая очередь FIFO для asyncio.
+
+    Хранение элементов делегируется одной из очередей пакета (CAQueue, CDQueue, CLLQueue, CNQueue).
+    Future ожидающих корутин создаются только при заполненной (пустой) очереди, а при
+    добавлении (удалении) k элементов будится не более k ожидающих, поэтому каждый элемент
+    не перепланирует всех ожидающих.
+    Очередь не потокобезопасна и должна использоваться из одного цикла событий.
+
+    attr:
+    _queue (CAQueue[T]|CDQueue[T]|CLLQueue[T]|CNQueue[T]): Очередь, в которой хранятся элементы
+    _getters (deque[asyncio.Future]): Ожидающие появления элемента
+    _putters (deque[asyncio.Future]): Ожидающие свободного места
+
+    method:
+    empty()->bool: Возращает True, если очередь пустая иначе False
+    is_full()->bool: Возращает True, если очередь полная иначу False
+    length()->int: Возвращает количество элементов в очереди
+    clear()->None: Очищение очереди
+    push(value:T,replace:bool=False)->None: Добавляет элемент в конец очереди, ожидая свободного места (корутина)
+    pop()->T: Удаляет и возращает первый элемент очереди, ожидая его появления (корутина)
+    pop_many(n:int)->list[T]: Удаляет и возращает до n первых элементов очереди (корутина)
+    push_nowait(value:T,replace:bool=False)->None: Добавляет элемент в конец очереди без ожидания
+    pop_nowait()->T: Удаляет и возращает первый элемент очереди без ожидания
+    """
+
+    def __init__(self,max_size:int,backend:Callable[...,Any] = CDQueue,**kwargs:Any) -> None:
+        """
+        Инициализация пустой очереди
+
+        param:
+        max_size (int): Размер очереди
+        backend (Callable[...,Any]): Класс очереди для хранения элементов (по умолчанию CDQueue)
+        kwargs (Any): Дополнительные параметры конструктора очереди (например, dtype для CNQueue)
+        """
+        self._queue = backend(max_size,**kwargs)
+        self._getters:deque[asyncio.Future] = deque()
+        self._putters:deque[asyncio.Future] = deque()
+
+    @staticmethod
+    def _wakeup(waiters:deque[asyncio.Future],k:int = 1)->None:
+        """
+        Будит не более k ожидающих корутин (пропуская отмененные).
+
+        param:
+        waiters (deque[asyncio.Future]): Ожидающие
+        k (int): Количество будимых ожидающих
+        """
+        while k>0 and waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                k-=1
+
+    @staticmethod
+    async def _wait(waiters:deque[asyncio.Future])->None:
+        """
+        Ставит текущую корутину в очередь ожидающих и ждет пробуждения.
+
+        param:
+        waiters (deque[asyncio.Future]): Ожидающие
+        """
+        waiter = asyncio.get_running_loop().create_future()
+        waiters.append(waiter)
+        try:
+            await waiter
+        except BaseException:
+            waiter.cancel()
+            try:
+                waiters.remove(waiter)
+            except ValueError:
+                pass # Уже разбужен
+            raise
+
+    async def push(self,value:T,replace:bool = False)->None:
+        """
+        Добавляет элемент в конец очереди.
+        1)Если очередь переполнена и replace= False, то ожидаем свободного места.
+        2)Если очередь переполнена и replace= True, то удаляем первый элемент очереди и вставляем новый без ожидания.
+
+        param:
+        value (T): Элемент для добавления в очередь.
+        replace (bool): Указывает на то, что нужно ли удалять первый элемент при переполнении
+        """
+        while not replace and self._queue.is_full():
+            try:
+                await self._wait(self._putters)
+            except BaseException:
+                # Передаем освободившееся место следующему, если нас отменили после пробуждения
+                if not self._queue.is_full():
+                    self._wakeup(self._putters)
+                raise
+        self.push_nowait(value,replace)
+
+    def push_nowait(self,value:T,replace:bool = False)->None:
+        """
+        Добавляет элемент в конец очереди без ожидания.
+
+        raise:
+        (QFullError): Если очередь заполнена и replace= False.
+
+        param:
+        value (T): Элемент для добавления в очередь.
+        replace (bool): Указывает на то, что нужно ли удалять первый элемент при переполнении
+        """
+        self._queue.push(value,replace)
+        if self._getters:
+            self._wakeup(self._getters)
+
+    async def _wait_item(self)->None:
+        """
+        Ожидает появления хотя бы одного элемента в очереди.
+        """
+        while self._queue.empty():
+            try:
+                await self._wait(self._getters)
+            except BaseException:
+                # Передаем появившийся элемент следующему, если нас отменили после пробуждения
+                if not self._queue.empty():
+                    self._wakeup(self._getters)
+                raise
+
+    async def pop(self)->T:
+        """
+        Удаляет и возвращает первый элемент очереди, ожидая его появления.
+
+        return:
+        (T): Удаленный первый элемент очереди.
+        """
+        await self._wait_item()
+        return self.pop_nowait()
+
+    def pop_nowait(self)->T:
+        """
+        Удаляет и возвращает первый элемент очереди без ожидания.
+
+        raise:
+        (QEmptyError): Если очередь пуста.
+
+        return:
+        (T): Удаленный первый элемент очереди.
+        """
+        value = self._queue.pop()
+        if self._putters:
+            self._wakeup(self._putters)
+        return value
+
+    async def pop_many(self,n:int)->list[T]:
+        """
+        Удаляет и возвращает до n первых элементов очереди.
+        Ожидает появления хотя бы одного элемента, затем забирает все доступные (до n).
+
+        raise:
+        (ValueError): Если n отрицательное.
+
+        param:
+        n (int): Максимальное количество удаляемых элементов
+
+        return:
+        (list[T]): Удаленные элементы в порядке очереди.
+        """
+        if n<0:
+            raise ValueError("Количество элементов не может быть отрицательным")
+        if n==0:
+            return []
+        await self._wait_item()
+        values = self._queue.pop_many(n)
+        if self._putters:
+            self._wakeup(self._putters,len(values))
+        if self._getters and not self._queue.empty():
+            self._wakeup(self._getters)
+        return values
+
+    def empty(self)->bool:
+        """
+        Проверяет, пуста ли очередь.
+
+        return:
+        (bool): True, если очередь пуста, иначе False.
+        """
+        return self._queue.empty()
+
+    def is_full(self)->bool:
+        """
+        Проверяет, полная ли очередь
+
+        return:
+        (bool): True, если очередь полная, иначе False.
+        """
+        return self._queue.is_full()
+
+    def length(self)->int:
+        """
+        Возвращает количество элементов в очереди.
+
+        return:
+        (int): Количество элементов в очереди.
+        """
+        return self._queue.length()
+
+    def __len__(self)->int:
+        """
+        Возвращает количество элементов в очереди (магический метод).
+
+        return:
+        (int): Количество элементов в очереди.
+        """
+        return self._queue.length()
+
+    def clear(self)->None:
+        """
+        Очищает очередь, удаляя все элементы, и будит ожидающих свободного места.
+
+        return:
+        (None)
+        """
+        self._queue.clear()
+        self._wakeup(self._putters,len(self._putters))
+
+    def __repr__(self) -> str:
+        """
+        Представляет очередь в виде строки для печати (магический метод).
+
+        return:
+        (str): Строковое представление очереди.
+        """
+        return f"CAIOQueue({self._queue!r})"
+
+
+if __name__ == "__main__":
+    async def main()->None:
+        a = CAIOQueue[int](3)
+        consumer = asyncio.create_task(a.pop_many(10))
+        for i in range(5):
+            await a.push(i)
+        print(await consumer)
+        print(a)
+
+    asyncio.run(main())
@@ -15,14 +15,28 @@
 - вставка элемента по индексу
 - удаление конкретного элемента
 - изменение размерности очереди  
+- пакетное добавление и удаление элементов
+- доступ к элементам и срезам по индексу (в том числе отрицательному)
+- проверка вхождения и подсчет значений через хеш-индекс (по запросу)
+- отрезки массива и выгрузка в list, array.array и np.ndarray срезами
+- обратный обход и обход окна без копирования очереди
+- снимок очереди (pickle, dump/load) без пустых ячеек массива
 """
 
-from typing import Optional,TypeVar,Generic,Generator,Any
+from typing import Optional,TypeVar,Generic,Generator,Any,Iterable,Iterator
+from array import array
+from bisect import bisect_left,bisect_right
 import sys
+import numpy as np
+import numpy.typing as npt
 try:
     from qexception import QFullError,QEmptyError
+    from coverflow import OverflowPolicy
+    import csnapshot
 except ImportError:
     from .qexception import QFullError,QEmptyError
+    from .coverflow import OverflowPolicy
+    from . import csnapshot
 T = TypeVar("T") # Обобщенный тип данных
 
 class BArray(Generic[T]):
@@ -34,8 +48,11 @@ class BArray(Generic[T]):
 
     Methods:
     __init__(size: int) -> None: Инициализация массива заданного размера
-    __getitem__(index: int) -> Optional[T]: Получение элемента по индексу
-    __setitem__(index: int, value: T) -> None: Установка значения элемента по индексу
+    __getitem__(index: int|slice) -> Optional[T]|list[Optional[T]]: Получение элемента (среза) по индексу
+    __setitem__(index: int|slice, value: T|list[T]) -> None: Установка значения элемента (среза) по индексу
+    index(value: T, start: int, stop: int) -> int: Индекс первого вхождения значения в диапазоне
+    iter_range(indices: range) -> Iterator[Optional[T]]: Итератор по элементам с индексами из диапазона без копирования
+    bisect(value: T, lo: int, hi: int, right: bool) -> int: Двоичный поиск в отсортированном диапазоне
     clear() -> None: Очистка массива, устанавливает все элементы в None
     __len__() -> int: Размер массива
     __del__() -> None: Метод удаления объекта, вызывает метод clear()
@@ -49,14 +66,26 @@ class BArray(Generic[T]):
         """
         self._array:list[Optional[T]] = [None]*size
     
-    def __getitem__(self, index: int) -> Optional[T]:
-        """Получение элемента по индексу."""
+    def __getitem__(self, index: int|slice) -> Optional[T]|list[Optional[T]]:
+        """Получение элемента (или копии среза) по индексу."""
         return self._array[index]
 
-    def __setitem__(self, index: int, value: T) -> None:
-        """Установка значения элемента по индексу."""
+    def __setitem__(self, index: int|slice, value: T|list[T]) -> None:
+        """Установка значения элемента (или среза той же длины) по индексу."""
         self._array[index] = value
     
+    def index(self, value: T, start: int, stop: int) -> int:
+        """Индекс первого вхождения значения в диапазоне [start, stop) (ValueError, если значения нет)."""
+        return self._array.index(value, start, stop)
+    
+    def iter_range(self, indices: range) -> Iterator[Optional[T]]:
+        """Итератор по элементам с индексами из диапазона без копирования среза."""
+        return map(self._array.__getitem__, indices)
+    
+    def bisect(self, value: T, lo: int, hi: int, right: bool = False) -> int:
+        """Точка вставки значения в отсортированный диапазон [lo, hi) (right=True - после равных), без копирования."""
+        return (bisect_right if right else bisect_left)(self._array, value, lo, hi)
+    
     def clear(self) -> None:
         """Очистка массива, устанавливает все элементы в None."""
         self._array = [None] * len(self._array)
@@ -65,17 +94,26 @@ class BArray(Generic[T]):
         """Метод удаления объекта, вызывает метод clear()."""
         self.clear()
 
-class CAQueue(Generic[T]):
+class CAQueue(csnapshot.CSnapshotMixin,Generic[T]):
     
     """
     Реализация циклической структуры данных FIFO на основе массива(Array)
     
+    При indexed=True очередь ведет хеш-индекс (значение -> количество вхождений), который
+    обновляется во всех изменяющих операциях: проверка вхождения и count() выполняются за O(1),
+    remove() отсутствующего значения не просматривает очередь. remove() имеющегося значения остается O(n):
+    позиция ищется в массиве, а удаление все равно сдвигает элементы (индекс позиций устаревал бы при каждом сдвиге).
+    Значения должны быть хешируемыми.
+    Без индекса операции не несут дополнительных затрат, кроме проверки атрибута.
+    
     attr:
     _count (int): количество элементов в очереди
     _max_size (int): максимальное количество элементов в очереди 
     _front (Optional[Node[T]]): Индекс первого элемента в очереди
     _back (Optional[Node[T]]): Индекс последнего элемента в очереди
     _buf (BArray[T]): Контейнер очереди
+    _hindex (Optional[dict[T,int]]): Хеш-индекс: значение -> количество вхождений (None - индекс отключен)
+    _overflow (Optional[OverflowPolicy[T]]): Политика переполнения push()/push_many() (None - QFullError)
     
     method:
     empty()->None: Возращает True, если очередь пустая иначе False
@@ -90,14 +128,34 @@ class CAQueue(Generic[T]):
     resize(new_size:int)->None: Увеличивает размер очереди
     insert(index:int, value:T)->None: Вставляет элемент в очередь по индексу
     remove(value:T)->None: Удаляет первое вхождение значения из очереди
+    push_many(values:Iterable[T],replace:bool=False)->None: Добавляет элементы в конец очереди
+    pop_many(n:int)->list[T]: Удаляет и возращает до n первых элементов очереди
+    extend(values:Iterable[T])->None: Добавляет элементы в конец очереди (аналог push_many)
+    from_iterable(values:Iterable[T],max_size:Optional[int]=None,replace:bool=False)->CAQueue[T]: Создает очередь из элементов
+    __getitem__(index:int|slice)->T|list[T]: Возвращает элемент (срез) очереди по индексу за O(1) (O(k))
+    __setitem__(index:int|slice,value:T|Iterable[T])->None: Заменяет элемент (срез) очереди по индексу
+    __contains__(value:T)->bool: Проверяет вхождение значения в очередь (O(1) с хеш-индексом)
+    count(value:T)->int: Возвращает количество вхождений значения (O(1) с хеш-индексом)
+    segments()->tuple[list[T],...]: Возвращает элементы очереди не более чем двумя срезами массива
+    to_list()->list[T]: Возвращает элементы очереди списком (не более двух срезов)
+    to_array(typecode:str)->array: Возвращает элементы очереди в array.array
+    to_numpy(dtype:Optional[npt.DTypeLike]=None)->np.ndarray: Возвращает элементы очереди в np.ndarray
+    __reversed__()->Iterator[T]: Обход очереди от последнего элемента к первому
+    window(start:int=0,stop:Optional[int]=None,step:int=1)->Iterator[T]: Обход части очереди, как itertools.islice
+    __getstate__()->dict[str,Any]: Возвращает состояние для pickle (элементы в логическом порядке)
+    __setstate__(state:dict[str,Any])->None: Восстанавливает очередь из состояния pickle
+    dump(path:str)->int: Записывает снимок очереди в файл
+    load(path:str)->CAQueue: Восстанавливает очередь из снимка (classmethod)
     """
     
-    def __init__(self,max_size:int) -> None:
+    def __init__(self,max_size:int,indexed:bool = False,overflow:Optional[OverflowPolicy[T]] = None) -> None:
         """
         Инициализация пустой очереди
         
         param:
         max_size (int): Размер очереди
+        indexed (bool): Вести хеш-индекс значений для __contains__, count() и remove()
+        overflow (Optional[OverflowPolicy[T]]): Политика переполнения push()/push_many() (None - QFullError)
         """
         assert max_size>0,"Очередь не может быть отрицательной или равной 0"
         self._count: int = 0
@@ -105,6 +163,34 @@ class CAQueue(Generic[T]):
         self._buf:BArray[T] = BArray(max_size)        
         self._front: Optional[int] = None
         self._back: Optional[int] = None
+        self._hindex: Optional[dict[T,int]] = {} if indexed else None
+        self._overflow: Optional[OverflowPolicy[T]] = overflow
+    
+    def _hadd(self,values:Iterable[T])->None:
+        """
+        Добавляет значения в хеш-индекс.
+        
+        param:
+        values (Iterable[T]): Добавленные в очередь значения
+        """
+        hindex = self._hindex
+        for value in values:
+            hindex[value] = hindex.get(value,0)+1
+    
+    def _hdel(self,values:Iterable[T])->None:
+        """
+        Удаляет значения из хеш-индекса.
+        
+        param:
+        values (Iterable[T]): Удаленные из очереди значения
+        """
+        hindex = self._hindex
+        for value in values:
+            count = hindex[value]-1
+            if count:
+                hindex[value] = count
+            else:
+                del hindex[value]
         
     def empty(self)->bool:
         """
@@ -155,7 +241,7 @@ class CAQueue(Generic[T]):
     def push(self,value:T,replace:bool = False)->None:
         """
         Добавляет элемент в конец очереди. 
-        1)Если очередь переполнена и replace= False, то поднимаем исключение. 
+        1)Если очередь переполнена и replace= False, то поднимаем исключение (или применяем политику overflow). 
         2)Если очередь переполнена и replace= True, то удаляем первый элемент очереди и вставляем новый. 
 
         raise:
@@ -167,11 +253,15 @@ class CAQueue(Generic[T]):
         """
         if self.is_full():
             if replace:
+                if self._hindex is not None:
+                    self._hdel((self._buf[self._front],))
                 self._buf[self._front] = None
                 self._front = (self._front+1)%self._max_size 
                 self._count-=1
-            else: 
+            elif self._overflow is None:
                 raise QFullError()
+            elif not self._overflow.admit(self,value):
+                return
         
         if self.empty():
             self._front,self._back = 0,0
@@ -179,6 +269,8 @@ class CAQueue(Generic[T]):
         else:
             self._back = (self._back+1)%self._max_size
             self._buf[self._back] = value
+        if self._hindex is not None:
+            self._hadd((value,))
         self._count+=1 
         
     def pop(self)->T:
@@ -196,6 +288,8 @@ class CAQueue(Generic[T]):
         
         value:T = self._buf[self._front]
         self._buf[self._front] = None
+        if self._hindex is not None:
+            self._hdel((value,))
         self._count-=1
         if self._count == 0:
             self._front,self._back = None,None
@@ -204,6 +298,156 @@ class CAQueue(Generic[T]):
         
         return value
     
+    def _read(self,start:int,k:int)->list[T]:
+        """
+        Копирует k элементов, начиная с физического индекса start, не более чем двумя срезами.
+        
+        param:
+        start (int): Физический индекс первого элемента
+        k (int): Количество элементов
+        
+        return:
+        (list[T]): Элементы в логическом порядке
+        """
+        end = start+k
+        if end<=self._max_size:
+            return self._buf[start:end]
+        return self._buf[start:self._max_size]+self._buf[0:end-self._max_size]
+    
+    def _write(self,start:int,values:list[T])->None:
+        """
+        Записывает элементы, начиная с физического индекса start, не более чем двумя срезами.
+        
+        param:
+        start (int): Физический индекс первого элемента
+        values (list[T]): Элементы для записи (не больше размера очереди)
+        """
+        first = min(len(values),self._max_size-start)
+        self._buf[start:start+first] = values[:first]
+        if first<len(values):
+            self._buf[0:len(values)-first] = values[first:]
+    
+    def _discard(self,k:int)->None:
+        """
+        Удаляет k первых элементов очереди без их возврата.
+        
+        param:
+        k (int): Количество удаляемых элементов (не больше количества элементов в очереди)
+        """
+        if k<=0:
+            return
+        if self._hindex is not None:
+            self._hdel(self._read(self._front,k))
+        self._write(self._front,[None]*k)
+        self._count-=k
+        if self._count == 0:
+            self._front,self._back = None,None
+        else:
+            self._front = (self._front+k)%self._max_size
+    
+    def push_many(self,values:Iterable[T],replace:bool = False)->None:
+        """
+        Добавляет элементы в конец очереди, копируя их не более чем двумя срезами.
+        1)Если элементы не помещаются и replace= False, то поднимаем исключение, очередь не изменяется (или применяем политику overflow). 
+        2)Если элементы не помещаются и replace= True, то удаляем первые элементы очереди и вставляем новые. 
+
+        raise:
+        (QFullError): Если элементы не помещаются в очередь.
+        
+        param:
+        values (Iterable[T]): Элементы для добавления в очередь.
+        replace (bool): Указывает на то, что нужно ли удалять первые элементы при переполнении или поднять исключение
+        """
+        values = list(values)
+        k = len(values)
+        if k == 0:
+            return
+        
+        free = self._max_size-self._count
+        if k>free:
+            if not replace:
+                if self._overflow is None:
+                    raise QFullError()
+                self._overflow.admit_many(self,values,free)
+                return
+            if k>=self._max_size:
+                # В очереди останутся только последние max_size новых элементов
+                self._buf[0:self._max_size] = values[k-self._max_size:]
+                self._count = self._max_size
+                self._front,self._back = 0,self._max_size-1
+                if self._hindex is not None:
+                    self._hindex.clear()
+                    self._hadd(values[k-self._max_size:])
+                return
+            self._discard(k-free)
+        
+        start = 0 if self.empty() else (self._back+1)%self._max_size
+        self._write(start,values)
+        if self.empty():
+            self._front = start
+        self._back = (start+k-1)%self._max_size
+        self._count+=k
+        if self._hindex is not None:
+            self._hadd(values)
+    
+    def extend(self,values:Iterable[T])->None:
+        """
+        Добавляет элементы в конец очереди (аналог push_many с replace=False).
+
+        raise:
+        (QFullError): Если элементы не помещаются в очередь.
+        
+        param:
+        values (Iterable[T]): Элементы для добавления в очередь.
+        """
+        self.push_many(values)
+    
+    def pop_many(self,n:int)->list[T]:
+        """
+        Удаляет и возвращает до n первых элементов очереди.
+        Если в очереди меньше n элементов, то возвращаются все элементы.
+
+        raise:
+        (QEmptyError): Если очередь пуста.
+        (ValueError): Если n отрицательное.
+        
+        param:
+        n (int): Максимальное количество удаляемых элементов
+
+        return:
+        (list[T]) : Удаленные элементы в порядке очереди.
+        """
+        if n<0:
+            raise ValueError("Количество элементов не может быть отрицательным")
+        if self.empty():
+            raise QEmptyError()
+        
+        k = min(n,self._count)
+        values = self._read(self._front,k)
+        self._discard(k)
+        return values
+    
+    @classmethod
+    def from_iterable(cls,values:Iterable[T],max_size:Optional[int] = None,replace:bool = False)->'CAQueue[T]':
+        """
+        Создает очередь из элементов.
+        
+        raise:
+        (QFullError): Если элементы не помещаются в очередь и replace= False.
+        
+        param:
+        values (Iterable[T]): Элементы для добавления в очередь.
+        max_size (Optional[int]): Размер очереди, по умолчанию равен количеству элементов (не меньше 1)
+        replace (bool): Указывает на то, что нужно ли удалять первые элементы при переполнении
+        
+        return:
+        (CAQueue[T]): Новая очередь
+        """
+        values = list(values)
+        queue = cls(max(1,len(values)) if max_size is None else max_size)
+        queue.push_many(values,replace)
+        return queue
+    
     def length(self)->int:
         """
         Возвращает количество элементов в очереди.
@@ -213,9 +457,49 @@ class CAQueue(Generic[T]):
         """
         return self._count
     
+    def _parts(self,src:int,dst:int,k:int)->list[tuple[int,int,int]]:
+        """
+        Разбивает перемещение k подряд идущих элементов с физического индекса src на физический индекс dst
+        (сдвиг на одну позицию) на границах массива (с учетом перехода через конец) не более чем на три части.
+        При сдвиге вправо части идут с конца, чтобы не затереть еще не перенесенные элементы.
+        
+        param:
+        src (int): Физический индекс первого перемещаемого элемента
+        dst (int): Физический индекс, куда перемещается первый элемент
+        k (int): Количество элементов
+        
+        return:
+        (list[tuple[int,int,int]]): Части (откуда, куда, сколько) в порядке переноса
+        """
+        right = dst==(src+1)%self._max_size
+        parts:list[tuple[int,int,int]] = []
+        while k>0:
+            n = min(k,self._max_size-src,self._max_size-dst)
+            parts.append((src,dst,n))
+            src = (src+n)%self._max_size
+            dst = (dst+n)%self._max_size
+            k-=n
+        if right:
+            parts.reverse()
+        return parts
+    
+    def _move(self,src:int,dst:int,k:int)->None:
+        """
+        Перемещает k подряд идущих элементов с физического индекса src на физический индекс dst (сдвиг на одну позицию).
+        Каждая часть из _parts() переносится одним присваиванием среза.
+        
+        param:
+        src (int): Физический индекс первого перемещаемого элемента
+        dst (int): Физический индекс, куда перемещается первый элемент
+        k (int): Количество элементов
+        """
+        for src,dst,n in self._parts(src,dst,k):
+            self._buf[dst:dst+n] = self._buf[src:src+n]
+    
     def resize(self,new_size:int)->None:
         """
-        Увеличивает размер очереди.
+        Изменяет размер очереди. При уменьшении удаляются первые элементы.
+        Элементы копируются в новый массив не более чем двумя срезами.
         
         raise:
         (ValueError): Если размер отрицательный
@@ -228,18 +512,17 @@ class CAQueue(Generic[T]):
         
         new_buf:BArray[T] = BArray[T](new_size)
         offset = max(0,self._count-new_size) # Если новый размер меньше, то смещаем 
-        cur = (self._front + offset)%self._max_size
-        
-        for i in range(min(self._count,new_size)):
-            new_buf[i] =self._buf[cur]
-            cur = (cur+1)%self._max_size
+        if offset and self._hindex is not None:
+            self._hdel(self._read(self._front,offset))
+        count = min(self._count,new_size)
+        if count:
+            new_buf[0:count] = self._read((self._front+offset)%self._max_size,count)
         
         # Обновляем данные
-        self._count = min(self._count,new_size)
-        self._max_size=new_size
+        self._count = count
+        self._max_size = new_size
         self._buf = new_buf
-        self._front = 0
-        self._back = self._count-1
+        self._front,self._back = (0,count-1) if count else (None,None)
         
     def insert(self,index:int, value:T)->None:
         """ 
@@ -264,40 +547,30 @@ class CAQueue(Generic[T]):
         else:
             #Нормализуем индекс
             index = self._count if index>self._count else 0 if index<0 else index 
-            norm_index = (self._front+index)% self._max_size  
-            
             
             ### ОПТИМИЗАЦИЯ (ВЫБОР СТОРОНЫ ДЛЯ СДВИГА) ###
-            #Сотрим куда ближе всего сдвигать
-            if abs(self._front-norm_index)<abs(self._back -norm_index):
-                #Делаем сдвиг влево
-                self._front = (self._front-1)% self._max_size
-                cur = self._front
-                next = (cur+1)%self._max_size
-                norm_index = (norm_index-1)%self._max_size # Из-за логики сдвига элементов вправо 
-                while cur != norm_index:
-                    self._buf[cur] = self._buf[next]
-                    cur = next
-                    next = (next+1)%self._max_size                    
-            else:  
-                #Делаем сдвиг вправо     
-                self._back = (self._back+1)% self._max_size   
-                rcur = self._back
-                rnext = (rcur-1)%self._max_size
-                while rcur != norm_index:
-                    self._buf[rcur] = self._buf[rnext]
-                    rcur = rnext
-                    rnext = (rcur-1)%self._max_size
+            # Сдвигаем блок элементов со стороны ближайшего конца очереди
+            if index<self._count-index:
+                # Сдвиг влево: элементы [0,index) на одну позицию к началу массива
+                front = self._front
+                self._front = (front-1)%self._max_size
+                self._move(front,self._front,index)
+            else:
+                # Сдвиг вправо: элементы [index,count) на одну позицию к концу массива
+                src = (self._front+index)%self._max_size
+                self._move(src,(src+1)%self._max_size,self._count-index)
+                self._back = (self._back+1)%self._max_size
             ##################################################
                     
-            self._buf[norm_index] = value
+            self._buf[(self._front+index)%self._max_size] = value
             self._count+=1
-    
-    
+            if self._hindex is not None:
+                self._hadd((value,))
     
     def remove(self,value:T)->None:
         """ 
-        Удаляет первое вхождение значения из очереди
+        Удаляет первое вхождение значения из очереди.
+        Элемент ищется в массиве за O(n) (с хеш-индексом отсутствующее значение отклоняется за O(1)).
         
         raise:
         (QEmptyError): Если очередь пуста.  
@@ -309,41 +582,29 @@ class CAQueue(Generic[T]):
         if self.empty():
             raise QEmptyError()
         
-        index:int = None
-        
-        for i, el in enumerate(self):
-            if el == value:
-                index = (self._front+i)%self._max_size
-                break
-        
-        if index is None:
+        pos:Optional[int] = None if self._hindex is not None and value not in self._hindex else self._find(value)
+        if pos is None:
             raise ValueError("Очередь не имеет элемент с указаным значением")
-        
-        cur = index
-        
+        if self._hindex is not None:
+            self._hdel((value,))
+        index = (pos-self._front)%self._max_size # Логический индекс
         
         ### ОПТИМИЗАЦИЯ (ВЫБОР СТОРОНЫ ДЛЯ СДВИГА) ###
-        # Сотрим куда ближе всего сдвигать
-        if abs(self._front-index)<abs(self._back -index):
-            # Cдвиг влево
-            while cur!=self._front:
-                self._buf[cur] = self._buf[(cur-1)%self._max_size]
-                cur = (cur-1)%self._max_size
-            
-            self._front = (self._front+1)% self._max_size
+        # Сдвигаем блок элементов со стороны ближайшего конца очереди
+        if index<self._count-1-index:
+            # Сдвиг вправо: элементы [0,index) на одну позицию к концу массива
+            self._move(self._front,(self._front+1)%self._max_size,index)
+            self._buf[self._front] = None
+            self._front = (self._front+1)%self._max_size
         else:
-            # Сдвиг вправо
-            while cur!=self._back:
-                self._buf[cur] = self._buf[(cur+1)%self._max_size]
-                cur = (cur+1)%self._max_size     
-                       
-            self._back = (self._back-1)% self._max_size
-            
+            # Сдвиг влево: элементы (index,count) на одну позицию к началу массива
+            self._move((pos+1)%self._max_size,pos,self._count-1-index)
+            self._buf[self._back] = None
+            self._back = (self._back-1)%self._max_size
         ##################################################
         self._count-=1 
-        self._buf[cur] = None
-        
-        
+        if self._count==0:
+            self._front,self._back = None,None
     
     def __len__(self)->int:
         """
@@ -354,28 +615,284 @@ class CAQueue(Generic[T]):
         """
         return self.length()
     
+    def _index(self,index:int)->int:
+        """
+        Нормализует логический индекс элемента (отрицательный индекс считается с конца очереди).
+        
+        raise:
+        (IndexError): Если индекс вне диапазона очереди
+        
+        param:
+        index (int): Логический индекс
+        
+        return:
+        (int): Логический индекс от 0 до length()-1
+        """
+        if index<0:
+            index+=self._count
+        if not 0<=index<self._count:
+            raise IndexError("Индекс вне диапазона очереди")
+        return index
+    
+    def __getitem__(self,index:int|slice)->T|list[T]:
+        """
+        Возвращает элемент очереди по логическому индексу (0 - первый, -1 - последний) или срез в виде списка.
+        Физический индекс вычисляется напрямую, срез с шагом 1 копируется не более чем двумя срезами массива.
+        
+        raise:
+        (IndexError): Если индекс вне диапазона очереди
+        
+        param:
+        index (int|slice): Индекс или срез
+        
+        return:
+        (T|list[T]): Элемент или список элементов
+        """
+        if isinstance(index,slice):
+            start,stop,step = index.indices(self._count)
+            positions = range(start,stop,step)
+            if len(positions)==0:
+                return []
+            low = min(positions[0],positions[-1])
+            span = self._read((self._front+low)%self._max_size,abs(positions[-1]-positions[0])+1)
+            return span if step==1 else span[positions[0]-low::step]
+        return self._buf[(self._front+self._index(index))%self._max_size]
+    
+    def __setitem__(self,index:int|slice,value:T|Iterable[T])->None:
+        """
+        Заменяет элемент очереди по логическому индексу или элементы среза.
+        Срез заменяется элементами того же количества (размер очереди не меняется).
+        
+        raise:
+        (IndexError): Если индекс вне диапазона очереди
+        (ValueError): Если количество элементов не совпадает с длиной среза
+        
+        param:
+        index (int|slice): Индекс или срез
+        value (T|Iterable[T]): Элемент или элементы среза
+        """
+        if isinstance(index,slice):
+            positions = range(*index.indices(self._count))
+            values = list(value)
+            if len(values)!=len(positions):
+                raise ValueError("Количество элементов не совпадает с длиной среза")
+            if len(positions)==0:
+                return
+            if self._hindex is not None:
+                self._hdel(self[index])
+                self._hadd(values)
+            if positions.step==1:
+                self._write((self._front+positions[0])%self._max_size,values)
+            else:
+                for i,el in zip(positions,values):
+                    self._buf[(self._front+i)%self._max_size] = el
+            return
+        index = (self._front+self._index(index))%self._max_size
+        if self._hindex is not None:
+            self._hdel((self._buf[index],))
+            self._hadd((value,))
+        self._buf[index] = value
+    
+    def _find(self,value:T)->Optional[int]:
+        """
+        Ищет первое вхождение значения поиском по не более чем двум срезам массива.
+        
+        param:
+        value (T): Искомое значение
+        
+        return:
+        (Optional[int]): Физический индекс элемента или None, если значения нет
+        """
+        if self.empty():
+            return None
+        end = self._front+self._count
+        for start,stop in ((self._front,min(end,self._max_size)),(0,end-self._max_size)):
+            if start<stop:
+                try:
+                    return self._buf.index(value,start,stop)
+                except ValueError:
+                    pass
+        return None
+    
+    def __contains__(self,value:T)->bool:
+        """
+        Проверяет вхождение значения в очередь (магический метод).
+        С хеш-индексом - за O(1), иначе поиском по массиву.
+        
+        param:
+        value (T): Искомое значение
+        
+        return:
+        (bool): True, если значение есть в очереди, иначе False
+        """
+        if self._hindex is not None:
+            return value in self._hindex
+        return self._find(value) is not None
+    
+    def count(self,value:T)->int:
+        """
+        Возвращает количество вхождений значения в очередь.
+        С хеш-индексом - за O(1), иначе подсчетом по массиву.
+        
+        param:
+        value (T): Искомое значение
+        
+        return:
+        (int): Количество вхождений
+        """
+        if self._hindex is not None:
+            return self._hindex.get(value,0)
+        return self._read(self._front,self._count).count(value) if self._count else 0
+    
+    def _ranges(self,start:int,stop:int,step:int)->tuple[range,...]:
+        """
+        Переводит логические индексы range(start,stop,step) в не более чем два диапазона физических индексов.
+        
+        param:
+        start (int): Первый логический индекс (0<=start<=stop)
+        stop (int): Логический индекс после последнего (stop<=_count)
+        step (int): Шаг (больше 0)
+        
+        return:
+        (tuple[range,...]): Диапазоны физических индексов в логическом порядке
+        """
+        if self._count==0:
+            return ()
+        first = self._max_size-self._front # Количество элементов до конца массива
+        head = range(self._front+start,self._front+min(stop,first),step)
+        if stop<=first:
+            return (head,)
+        # Первый логический индекс второго отрезка с тем же шагом
+        second = start if start>=first else start-(start-first)//step*step
+        return (head,range(second-first,stop-first,step))
+    
+    def segments(self)->tuple[list[T],...]:
+        """
+        Возвращает элементы очереди не более чем двумя непрерывными срезами массива (в логическом порядке).
+        Срезы списка копируют только ссылки на элементы.
+
+        return:
+        (tuple[list[T],...]): Срезы массива (пустой кортеж для пустой очереди)
+        """
+        return tuple(self._buf[r.start:r.stop] for r in self._ranges(0,self._count,1))
+    
+    def to_list(self)->list[T]:
+        """
+        Возвращает список всех элементов очереди, собранный не более чем из двух срезов массива.
+
+        return:
+        (list[T]): Список элементов очереди.
+        """
+        return self._read(self._front,self._count) if self._count else []
+    
+    def to_array(self,typecode:str)->array:
+        """
+        Возвращает элементы очереди в array.array, заполняя его срезами массива.
+
+        raise:
+        (TypeError): Если элементы не соответствуют typecode
+        
+        param:
+        typecode (str): Код типа array.array (например, "q" или "d")
+
+        return:
+        (array): Массив элементов очереди.
+        """
+        result = array(typecode)
+        for segment in self.segments():
+            result.extend(segment)
+        return result
+    
+    def to_numpy(self,dtype:Optional[npt.DTypeLike] = None)->np.ndarray:
+        """
+        Возвращает элементы очереди в np.ndarray, копируя срезы массива в заранее выделенный массив.
+
+        param:
+        dtype (Optional[npt.DTypeLike]): Тип элементов массива (None - определяется NumPy по элементам)
+
+        return:
+        (np.ndarray): Массив элементов очереди.
+        """
+        if dtype is None:
+            return np.array(self.to_list())
+        result = np.empty(self._count,dtype=dtype)
+        offset = 0
+        for segment in self.segments():
+            result[offset:offset+len(segment)] = segment
+            offset+=len(segment)
+        return result
+    
     def __iter__(self)->Generator[T,None,None]:
         """
         Генератор, который позволяет итерировать по элементам очереди (магический метод).
+        Элементы берутся по диапазонам физических индексов, без деления по модулю и без копирования.
 
         return:
         (Generator[T,None,None]): Генератор, который возвращает элементы очереди один за другим.
         """
-        cur = self._front
-        for _ in range(self._count):
-            yield self._buf[cur]
-            cur = (cur+1)%self._max_size      
+        for indices in self._ranges(0,self._count,1):
+            yield from self._buf.iter_range(indices)
+    
+    def __reversed__(self)->Generator[T,None,None]:
+        """
+        Генератор, который обходит элементы очереди от последнего к первому (магический метод).
+
+        return:
+        (Generator[T,None,None]): Генератор, который возвращает элементы очереди в обратном порядке.
+        """
+        for indices in reversed(self._ranges(0,self._count,1)):
+            yield from self._buf.iter_range(indices[::-1])
+    
+    def window(self,start:int = 0,stop:Optional[int] = None,step:int = 1)->Generator[T,None,None]:
+        """
+        Обходит элементы очереди с логическими индексами range(start,stop,step), как itertools.islice,
+        но без пропуска первых start элементов и без копирования очереди.
+
+        raise:
+        (ValueError): Если start или stop отрицательные или step не положительный
+        
+        param:
+        start (int): Первый логический индекс
+        stop (Optional[int]): Логический индекс после последнего (None - до конца очереди)
+        step (int): Шаг
+
+        return:
+        (Generator[T,None,None]): Генератор элементов окна
+        """
+        if start<0 or (stop is not None and stop<0) or step<=0:
+            raise ValueError("Индексы окна должны быть неотрицательными, а шаг - положительным")
+        stop = self._count if stop is None else min(stop,self._count)
+        for indices in self._ranges(min(start,stop),stop,step):
+            yield from self._buf.iter_range(indices)
         
     def aslist(self)->list[T]:
         """
-        Возвращает список всех элементов очереди.
+        Возвращает список всех элементов очереди (не более двух срезов массива).
 
         return:
         (list[T]): Список элементов очереди.
         """
-        
-        return [i for i in self]
+        return self.to_list()
     
+    def __getstate__(self)->dict[str,Any]:
+        """
+        Возвращает состояние для pickle: параметры очереди и только элементы очереди в логическом порядке (без пустых ячеек массива).
+
+        return:
+        (dict[str,Any]): Состояние очереди
+        """
+        return {"max_size":self._max_size,"indexed":self._hindex is not None,"overflow":self._overflow,"values":self.to_list()}
+
+    def __setstate__(self,state:dict[str,Any])->None:
+        """
+        Восстанавливает очередь из состояния __getstate__() (элементы записываются не более чем двумя срезами, хеш-индекс строится заново).
+
+        param:
+        state (dict[str,Any]): Состояние очереди
+        """
+        self.__init__(state["max_size"],state["indexed"],state["overflow"])
+        self.push_many(state["values"])
+
     def __repr__(self) -> str:
         """
         Представляет очередь в виде строки для печати (магический метод).
@@ -397,6 +914,8 @@ class CAQueue(Generic[T]):
         self._back = None
         self._front = None
         self._buf.clear()
+        if self._hindex is not None:
+            self._hindex.clear()
     
     def __del__(self)->None:
         """
@@ -0,0 +1,262 @@
+"""
+Модуль cbqueue, реализует потокобезопасную блокирующую циклическую очередь поверх существующих очередей пакета.
+
+Класса CBQueue, представляет блокирующую циклическую очередь для схемы производитель/потребитель.
+Очередь предоставляет возможности:
+- добавления элемента с ожиданием свободного места (с таймаутом)
+- удаления элемента и его возврат с ожиданием появления элемента (с таймаутом)
+- пакетное удаление элементов с ожиданием
+- проверка на пустоту
+- проверка на заполненость
+- колличество элементов
+- очищение очереди
+- копия элементов и снимок очереди для читателей (снимок - только у бэкенда со snapshot(), например CVQueue)
+"""
+
+import threading
+import time
+from typing import Optional,TypeVar,Generic,Any,Callable
+try:
+    from qexception import QFullError,QEmptyError
+    from cdqueue import CDQueue
+except ImportError:
+    from .qexception import QFullError,QEmptyError
+    from .cdqueue import CDQueue
+
+T = TypeVar("T") # Обобщенный тип данных
+
+
+class CBQueue(Generic[T]):
+
+    """
+    Потокобезопасная блокирующая циклическая очередь FIFO.
+
+    Хранение элементов делегируется одной из очередей пакета (CAQueue, CDQueue, CLLQueue, CNQueue).
+    Все операции выполняются под одной блокировкой, а ожидание реализовано двумя условными
+    переменными: производители ждут на _not_full, потребители - на _not_empty, поэтому
+    заполненная или пустая очередь не нагружает процессор опросом.
+
+    attr:
+    _queue (CAQueue[T]|CDQueue[T]|CLLQueue[T]|CNQueue[T]): Очередь, в которой хранятся элементы
+    _lock (threading.Lock): Блокировка очереди
+    _not_empty (threading.Condition): Условие "очередь не пуста"
+    _not_full (threading.Condition): Условие "очередь не заполнена"
+
+    method:
+    empty()->bool: Возращает True, если очередь пустая иначе False
+    is_full()->bool: Возращает True, если очередь полная иначу False
+    length()->int: Возвращает количество элементов в очереди
+    clear()->None: Очищение очереди
+    put(value:T,timeout:Optional[float]=None,replace:bool=False)->None: Добавляет элемент в конец очереди, ожидая свободного места
+    get(timeout:Optional[float]=None)->T: Удаляет и возращает первый элемент очереди, ожидая его появления
+    get_many(n:int,timeout:Optional[float]=None)->list[T]: Удаляет и возращает до n первых элементов очереди
+    aslist()->list[T]: Возращает копию элементов очереди (под блокировкой)
+    snapshot()->Any: Возвращает снимок очереди бэкенда, блокировка держится только на время его создания
+    """
+
+    def __init__(self,max_size:int,backend:Callable[...,Any] = CDQueue,**kwargs:Any) -> None:
+        """
+        Инициализация пустой очереди
+
+        param:
+        max_size (int): Размер очереди
+        backend (Callable[...,Any]): Класс очереди для хранения элементов (по умолчанию CDQueue)
+        kwargs (Any): Дополнительные параметры конструктора очереди (например, dtype для CNQueue)
+        """
+        self._queue = backend(max_size,**kwargs)
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+    @staticmethod
+    def _wait(condition:threading.Condition,predicate:Callable[[],bool],timeout:Optional[float])->bool:
+        """
+        Ожидает выполнения предиката на условной переменной (блокировка должна быть захвачена).
+
+        param:
+        condition (threading.Condition): Условная переменная
+        predicate (Callable[[],bool]): Условие окончания ожидания
+        timeout (Optional[float]): Время ожидания в секундах, None - бесконечно
+
+        return:
+        (bool): True, если условие выполнено, иначе False (истек таймаут)
+        """
+        if predicate():
+            return True
+        if timeout is None:
+            while not predicate():
+                condition.wait()
+            return True
+        if timeout<=0:
+            return False
+        deadline = time.monotonic()+timeout
+        while not predicate():
+            remaining = deadline-time.monotonic()
+            if remaining<=0:
+                return False
+            condition.wait(remaining)
+        return True
+
+    def put(self,value:T,timeout:Optional[float] = None,replace:bool = False)->None:
+        """
+        Добавляет элемент в конец очереди.
+        1)Если очередь переполнена и replace= False, то ожидаем свободного места не более timeout секунд.
+        2)Если очередь переполнена и replace= True, то удаляем первый элемент очереди и вставляем новый без ожидания.
+
+        raise:
+        (QFullError): Если за время ожидания место в очереди не освободилось.
+
+        param:
+        value (T): Элемент для добавления в очередь.
+        timeout (Optional[float]): Время ожидания в секундах, None - бесконечно, 0 - без ожидания
+        replace (bool): Указывает на то, что нужно ли удалять первый элемент при переполнении
+        """
+        with self._not_full:
+            if not replace and self._queue.is_full() and \
+                    not self._wait(self._not_full,lambda: not self._queue.is_full(),timeout):
+                raise QFullError()
+            self._queue.push(value,replace)
+            self._not_empty.notify()
+
+    def get(self,timeout:Optional[float] = None)->T:
+        """
+        Удаляет и возвращает первый элемент очереди, ожидая его появления не более timeout секунд.
+
+        raise:
+        (QEmptyError): Если за время ожидания в очереди не появилось элементов.
+
+        param:
+        timeout (Optional[float]): Время ожидания в секундах, None - бесконечно, 0 - без ожидания
+
+        return:
+        (T): Удаленный первый элемент очереди.
+        """
+        with self._not_empty:
+            if self._queue.empty() and not self._wait(self._not_empty,lambda: not self._queue.empty(),timeout):
+                raise QEmptyError()
+            value = self._queue.pop()
+            self._not_full.notify()
+            return value
+
+    def get_many(self,n:int,timeout:Optional[float] = None)->list[T]:
+        """
+        Удаляет и возвращает до n первых элементов очереди.
+        Ожидает появления хотя бы одного элемента не более timeout секунд, затем забирает все доступные (до n).
+
+        raise:
+        (QEmptyError): Если за время ожидания в очереди не появилось элементов.
+        (ValueError): Если n отрицательное.
+
+        param:
+        n (int): Максимальное количество удаляемых элементов
+        timeout (Optional[float]): Время ожидания в секундах, None - бесконечно, 0 - без ожидания
+
+        return:
+        (list[T]): Удаленные элементы в порядке очереди.
+        """
+        if n<0:
+            raise ValueError("Количество элементов не может быть отрицательным")
+        if n==0:
+            return []
+        with self._not_empty:
+            if self._queue.empty() and not self._wait(self._not_empty,lambda: not self._queue.empty(),timeout):
+                raise QEmptyError()
+            values = self._queue.pop_many(n)
+            self._not_full.notify(len(values))
+            return values
+
+    def empty(self)->bool:
+        """
+        Проверяет, пуста ли очередь.
+
+        return:
+        (bool): True, если очередь пуста, иначе False.
+        """
+        with self._lock:
+            return self._queue.empty()
+
+    def is_full(self)->bool:
+        """
+        Проверяет, полная ли очередь
+
+        return:
+        (bool): True, если очередь полная, иначе False.
+        """
+        with self._lock:
+            return self._queue.is_full()
+
+    def length(self)->int:
+        """
+        Возвращает количество элементов в очереди.
+
+        return:
+        (int): Количество элементов в очереди.
+        """
+        with self._lock:
+            return self._queue.length()
+
+    def __len__(self)->int:
+        """
+        Возвращает количество элементов в очереди (магический метод).
+
+        return:
+        (int): Количество элементов в очереди.
+        """
+        return self.length()
+
+    def clear(self)->None:
+        """
+        Очищает очередь, удаляя все элементы, и будит ожидающих производителей.
+
+        return:
+        (None)
+        """
+        with self._lock:
+            self._queue.clear()
+            self._not_full.notify_all()
+
+    def aslist(self)->list[T]:
+        """
+        Возвращает копию элементов очереди. Блокировка держится все время копирования.
+
+        return:
+        (list[T]): Список элементов очереди.
+        """
+        with self._lock:
+            return self._queue.aslist()
+
+    def snapshot(self)->Any:
+        """
+        Возвращает неизменяемый снимок очереди бэкенда (CVQueue.snapshot()). Блокировка держится только на время
+        создания снимка (O(1) для CVQueue), снимок читается без блокировки, пока производители продолжают добавлять элементы.
+
+        raise:
+        (TypeError): Если бэкенд не поддерживает снимки
+
+        return:
+        (Any): Снимок очереди (CVSnapshot[T] для CVQueue)
+        """
+        if not hasattr(self._queue,"snapshot"):
+            raise TypeError(f"{type(self._queue).__name__} не поддерживает снимки")
+        with self._lock:
+            return self._queue.snapshot()
+
+    def __repr__(self) -> str:
+        """
+        Представляет очередь в виде строки для печати (магический метод).
+
+        return:
+        (str): Строковое представление очереди.
+        """
+        with self._lock:
+            return f"CBQueue({self._queue!r})"
+
+
+if __name__ == "__main__":
+    a = CBQueue[int](3)
+    consumer = threading.Thread(target=lambda: print(a.get_many(10,timeout=1)))
+    consumer.start()
+    for i in range(5):
+        a.put(i)
+    consumer.join()
+    print(a)
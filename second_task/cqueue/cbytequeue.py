@@ -0,0 +1,442 @@
+"""
+Модуль cbytequeue, реализует циклический буфер байтов (как приемный буфер сокета).
+
+Класса CByteQueue, представляет циклическую очередь байтов поверх bytearray, в которой данные
+читаются и записываются через memoryview без промежуточных копий.
+Очередь предоставляет возможности:
+- запись байтов (write)
+- чтение байтов в буфер вызывающего (readinto) и в bytes (read)
+- просмотр байтов без копирования и без удаления (peek - одно или два memoryview)
+- удаление прочитанных байтов (consume)
+- заполнение свободного места напрямую (writable/commit, recv_into)
+- поиск подпоследовательности через границу кольца (find)
+- проверка на пустоту
+- проверка на заполненость
+- колличество байтов и свободное место
+- очищение очереди
+- изменение размерности очереди
+- снимок очереди (pickle протокола 5 с внеполосными буферами, dump/load)
+"""
+
+import pickle
+from typing import Any,Callable
+try:
+    from qexception import QFullError,QEmptyError
+    import csnapshot
+except ImportError:
+    from .qexception import QFullError,QEmptyError
+    from . import csnapshot
+
+
+class CByteQueue(csnapshot.CSnapshotMixin):
+
+    """
+    Реализация циклического буфера байтов FIFO на основе bytearray.
+
+    Индексная арифметика как в CAQueue: байты лежат с позиции _front, следующий байт
+    записывается в (_front+_count)%_max_size. Занятая и свободная области - не более двух
+    непрерывных отрезков буфера, поэтому peek() и writable() возвращают одно или два memoryview,
+    а write()/readinto() копируют данные не более чем двумя срезами.
+    Пока существуют memoryview, полученные из peek()/writable(), байты под ними могут быть
+    перезаписаны следующими операциями: их нужно использовать до consume()/write().
+
+    attr:
+    _count (int): Количество байтов в очереди
+    _max_size (int): Размер буфера
+    _front (int): Индекс первого байта в буфере
+    _buf (bytearray): Буфер
+    _view (memoryview): Представление буфера для срезов без копирования
+
+    method:
+    empty()->bool: Возращает True, если очередь пустая иначе False
+    is_full()->bool: Возращает True, если очередь полная иначу False
+    length()->int: Возвращает количество байтов в очереди
+    free()->int: Возвращает количество свободных байтов
+    clear()->None: Очищение очереди
+    write(data:bytes|bytearray|memoryview)->int: Записывает байты в конец очереди
+    readinto(buffer:bytearray|memoryview)->int: Удаляет первые байты очереди, копируя их в буфер
+    read(n:int=-1)->bytes: Удаляет и возвращает до n первых байтов
+    peek(n:int=-1)->tuple[memoryview,...]: Возвращает до n первых байтов без копирования
+    consume(n:int)->None: Удаляет n первых байтов
+    writable(n:int=-1)->tuple[memoryview,...]: Возвращает свободное место без копирования
+    commit(n:int)->None: Добавляет n байтов, записанных в writable()
+    recv_into(sock:Any,nbytes:int=0)->int: Заполняет свободное место из сокета
+    find(sub:bytes,start:int=0)->int: Возвращает индекс подпоследовательности или -1
+    tobytes()->bytes: Возвращает копию байтов очереди
+    resize(new_size:int)->None: Изменяет размер буфера
+    __reduce_ex__(protocol:int)->tuple: Возвращает описание для pickle (байты очереди, протокол 5 - внеполосно)
+    __setstate__(state:dict[str,Any])->None: Восстанавливает байты очереди из состояния pickle
+    dump(path:str)->int: Записывает снимок очереди в файл
+    load(path:str)->CByteQueue: Восстанавливает очередь из снимка (classmethod)
+    """
+
+    def __init__(self,max_size:int) -> None:
+        """
+        Инициализация пустой очереди
+
+        param:
+        max_size (int): Размер буфера в байтах
+        """
+        assert max_size>0,"Очередь не может быть отрицательной или равной 0"
+        self._count: int = 0
+        self._max_size: int = max_size
+        self._front: int = 0
+        self._buf: bytearray = bytearray(max_size)
+        self._view: memoryview = memoryview(self._buf)
+
+    def _segments(self,start:int,n:int)->tuple[memoryview,...]:
+        """
+        Возвращает n байтов буфера с физического индекса start одним или двумя memoryview.
+
+        param:
+        start (int): Физический индекс первого байта
+        n (int): Количество байтов (не больше _max_size)
+
+        return:
+        (tuple[memoryview,...]): Непрерывные отрезки буфера
+        """
+        first = min(n,self._max_size-start)
+        if first==n:
+            return (self._view[start:start+n],)
+        return (self._view[start:self._max_size],self._view[0:n-first])
+
+    def empty(self)->bool:
+        """
+        Проверяет, пуста ли очередь.
+
+        return:
+        (bool): True, если очередь пуста, иначе False.
+        """
+        return self._count==0
+
+    def is_full(self)->bool:
+        """
+        Проверяет, полная ли очередь.
+
+        return:
+        (bool): True, если очередь полная, иначе False.
+        """
+        return self._count==self._max_size
+
+    def length(self)->int:
+        """
+        Возвращает количество байтов в очереди.
+
+        return:
+        (int): Количество байтов в очереди.
+        """
+        return self._count
+
+    def __len__(self)->int:
+        """
+        Возвращает количество байтов в очереди (магический метод).
+
+        return:
+        (int): Количество байтов в очереди.
+        """
+        return self._count
+
+    def free(self)->int:
+        """
+        Возвращает количество свободных байтов.
+
+        return:
+        (int): Количество свободных байтов.
+        """
+        return self._max_size-self._count
+
+    def clear(self)->None:
+        """
+        Очищает очередь (буфер не обнуляется).
+
+        return:
+        (None)
+        """
+        self._front = 0
+        self._count = 0
+
+    def write(self,data:bytes|bytearray|memoryview)->int:
+        """
+        Записывает байты в конец очереди не более чем двумя срезами.
+
+        raise:
+        (QFullError): Если байты не помещаются в очередь, очередь не изменяется.
+
+        param:
+        data (bytes|bytearray|memoryview): Записываемые байты (любой объект с буферным протоколом)
+
+        return:
+        (int): Количество записанных байтов
+        """
+        data = memoryview(data).cast("B")
+        n = len(data)
+        if n>self._max_size-self._count:
+            raise QFullError()
+        offset = 0
+        for view in self._segments((self._front+self._count)%self._max_size,n):
+            view[:] = data[offset:offset+len(view)]
+            offset+=len(view)
+        self._count+=n
+        return n
+
+    def peek(self,n:int = -1)->tuple[memoryview,...]:
+        """
+        Возвращает до n первых байтов очереди без копирования и без удаления.
+
+        raise:
+        (QEmptyError): Если очередь пуста.
+
+        param:
+        n (int): Максимальное количество байтов (-1 - все байты)
+
+        return:
+        (tuple[memoryview,...]): Один или два memoryview в порядке очереди
+        """
+        if self._count==0:
+            raise QEmptyError()
+        n = self._count if n<0 else min(n,self._count)
+        return self._segments(self._front,n)
+
+    def consume(self,n:int)->None:
+        """
+        Удаляет n первых байтов очереди.
+
+        raise:
+        (QEmptyError): Если в очереди меньше n байтов, очередь не изменяется.
+        (ValueError): Если n отрицательное.
+
+        param:
+        n (int): Количество удаляемых байтов
+        """
+        if n<0:
+            raise ValueError("Количество байтов не может быть отрицательным")
+        if n>self._count:
+            raise QEmptyError()
+        self._count-=n
+        self._front = 0 if self._count==0 else (self._front+n)%self._max_size
+
+    def readinto(self,buffer:bytearray|memoryview)->int:
+        """
+        Удаляет до len(buffer) первых байтов очереди, копируя их в buffer не более чем двумя срезами.
+
+        raise:
+        (QEmptyError): Если очередь пуста.
+
+        param:
+        buffer (bytearray|memoryview): Изменяемый буфер вызывающего
+
+        return:
+        (int): Количество скопированных байтов
+        """
+        target = memoryview(buffer).cast("B")
+        offset = 0
+        for view in self.peek(len(target)):
+            target[offset:offset+len(view)] = view
+            offset+=len(view)
+        self.consume(offset)
+        return offset
+
+    def read(self,n:int = -1)->bytes:
+        """
+        Удаляет и возвращает до n первых байтов очереди.
+
+        raise:
+        (QEmptyError): Если очередь пуста.
+
+        param:
+        n (int): Максимальное количество байтов (-1 - все байты)
+
+        return:
+        (bytes): Удаленные байты
+        """
+        data = b"".join(self.peek(n))
+        self.consume(len(data))
+        return data
+
+    def writable(self,n:int = -1)->tuple[memoryview,...]:
+        """
+        Возвращает до n свободных байтов после последнего байта очереди для записи без копирования.
+        Записанные байты добавляются в очередь вызовом commit().
+
+        raise:
+        (QFullError): Если очередь заполнена.
+
+        param:
+        n (int): Максимальное количество байтов (-1 - все свободное место)
+
+        return:
+        (tuple[memoryview,...]): Один или два memoryview свободного места в порядке записи
+        """
+        free = self._max_size-self._count
+        if free==0:
+            raise QFullError()
+        n = free if n<0 else min(n,free)
+        if self._count==0:
+            self._front = 0 # Пустая очередь - свободное место одним отрезком
+        return self._segments((self._front+self._count)%self._max_size,n)
+
+    def commit(self,n:int)->None:
+        """
+        Добавляет в очередь n байтов, записанных в memoryview из writable().
+
+        raise:
+        (QFullError): Если n больше свободного места.
+        (ValueError): Если n отрицательное.
+
+        param:
+        n (int): Количество записанных байтов
+        """
+        if n<0:
+            raise ValueError("Количество байтов не может быть отрицательным")
+        if n>self._max_size-self._count:
+            raise QFullError()
+        self._count+=n
+
+    def recv_into(self,sock:Any,nbytes:int = 0)->int:
+        """
+        Заполняет свободное место одним вызовом sock.recv_into() без промежуточного буфера.
+        Подходит любой объект с методом recv_into(buffer,nbytes) (сокет) или readinto(buffer) (файл).
+
+        raise:
+        (QFullError): Если очередь заполнена.
+
+        param:
+        sock (Any): Источник данных
+        nbytes (int): Максимальное количество байтов (0 - сколько поместится в непрерывный отрезок)
+
+        return:
+        (int): Количество полученных байтов (0 - источник закрыт)
+        """
+        view = self.writable(nbytes if nbytes>0 else -1)[0]
+        recv:Callable[...,Any] = getattr(sock,"recv_into",None) or sock.readinto
+        n = recv(view) or 0
+        self._count+=n
+        return n
+
+    def find(self,sub:bytes,start:int = 0)->int:
+        """
+        Возвращает логический индекс первого вхождения sub начиная с start или -1.
+        Вхождение может пересекать границу кольца.
+
+        param:
+        sub (bytes): Искомая последовательность байтов
+        start (int): Логический индекс начала поиска
+
+        return:
+        (int): Логический индекс вхождения или -1
+        """
+        m = len(sub)
+        if start<0 or start+m>self._count:
+            return -1
+        if m==0:
+            return start
+        end = self._front+self._count
+        if end<=self._max_size:
+            index = self._buf.find(sub,self._front+start,end)
+            return -1 if index<0 else index-self._front
+        # Первый отрезок, шов (последние m-1 байтов первого и первые m-1 байтов второго отрезка), второй отрезок
+        first = self._max_size-self._front
+        if start<first:
+            index = self._buf.find(sub,self._front+start,self._max_size)
+            if index>=0:
+                return index-self._front
+            seam_start = max(start,first-m+1)
+            seam = bytes(self._buf[self._front+seam_start:self._max_size])+bytes(self._buf[0:min(m-1,end-self._max_size)])
+            index = seam.find(sub)
+            if index>=0:
+                return seam_start+index
+        index = self._buf.find(sub,max(0,start-first),end-self._max_size)
+        return -1 if index<0 else first+index
+
+    def tobytes(self)->bytes:
+        """
+        Возвращает копию байтов очереди.
+
+        return:
+        (bytes): Байты очереди
+        """
+        return b"".join(self.peek()) if self._count else b""
+
+    def __bytes__(self)->bytes:
+        """
+        Возвращает копию байтов очереди (магический метод).
+
+        return:
+        (bytes): Байты очереди
+        """
+        return self.tobytes()
+
+    def resize(self,new_size:int)->None:
+        """
+        Изменяет размер буфера, байты очереди копируются в начало нового буфера.
+        Старые memoryview из peek()/writable() продолжают ссылаться на старый буфер.
+
+        raise:
+        (ValueError): Если размер не положительный или меньше количества байтов в очереди
+
+        param:
+        new_size (int): Размер буфера
+        """
+        if new_size<=0:
+            raise ValueError("Размер очереди должен быть больше 0")
+        if new_size<self._count:
+            raise ValueError("Размер очереди меньше количества байтов в ней")
+        buf = bytearray(new_size)
+        offset = 0
+        if self._count:
+            for view in self.peek():
+                buf[offset:offset+len(view)] = view
+                offset+=len(view)
+        self._buf = buf
+        self._view = memoryview(buf)
+        self._max_size = new_size
+        self._front = 0
+
+    def __reduce_ex__(self,protocol:int)->tuple:
+        """
+        Возвращает описание для pickle: конструктор с размером буфера и байты очереди одним или двумя отрезками.
+        С протоколом 5 отрезки передаются как pickle.PickleBuffer над memoryview буфера (внеполосно, без копирования),
+        с протоколом ниже 5 - копиями bytes.
+
+        param:
+        protocol (int): Протокол pickle
+
+        return:
+        (tuple): Конструктор, его аргументы и состояние для __setstate__()
+        """
+        views = self.peek() if self._count else ()
+        if protocol>=5:
+            segments = tuple(pickle.PickleBuffer(view) for view in views)
+        else:
+            segments = tuple(bytes(view) for view in views)
+        return (type(self),(self._max_size,),{"segments":segments})
+
+    def __setstate__(self,state:dict[str,Any])->None:
+        """
+        Восстанавливает байты очереди из состояния __reduce_ex__() (отрезки копируются в начало буфера).
+
+        param:
+        state (dict[str,Any]): Состояние очереди
+        """
+        self.clear()
+        for segment in state["segments"]:
+            self.write(segment)
+
+    def __repr__(self) -> str:
+        """
+        Представляет очередь в виде строки для печати (магический метод).
+
+        return:
+        (str): Строковое представление очереди.
+        """
+        return f"CByteQueue({self.tobytes()!r}, max_size={self._max_size})"
+
+
+if __name__ == "__main__":
+    a = CByteQueue(8)
+    a.write(b"GET /\r")
+    a.consume(4)
+    a.write(b"\nab")
+    print(a,a.peek(),a.find(b"\r\n"))
+    buf = bytearray(4)
+    print(a.readinto(buf),buf,a)
@@ -15,25 +15,41 @@
 - вставка элемента по индексу
 - удаление конкретного элемента
 - изменение размерности очереди   
+- пакетное добавление и удаление элементов
+- доступ к элементам и срезам по индексу (в том числе отрицательному)
+- проверка вхождения и подсчет значений через хеш-индекс (по запросу)
+- снимок очереди (pickle, dump/load) списком элементов
 """
 from dataclasses import dataclass,field
-from typing import Optional,TypeVar,Generic,Generator,Any
+from typing import Optional,TypeVar,Generic,Generator,Any,Iterable
 import sys
 from collections import deque
+from itertools import islice
 try:
     from qexception import QFullError,QEmptyError
+    from coverflow import OverflowPolicy
+    import csnapshot
 except ImportError:
     from .qexception import QFullError,QEmptyError
+    from .coverflow import OverflowPolicy
+    from . import csnapshot
 
 T = TypeVar("T") # Обобщенный тип данных
 
-class CDQueue(Generic[T]):
+class CDQueue(csnapshot.CSnapshotMixin,Generic[T]):
     
     """
     Реализация циклической структуры данных FIFO на основе deque из модуля collections.
     
+    При indexed=True очередь ведет хеш-индекс (значение -> количество вхождений), который
+    обновляется во всех изменяющих операциях: проверка вхождения и count() выполняются за O(1),
+    remove() отсутствующего значения не просматривает очередь. remove() имеющегося значения остается O(n):
+    deque.remove() ищет и сдвигает элементы. Значения должны быть хешируемыми.
+    
     attr:
     _buf (deque[T]): Контейнер Очереди
+    _hindex (Optional[dict[T,int]]): Хеш-индекс: значение -> количество вхождений (None - индекс отключен)
+    _overflow (Optional[OverflowPolicy[T]]): Политика переполнения push()/push_many() (None - QFullError)
     
     method:
     empty()->None: Возращает True, если очередь пустая иначе False
@@ -48,17 +64,59 @@ class CDQueue(Generic[T]):
     resize(new_size:int)->None: Увеличивает размер очереди
     insert(index:int, value:T)->None: Вставляет элемент в очередь по индексу
     remove(value:T)->None: Удаляет первое вхождение значения из очереди
+    push_many(values:Iterable[T],replace:bool=False)->None: Добавляет элементы в конец очереди
+    pop_many(n:int)->list[T]: Удаляет и возращает до n первых элементов очереди
+    extend(values:Iterable[T])->None: Добавляет элементы в конец очереди (аналог push_many)
+    from_iterable(values:Iterable[T],max_size:Optional[int]=None,replace:bool=False)->CDQueue[T]: Создает очередь из элементов
+    __getitem__(index:int|slice)->T|list[T]: Возвращает элемент (срез) очереди по индексу
+    __setitem__(index:int|slice,value:T|Iterable[T])->None: Заменяет элемент (срез) очереди по индексу
+    __contains__(value:T)->bool: Проверяет вхождение значения в очередь (O(1) с хеш-индексом)
+    count(value:T)->int: Возвращает количество вхождений значения (O(1) с хеш-индексом)
+    __getstate__()->dict[str,Any]: Возвращает состояние для pickle (элементы в логическом порядке)
+    __setstate__(state:dict[str,Any])->None: Восстанавливает очередь из состояния pickle
+    dump(path:str)->int: Записывает снимок очереди в файл
+    load(path:str)->CDQueue: Восстанавливает очередь из снимка (classmethod)
     """
     
-    def __init__(self,max_size:int) -> None:
+    def __init__(self,max_size:int,indexed:bool = False,overflow:Optional[OverflowPolicy[T]] = None) -> None:
         """
         Инициализация пустой очереди
         
         param:
         max_size (int): Размер очереди
+        indexed (bool): Вести хеш-индекс значений для __contains__, count() и remove()
+        overflow (Optional[OverflowPolicy[T]]): Политика переполнения push()/push_many() (None - QFullError)
         """
         assert max_size>0,"Очередь не может быть отрицательной или равной 0"
         self._buf:deque[T] = deque(maxlen=max_size)
+        self._hindex: Optional[dict[T,int]] = {} if indexed else None
+        self._overflow: Optional[OverflowPolicy[T]] = overflow
+    
+    def _hadd(self,values:Iterable[T])->None:
+        """
+        Добавляет значения в хеш-индекс.
+        
+        param:
+        values (Iterable[T]): Добавленные в очередь значения
+        """
+        hindex = self._hindex
+        for value in values:
+            hindex[value] = hindex.get(value,0)+1
+    
+    def _hdel(self,values:Iterable[T])->None:
+        """
+        Удаляет значения из хеш-индекса.
+        
+        param:
+        values (Iterable[T]): Удаленные из очереди значения
+        """
+        hindex = self._hindex
+        for value in values:
+            count = hindex[value]-1
+            if count:
+                hindex[value] = count
+            else:
+                del hindex[value]
     
     def empty(self)->bool:
         """
@@ -95,6 +153,8 @@ class CDQueue(Generic[T]):
         (None)
         """
         self._buf.clear()
+        if self._hindex is not None:
+            self._hindex.clear()
     
     def __len__(self)->int:
         """
@@ -146,12 +206,15 @@ class CDQueue(Generic[T]):
         if self.empty():
             raise QEmptyError()
         
-        return self._buf.popleft()
+        value:T = self._buf.popleft()
+        if self._hindex is not None:
+            self._hdel((value,))
+        return value
     
     def push(self,value:T,replace:bool = False)->None:
         """
         Добавляет элемент в конец очереди. 
-        1)Если очередь переполнена и replace= False, то поднимаем исключение. 
+        1)Если очередь переполнена и replace= False, то поднимаем исключение (или применяем политику overflow). 
         2)Если очередь переполнена и replace= True, то удаляем первый элемент очереди и вставляем новый. 
 
         raise:
@@ -161,9 +224,107 @@ class CDQueue(Generic[T]):
         value (T): Элемент для добавления в очередь.
         replace (bool): Указывает на то, что нужно ли удалять первый элемент при переполнении
         """
-        if self.is_full() and not replace:
-            raise QFullError()
+        if self.is_full():
+            if replace:
+                if self._hindex is not None:
+                    self._hdel((self._buf[0],))
+            elif self._overflow is None:
+                raise QFullError()
+            elif not self._overflow.admit(self,value):
+                return
         self._buf.append(value)
+        if self._hindex is not None:
+            self._hadd((value,))
+    
+    def push_many(self,values:Iterable[T],replace:bool = False)->None:
+        """
+        Добавляет элементы в конец очереди. 
+        1)Если элементы не помещаются и replace= False, то поднимаем исключение, очередь не изменяется (или применяем политику overflow). 
+        2)Если элементы не помещаются и replace= True, то удаляем первые элементы очереди и вставляем новые. 
+
+        raise:
+        (QFullError): Если элементы не помещаются в очередь.
+        
+        param:
+        values (Iterable[T]): Элементы для добавления в очередь.
+        replace (bool): Указывает на то, что нужно ли удалять первые элементы при переполнении
+        """
+        values = list(values)
+        if not replace and len(self._buf)+len(values)>self._buf.maxlen:
+            if self._overflow is None:
+                raise QFullError()
+            self._overflow.admit_many(self,values,self._buf.maxlen-len(self._buf))
+            return
+        if self._hindex is not None:
+            # Учитываем элементы, которые deque вытеснит, и новые элементы, которые останутся
+            maxlen = self._buf.maxlen
+            dropped = max(0,len(self._buf)+len(values)-maxlen)
+            self._hdel(islice(self._buf,0,min(dropped,len(self._buf))))
+            self._hadd(values[max(0,len(values)-maxlen):])
+        self._buf.extend(values) # deque с maxlen сам удаляет первые элементы
+    
+    def extend(self,values:Iterable[T])->None:
+        """
+        Добавляет элементы в конец очереди (аналог push_many с replace=False).
+
+        raise:
+        (QFullError): Если элементы не помещаются в очередь.
+        
+        param:
+        values (Iterable[T]): Элементы для добавления в очередь.
+        """
+        self.push_many(values)
+    
+    def pop_many(self,n:int)->list[T]:
+        """
+        Удаляет и возвращает до n первых элементов очереди.
+        Если в очереди меньше n элементов, то возвращаются все элементы.
+
+        raise:
+        (QEmptyError): Если очередь пуста.
+        (ValueError): Если n отрицательное.
+        
+        param:
+        n (int): Максимальное количество удаляемых элементов
+
+        return:
+        (list[T]) : Удаленные элементы в порядке очереди.
+        """
+        if n<0:
+            raise ValueError("Количество элементов не может быть отрицательным")
+        if self.empty():
+            raise QEmptyError()
+        
+        if n>=len(self._buf):
+            values = list(self._buf)
+            self._buf.clear()
+        else:
+            popleft = self._buf.popleft
+            values = [popleft() for _ in range(n)]
+        if self._hindex is not None:
+            self._hdel(values)
+        return values
+    
+    @classmethod
+    def from_iterable(cls,values:Iterable[T],max_size:Optional[int] = None,replace:bool = False)->'CDQueue[T]':
+        """
+        Создает очередь из элементов.
+        
+        raise:
+        (QFullError): Если элементы не помещаются в очередь и replace= False.
+        
+        param:
+        values (Iterable[T]): Элементы для добавления в очередь.
+        max_size (Optional[int]): Размер очереди, по умолчанию равен количеству элементов (не меньше 1)
+        replace (bool): Указывает на то, что нужно ли удалять первые элементы при переполнении
+        
+        return:
+        (CDQueue[T]): Новая очередь
+        """
+        values = list(values)
+        queue = cls(max(1,len(values)) if max_size is None else max_size)
+        queue.push_many(values,replace)
+        return queue
     
     def resize(self,new_size:int)->None:
         """
@@ -177,6 +338,8 @@ class CDQueue(Generic[T]):
         """
         if new_size<=0:
             raise ValueError("Размер очереди должен быть больше 0")
+        if self._hindex is not None:
+            self._hdel(islice(self._buf,0,max(0,len(self._buf)-new_size)))
         self._buf = deque(self._buf,maxlen=new_size) 
 
     
@@ -199,10 +362,13 @@ class CDQueue(Generic[T]):
             raise QFullError()
            
         self._buf.insert(index,value)
+        if self._hindex is not None:
+            self._hadd((value,))
     
     def remove(self,value:T)->None:
         """ 
-        Удаляет первое вхождение значения из очереди
+        Удаляет первое вхождение значения из очереди.
+        Элемент ищется в deque за O(n) (с хеш-индексом отсутствующее значение отклоняется за O(1)).
         
         raise:
         (QEmptyError): Если очередь пуста.  
@@ -214,6 +380,10 @@ class CDQueue(Generic[T]):
         if self.empty():
             raise QEmptyError()
         
+        if self._hindex is not None:
+            if value not in self._hindex:
+                raise ValueError("Очередь не имеет элемент с указаным значением")
+            self._hdel((value,))
         try:
             self._buf.remove(value)
         except ValueError:
@@ -230,6 +400,93 @@ class CDQueue(Generic[T]):
         """
         return list(self._buf)
     
+    def __getitem__(self,index:int|slice)->T|list[T]:
+        """
+        Возвращает элемент очереди по логическому индексу (0 - первый, -1 - последний) или срез в виде списка.
+        Элемент берется индексацией deque, срез с шагом 1 - проходом islice без копирования всей очереди.
+        
+        raise:
+        (IndexError): Если индекс вне диапазона очереди
+        
+        param:
+        index (int|slice): Индекс или срез
+        
+        return:
+        (T|list[T]): Элемент или список элементов
+        """
+        if isinstance(index,slice):
+            start,stop,step = index.indices(len(self._buf))
+            if step==1:
+                return list(islice(self._buf,start,max(start,stop)))
+            return [self._buf[i] for i in range(start,stop,step)]
+        try:
+            return self._buf[index]
+        except IndexError:
+            raise IndexError("Индекс вне диапазона очереди")
+    
+    def __setitem__(self,index:int|slice,value:T|Iterable[T])->None:
+        """
+        Заменяет элемент очереди по логическому индексу или элементы среза.
+        Срез заменяется элементами того же количества (размер очереди не меняется).
+        
+        raise:
+        (IndexError): Если индекс вне диапазона очереди
+        (ValueError): Если количество элементов не совпадает с длиной среза
+        
+        param:
+        index (int|slice): Индекс или срез
+        value (T|Iterable[T]): Элемент или элементы среза
+        """
+        if isinstance(index,slice):
+            positions = range(*index.indices(len(self._buf)))
+            values = list(value)
+            if len(values)!=len(positions):
+                raise ValueError("Количество элементов не совпадает с длиной среза")
+            if self._hindex is not None:
+                self._hdel(self[index])
+                self._hadd(values)
+            for i,el in zip(positions,values):
+                self._buf[i] = el
+            return
+        try:
+            old = self._buf[index]
+        except IndexError:
+            raise IndexError("Индекс вне диапазона очереди")
+        if self._hindex is not None:
+            self._hdel((old,))
+            self._hadd((value,))
+        self._buf[index] = value
+    
+    def __contains__(self,value:T)->bool:
+        """
+        Проверяет вхождение значения в очередь (магический метод).
+        С хеш-индексом - за O(1), иначе поиском по deque.
+        
+        param:
+        value (T): Искомое значение
+        
+        return:
+        (bool): True, если значение есть в очереди, иначе False
+        """
+        if self._hindex is not None:
+            return value in self._hindex
+        return value in self._buf
+    
+    def count(self,value:T)->int:
+        """
+        Возвращает количество вхождений значения в очередь.
+        С хеш-индексом - за O(1), иначе подсчетом по deque.
+        
+        param:
+        value (T): Искомое значение
+        
+        return:
+        (int): Количество вхождений
+        """
+        if self._hindex is not None:
+            return self._hindex.get(value,0)
+        return self._buf.count(value)
+    
     def __iter__(self)->Generator[T,None,None]:
         """
         Генератор, который позволяет итерировать по элементам очереди (магический метод).
@@ -240,6 +497,25 @@ class CDQueue(Generic[T]):
         for el in self._buf:
             yield el
             
+    def __getstate__(self)->dict[str,Any]:
+        """
+        Возвращает состояние для pickle: параметры очереди и только элементы очереди в логическом порядке (без внутренней структуры).
+
+        return:
+        (dict[str,Any]): Состояние очереди
+        """
+        return {"max_size":self._buf.maxlen,"indexed":self._hindex is not None,"overflow":self._overflow,"values":list(self._buf)}
+
+    def __setstate__(self,state:dict[str,Any])->None:
+        """
+        Восстанавливает очередь из состояния __getstate__() (хеш-индекс строится заново).
+
+        param:
+        state (dict[str,Any]): Состояние очереди
+        """
+        self.__init__(state["max_size"],state["indexed"],state["overflow"])
+        self.push_many(state["values"])
+
     def __repr__(self) -> str:
         """
         Представляет очередь в виде строки для печати (магический метод).
@@ -0,0 +1,520 @@
+"""
+Модуль cequeue, реализует эластичную циклическую очередь поверх существующих очередей пакета.
+
+Класс CapacityPolicy, описывает политику изменения размера очереди.
+Класса CEQueue, представляет очередь, размер которой увеличивается при заполнении и уменьшается при опустошении.
+Очередь предоставляет возможности:
+- добавления элемента (с увеличением размера вместо QFullError до заданного предела)
+- удаления элемента и его возврат (с уменьшением размера с гистерезисом)
+- возвращение ссылки на первый элемент
+- возвращение ссылки на последний элемент
+- проверка на пустоту
+- проверка на заполненость
+- колличество элементов
+- очищение очереди
+- преобразование очереди в список
+- вставка элемента по индексу
+- удаление конкретного элемента
+- изменение размерности очереди
+- пакетное добавление и удаление элементов
+- доступ к элементам и срезам по индексу
+- текущий размер и количество изменений размера
+"""
+
+from dataclasses import dataclass
+from typing import Optional,TypeVar,Generic,Generator,Any,Callable,Iterable
+try:
+    from qexception import QFullError,QEmptyError
+    from cdqueue import CDQueue
+except ImportError:
+    from .qexception import QFullError,QEmptyError
+    from .cdqueue import CDQueue
+
+T = TypeVar("T") # Обобщенный тип данных
+
+
+@dataclass(frozen=True)
+class CapacityPolicy:
+    """
+    Политика изменения размера эластичной очереди.
+
+    Размер умножается на growth, когда очередь заполнена, но не больше ceiling.
+    Размер делится на growth, когда заполненность падает ниже shrink_below, но не меньше начального.
+    Условие shrink_below*growth<1 дает гистерезис: после уменьшения очередь заполнена не более чем на
+    shrink_below*growth, после увеличения - на 1/growth, поэтому размер не меняется туда и обратно на
+    каждой операции у границы.
+
+    attr:
+    growth (float): Множитель увеличения и делитель уменьшения размера (больше 1)
+    ceiling (Optional[int]): Максимальный размер очереди (None - без ограничения)
+    shrink_below (float): Доля заполненности, ниже которой размер уменьшается (0 - не уменьшать)
+    """
+    growth: float = 2.0
+    ceiling: Optional[int] = None
+    shrink_below: float = 0.25
+
+    def __post_init__(self)->None:
+        """
+        Проверяет параметры политики.
+
+        raise:
+        (ValueError): Если параметры не допускают гистерезиса
+        """
+        if self.growth<=1:
+            raise ValueError("Множитель увеличения размера должен быть больше 1")
+        if self.ceiling is not None and self.ceiling<=0:
+            raise ValueError("Максимальный размер очереди должен быть больше 0")
+        if not 0<=self.shrink_below*self.growth<1:
+            raise ValueError("Порог уменьшения должен быть не меньше 0 и меньше 1/growth")
+
+    def grow(self,capacity:int,needed:int)->int:
+        """
+        Возвращает размер, достаточный для needed элементов (не больше ceiling).
+
+        param:
+        capacity (int): Текущий размер
+        needed (int): Необходимое количество элементов
+
+        return:
+        (int): Новый размер
+        """
+        while capacity<needed:
+            capacity = max(capacity+1,int(capacity*self.growth))
+        return capacity if self.ceiling is None else min(capacity,self.ceiling)
+
+    def shrink(self,capacity:int,count:int,floor:int)->int:
+        """
+        Возвращает уменьшенный размер для count элементов (не меньше floor).
+
+        param:
+        capacity (int): Текущий размер
+        count (int): Количество элементов
+        floor (int): Минимальный размер
+
+        return:
+        (int): Новый размер (равен capacity, если уменьшать не нужно)
+        """
+        while capacity>floor and count<capacity*self.shrink_below:
+            capacity = max(floor,int(capacity/self.growth))
+        return capacity
+
+
+class CEQueue(Generic[T]):
+
+    """
+    Эластичная циклическая очередь FIFO.
+
+    Хранение элементов делегируется одной из очередей пакета (CAQueue, CDQueue, CLLQueue, CPLLQueue, CSQueue, CNQueue).
+    Вместо QFullError очередь увеличивает размер через resize() хранилища по политике CapacityPolicy,
+    QFullError (или вытеснение при replace=True) возникает только при достижении ceiling.
+    При опустошении размер уменьшается с гистерезисом, но не меньше начального размера.
+    Размер меняется геометрически, поэтому копирования элементов при resize() амортизированы.
+
+    attr:
+    _queue (CAQueue[T]|CDQueue[T]|CLLQueue[T]|CPLLQueue[T]|CSQueue[T]|CNQueue[T]): Очередь, в которой хранятся элементы
+    _policy (CapacityPolicy): Политика изменения размера
+    _capacity (int): Текущий размер очереди
+    _floor (int): Минимальный размер очереди
+    _resizes (int): Количество изменений размера
+    _overflow (Any): Политика переполнения хранилища (None - QFullError)
+
+    method:
+    empty()->None: Возращает True, если очередь пустая иначе False
+    is_full()->bool: Возращает True, если очередь достигла максимального размера и заполнена иначу False
+    length()->int: Возвращает количество элементов в очереди
+    clear()->None: Очищение очереди и возврат к минимальному размеру
+    front()->T: Возращает ссылку на первый элемент в очереди
+    back()->T: Возращает ссылку на последний элемент в очереди
+    pop()->T: Удаляет и возращает первый элемент в очереди
+    push(value:T,raplace:bool=False)->None: Добавляет элемент в конец очереди
+    aslist()->list[T]: Возращает очередь в виде списка
+    resize(new_size:int)->None: Изменяет размер и минимальный размер очереди
+    insert(index:int, value:T)->None: Вставляет элемент в очередь по индексу
+    remove(value:T)->None: Удаляет первое вхождение значения из очереди
+    push_many(values:Iterable[T],replace:bool=False)->None: Добавляет элементы в конец очереди
+    pop_many(n:int)->list[T]: Удаляет и возращает до n первых элементов очереди
+    extend(values:Iterable[T])->None: Добавляет элементы в конец очереди (аналог push_many)
+    from_iterable(values:Iterable[T],max_size:Optional[int]=None,replace:bool=False)->CEQueue[T]: Создает очередь из элементов
+    capacity (int): Текущий размер очереди (свойство)
+    resize_count (int): Количество изменений размера (свойство)
+    policy (CapacityPolicy): Политика изменения размера (свойство)
+    """
+
+    def __init__(self,max_size:int,backend:Callable[...,Any] = CDQueue,policy:Optional[CapacityPolicy] = None,**kwargs:Any) -> None:
+        """
+        Инициализация пустой очереди
+
+        param:
+        max_size (int): Начальный и минимальный размер очереди
+        backend (Callable[...,Any]): Класс очереди для хранения элементов (по умолчанию CDQueue)
+        policy (Optional[CapacityPolicy]): Политика изменения размера (по умолчанию CapacityPolicy())
+        kwargs (Any): Дополнительные параметры конструктора очереди (например, dtype для CNQueue)
+        """
+        self._policy:CapacityPolicy = CapacityPolicy() if policy is None else policy
+        assert self._policy.ceiling is None or max_size<=self._policy.ceiling,"Начальный размер больше максимального"
+        self._queue = backend(max_size,**kwargs)
+        self._capacity:int = max_size
+        self._floor:int = max_size
+        self._resizes:int = 0
+        self._overflow:Any = kwargs.get("overflow")
+
+    @property
+    def capacity(self)->int:
+        """
+        Текущий размер очереди.
+        """
+        return self._capacity
+
+    @property
+    def resize_count(self)->int:
+        """
+        Количество изменений размера очереди.
+        """
+        return self._resizes
+
+    @property
+    def policy(self)->CapacityPolicy:
+        """
+        Политика изменения размера очереди.
+        """
+        return self._policy
+
+    def _set_capacity(self,capacity:int)->None:
+        """
+        Изменяет размер хранилища через resize(), если он отличается от текущего.
+
+        param:
+        capacity (int): Новый размер
+        """
+        if capacity!=self._capacity:
+            self._queue.resize(capacity)
+            self._capacity = capacity
+            self._resizes+=1
+
+    def _reserve(self,k:int)->None:
+        """
+        Увеличивает размер так, чтобы поместилось еще k элементов (не больше ceiling).
+
+        param:
+        k (int): Количество добавляемых элементов
+        """
+        needed = self._queue.length()+k
+        if needed>self._capacity:
+            self._set_capacity(self._policy.grow(self._capacity,needed))
+
+    def _release(self)->None:
+        """
+        Уменьшает размер, если заполненность упала ниже порога политики.
+        """
+        count = self._queue.length()
+        if count<self._capacity*self._policy.shrink_below:
+            self._set_capacity(self._policy.shrink(self._capacity,count,self._floor))
+
+    def empty(self)->bool:
+        """
+        Проверяет, пуста ли очередь.
+
+        return:
+        (bool): True, если очередь пуста, иначе False.
+        """
+        return self._queue.empty()
+
+    def is_full(self)->bool:
+        """
+        Проверяет, полная ли очередь: заполнена и размер достиг ceiling.
+
+        return:
+        (bool): True, если очередь полная, иначе False.
+        """
+        return self._queue.is_full() and self._policy.ceiling is not None and self._capacity>=self._policy.ceiling
+
+    def length(self)->int:
+        """
+        Возвращает количество элементов в очереди.
+
+        return:
+        (int): Количество элементов в очереди.
+        """
+        return self._queue.length()
+
+    def clear(self)->None:
+        """
+        Очищает очередь и возвращает минимальный размер.
+
+        return:
+        (None)
+        """
+        self._queue.clear()
+        self._set_capacity(self._floor)
+
+    def __len__(self)->int:
+        """
+        Возвращает количество элементов в очереди (магический метод).
+
+        return:
+        (int): Количество элементов в очереди.
+        """
+        return self.length()
+
+    def front(self)->T:
+        """
+        Возвращает ссылку на первый элемент очереди без его удаления.
+
+        raise:
+        (QEmptyError): Если очередь пуста.
+
+        return:
+        (T): Первый элемент очереди.
+        """
+        return self._queue.front()
+
+    def back(self)->T:
+        """
+        Возвращает ссылку на последний элемент очереди без его удаления.
+
+        raise:
+        (QEmptyError): Если очередь пуста.
+
+        return:
+        (T): Последний элемент очереди.
+        """
+        return self._queue.back()
+
+    def push(self,value:T,replace:bool = False)->None:
+        """
+        Добавляет элемент в конец очереди, увеличивая размер заполненной очереди.
+        1)Если размер достиг ceiling и replace= False, то поднимаем исключение.
+        2)Если размер достиг ceiling и replace= True, то удаляем первый элемент очереди и вставляем новый.
+
+        raise:
+        (QFullError): Если очередь заполнена и размер достиг ceiling.
+
+        param:
+        value (T): Элемент для добавления в очередь.
+        replace (bool): Указывает на то, что нужно ли удалять первый элемент при переполнении
+        """
+        if self._queue.is_full():
+            self._reserve(1)
+        self._queue.push(value,replace)
+
+    def pop(self)->T:
+        """
+        Удаляет и возвращает первый элемент очереди, уменьшая размер при низкой заполненности.
+
+        raise:
+        (QEmptyError): Если очередь пуста.
+
+        return:
+        value (T) : Удаленный первый элемент очереди.
+        """
+        value:T = self._queue.pop()
+        self._release()
+        return value
+
+    def push_many(self,values:Iterable[T],replace:bool = False)->None:
+        """
+        Добавляет элементы в конец очереди, заранее увеличивая размер один раз.
+        1)Если элементы не помещаются в ceiling и replace= False, то поднимаем исключение, очередь не изменяется.
+        2)Если элементы не помещаются в ceiling и replace= True, то удаляем первые элементы очереди и вставляем новые.
+        Политика overflow хранилища (kwargs) применяется, когда размер достиг ceiling.
+
+        raise:
+        (QFullError): Если элементы не помещаются в очередь.
+
+        param:
+        values (Iterable[T]): Элементы для добавления в очередь.
+        replace (bool): Указывает на то, что нужно ли удалять первые элементы при переполнении
+        """
+        if not hasattr(values,"__len__"):
+            values = list(values)
+        ceiling = self._policy.ceiling
+        if not replace and self._overflow is None and ceiling is not None and self._queue.length()+len(values)>ceiling:
+            raise QFullError() # Проверяем до увеличения размера, чтобы очередь не изменилась
+        self._reserve(len(values)) # Не больше ceiling, остальное решает хранилище (QFullError или политика overflow)
+        self._queue.push_many(values,replace)
+
+    def extend(self,values:Iterable[T])->None:
+        """
+        Добавляет элементы в конец очереди (аналог push_many с replace=False).
+
+        raise:
+        (QFullError): Если элементы не помещаются в очередь.
+
+        param:
+        values (Iterable[T]): Элементы для добавления в очередь.
+        """
+        self.push_many(values)
+
+    def pop_many(self,n:int)->list[T]:
+        """
+        Удаляет и возвращает до n первых элементов очереди, уменьшая размер при низкой заполненности.
+
+        raise:
+        (QEmptyError): Если очередь пуста.
+        (ValueError): Если n отрицательное.
+
+        param:
+        n (int): Максимальное количество удаляемых элементов
+
+        return:
+        (list[T]) : Удаленные элементы в порядке очереди.
+        """
+        values = self._queue.pop_many(n)
+        self._release()
+        return values
+
+    @classmethod
+    def from_iterable(cls,values:Iterable[T],max_size:Optional[int] = None,replace:bool = False)->'CEQueue[T]':
+        """
+        Создает очередь из элементов.
+
+        raise:
+        (QFullError): Если элементы не помещаются в очередь и replace= False.
+
+        param:
+        values (Iterable[T]): Элементы для добавления в очередь.
+        max_size (Optional[int]): Начальный размер очереди, по умолчанию равен количеству элементов
+        replace (bool): Указывает на то, что нужно ли удалять первые элементы при переполнении
+
+        return:
+        (CEQueue[T]): Новая очередь
+        """
+        values = list(values)
+        queue = cls(max(1,len(values)) if max_size is None else max_size)
+        queue.push_many(values,replace)
+        return queue
+
+    def resize(self,new_size:int)->None:
+        """
+        Изменяет размер очереди и делает его минимальным размером для уменьшения.
+        При уменьшении удаляются первые элементы.
+
+        raise:
+        (ValueError): Если размер отрицательный или больше ceiling
+
+        param:
+        new_size (int): Размер очереди
+        """
+        if new_size<=0:
+            raise ValueError("Размер очереди должен быть больше 0")
+        if self._policy.ceiling is not None and new_size>self._policy.ceiling:
+            raise ValueError("Размер очереди больше максимального")
+        self._set_capacity(new_size)
+        self._floor = new_size
+
+    def insert(self,index:int, value:T)->None:
+        """
+        Вставляет элемент в очередь по индексу, увеличивая размер заполненной очереди.
+
+        raise:
+        (QFullError): Если очередь заполнена и размер достиг ceiling.
+
+        param:
+        index (int): Вставка элемента в позициию указаным индексом.
+        value (T): Элемент для добавления в очередь.
+        """
+        if self._queue.is_full():
+            self._reserve(1)
+        self._queue.insert(index,value)
+
+    def remove(self,value:T)->None:
+        """
+        Удаляет первое вхождение значения из очереди, уменьшая размер при низкой заполненности.
+
+        raise:
+        (QEmptyError): Если очередь пуста.
+        (ValueError): Если очередь не имеет элемент с указаным значением
+
+        param:
+        value (T): Элемент для удаления из очереди.
+        """
+        self._queue.remove(value)
+        self._release()
+
+    def aslist(self)->list[T]:
+        """
+        Возвращает список всех элементов очереди.
+
+        return:
+        (list[T]): Список элементов очереди.
+        """
+        return self._queue.aslist()
+
+    def __getitem__(self,index:int|slice)->Any:
+        """
+        Возвращает элемент очереди по логическому индексу или срез (магический метод).
+
+        raise:
+        (IndexError): Если индекс вне диапазона очереди
+
+        param:
+        index (int|slice): Индекс или срез
+
+        return:
+        (Any): Элемент или элементы среза
+        """
+        return self._queue[index]
+
+    def __setitem__(self,index:int|slice,value:Any)->None:
+        """
+        Заменяет элемент очереди по логическому индексу или элементы среза (магический метод).
+
+        raise:
+        (IndexError): Если индекс вне диапазона очереди
+        (ValueError): Если количество элементов не совпадает с длиной среза
+
+        param:
+        index (int|slice): Индекс или срез
+        value (Any): Элемент или элементы среза
+        """
+        self._queue[index] = value
+
+    def __contains__(self,value:T)->bool:
+        """
+        Проверяет вхождение значения в очередь (магический метод).
+
+        param:
+        value (T): Искомое значение
+
+        return:
+        (bool): True, если значение есть в очереди, иначе False
+        """
+        return value in self._queue
+
+    def count(self,value:T)->int:
+        """
+        Возвращает количество вхождений значения в очередь.
+
+        param:
+        value (T): Искомое значение
+
+        return:
+        (int): Количество вхождений
+        """
+        return self._queue.count(value)
+
+    def __iter__(self)->Generator[T,None,None]:
+        """
+        Генератор, который позволяет итерировать по элементам очереди (магический метод).
+
+        return:
+        (Generator[T,None,None]): Генератор, который возвращает элементы очереди один за другим.
+        """
+        yield from self._queue
+
+    def __repr__(self) -> str:
+        """
+        Представляет очередь в виде строки для печати (магический метод).
+
+        return:
+        (str): Строковое представление очереди.
+        """
+        return f"CEQueue({self.aslist()}, capacity={self._capacity}, resizes={self._resizes})"
+
+
+if __name__ == "__main__":
+    a = CEQueue[int](2,policy=CapacityPolicy(growth=2,ceiling=8))
+    a.push_many(range(5))
+    print(a)
+    a.pop_many(4)
+    print(a)
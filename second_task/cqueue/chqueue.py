@@ -0,0 +1,525 @@
+"""
+Модуль chqueue, реализует гибридную очередь: кольцо в памяти и сегменты на локальном диске.
+
+Класса CHQueue, представляет очередь FIFO для всплесков больше оперативной памяти: пока кольцо
+в памяти не заполнено, очередь работает как обычная циклическая очередь, а при заполнении кольца
+новые элементы пакетами записываются в файлы-сегменты и подгружаются обратно в порядке FIFO
+по мере того, как потребитель освобождает кольцо.
+Очередь предоставляет возможности:
+- добавления элемента (с выгрузкой на диск вместо QFullError)
+- удаления элемента и его возврат
+- возвращение первого элемента
+- возвращение последнего элемента
+- проверка на пустоту
+- проверка на заполненость (если задано максимальное количество элементов)
+- колличество элементов
+- очищение очереди
+- преобразование очереди в список
+- пакетное добавление и удаление элементов
+- подгрузка следующего сегмента в фоновом потоке
+"""
+
+import os
+import pickle
+import shutil
+import tempfile
+from collections import deque
+from concurrent.futures import Future,ThreadPoolExecutor
+from itertools import islice
+from typing import Optional,TypeVar,Generic,Generator,Any,Callable,Iterable
+try:
+    from qexception import QFullError,QEmptyError
+    from cdqueue import CDQueue
+except ImportError:
+    from .qexception import QFullError,QEmptyError
+    from .cdqueue import CDQueue
+
+T = TypeVar("T") # Обобщенный тип данных
+
+
+class CHQueue(Generic[T]):
+
+    """
+    Гибридная очередь FIFO: кольцо в памяти и сегменты на диске.
+
+    Элементы лежат в четырех частях, в порядке очереди: кольцо _ring (одна из очередей пакета),
+    прочитанный сегмент _reading, файлы-сегменты _segments и буфер записи _tail.
+    Пока вне кольца нет элементов, push()/pop() - операции кольца. Когда кольцо заполнено, новые
+    элементы копятся в _tail и записываются последовательно, по segment_size элементов на файл
+    (один pickle.dump на сегмент). Когда кольцо опустело, оно заполняется одним push_many() из
+    прочитанного сегмента, следующего сегмента или буфера записи. Пока потребитель читает сегмент,
+    следующий сегмент читается (и удаляется с диска) в фоновом потоке.
+    В памяти находится не больше max_size+3*segment_size элементов.
+    Очередь не потокобезопасна: фоновый поток только читает файл следующего сегмента.
+
+    attr:
+    _ring (CAQueue[T]|CDQueue[T]|CLLQueue[T]|CPLLQueue[T]|CSQueue[T]|CNQueue[T]): Кольцо в памяти
+    _max_size (int): Размер кольца
+    _segment_size (int): Количество элементов в сегменте
+    _max_items (Optional[int]): Максимальное количество элементов в очереди (None - без ограничения)
+    _dir (str): Каталог сегментов
+    _own_dir (bool): Каталог создан очередью и удаляется в close()
+    _tail (list[T]): Буфер записи - последние элементы, еще не записанные в сегмент
+    _segments (deque[tuple[str,int]]): Файлы сегментов и количество элементов в них
+    _reading (list[T]): Прочитанный сегмент, элементы которого еще не перенесены в кольцо
+    _reading_pos (int): Индекс первого непереданного элемента в _reading
+    _outside (int): Количество элементов вне кольца
+    _on_disk (int): Количество элементов в файлах сегментов
+    _last (Any): Последний элемент последнего записанного сегмента
+    _seq (int): Номер следующего файла сегмента
+    _executor (ThreadPoolExecutor): Фоновый поток чтения сегментов
+    _prefetch (Optional[Future[list[T]]]): Чтение первого сегмента из _segments
+
+    method:
+    empty()->None: Возращает True, если очередь пустая иначе False
+    is_full()->bool: Возращает True, если очередь содержит max_items элементов иначу False
+    length()->int: Возвращает количество элементов в очереди
+    clear()->None: Очищение очереди и удаление сегментов
+    front()->T: Возращает первый элемент в очереди
+    back()->T: Возращает последний элемент в очереди
+    pop()->T: Удаляет и возращает первый элемент в очереди
+    push(value:T,raplace:bool=False)->None: Добавляет элемент в конец очереди
+    push_many(values:Iterable[T],replace:bool=False)->None: Добавляет элементы в конец очереди
+    pop_many(n:int)->list[T]: Удаляет и возращает до n первых элементов очереди
+    extend(values:Iterable[T])->None: Добавляет элементы в конец очереди (аналог push_many)
+    aslist()->list[T]: Возращает очередь в виде списка (с чтением сегментов)
+    close()->None: Удаляет сегменты и останавливает фоновый поток
+    spilled (int): Количество элементов в файлах сегментов (свойство)
+    segment_count (int): Количество файлов сегментов (свойство)
+    """
+
+    def __init__(self,max_size:int,backend:Callable[...,Any] = CDQueue,segment_size:int = 4096,
+                 directory:Optional[str] = None,max_items:Optional[int] = None,**kwargs:Any) -> None:
+        """
+        Инициализация пустой очереди
+
+        param:
+        max_size (int): Размер кольца в памяти
+        backend (Callable[...,Any]): Класс очереди для кольца (по умолчанию CDQueue)
+        segment_size (int): Количество элементов в файле сегмента
+        directory (Optional[str]): Каталог сегментов (по умолчанию временный каталог, удаляемый в close())
+        max_items (Optional[int]): Максимальное количество элементов в очереди (по умолчанию без ограничения)
+        kwargs (Any): Дополнительные параметры конструктора очереди (например, dtype для CNQueue)
+        """
+        assert segment_size>0,"Размер сегмента не может быть отрицательным или равным 0"
+        assert max_items is None or max_items>=max_size,"Максимальное количество элементов меньше размера кольца"
+        self._ring = backend(max_size,**kwargs)
+        self._max_size: int = max_size
+        self._segment_size: int = segment_size
+        self._max_items: Optional[int] = max_items
+        self._own_dir: bool = directory is None
+        self._dir: str = tempfile.mkdtemp(prefix="chqueue-") if directory is None else directory
+        os.makedirs(self._dir,exist_ok=True)
+        self._tail: list[T] = []
+        self._segments: deque[tuple[str,int]] = deque()
+        self._reading: list[T] = []
+        self._reading_pos: int = 0
+        self._outside: int = 0
+        self._on_disk: int = 0
+        self._last: Any = None
+        self._seq: int = 0
+        self._executor: Optional[ThreadPoolExecutor] = ThreadPoolExecutor(max_workers=1,thread_name_prefix="chqueue")
+        self._prefetch: Optional[Future] = None
+
+    @property
+    def spilled(self)->int:
+        """
+        Количество элементов в файлах сегментов.
+        """
+        return self._on_disk
+
+    @property
+    def segment_count(self)->int:
+        """
+        Количество файлов сегментов.
+        """
+        return len(self._segments)
+
+    @staticmethod
+    def _load(path:str)->list[T]:
+        """
+        Читает сегмент и удаляет его файл.
+
+        param:
+        path (str): Путь к файлу сегмента
+
+        return:
+        (list[T]): Элементы сегмента
+        """
+        with open(path,"rb") as file:
+            values = pickle.load(file)
+        os.remove(path)
+        return values
+
+    def _write(self,values:list[T])->None:
+        """
+        Записывает элементы в новый файл сегмента одним pickle.dump().
+
+        param:
+        values (list[T]): Элементы сегмента
+        """
+        path = os.path.join(self._dir,f"{self._seq:08d}.seg")
+        self._seq+=1
+        with open(path,"wb") as file:
+            pickle.dump(values,file,protocol=pickle.HIGHEST_PROTOCOL)
+        self._segments.append((path,len(values)))
+        self._on_disk+=len(values)
+        self._last = values[-1]
+        if self._reading:
+            # Потребитель уже читает сегменты - подгружаем новый заранее
+            self._schedule()
+
+    def _spill(self,values:list[T])->None:
+        """
+        Добавляет элементы в буфер записи и записывает полные сегменты.
+
+        param:
+        values (list[T]): Добавляемые элементы
+        """
+        tail = self._tail
+        tail.extend(values)
+        self._outside+=len(values)
+        size = self._segment_size
+        full = len(tail)//size*size
+        if full:
+            for offset in range(0,full,size):
+                self._write(tail[offset:offset+size])
+            del tail[:full]
+
+    def _schedule(self)->None:
+        """
+        Запускает фоновое чтение первого сегмента, если оно еще не запущено.
+        """
+        if self._prefetch is None and self._segments:
+            self._prefetch = self._executor.submit(self._load,self._segments[0][0])
+
+    def _next_segment(self)->list[T]:
+        """
+        Возвращает элементы первого сегмента (прочитанные заранее или читает их) и запускает чтение следующего.
+
+        return:
+        (list[T]): Элементы сегмента
+        """
+        path,count = self._segments.popleft()
+        if self._prefetch is not None:
+            values = self._prefetch.result()
+            self._prefetch = None
+        else:
+            values = self._load(path)
+        self._on_disk-=count
+        self._schedule()
+        return values
+
+    def _refill(self)->None:
+        """
+        Заполняет кольцо элементами вне кольца в порядке очереди: прочитанный сегмент, сегменты, буфер записи.
+        """
+        ring = self._ring
+        free = self._max_size-ring.length()
+        while free>0 and self._outside>0:
+            if self._reading_pos<len(self._reading):
+                chunk = self._reading[self._reading_pos:self._reading_pos+free]
+                self._reading_pos+=len(chunk)
+                if self._reading_pos==len(self._reading):
+                    self._reading,self._reading_pos = [],0
+            elif self._segments:
+                self._reading,self._reading_pos = self._next_segment(),0
+                continue
+            else:
+                chunk = self._tail[:free]
+                del self._tail[:free]
+            ring.push_many(chunk)
+            self._outside-=len(chunk)
+            free-=len(chunk)
+
+    def empty(self)->bool:
+        """
+        Проверяет, пуста ли очередь.
+
+        return:
+        (bool): True, если очередь пуста, иначе False.
+        """
+        return self._outside==0 and self._ring.empty()
+
+    def is_full(self)->bool:
+        """
+        Проверяет, полная ли очередь (только при заданном max_items).
+
+        return:
+        (bool): True, если очередь полная, иначе False.
+        """
+        return self._max_items is not None and self.length()>=self._max_items
+
+    def length(self)->int:
+        """
+        Возвращает количество элементов в очереди.
+
+        return:
+        (int): Количество элементов в очереди.
+        """
+        return self._ring.length()+self._outside
+
+    def __len__(self)->int:
+        """
+        Возвращает количество элементов в очереди (магический метод).
+
+        return:
+        (int): Количество элементов в очереди.
+        """
+        return self.length()
+
+    def clear(self)->None:
+        """
+        Очищает очередь и удаляет файлы сегментов.
+
+        return:
+        (None)
+        """
+        self._ring.clear()
+        if self._prefetch is not None:
+            try:
+                self._prefetch.result() # Фоновое чтение само удаляет файл
+            except OSError:
+                pass
+            self._prefetch = None
+            if self._segments:
+                self._segments.popleft()
+        for path,_ in self._segments:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        self._segments.clear()
+        self._tail = []
+        self._reading,self._reading_pos = [],0
+        self._outside = 0
+        self._on_disk = 0
+        self._last = None
+
+    def front(self)->T:
+        """
+        Возвращает первый элемент очереди без его удаления.
+
+        raise:
+        (QEmptyError): Если очередь пуста.
+
+        return:
+        (T): Первый элемент очереди.
+        """
+        if self._outside and self._ring.empty():
+            self._refill()
+        return self._ring.front()
+
+    def back(self)->T:
+        """
+        Возвращает последний элемент очереди без его удаления.
+
+        raise:
+        (QEmptyError): Если очередь пуста.
+
+        return:
+        (T): Последний элемент очереди.
+        """
+        if self._tail:
+            return self._tail[-1]
+        if self._segments:
+            return self._last
+        if self._reading_pos<len(self._reading):
+            return self._reading[-1]
+        return self._ring.back()
+
+    def push(self,value:T,replace:bool = False)->None:
+        """
+        Добавляет элемент в конец очереди: в кольцо или, если кольцо заполнено, в буфер записи на диск.
+        1)Если очередь содержит max_items элементов и replace= False, то поднимаем исключение.
+        2)Если очередь содержит max_items элементов и replace= True, то удаляем первый элемент очереди и вставляем новый.
+
+        raise:
+        (QFullError): Если очередь содержит max_items элементов.
+
+        param:
+        value (T): Элемент для добавления в очередь.
+        replace (bool): Указывает на то, что нужно ли удалять первый элемент при переполнении
+        """
+        if self._outside==0 and not self._ring.is_full():
+            self._ring.push(value)
+            return
+        if self._max_items is not None and self.length()>=self._max_items:
+            if not replace:
+                raise QFullError()
+            self.pop()
+            if self._outside==0:
+                self._ring.push(value)
+                return
+        self._tail.append(value)
+        self._outside+=1
+        if len(self._tail)==self._segment_size:
+            self._write(self._tail)
+            self._tail = []
+
+    def pop(self)->T:
+        """
+        Удаляет и возвращает первый элемент очереди.
+
+        raise:
+        (QEmptyError): Если очередь пуста.
+
+        return:
+        value (T) : Удаленный первый элемент очереди.
+        """
+        if self._outside and self._ring.empty():
+            self._refill()
+        return self._ring.pop()
+
+    def push_many(self,values:Iterable[T],replace:bool = False)->None:
+        """
+        Добавляет элементы в конец очереди: заполняет кольцо, остальные элементы записывает на диск сегментами.
+        1)Если элементы не помещаются в max_items и replace= False, то поднимаем исключение, очередь не изменяется.
+        2)Если элементы не помещаются в max_items и replace= True, то удаляем первые элементы очереди и вставляем новые.
+
+        raise:
+        (QFullError): Если элементы не помещаются в очередь.
+
+        param:
+        values (Iterable[T]): Элементы для добавления в очередь.
+        replace (bool): Указывает на то, что нужно ли удалять первые элементы при переполнении
+        """
+        values = list(values)
+        k = len(values)
+        if self._max_items is not None and self.length()+k>self._max_items:
+            if not replace:
+                raise QFullError()
+            if k>=self._max_items:
+                # В очереди останутся только последние max_items новых элементов
+                self.clear()
+                values = values[k-self._max_items:]
+            else:
+                self.pop_many(self.length()+k-self._max_items)
+        if self._outside==0:
+            free = self._max_size-self._ring.length()
+            if free>0 and values:
+                self._ring.push_many(values[:free])
+                values = values[free:]
+        if values:
+            self._spill(values)
+
+    def extend(self,values:Iterable[T])->None:
+        """
+        Добавляет элементы в конец очереди (аналог push_many с replace=False).
+
+        raise:
+        (QFullError): Если элементы не помещаются в очередь.
+
+        param:
+        values (Iterable[T]): Элементы для добавления в очередь.
+        """
+        self.push_many(values)
+
+    def pop_many(self,n:int)->list[T]:
+        """
+        Удаляет и возвращает до n первых элементов очереди, заполняя кольцо с диска по мере необходимости.
+
+        raise:
+        (QEmptyError): Если очередь пуста.
+        (ValueError): Если n отрицательное.
+
+        param:
+        n (int): Максимальное количество удаляемых элементов
+
+        return:
+        (list[T]) : Удаленные элементы в порядке очереди.
+        """
+        if n<0:
+            raise ValueError("Количество элементов не может быть отрицательным")
+        if self.empty():
+            raise QEmptyError()
+        values:list[T] = []
+        while len(values)<n:
+            if self._ring.empty():
+                if not self._outside:
+                    break
+                self._refill()
+            values.extend(self._ring.pop_many(n-len(values)))
+        return values
+
+    def _disk_values(self)->Generator[T,None,None]:
+        """
+        Генератор элементов файлов сегментов без их удаления.
+
+        return:
+        (Generator[T,None,None]): Элементы сегментов в порядке очереди
+        """
+        for i,(path,_) in enumerate(self._segments):
+            if i==0 and self._prefetch is not None:
+                yield from self._prefetch.result() # Файл удаляется фоновым чтением
+            else:
+                with open(path,"rb") as file:
+                    yield from pickle.load(file)
+
+    def __iter__(self)->Generator[T,None,None]:
+        """
+        Генератор, который позволяет итерировать по элементам очереди (магический метод).
+        Сегменты читаются с диска по одному.
+
+        return:
+        (Generator[T,None,None]): Генератор, который возвращает элементы очереди один за другим.
+        """
+        yield from self._ring
+        yield from islice(self._reading,self._reading_pos,None)
+        yield from self._disk_values()
+        yield from self._tail
+
+    def aslist(self)->list[T]:
+        """
+        Возвращает список всех элементов очереди (с чтением файлов сегментов).
+
+        return:
+        (list[T]): Список элементов очереди.
+        """
+        return list(self)
+
+    def close(self)->None:
+        """
+        Удаляет сегменты, останавливает фоновый поток и удаляет временный каталог.
+        """
+        if self._executor is None:
+            return
+        self.clear()
+        self._executor.shutdown()
+        self._executor = None
+        if self._own_dir:
+            shutil.rmtree(self._dir,ignore_errors=True)
+
+    def __enter__(self)->'CHQueue[T]':
+        """Вход в контекстный менеджер."""
+        return self
+
+    def __exit__(self,*exc:Any)->None:
+        """Выход из контекстного менеджера: удаляет сегменты."""
+        self.close()
+
+    def __del__(self)->None:
+        """
+        Удаляет сегменты перед уничтожением.
+        """
+        try:
+            self.close()
+        except (AttributeError,OSError,RuntimeError):
+            pass
+
+    def __repr__(self) -> str:
+        """
+        Представляет очередь в виде строки для печати (магический метод).
+
+        return:
+        (str): Строковое представление очереди.
+        """
+        return f"CHQueue({self.aslist()}, spilled={self._on_disk})"
+
+
+if __name__ == "__main__":
+    with CHQueue[int](4,segment_size=3) as a:
+        a.push_many(range(12))
+        print(a,a.segment_count)
+        print(a.pop_many(6))
+        print(a)
@@ -0,0 +1,613 @@
+"""
+Модуль ciqueue, реализует очередь со сбором статистики поверх существующих очередей пакета.
+
+Класса CIQueue, представляет очередь, которая передает операции хранилищу и ведет статистику:
+счетчики добавлений, удалений, вытеснений, отброшенных элементов и исключений, максимальную длину,
+события изменения размера и гистограмму времени ожидания элементов в очереди (от push до pop).
+Статистика включается выбором CIQueue вместо самой очереди: без обертки операции очереди
+не несут никаких дополнительных затрат.
+Очередь предоставляет возможности:
+- добавления элемента
+- удаления элемента и его возврат
+- возвращение ссылки на первый элемент
+- возвращение ссылки на последний элемент
+- проверка на пустоту
+- проверка на заполненость
+- колличество элементов
+- очищение очереди
+- преобразование очереди в список
+- вставка элемента по индексу
+- удаление конкретного элемента
+- изменение размерности очереди
+- пакетное добавление и удаление элементов
+- доступ к элементам и срезам по индексу
+- снимок статистики в виде словаря и ее сброс
+"""
+
+import time
+from collections import deque
+from typing import Optional,TypeVar,Generic,Generator,Any,Callable,Iterable
+try:
+    from qexception import QFullError,QEmptyError
+    from cdqueue import CDQueue
+except ImportError:
+    from .qexception import QFullError,QEmptyError
+    from .cdqueue import CDQueue
+
+T = TypeVar("T") # Обобщенный тип данных
+
+_BUCKETS = 32 # Корзины гистограммы: 0 - меньше 1 мкс, i - от 2^(i-1) до 2^i мкс, последняя - все больше
+_EVENTS = 16  # Количество хранимых последних событий изменения размера
+
+
+class CIQueue(Generic[T]):
+
+    """
+    Циклическая очередь FIFO со сбором статистики.
+
+    Хранение элементов делегируется одной из очередей пакета (CAQueue, CDQueue, CLLQueue, CPLLQueue, CSQueue,
+    CNQueue, CVQueue, CEQueue), для CBQueue и CAIOQueue CIQueue передается бэкендом
+    (functools.partial(CIQueue, backend=CAQueue)).
+    Количество добавленных, вытесненных и отброшенных элементов вычисляется по длине хранилища до и после
+    операции и по счетчику dropped политики overflow (если она передана), поэтому учитываются и replace=True,
+    и политики переполнения, и рост CEQueue.
+    Каждый элемент получает порядковый номер, номер последнего элемента очереди - _seq-1, первого - _seq-length().
+    Для каждого sample-го номера запоминается время добавления (_stamps), при удалении элемента с этим номером
+    время ожидания попадает в логарифмическую гистограмму; отметки элементов, вытесненных без pop(), отбрасываются.
+    insert(), remove() и замена по индексу сдвигают номера, поэтому отбрасывают текущие отметки.
+    Очередь не потокобезопасна: для нескольких потоков CIQueue используется бэкендом CBQueue.
+
+    attr:
+    _queue (CAQueue[T]|CDQueue[T]|CLLQueue[T]|CPLLQueue[T]|CSQueue[T]|CNQueue[T]|CVQueue[T]|CEQueue[T]): Очередь, в которой хранятся элементы
+    _policy (Optional[OverflowPolicy[T]]): Политика переполнения хранилища (из kwargs)
+    _capacity (int): Размер очереди (начальный или последний resize()), если хранилище не сообщает свой размер
+    _sample (int): Время ожидания замеряется у каждого sample-го элемента (0 - не замеряется)
+    _clock (Callable[[],float]): Источник времени в секундах
+    _seq (int): Количество номеров, выданных добавленным элементам
+    _stamps (deque[tuple[int,float]]): Номер и время добавления элементов выборки
+    _pushes (int): Количество добавленных элементов
+    _pops (int): Количество удаленных pop()/pop_many() элементов
+    _replaced (int): Количество первых элементов, вытесненных replace=True или политикой overflow
+    _dropped (int): Количество новых элементов, отброшенных политикой overflow
+    _full_errors (int): Количество QFullError
+    _empty_errors (int): Количество QEmptyError
+    _resizes (int): Количество изменений размера
+    _events (deque[tuple[float,int,int]]): Последние изменения размера (время, старый размер, новый размер)
+    _high (int): Максимальная длина очереди
+    _buckets (list[int]): Гистограмма времени ожидания
+    _waits (int): Количество замеров времени ожидания
+    _wait_sum (float): Сумма времени ожидания в секундах
+    _wait_max (float): Максимальное время ожидания в секундах
+
+    method:
+    empty()->bool: Возращает True, если очередь пустая иначе False
+    is_full()->bool: Возращает True, если очередь полная иначу False
+    length()->int: Возвращает количество элементов в очереди
+    clear()->None: Очищение очереди
+    front()->T: Возращает ссылку на первый элемент в очереди
+    back()->T: Возращает ссылку на последний элемент в очереди
+    pop()->T: Удаляет и возращает первый элемент в очереди
+    push(value:T,raplace:bool=False)->None: Добавляет элемент в конец очереди
+    push_many(values:Iterable[T],replace:bool=False)->None: Добавляет элементы в конец очереди
+    pop_many(n:int)->list[T]: Удаляет и возращает до n первых элементов очереди
+    extend(values:Iterable[T])->None: Добавляет элементы в конец очереди (аналог push_many)
+    resize(new_size:int)->None: Изменяет размер очереди
+    insert(index:int, value:T)->None: Вставляет элемент в очередь по индексу
+    remove(value:T)->None: Удаляет первое вхождение значения из очереди
+    aslist()->list[T]: Возращает очередь в виде списка
+    stats()->dict[str,Any]: Возвращает снимок статистики в виде словаря
+    reset_stats()->None: Обнуляет статистику
+    queue (Any): Очередь, в которой хранятся элементы (свойство)
+    capacity (int): Текущий размер очереди (свойство)
+    """
+
+    def __init__(self,max_size:int,backend:Callable[...,Any] = CDQueue,sample:int = 16,clock:Callable[[],float] = time.perf_counter,**kwargs:Any) -> None:
+        """
+        Инициализация пустой очереди
+
+        param:
+        max_size (int): Размер очереди
+        backend (Callable[...,Any]): Класс очереди для хранения элементов (по умолчанию CDQueue)
+        sample (int): Время ожидания замеряется у каждого sample-го элемента (1 - у всех, 0 - не замеряется)
+        clock (Callable[[],float]): Источник времени в секундах для времени ожидания и событий изменения размера
+        kwargs (Any): Дополнительные параметры конструктора очереди (например, dtype для CNQueue или overflow)
+        """
+        assert sample>=0,"Частота выборки не может быть отрицательной"
+        self._queue = backend(max_size,**kwargs)
+        self._policy = kwargs.get("overflow")
+        self._capacity:int = max_size
+        self._sample:int = sample
+        self._clock:Callable[[],float] = clock
+        self._seq:int = 0
+        self._stamps:deque[tuple[int,float]] = deque()
+        self.reset_stats()
+
+    @property
+    def queue(self)->Any:
+        """
+        Очередь, в которой хранятся элементы (операции с ней статистику не изменяют).
+        """
+        return self._queue
+
+    @property
+    def capacity(self)->int:
+        """
+        Текущий размер очереди: свойство capacity хранилища (CEQueue изменяет размер сама), иначе
+        начальный размер или размер последнего resize().
+        """
+        return getattr(self._queue,"capacity",self._capacity)
+
+    def reset_stats(self)->None:
+        """
+        Обнуляет счетчики, события и гистограмму; максимальная длина становится равной текущей.
+        Отметки времени элементов в очереди сохраняются.
+        """
+        self._pushes:int = 0
+        self._pops:int = 0
+        self._replaced:int = 0
+        self._dropped:int = 0
+        self._full_errors:int = 0
+        self._empty_errors:int = 0
+        self._resizes:int = 0
+        self._events:deque[tuple[float,int,int]] = deque(maxlen=_EVENTS)
+        self._high:int = self._queue.length()
+        self._buckets:list[int] = [0]*_BUCKETS
+        self._waits:int = 0
+        self._wait_sum:float = 0.0
+        self._wait_max:float = 0.0
+
+    def _added(self,k:int,before:int,after:int,dropped:int)->None:
+        """
+        Учитывает добавление пакета из k элементов: добавленные, вытесненные и отброшенные элементы,
+        номера и отметки времени оставшихся в очереди элементов выборки.
+
+        param:
+        k (int): Количество переданных элементов
+        before (int): Длина очереди до добавления
+        after (int): Длина очереди после добавления
+        dropped (int): Количество элементов, отброшенных политикой overflow
+        """
+        added = k-dropped
+        self._pushes+=added
+        self._dropped+=dropped
+        self._replaced+=before+added-after
+        first = self._seq
+        self._seq+=added
+        if after>self._high:
+            self._high = after
+        if self._sample:
+            start = max(first,self._seq-after) # Номер первого добавленного элемента, оставшегося в очереди
+            start = -(-start//self._sample)*self._sample
+            if start<self._seq:
+                now = self._clock()
+                self._stamps.extend((seq,now) for seq in range(start,self._seq,self._sample))
+
+    def _removed(self,head:int,k:int)->None:
+        """
+        Замеряет время ожидания элементов выборки с номерами от head до head+k и отбрасывает отметки
+        элементов с меньшими номерами (вытесненных без pop()).
+
+        param:
+        head (int): Номер первого удаленного элемента
+        k (int): Количество удаленных элементов
+        """
+        stamps = self._stamps
+        while stamps and stamps[0][0]<head:
+            stamps.popleft()
+        end = head+k
+        if stamps and stamps[0][0]<end:
+            now = self._clock()
+            while stamps and stamps[0][0]<end:
+                wait = now-stamps.popleft()[1]
+                self._buckets[min(int(wait*1e6).bit_length(),_BUCKETS-1)]+=1
+                self._waits+=1
+                self._wait_sum+=wait
+                if wait>self._wait_max:
+                    self._wait_max = wait
+
+    def empty(self)->bool:
+        """
+        Проверяет, пуста ли очередь.
+
+        return:
+        (bool): True, если очередь пуста, иначе False.
+        """
+        return self._queue.empty()
+
+    def is_full(self)->bool:
+        """
+        Проверяет, полная ли очередь
+
+        return:
+        (bool): True, если очередь полная, иначе False.
+        """
+        return self._queue.is_full()
+
+    def length(self)->int:
+        """
+        Возвращает количество элементов в очереди.
+
+        return:
+        (int): Количество элементов в очереди.
+        """
+        return self._queue.length()
+
+    def __len__(self)->int:
+        """
+        Возвращает количество элементов в очереди (магический метод).
+
+        return:
+        (int): Количество элементов в очереди.
+        """
+        return self._queue.length()
+
+    def clear(self)->None:
+        """
+        Очищает очередь, удаляя все элементы и отметки времени.
+
+        return:
+        (None)
+        """
+        self._queue.clear()
+        self._stamps.clear()
+
+    def front(self)->T:
+        """
+        Возвращает ссылку на первый элемент очереди без его удаления.
+
+        raise:
+        (QEmptyError): Если очередь пуста.
+
+        return:
+        (T): Первый элемент очереди.
+        """
+        return self._queue.front()
+
+    def back(self)->T:
+        """
+        Возвращает ссылку на последний элемент очереди без его удаления.
+
+        raise:
+        (QEmptyError): Если очередь пуста.
+
+        return:
+        (T): Последний элемент очереди.
+        """
+        return self._queue.back()
+
+    def push(self,value:T,replace:bool = False)->None:
+        """
+        Добавляет элемент в конец очереди и учитывает добавление, вытеснение или отбрасывание элемента.
+        1)Если очередь переполнена и replace= False, то поднимаем исключение (или применяем политику overflow хранилища).
+        2)Если очередь переполнена и replace= True, то удаляем первый элемент очереди и вставляем новый.
+
+        raise:
+        (QFullError): Если очередь заполнена.
+
+        param:
+        value (T): Элемент для добавления в очередь.
+        replace (bool): Указывает на то, что нужно ли удалять первый элемент при переполнении
+        """
+        queue = self._queue
+        policy = self._policy
+        before = queue.length()
+        if policy is not None:
+            dropped = policy.dropped
+            try:
+                queue.push(value,replace)
+            except QFullError:
+                self._full_errors+=1
+                raise
+            self._added(1,before,queue.length(),policy.dropped-dropped)
+            return
+        try:
+            queue.push(value,replace)
+        except QFullError:
+            self._full_errors+=1
+            raise
+        # Без политики элемент добавлен всегда, а первый элемент вытеснен только при replace=True
+        after = queue.length() if replace else before+1
+        if after==before:
+            self._replaced+=1
+        elif after>self._high:
+            self._high = after
+        self._pushes+=1
+        seq = self._seq
+        self._seq = seq+1
+        if self._sample and seq%self._sample==0:
+            self._stamps.append((seq,self._clock()))
+
+    def pop(self)->T:
+        """
+        Удаляет и возвращает первый элемент очереди и замеряет время его ожидания (для элементов выборки).
+
+        raise:
+        (QEmptyError): Если очередь пуста.
+
+        return:
+        value (T) : Удаленный первый элемент очереди.
+        """
+        queue = self._queue
+        before = queue.length()
+        try:
+            value:T = queue.pop()
+        except QEmptyError:
+            self._empty_errors+=1
+            raise
+        self._pops+=1
+        stamps = self._stamps
+        if stamps and stamps[0][0]<=self._seq-before:
+            self._removed(self._seq-before,1)
+        return value
+
+    def push_many(self,values:Iterable[T],replace:bool = False)->None:
+        """
+        Добавляет элементы в конец очереди одним вызовом хранилища и учитывает пакет.
+        1)Если элементы не помещаются и replace= False, то поднимаем исключение, очередь не изменяется (или применяем политику overflow хранилища).
+        2)Если элементы не помещаются и replace= True, то удаляем первые элементы очереди и вставляем новые.
+
+        raise:
+        (QFullError): Если элементы не помещаются в очередь.
+
+        param:
+        values (Iterable[T]): Элементы для добавления в очередь.
+        replace (bool): Указывает на то, что нужно ли удалять первые элементы при переполнении
+        """
+        if not hasattr(values,"__len__"):
+            values = list(values)
+        queue = self._queue
+        policy = self._policy
+        dropped = 0 if policy is None else policy.dropped
+        before = queue.length()
+        try:
+            queue.push_many(values,replace)
+        except QFullError:
+            self._full_errors+=1
+            raise
+        if policy is not None:
+            dropped = policy.dropped-dropped
+        self._added(len(values),before,queue.length(),dropped)
+
+    def extend(self,values:Iterable[T])->None:
+        """
+        Добавляет элементы в конец очереди (аналог push_many с replace=False).
+
+        raise:
+        (QFullError): Если элементы не помещаются в очередь.
+
+        param:
+        values (Iterable[T]): Элементы для добавления в очередь.
+        """
+        self.push_many(values)
+
+    def pop_many(self,n:int)->list[T]:
+        """
+        Удаляет и возвращает до n первых элементов очереди и замеряет время ожидания элементов выборки.
+
+        raise:
+        (QEmptyError): Если очередь пуста.
+        (ValueError): Если n отрицательное.
+
+        param:
+        n (int): Максимальное количество удаляемых элементов
+
+        return:
+        (list[T]) : Удаленные элементы в порядке очереди.
+        """
+        queue = self._queue
+        before = queue.length()
+        try:
+            values = queue.pop_many(n)
+        except QEmptyError:
+            self._empty_errors+=1
+            raise
+        self._pops+=len(values)
+        if self._stamps:
+            self._removed(self._seq-before,len(values))
+        return values
+
+    def resize(self,new_size:int)->None:
+        """
+        Изменяет размер очереди и записывает событие изменения размера. При уменьшении удаляются первые элементы.
+
+        raise:
+        (ValueError): Если размер отрицательный
+
+        param:
+        new_size (int): Размер очереди
+        """
+        old = self.capacity
+        self._queue.resize(new_size)
+        self._events.append((self._clock(),old,new_size))
+        self._capacity = new_size
+        self._resizes+=1
+
+    def insert(self,index:int, value:T)->None:
+        """
+        Вставляет элемент в очередь по индексу (учитывается как добавление, отметки времени отбрасываются).
+
+        raise:
+        (QFullError): Если очередь заполнена.
+
+        param:
+        index (int): Вставка элемента в позициию указаным индексом.
+        value (T): Элемент для добавления в очередь.
+        """
+        try:
+            self._queue.insert(index,value)
+        except QFullError:
+            self._full_errors+=1
+            raise
+        self._stamps.clear()
+        self._pushes+=1
+        self._seq+=1
+        self._high = max(self._high,self._queue.length())
+
+    def remove(self,value:T)->None:
+        """
+        Удаляет первое вхождение значения из очереди (отметки времени отбрасываются).
+
+        raise:
+        (QEmptyError): Если очередь пуста.
+        (ValueError): Если очередь не имеет элемент с указаным значением
+
+        param:
+        value (T): Элемент для удаления из очереди.
+        """
+        try:
+            self._queue.remove(value)
+        except QEmptyError:
+            self._empty_errors+=1
+            raise
+        self._stamps.clear()
+
+    def aslist(self)->list[T]:
+        """
+        Возвращает список всех элементов очереди.
+
+        return:
+        (list[T]): Список элементов очереди.
+        """
+        return self._queue.aslist()
+
+    def __getitem__(self,index:int|slice)->Any:
+        """
+        Возвращает элемент очереди по логическому индексу или срез (магический метод).
+
+        raise:
+        (IndexError): Если индекс вне диапазона очереди
+
+        param:
+        index (int|slice): Индекс или срез
+
+        return:
+        (Any): Элемент или элементы среза
+        """
+        return self._queue[index]
+
+    def __setitem__(self,index:int|slice,value:Any)->None:
+        """
+        Заменяет элемент очереди по логическому индексу или элементы среза (отметки времени отбрасываются).
+
+        raise:
+        (IndexError): Если индекс вне диапазона очереди
+        (ValueError): Если количество элементов не совпадает с длиной среза
+
+        param:
+        index (int|slice): Индекс или срез
+        value (Any): Элемент или элементы среза
+        """
+        self._queue[index] = value
+        self._stamps.clear()
+
+    def __contains__(self,value:T)->bool:
+        """
+        Проверяет вхождение значения в очередь (магический метод).
+
+        param:
+        value (T): Искомое значение
+
+        return:
+        (bool): True, если значение есть в очереди, иначе False
+        """
+        return value in self._queue
+
+    def count(self,value:T)->int:
+        """
+        Возвращает количество вхождений значения в очередь.
+
+        param:
+        value (T): Искомое значение
+
+        return:
+        (int): Количество вхождений
+        """
+        return self._queue.count(value)
+
+    def __iter__(self)->Generator[T,None,None]:
+        """
+        Генератор, который позволяет итерировать по элементам очереди (магический метод).
+
+        return:
+        (Generator[T,None,None]): Генератор, который возвращает элементы очереди один за другим.
+        """
+        yield from self._queue
+
+    def _quantile(self,q:float)->Optional[float]:
+        """
+        Оценивает квантиль времени ожидания верхней границей корзины гистограммы.
+
+        param:
+        q (float): Уровень квантиля от 0 до 1
+
+        return:
+        (Optional[float]): Верхняя граница корзины в секундах (None, если замеров нет)
+        """
+        if self._waits==0:
+            return None
+        rank = q*self._waits
+        total = 0
+        for i,count in enumerate(self._buckets):
+            total+=count
+            if total>=rank and count:
+                return 2**i/1e6 if i<_BUCKETS-1 else self._wait_max
+        return self._wait_max
+
+    def stats(self)->dict[str,Any]:
+        """
+        Возвращает снимок статистики в виде словаря (только встроенные типы, пригоден для json.dumps()).
+
+        return:
+        (dict[str,Any]): Длина, размер и максимальная длина очереди, счетчики операций, последние события
+        изменения размера и время ожидания: количество замеров, среднее, максимум, p50/p90/p99 в секундах
+        и непустые корзины гистограммы (le - верхняя граница корзины в секундах, None - без границы)
+        """
+        buckets = [{"le":2**i/1e6 if i<_BUCKETS-1 else None,"count":count}
+                   for i,count in enumerate(self._buckets) if count]
+        return {
+            "length":self._queue.length(),
+            "capacity":self.capacity,
+            "high_water":self._high,
+            "pushes":self._pushes,
+            "pops":self._pops,
+            "replaced":self._replaced,
+            "dropped":self._dropped,
+            "full_errors":self._full_errors,
+            "empty_errors":self._empty_errors,
+            "resizes":self._resizes,
+            "resize_events":[{"time":t,"old":old,"new":new} for t,old,new in self._events],
+            "latency":{
+                "sample":self._sample,
+                "count":self._waits,
+                "mean":self._wait_sum/self._waits if self._waits else None,
+                "max":self._wait_max if self._waits else None,
+                "p50":self._quantile(0.5),
+                "p90":self._quantile(0.9),
+                "p99":self._quantile(0.99),
+                "buckets":buckets,
+            },
+        }
+
+    def __repr__(self) -> str:
+        """
+        Представляет очередь в виде строки для печати (магический метод).
+
+        return:
+        (str): Строковое представление очереди.
+        """
+        return f"CIQueue({self._queue!r}, pushes={self._pushes}, pops={self._pops}, high_water={self._high})"
+
+
+if __name__ == "__main__":
+    a = CIQueue[int](4,sample=1)
+    a.push_many(range(3))
+    a.push(3)
+    a.push(4,replace=True)
+    a.pop_many(2)
+    try:
+        a.push_many(range(5))
+    except QFullError:
+        pass
+    a.resize(8)
+    print(a)
+    print(a.stats())
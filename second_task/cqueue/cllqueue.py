@@ -16,22 +16,34 @@
 - вставка элемента по индексу
 - удаление конкретного элемента
 - изменение размерности очереди  
+- пакетное добавление и удаление элементов
+- повторное использование удаленных узлов (пул узлов)
+- доступ к элементам и срезам по индексу (в том числе отрицательному) через индекс опорных узлов
+- проверка вхождения, подсчет и удаление значений за O(1) через хеш-индекс узлов (по запросу)
+- снимок очереди (pickle, dump/load) без рекурсии по цепочке узлов
 """
 from dataclasses import dataclass,field
-from typing import Optional,TypeVar,Generic,Generator,Any
+from typing import Optional,TypeVar,Generic,Generator,Any,Iterable
 import sys
+from collections import deque
+from math import isqrt
 try:
     from qexception import QFullError,QEmptyError
+    from coverflow import OverflowPolicy
+    import csnapshot
 except ImportError:
     from .qexception import QFullError,QEmptyError
+    from .coverflow import OverflowPolicy
+    from . import csnapshot
 
 T = TypeVar("T") # Обобщенный тип данных
   
 
-@dataclass
+@dataclass(slots=True)
 class Node(Generic[T]):
     """
     Узел для использования в очереди (односвязный список)
+    Узел хранит атрибуты в __slots__ без словаря экземпляра, что уменьшает размер и ускоряет создание.
     
     attr:
     value (T): Значение элемента узла
@@ -41,18 +53,39 @@ class Node(Generic[T]):
     next: Optional['Node[T]'] = field(default=None,init=False,repr=False)
     
 
-class CLLQueue(Generic[T]): 
+class CLLQueue(csnapshot.CSnapshotMixin,Generic[T]):
     
     """
     Реализация циклической структуры данных FIFO на основе связного списка (Linked List)
     
     Связный список заранее не проинициализирован. 
     Инициалищация Node происходит по мере добавления элемента в очередь. 
+    Удаленные узлы возвращаются в пул (односвязный список свободных узлов) и повторно
+    используются при добавлении, поэтому в установившемся режиме push/pop не создают объектов.
+    
+    Для доступа по индексу при первом обращении строится индекс опорных узлов (skip pointers):
+    ссылка на каждый step-ый узел, где step ~ sqrt(n). Далее индекс поддерживается при push/pop,
+    поэтому доступ по индексу выполняется за O(sqrt(n)) вместо O(n).
+    Вставка и удаление по значению без хеш-индекса сбрасывают индекс, он строится заново при следующем обращении.
+    
+    При indexed=True очередь ведет хеш-индекс (значение -> узлы с этим значением), который
+    обновляется во всех изменяющих операциях: проверка вхождения и count() выполняются за O(1),
+    remove() находит узел по индексу и удаляет его за O(1), перенося в него значение следующего узла
+    (только удаление последнего элемента требует поиска предыдущего узла). Построенный индекс опорных узлов
+    при этом исправляется на месте за O(sqrt(n)). Значения должны быть хешируемыми.
     
     attr:
     _count (int): количество элементов в очереди
     _max_size (int): максимальное количество элементов в очереди 
     _back (Optional[Node[T]]): Ссылка на последний элемент в очереди
+    _pool (Optional[Node[T]]): Первый свободный узел пула
+    _pool_count (int): Количество узлов в пуле
+    _pool_limit (int): Максимальное количество узлов в пуле
+    _skip (Optional[deque[Node[T]]]): Опорные узлы (None - индекс не построен)
+    _skip_step (int): Расстояние между опорными узлами
+    _skip_first (int): Логический индекс первого опорного узла
+    _hindex (Optional[dict[T,dict[int,Node[T]]]]): Хеш-индекс: значение -> узлы по id (None - индекс отключен)
+    _overflow (Optional[OverflowPolicy[T]]): Политика переполнения push()/push_many() (None - QFullError)
     
     method:
     empty()->None: Возращает True, если очередь пустая иначе False
@@ -67,19 +100,189 @@ class CLLQueue(Generic[T]):
     resize(new_size:int)->None: Увеличивает размер очереди
     insert(index:int, value:T)->None: Вставляет элемент в очередь по индексу
     remove(value:T)->None: Удаляет первое вхождение значения из очереди
+    push_many(values:Iterable[T],replace:bool=False)->None: Добавляет элементы в конец очереди
+    pop_many(n:int)->list[T]: Удаляет и возращает до n первых элементов очереди
+    extend(values:Iterable[T])->None: Добавляет элементы в конец очереди (аналог push_many)
+    from_iterable(values:Iterable[T],max_size:Optional[int]=None,replace:bool=False)->CLLQueue[T]: Создает очередь из элементов
+    __getitem__(index:int|slice)->T|list[T]: Возвращает элемент (срез) очереди по индексу за O(sqrt(n)) (O(sqrt(n)+k))
+    __setitem__(index:int|slice,value:T|Iterable[T])->None: Заменяет элемент (срез) очереди по индексу
+    __contains__(value:T)->bool: Проверяет вхождение значения в очередь (O(1) с хеш-индексом)
+    count(value:T)->int: Возвращает количество вхождений значения (O(1) с хеш-индексом)
+    __getstate__()->dict[str,Any]: Возвращает состояние для pickle (элементы в логическом порядке)
+    __setstate__(state:dict[str,Any])->None: Восстанавливает очередь из состояния pickle
+    dump(path:str)->int: Записывает снимок очереди в файл
+    load(path:str)->CLLQueue: Восстанавливает очередь из снимка (classmethod)
     """
     
-    def __init__(self,max_size:int) -> None:
+    def __init__(self,max_size:int,pool_limit:Optional[int] = None,indexed:bool = False,overflow:Optional[OverflowPolicy[T]] = None) -> None:
         """
         Инициализация пустой очереди
         
         param:
         max_size (int): Размер очереди
+        pool_limit (Optional[int]): Максимальное количество свободных узлов в пуле (по умолчанию max_size, 0 - без пула)
+        indexed (bool): Вести хеш-индекс значений для __contains__, count() и remove()
+        overflow (Optional[OverflowPolicy[T]]): Политика переполнения push()/push_many() (None - QFullError)
         """
         assert max_size>0,"Очередь не может быть отрицательной или равной 0"
         self._count:int = 0
         self._max_size:int = max_size
         self._back: Optional[Node[T]] = None
+        self._pool: Optional[Node[T]] = None
+        self._pool_count: int = 0
+        self._pool_limit: int = max_size if pool_limit is None else pool_limit
+        self._skip: Optional[deque[Node[T]]] = None
+        self._skip_step: int = 1
+        self._skip_first: int = 0
+        self._hindex: Optional[dict[T,dict[int,Node[T]]]] = {} if indexed else None
+        self._overflow: Optional[OverflowPolicy[T]] = overflow
+    
+    def _new_node(self,value:T)->Node[T]:
+        """
+        Возвращает узел со значением: берет свободный узел из пула или создает новый.
+        
+        param:
+        value (T): Значение узла
+        
+        return:
+        (Node[T]): Узел (поле next не определено)
+        """
+        node = self._pool
+        if node is None:
+            return Node(value)
+        self._pool = node.next
+        self._pool_count-=1
+        node.value = value
+        return node
+    
+    def _release(self,node:Node[T])->None:
+        """
+        Возвращает удаленный узел в пул, если пул не заполнен.
+        
+        param:
+        node (Node[T]): Удаленный узел
+        """
+        if self._pool_count<self._pool_limit:
+            node.value = None # Не удерживаем ссылку на значение
+            node.next = self._pool
+            self._pool = node
+            self._pool_count+=1
+    
+    def _hadd(self,node:Node[T])->None:
+        """
+        Добавляет узел в хеш-индекс по его значению.
+        
+        param:
+        node (Node[T]): Узел очереди
+        """
+        nodes = self._hindex.get(node.value)
+        if nodes is None:
+            self._hindex[node.value] = {id(node):node}
+        else:
+            nodes[id(node)] = node
+    
+    def _hdel(self,node:Node[T])->None:
+        """
+        Удаляет узел из хеш-индекса (до изменения значения узла).
+        
+        param:
+        node (Node[T]): Узел очереди
+        """
+        nodes = self._hindex[node.value]
+        del nodes[id(node)]
+        if not nodes:
+            del self._hindex[node.value]
+    
+    def _skip_build(self)->None:
+        """
+        Строит индекс опорных узлов: ссылка на каждый step-ый узел, step = sqrt(n).
+        """
+        self._skip_step = max(1,isqrt(self._count))
+        self._skip_first = 0
+        self._skip = deque()
+        node = self._back.next
+        for i in range(self._count):
+            if i%self._skip_step==0:
+                self._skip.append(node)
+            node = node.next
+    
+    def _skip_shift(self,k:int)->None:
+        """
+        Сдвигает индекс опорных узлов после удаления k первых элементов очереди.
+        
+        param:
+        k (int): Количество удаленных элементов
+        """
+        self._skip_first-=k
+        while self._skip_first<0 and self._skip:
+            self._skip.popleft()
+            self._skip_first+=self._skip_step
+        if not self._skip:
+            self._skip = None
+    
+    def _skip_extend(self,node:Node[T],index:int,k:int)->None:
+        """
+        Добавляет в индекс опорные узлы среди k новых узлов в конце очереди.
+        
+        param:
+        node (Node[T]): Первый новый узел
+        index (int): Логический индекс первого нового узла
+        k (int): Количество новых узлов
+        """
+        step = self._skip_step
+        nxt = self._skip_first+len(self._skip)*step
+        for i in range(index,index+k):
+            if i==nxt:
+                self._skip.append(node)
+                nxt+=step
+            node = node.next
+    
+    def _skip_remove(self,node:Node[T])->None:
+        """
+        Исправляет индекс опорных узлов до удаления элемента узла node: опорные узлы после него
+        сдвигаются на следующий узел, чтобы сохранить шаг. Позиция узла находится проходом до ближайшего
+        опорного узла (не больше step узлов), поэтому исправление занимает O(sqrt(n)).
+        
+        param:
+        node (Node[T]): Узел удаляемого элемента
+        """
+        skip,step = self._skip,self._skip_step
+        positions = {id(anchor):j for j,anchor in enumerate(skip)}
+        cur,hops = node,0
+        while id(cur) not in positions and cur is not self._back:
+            cur = cur.next
+            hops+=1
+        j = positions.get(id(cur))
+        index = (self._count-1 if j is None else self._skip_first+j*step)-hops
+        for j in range(0 if index<self._skip_first else (index-self._skip_first)//step+1,len(skip)):
+            skip[j] = skip[j].next
+        while skip and self._skip_first+(len(skip)-1)*step>=self._count-1:
+            skip.pop()
+        if not skip:
+            self._skip = None
+    
+    def _node(self,index:int)->Node[T]:
+        """
+        Возвращает узел по логическому индексу: переход к ближайшему опорному узлу и проход не более step узлов.
+        
+        param:
+        index (int): Логический индекс от 0 до length()-1
+        
+        return:
+        (Node[T]): Узел очереди
+        """
+        if self._skip is None or self._count>(2*self._skip_step)**2:
+            self._skip_build()
+        if index<self._skip_first:
+            node = self._back.next
+            offset = index
+        else:
+            j = (index-self._skip_first)//self._skip_step
+            node = self._skip[j]
+            offset = index-self._skip_first-j*self._skip_step
+        for _ in range(offset):
+            node = node.next
+        return node
     
         
     def empty(self)->bool:
@@ -118,6 +321,9 @@ class CLLQueue(Generic[T]):
         """
         self._count = 0
         self._back = None
+        self._skip = None
+        if self._hindex is not None:
+            self._hindex.clear()
 
     def __len__(self)->int:
         """
@@ -171,19 +377,24 @@ class CLLQueue(Generic[T]):
         
         front = self._back.next # Это начало 
         value:T = front.value      
+        if self._hindex is not None:
+            self._hdel(front)
         self._count-=1
         
         if self._count==0:
             self._back = None
         else:
             self._back.next = front.next  # Конец указывает на начало
+        if self._skip is not None:
+            self._skip_shift(1)
+        self._release(front)
         return value
         
     
     def push(self,value:T,replace:bool = False)->None:
         """
         Добавляет элемент в конец очереди. 
-        1)Если очередь переполнена и replace= False, то поднимаем исключение. 
+        1)Если очередь переполнена и replace= False, то поднимаем исключение (или применяем политику overflow). 
         2)Если очередь переполнена и replace= True, то удаляем первый элемент очереди и вставляем новый. 
 
         raise:
@@ -195,13 +406,24 @@ class CLLQueue(Generic[T]):
         """
         if self.is_full():
             if replace:
-                front = self._back.next
-                self._back.next = front.next                             
-                self._count -=1            
-            else: 
+                # Первый узел становится последним с новым значением, без создания узла
+                self._back = self._back.next
+                if self._hindex is not None:
+                    self._hdel(self._back)
+                self._back.value = value
+                if self._hindex is not None:
+                    self._hadd(self._back)
+                if self._skip is not None:
+                    self._skip_shift(1)
+                    if self._skip is not None:
+                        self._skip_extend(self._back,self._count-1,1)
+                return
+            elif self._overflow is None:
                 raise QFullError()
+            elif not self._overflow.admit(self,value):
+                return
             
-        newNode:Node[T] = Node[T](value)
+        newNode:Node[T] = self._new_node(value)
         if self.empty():
             self._back = newNode
             self._back.next = self._back
@@ -210,7 +432,162 @@ class CLLQueue(Generic[T]):
             self._back.next = newNode
             self._back = self._back.next
             self._back.next = front
+        if self._skip is not None:
+            self._skip_extend(newNode,self._count,1)
+        if self._hindex is not None:
+            self._hadd(newNode)
         self._count+=1 
+    
+    def push_many(self,values:Iterable[T],replace:bool = False)->None:
+        """
+        Добавляет элементы в конец очереди, связывая новую цепочку узлов с очередью один раз.
+        1)Если элементы не помещаются и replace= False, то поднимаем исключение, очередь не изменяется (или применяем политику overflow). 
+        2)Если элементы не помещаются и replace= True, то удаляем первые элементы очереди и вставляем новые. 
+
+        raise:
+        (QFullError): Если элементы не помещаются в очередь.
+        
+        param:
+        values (Iterable[T]): Элементы для добавления в очередь.
+        replace (bool): Указывает на то, что нужно ли удалять первые элементы при переполнении
+        """
+        values = list(values)
+        k = len(values)
+        if k == 0:
+            return
+        
+        free = self._max_size-self._count
+        if k>free:
+            if not replace:
+                if self._overflow is None:
+                    raise QFullError()
+                self._overflow.admit_many(self,values,free)
+                return
+            if k>=self._max_size:
+                # В очереди останутся только последние max_size новых элементов
+                values = values[k-self._max_size:]
+                k = self._max_size
+                self.clear()
+            else:
+                self._discard(k-free)
+        
+        # Строим цепочку новых узлов
+        new_node = self._new_node
+        first:Node[T] = new_node(values[0])
+        last:Node[T] = first
+        for value in values[1:]:
+            last.next = new_node(value)
+            last = last.next
+        
+        if self.empty():
+            last.next = first
+        else:
+            last.next = self._back.next
+            self._back.next = first
+        self._back = last
+        if self._skip is not None:
+            self._skip_extend(first,self._count,k)
+        if self._hindex is not None:
+            node = first
+            for _ in range(k):
+                self._hadd(node)
+                node = node.next
+        self._count+=k
+    
+    def extend(self,values:Iterable[T])->None:
+        """
+        Добавляет элементы в конец очереди (аналог push_many с replace=False).
+
+        raise:
+        (QFullError): Если элементы не помещаются в очередь.
+        
+        param:
+        values (Iterable[T]): Элементы для добавления в очередь.
+        """
+        self.push_many(values)
+    
+    def _discard(self,k:int)->None:
+        """
+        Удаляет k первых элементов очереди без их возврата.
+        
+        param:
+        k (int): Количество удаляемых элементов (не больше количества элементов в очереди)
+        """
+        if k<=0:
+            return
+        if k>=self._count:
+            self.clear()
+            return
+        front = self._back.next
+        for _ in range(k):
+            node,front = front,front.next
+            if self._hindex is not None:
+                self._hdel(node)
+            self._release(node)
+        self._back.next = front
+        self._count-=k
+        if self._skip is not None:
+            self._skip_shift(k)
+    
+    def pop_many(self,n:int)->list[T]:
+        """
+        Удаляет и возвращает до n первых элементов очереди.
+        Если в очереди меньше n элементов, то возвращаются все элементы.
+
+        raise:
+        (QEmptyError): Если очередь пуста.
+        (ValueError): Если n отрицательное.
+        
+        param:
+        n (int): Максимальное количество удаляемых элементов
+
+        return:
+        (list[T]) : Удаленные элементы в порядке очереди.
+        """
+        if n<0:
+            raise ValueError("Количество элементов не может быть отрицательным")
+        if self.empty():
+            raise QEmptyError()
+        
+        k = min(n,self._count)
+        values:list[T] = []
+        front = self._back.next
+        for _ in range(k):
+            values.append(front.value)
+            node,front = front,front.next
+            if self._hindex is not None:
+                self._hdel(node)
+            self._release(node)
+        
+        self._count-=k
+        if self._count == 0:
+            self._back = None
+        else:
+            self._back.next = front # Конец указывает на новое начало
+        if self._skip is not None:
+            self._skip_shift(k)
+        return values
+    
+    @classmethod
+    def from_iterable(cls,values:Iterable[T],max_size:Optional[int] = None,replace:bool = False)->'CLLQueue[T]':
+        """
+        Создает очередь из элементов.
+        
+        raise:
+        (QFullError): Если элементы не помещаются в очередь и replace= False.
+        
+        param:
+        values (Iterable[T]): Элементы для добавления в очередь.
+        max_size (Optional[int]): Размер очереди, по умолчанию равен количеству элементов (не меньше 1)
+        replace (bool): Указывает на то, что нужно ли удалять первые элементы при переполнении
+        
+        return:
+        (CLLQueue[T]): Новая очередь
+        """
+        values = list(values)
+        queue = cls(max(1,len(values)) if max_size is None else max_size)
+        queue.push_many(values,replace)
+        return queue
         
     def resize(self,new_size:int)->None:
         """
@@ -232,9 +609,13 @@ class CLLQueue(Generic[T]):
             offset = max(0,self._count - new_size)
             front = self._back.next
             for i in range(offset):
-                front = front.next
+                node,front = front,front.next
+                if self._hindex is not None:
+                    self._hdel(node)
+                self._release(node)
             self._count = min(self._count,new_size)
             self._max_size = new_size
+            self._skip = None
             self._back.next = front
                 
             
@@ -260,7 +641,7 @@ class CLLQueue(Generic[T]):
             self.push(value)
         else:
             index = self._count if index>self._count else 0 if index<0 else index
-            newNode:Node[T] = Node[T](value)
+            newNode:Node[T] = self._new_node(value)
             if index == 0:
                 front = self._back.next
                 self._back.next = newNode
@@ -277,6 +658,9 @@ class CLLQueue(Generic[T]):
                 newNode.next = cur.next
                 cur.next = newNode
             self._count+=1
+            self._skip = None
+            if self._hindex is not None:
+                self._hadd(newNode)
     
     def remove(self,value:T)->None:
         """ 
@@ -292,6 +676,20 @@ class CLLQueue(Generic[T]):
         if self.empty():
             raise QEmptyError()
         
+        if self._hindex is not None:
+            nodes = self._hindex.get(value)
+            if nodes is None:
+                raise ValueError("Очередь не имеет элемент с указаным значением")
+            if len(nodes)==1:
+                node = next(iter(nodes.values()))
+            else:
+                # Первое вхождение - ближайший к началу узел из индекса
+                node = self._back.next
+                while id(node) not in nodes:
+                    node = node.next
+            self._unlink(node)
+            return
+        
         flag:bool = False
         prevNode:Node[T] = self._back
         nextNode:Node[T] = self._back.next
@@ -310,6 +708,43 @@ class CLLQueue(Generic[T]):
         if self._back is nextNode:
             self._back = prevNode
         self._count-=1
+        if self._count==0:
+            self._back = None
+        self._skip = None
+        self._release(nextNode)
+    
+    def _unlink(self,node:Node[T])->None:
+        """
+        Удаляет узел из очереди за O(1): в узел переносится значение следующего узла, а следующий узел
+        вырезается из списка. Для последнего узла предыдущий узел ищется по индексу опорных узлов.
+        Построенный индекс опорных узлов исправляется на месте (O(sqrt(n))), а не сбрасывается.
+        
+        param:
+        node (Node[T]): Удаляемый узел очереди
+        """
+        self._hdel(node)
+        if self._count==1:
+            self._back = None
+            self._skip = None
+            removed = node
+        elif node is self._back:
+            prev = self._node(self._count-2)
+            self._skip_remove(node)
+            prev.next = node.next
+            self._back = prev
+            removed = node
+        else:
+            if self._skip is not None:
+                self._skip_remove(node)
+            removed = node.next
+            self._hdel(removed)
+            node.value = removed.value
+            self._hadd(node)
+            node.next = removed.next
+            if removed is self._back:
+                self._back = node
+        self._count-=1
+        self._release(removed)
                
     
     def aslist(self)->list[T]:
@@ -322,6 +757,141 @@ class CLLQueue(Generic[T]):
         return [i for i in self]
         
         
+    def _index(self,index:int)->int:
+        """
+        Нормализует логический индекс элемента (отрицательный индекс считается с конца очереди).
+        
+        raise:
+        (IndexError): Если индекс вне диапазона очереди
+        
+        param:
+        index (int): Логический индекс
+        
+        return:
+        (int): Логический индекс от 0 до length()-1
+        """
+        if index<0:
+            index+=self._count
+        if not 0<=index<self._count:
+            raise IndexError("Индекс вне диапазона очереди")
+        return index
+    
+    def _span(self,start:int,k:int)->Generator[Node[T],None,None]:
+        """
+        Генератор k подряд идущих узлов, начиная с логического индекса start.
+        
+        param:
+        start (int): Логический индекс первого узла
+        k (int): Количество узлов
+        
+        return:
+        (Generator[Node[T],None,None]): Узлы очереди
+        """
+        node = self._node(start) if start!=self._count-1 else self._back
+        for _ in range(k):
+            yield node
+            node = node.next
+    
+    def __getitem__(self,index:int|slice)->T|list[T]:
+        """
+        Возвращает элемент очереди по логическому индексу (0 - первый, -1 - последний) или срез в виде списка.
+        Узел находится по индексу опорных узлов, последний элемент берется напрямую.
+        
+        raise:
+        (IndexError): Если индекс вне диапазона очереди
+        
+        param:
+        index (int|slice): Индекс или срез
+        
+        return:
+        (T|list[T]): Элемент или список элементов
+        """
+        if isinstance(index,slice):
+            start,stop,step = index.indices(self._count)
+            positions = range(start,stop,step)
+            if len(positions)==0:
+                return []
+            low = min(positions[0],positions[-1])
+            span = [node.value for node in self._span(low,abs(positions[-1]-positions[0])+1)]
+            return span if step==1 else span[positions[0]-low::step]
+        index = self._index(index)
+        if index==self._count-1:
+            return self._back.value
+        return self._node(index).value
+    
+    def __setitem__(self,index:int|slice,value:T|Iterable[T])->None:
+        """
+        Заменяет элемент очереди по логическому индексу или элементы среза.
+        Срез заменяется элементами того же количества (размер очереди не меняется).
+        
+        raise:
+        (IndexError): Если индекс вне диапазона очереди
+        (ValueError): Если количество элементов не совпадает с длиной среза
+        
+        param:
+        index (int|slice): Индекс или срез
+        value (T|Iterable[T]): Элемент или элементы среза
+        """
+        if isinstance(index,slice):
+            positions = range(*index.indices(self._count))
+            values = list(value)
+            if len(values)!=len(positions):
+                raise ValueError("Количество элементов не совпадает с длиной среза")
+            if len(positions)==0:
+                return
+            low = min(positions[0],positions[-1])
+            nodes = list(self._span(low,abs(positions[-1]-positions[0])+1))[positions[0]-low::positions.step]
+            for node,el in zip(nodes,values):
+                self._assign(node,el)
+            return
+        index = self._index(index)
+        self._assign(self._back if index==self._count-1 else self._node(index),value)
+    
+    def _assign(self,node:Node[T],value:T)->None:
+        """
+        Заменяет значение узла с обновлением хеш-индекса.
+        
+        param:
+        node (Node[T]): Узел очереди
+        value (T): Новое значение
+        """
+        if self._hindex is not None:
+            self._hdel(node)
+            node.value = value
+            self._hadd(node)
+        else:
+            node.value = value
+    
+    def __contains__(self,value:T)->bool:
+        """
+        Проверяет вхождение значения в очередь (магический метод).
+        С хеш-индексом - за O(1), иначе проходом по списку.
+        
+        param:
+        value (T): Искомое значение
+        
+        return:
+        (bool): True, если значение есть в очереди, иначе False
+        """
+        if self._hindex is not None:
+            return value in self._hindex
+        return any(el==value for el in self)
+    
+    def count(self,value:T)->int:
+        """
+        Возвращает количество вхождений значения в очередь.
+        С хеш-индексом - за O(1), иначе проходом по списку.
+        
+        param:
+        value (T): Искомое значение
+        
+        return:
+        (int): Количество вхождений
+        """
+        if self._hindex is not None:
+            return len(self._hindex.get(value,()))
+        return sum(1 for el in self if el==value)
+    
     def __iter__(self)->Generator[T,None,None]:
         """
         Генератор, который позволяет итерировать по элементам очереди (магический метод).
@@ -339,6 +909,26 @@ class CLLQueue(Generic[T]):
 
     
    
+    def __getstate__(self)->dict[str,Any]:
+        """
+        Возвращает состояние для pickle: параметры очереди и только элементы очереди в логическом порядке (без цепочки узлов, пула и индексов).
+
+        return:
+        (dict[str,Any]): Состояние очереди
+        """
+        return {"max_size":self._max_size,"pool_limit":self._pool_limit,"indexed":self._hindex is not None,
+                "overflow":self._overflow,"values":self.aslist()}
+
+    def __setstate__(self,state:dict[str,Any])->None:
+        """
+        Восстанавливает очередь из состояния __getstate__() (цепочка узлов и индексы строятся заново).
+
+        param:
+        state (dict[str,Any]): Состояние очереди
+        """
+        self.__init__(state["max_size"],state["pool_limit"],state["indexed"],state["overflow"])
+        self.push_many(state["values"])
+
     def __repr__(self) -> str:
         """
         Представляет очередь в виде строки для печати (магический метод).
@@ -0,0 +1,509 @@
+"""
+Модуль cmmqueue, реализует персистентную циклическую очередь в файле, отображенном в память (mmap).
+
+Класса CMMQueue, представляет циклическую очередь записей фиксированного размера, которая
+переживает перезапуск процесса: ячейки и заголовок (front, back, count, capacity) хранятся в файле.
+Очередь предоставляет возможности:
+- добавления элемента
+- удаления элемента и его возврат
+- возвращение первого элемента
+- возвращение последнего элемента
+- проверка на пустоту
+- проверка на заполненость
+- колличество элементов
+- очищение очереди
+- преобразование очереди в список
+- изменение размерности очереди (переотображением файла)
+- пакетное добавление и удаление элементов
+- восстановление после перезапуска за O(1) по заголовку
+- сброс изменений на диск (msync) каждые N операций или каждые T миллисекунд
+"""
+
+import mmap
+import os
+import time
+from typing import Optional,TypeVar,Generic,Generator,Any
+import numpy as np
+import numpy.typing as npt
+try:
+    from qexception import QFullError,QEmptyError
+except ImportError:
+    from .qexception import QFullError,QEmptyError
+
+T = TypeVar("T") # Обобщенный тип данных
+
+# Заголовок файла: int64 по индексам ниже
+_MAGIC = 0      # Сигнатура файла
+_FRONT = 1      # Индекс первого элемента
+_BACK = 2       # Индекс последнего элемента
+_COUNT = 3      # Количество элементов
+_MAX_SIZE = 4   # Размер очереди
+_ITEMSIZE = 5   # Размер записи в байтах
+_HEADER_SIZE = 64 # Размер заголовка в байтах
+_SIGNATURE = 0x31515143 # "CQQ1"
+
+
+class CMMQueue(Generic[T]):
+
+    """
+    Реализация персистентной циклической структуры данных FIFO в файле, отображенном в память.
+
+    Записи фиксированного размера (dtype NumPy) лежат в файле сразу после заголовка из 64 байт.
+    Запись элемента выполняется до обновления заголовка, поэтому после аварийного завершения
+    процесса очередь восстанавливается чтением заголовка, без просмотра ячеек. Индекс последнего
+    элемента при открытии вычисляется заново по FRONT и COUNT, поэтому сбой между записями полей
+    заголовка не оставляет BACK несогласованным. resize() записывает новый файл целиком и заменяет
+    им старый (os.replace), поэтому заголовок никогда не указывает за конец файла.
+    Отображение MAP_SHARED переживает падение процесса; для защиты от отключения питания
+    включается сброс на диск каждые sync_every операций или каждые sync_interval_ms миллисекунд.
+
+    attr:
+    _path (str): Путь к файлу очереди
+    _file: Файл очереди
+    _mm (mmap.mmap): Отображение файла в память
+    _header (np.ndarray): Заголовок (front, back, count, capacity)
+    _buf (np.ndarray): Контейнер очереди в файле
+    _max_size (int): максимальное количество элементов в очереди
+    _sync_every (Optional[int]): Сброс на диск каждые N изменяющих операций
+    _sync_interval (Optional[float]): Сброс на диск, если с прошлого сброса прошло T секунд
+    _ops (int): Количество изменяющих операций с прошлого сброса
+    _synced (float): Время прошлого сброса
+
+    method:
+    empty()->None: Возращает True, если очередь пустая иначе False
+    is_full()->bool: Возращает True, если очередь полная иначу False
+    length()->int: Возвращает количество элементов в очереди
+    clear()->None: Очищение очереди
+    front()->T: Возращает первый элемент в очереди
+    back()->T: Возращает последний элемент в очереди
+    pop()->T: Удаляет и возращает первый элемент в очереди
+    push(value:T,raplace:bool=False)->None: Добавляет элемент в конец очереди
+    push_many(values:npt.ArrayLike,replace:bool=False)->None: Добавляет элементы в конец очереди
+    pop_many(n:int)->np.ndarray: Удаляет и возращает до n первых элементов очереди
+    aslist()->list[T]: Возращает очередь в виде списка
+    resize(new_size:int)->None: Изменяет размер очереди (и файла)
+    flush()->None: Сбрасывает изменения на диск
+    close()->None: Сбрасывает изменения и закрывает файл
+    """
+
+    def __init__(self,path:str,max_size:int,dtype:npt.DTypeLike = np.float64,
+                 sync_every:Optional[int] = None,sync_interval_ms:Optional[float] = None) -> None:
+        """
+        Открывает очередь из файла или создает новую.
+        Если файл уже содержит очередь, то ее размер берется из заголовка, а max_size игнорируется.
+
+        raise:
+        (ValueError): Если файл не является очередью или размер записи не совпадает
+
+        param:
+        path (str): Путь к файлу очереди
+        max_size (int): Размер новой очереди
+        dtype (npt.DTypeLike): Тип записи (например, np.float64, "S64" или структурный dtype)
+        sync_every (Optional[int]): Сбрасывать изменения на диск каждые N изменяющих операций
+        sync_interval_ms (Optional[float]): Сбрасывать изменения на диск не реже, чем раз в T миллисекунд
+        """
+        assert max_size>0,"Очередь не может быть отрицательной или равной 0"
+        dtype = np.dtype(dtype)
+        assert not dtype.hasobject,"Записи в файле не могут содержать объекты Python"
+        self._path: str = path
+        self._sync_every: Optional[int] = sync_every
+        self._sync_interval: Optional[float] = None if sync_interval_ms is None else sync_interval_ms/1000
+        self._ops: int = 0
+        self._synced: float = time.monotonic()
+        self._mm: Optional[mmap.mmap] = None
+
+        exists = os.path.exists(path) and os.path.getsize(path)>=_HEADER_SIZE
+        self._file = open(path,"r+b" if exists else "w+b")
+        if exists:
+            header = np.fromfile(self._file,dtype=np.int64,count=_HEADER_SIZE//8)
+            if header[_MAGIC]!=_SIGNATURE:
+                self._file.close()
+                raise ValueError("Файл не является циклической очередью")
+            if header[_ITEMSIZE]!=dtype.itemsize:
+                self._file.close()
+                raise ValueError("Размер записи не совпадает с размером записи очереди")
+            self._map(int(header[_MAX_SIZE]),dtype)
+            count = int(self._header[_COUNT])
+            if count>0:
+                self._header[_BACK] = (int(self._header[_FRONT])+count-1)%self._max_size # Согласуем с FRONT и COUNT
+        else:
+            self._file.truncate(_HEADER_SIZE+max_size*dtype.itemsize)
+            self._map(max_size,dtype)
+            self._header[:] = 0
+            self._header[_MAX_SIZE] = max_size
+            self._header[_ITEMSIZE] = dtype.itemsize
+            self._header[_MAGIC] = _SIGNATURE # Сигнатура пишется последней
+            self.flush()
+
+    def _map(self,max_size:int,dtype:np.dtype)->None:
+        """
+        Отображает файл в память и создает представления заголовка и ячеек.
+
+        param:
+        max_size (int): Размер очереди
+        dtype (np.dtype): Тип записи
+        """
+        self._mm = mmap.mmap(self._file.fileno(),_HEADER_SIZE+max_size*dtype.itemsize)
+        self._header = np.ndarray(_HEADER_SIZE//8,dtype=np.int64,buffer=self._mm)
+        self._buf = np.ndarray(max_size,dtype=dtype,buffer=self._mm,offset=_HEADER_SIZE)
+        self._max_size = max_size
+
+    def _unmap(self)->None:
+        """
+        Освобождает представления и отображение файла.
+        """
+        self._header = None
+        self._buf = None
+        self._mm.close()
+        self._mm = None
+
+    def _written(self,ops:int = 1)->None:
+        """
+        Учитывает изменяющие операции и сбрасывает изменения на диск согласно политике.
+
+        param:
+        ops (int): Количество выполненных операций
+        """
+        if self._sync_every is None and self._sync_interval is None:
+            return
+        self._ops+=ops
+        if (self._sync_every is not None and self._ops>=self._sync_every) or \
+                (self._sync_interval is not None and time.monotonic()-self._synced>=self._sync_interval):
+            self.flush()
+
+    def flush(self)->None:
+        """
+        Сбрасывает изменения на диск (msync).
+        """
+        self._mm.flush()
+        self._ops = 0
+        self._synced = time.monotonic()
+
+    @property
+    def path(self)->str:
+        """Путь к файлу очереди."""
+        return self._path
+
+    def empty(self)->bool:
+        """
+        Проверяет, пуста ли очередь.
+
+        return:
+        (bool): True, если очередь пуста, иначе False.
+        """
+        return self._header[_COUNT]==0
+
+    def is_full(self)->bool:
+        """
+        Проверяет, полная ли очередь
+
+        return:
+        (bool): True, если очередь полная, иначе False.
+        """
+        return self._header[_COUNT]==self._max_size
+
+    def length(self)->int:
+        """
+        Возвращает количество элементов в очереди.
+
+        return:
+        (int): Количество элементов в очереди.
+        """
+        return int(self._header[_COUNT])
+
+    def front(self)->T:
+        """
+        Возвращает копию первого элемента очереди без его удаления.
+
+        raise:
+        (QEmptyError): Если очередь пуста.
+
+        return:
+        (T): Первый элемент очереди.
+        """
+        if self.empty():
+            raise QEmptyError()
+        return self._buf[self._header[_FRONT]].copy()
+
+    def back(self)->T:
+        """
+        Возвращает копию последнего элемента очереди без его удаления.
+
+        raise:
+        (QEmptyError): Если очередь пуста.
+
+        return:
+        (T): Последний элемент очереди.
+        """
+        if self.empty():
+            raise QEmptyError()
+        return self._buf[self._header[_BACK]].copy()
+
+    def push(self,value:T,replace:bool = False)->None:
+        """
+        Добавляет элемент в конец очереди.
+        1)Если очередь переполнена и replace= False, то поднимаем исключение.
+        2)Если очередь переполнена и replace= True, то удаляем первый элемент очереди и вставляем новый.
+
+        raise:
+        (QFullError): Если очередь заполнена.
+
+        param:
+        value (T): Элемент для добавления в очередь.
+        replace (bool): Указывает на то, что нужно ли удалять первый элемент при переполнении или поднять исключение
+        """
+        header = self._header
+        count = int(header[_COUNT])
+        back = 0 if count==0 else (int(header[_BACK])+1)%self._max_size
+        if count==self._max_size:
+            if not replace:
+                raise QFullError()
+            self._buf[back] = value
+            header[_FRONT] = (back+1)%self._max_size # FRONT - точка фиксации, BACK восстанавливается по нему при открытии
+            header[_BACK] = back
+        else:
+            self._buf[back] = value # Сначала запись, затем заголовок
+            if count==0:
+                header[_FRONT] = back
+            header[_BACK] = back
+            header[_COUNT] = count+1
+        self._written()
+
+    def pop(self)->T:
+        """
+        Удаляет и возвращает копию первого элемента очереди.
+
+        raise:
+        (QEmptyError): Если очередь пуста.
+
+        return:
+        value (T) : Удаленный первый элемент очереди.
+        """
+        if self.empty():
+            raise QEmptyError()
+        header = self._header
+        front = int(header[_FRONT])
+        value = self._buf[front].copy()
+        header[_FRONT] = (front+1)%self._max_size
+        header[_COUNT]-=1
+        self._written()
+        return value
+
+    def _segments(self,start:int,k:int)->tuple[np.ndarray,...]:
+        """
+        Возвращает не более двух представлений ячеек, покрывающих k элементов с физического индекса start.
+
+        param:
+        start (int): Физический индекс первого элемента
+        k (int): Количество элементов
+
+        return:
+        (tuple[np.ndarray,...]): Представления ячеек в логическом порядке
+        """
+        end = start+k
+        if end<=self._max_size:
+            return (self._buf[start:end],)
+        return (self._buf[start:],self._buf[:end-self._max_size])
+
+    def _read(self,start:int,k:int)->np.ndarray:
+        """
+        Копирует k элементов, начиная с физического индекса start.
+
+        return:
+        (np.ndarray): Копия элементов в логическом порядке
+        """
+        segments = self._segments(start,k)
+        return segments[0].copy() if len(segments)==1 else np.concatenate(segments)
+
+    def push_many(self,values:npt.ArrayLike,replace:bool = False)->None:
+        """
+        Добавляет элементы в конец очереди не более чем двумя копиями срезов.
+        1)Если элементы не помещаются и replace= False, то поднимаем исключение, очередь не изменяется.
+        2)Если элементы не помещаются и replace= True, то удаляем первые элементы очереди и вставляем новые.
+
+        raise:
+        (QFullError): Если элементы не помещаются в очередь.
+
+        param:
+        values (npt.ArrayLike): Элементы для добавления в очередь.
+        replace (bool): Указывает на то, что нужно ли удалять первые элементы при переполнении
+        """
+        values = np.asarray(values,dtype=self._buf.dtype)
+        k = len(values)
+        if k==0:
+            return
+        header = self._header
+        count = int(header[_COUNT])
+        if count+k>self._max_size and not replace:
+            raise QFullError()
+        if k>self._max_size:
+            values = values[k-self._max_size:]
+            k = self._max_size
+
+        start = 0 if count==0 else (int(header[_BACK])+1)%self._max_size
+        offset = 0
+        for segment in self._segments(start,k):
+            segment[:] = values[offset:offset+len(segment)]
+            offset+=len(segment)
+        back = (start+k-1)%self._max_size
+        if count+k>=self._max_size:
+            header[_FRONT] = (back+1)%self._max_size
+        elif count==0:
+            header[_FRONT] = start
+        header[_BACK] = back
+        header[_COUNT] = min(count+k,self._max_size)
+        self._written(k)
+
+    def pop_many(self,n:int)->np.ndarray:
+        """
+        Удаляет и возвращает до n первых элементов очереди одним массивом.
+
+        raise:
+        (QEmptyError): Если очередь пуста.
+        (ValueError): Если n отрицательное.
+
+        param:
+        n (int): Максимальное количество удаляемых элементов
+
+        return:
+        (np.ndarray) : Удаленные элементы в порядке очереди.
+        """
+        if n<0:
+            raise ValueError("Количество элементов не может быть отрицательным")
+        if self.empty():
+            raise QEmptyError()
+        header = self._header
+        front = int(header[_FRONT])
+        k = min(n,int(header[_COUNT]))
+        values = self._read(front,k)
+        header[_FRONT] = (front+k)%self._max_size
+        header[_COUNT]-=k
+        self._written(k)
+        return values
+
+    def resize(self,new_size:int)->None:
+        """
+        Изменяет размер очереди переотображением файла. При уменьшении сохраняются последние элементы.
+        Новый файл (заголовок и элементы с начала) записывается под временным именем и сбрасывается на диск,
+        затем заменяет файл очереди (os.replace): при сбое остается старый или новый файл целиком.
+
+        raise:
+        (ValueError): Если размер отрицательный
+
+        param:
+        new_size (int): Размер очереди
+        """
+        if new_size<=0:
+            raise ValueError("Размер очереди должен быть больше 0")
+
+        count = self.length()
+        offset = max(0,count-new_size) # Если новый размер меньше, то смещаем
+        values = self._read((int(self._header[_FRONT])+offset)%self._max_size,count-offset)
+        dtype = self._buf.dtype
+        header = self._header.copy()
+        header[_FRONT] = 0
+        header[_BACK] = max(0,len(values)-1)
+        header[_COUNT] = len(values)
+        header[_MAX_SIZE] = new_size
+
+        tmp = f"{self._path}.tmp"
+        with open(tmp,"wb") as file:
+            file.truncate(_HEADER_SIZE+new_size*dtype.itemsize)
+            header.tofile(file)
+            values.tofile(file)
+            file.flush()
+            os.fsync(file.fileno())
+        self._unmap()
+        self._file.close()
+        os.replace(tmp,self._path)
+        self._file = open(self._path,"r+b")
+        self._map(new_size,dtype)
+        self._ops = 0
+        self._synced = time.monotonic()
+
+    def clear(self)->None:
+        """
+        Очищает очередь, удаляя все элементы.
+
+        return:
+        (None)
+        """
+        self._header[_COUNT] = 0
+        self._header[_FRONT] = 0
+        self._header[_BACK] = 0
+        self._written()
+
+    def __len__(self)->int:
+        """
+        Возвращает количество элементов в очереди (магический метод).
+
+        return:
+        (int): Количество элементов в очереди.
+        """
+        return self.length()
+
+    def __iter__(self)->Generator[T,None,None]:
+        """
+        Генератор, который позволяет итерировать по элементам очереди (магический метод).
+
+        return:
+        (Generator[T,None,None]): Генератор, который возвращает элементы очереди один за другим.
+        """
+        for segment in self._segments(int(self._header[_FRONT]),self.length()):
+            yield from segment
+
+    def aslist(self)->list[T]:
+        """
+        Возвращает список всех элементов очереди.
+
+        return:
+        (list[T]): Список элементов очереди.
+        """
+        return self._read(int(self._header[_FRONT]),self.length()).tolist()
+
+    def __repr__(self) -> str:
+        """
+        Представляет очередь в виде строки для печати (магический метод).
+
+        return:
+        (str): Строковое представление очереди.
+        """
+        return f"CMMQueue({self.aslist()}, max_size={self._max_size}, path={self._path!r})"
+
+    def close(self)->None:
+        """
+        Сбрасывает изменения на диск и закрывает файл очереди.
+        """
+        if self._mm is None:
+            return
+        self._mm.flush()
+        self._unmap()
+        self._file.close()
+
+    def __enter__(self)->'CMMQueue[T]':
+        """Вход в контекстный менеджер."""
+        return self
+
+    def __exit__(self,*exc:Any)->None:
+        """Выход из контекстного менеджера: закрывает файл очереди."""
+        self.close()
+
+    def __del__(self)->None:
+        """
+        Закрывает файл очереди перед уничтожением.
+        """
+        try:
+            self.close()
+        except (BufferError,AttributeError,ValueError):
+            pass
+
+
+if __name__ == "__main__":
+    import tempfile
+    path = os.path.join(tempfile.gettempdir(),"cmmqueue.bin")
+    with CMMQueue[int](path,4,np.int64,sync_every=100) as a:
+        a.push_many([1,2,3])
+        print(a)
+    with CMMQueue[int](path,4,np.int64) as a:
+        print(a.pop(),a)
+    os.remove(path)
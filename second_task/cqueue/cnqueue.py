@@ -0,0 +1,744 @@
+"""
+Модуль cnqueue, реализует структуру данных циклической очереди на основе массива NumPy (np.ndarray).
+
+Класса CNQueue, представляет циклическую очередь с заранее выделенным типизированным буфером.
+Очередь предоставляет возможности:
+- добавления элемента
+- удаления элемента и его возврат
+- возвращение ссылки на первый элемент
+- возвращение ссылки на последний элемент
+- проверка на пустоту
+- проверка на заполненость
+- колличество элементов
+- очищение очереди
+- преобразование очереди в список и в массив NumPy
+- вставка элемента по индексу
+- удаление конкретного элемента
+- изменение размерности очереди
+- пакетное добавление и удаление элементов массивами NumPy
+- доступ к элементам и срезам по индексу (в том числе отрицательному)
+- представления буфера без копирования и выгрузка в list, array.array и np.ndarray
+- обратный обход и обход окна без копирования очереди
+- снимок очереди (pickle протокола 5 с внеполосными буферами, dump/load)
+"""
+
+from typing import Optional,TypeVar,Generic,Generator,Any,Iterable
+from array import array
+import numpy as np
+import numpy.typing as npt
+try:
+    from qexception import QFullError,QEmptyError
+    from coverflow import OverflowPolicy
+    import csnapshot
+except ImportError:
+    from .qexception import QFullError,QEmptyError
+    from .coverflow import OverflowPolicy
+    from . import csnapshot
+
+T = TypeVar("T") # Обобщенный тип данных
+
+
+class CNQueue(csnapshot.CSnapshotMixin,Generic[T]):
+
+    """
+    Реализация циклической структуры данных FIFO на основе массива NumPy.
+
+    Элементы хранятся в заранее выделенном np.ndarray заданного типа (dtype),
+    поэтому 1M чисел int64 занимает 8MB вместо списка ссылок на объекты Python.
+    Пакетные операции копируют данные не более чем двумя срезами.
+
+    attr:
+    _count (int): количество элементов в очереди
+    _max_size (int): максимальное количество элементов в очереди
+    _front (int): Индекс первого элемента в очереди
+    _buf (np.ndarray): Контейнер очереди
+    _overflow (Optional[OverflowPolicy[T]]): Политика переполнения push()/push_many() (None - QFullError)
+
+    method:
+    empty()->None: Возращает True, если очередь пустая иначе False
+    is_full()->bool: Возращает True, если очередь полная иначу False
+    length()->int: Возвращает количество элементов в очереди
+    clear()->None: Очищение очереди
+    front()->T: Возращает первый элемент в очереди
+    back()->T: Возращает последний элемент в очереди
+    pop()->T: Удаляет и возращает первый элемент в очереди
+    push(value:T,raplace:bool=False)->None: Добавляет элемент в конец очереди
+    aslist()->list[T]: Возращает очередь в виде списка
+    asarray()->np.ndarray: Возращает очередь в виде массива NumPy (копия)
+    resize(new_size:int)->None: Увеличивает размер очереди
+    insert(index:int, value:T)->None: Вставляет элемент в очередь по индексу
+    remove(value:T)->None: Удаляет первое вхождение значения из очереди
+    push_many(values:npt.ArrayLike,replace:bool=False)->None: Добавляет массив элементов в конец очереди
+    pop_many(n:int)->np.ndarray: Удаляет и возращает до n первых элементов очереди
+    extend(values:npt.ArrayLike)->None: Добавляет элементы в конец очереди (аналог push_many)
+    from_iterable(values:npt.ArrayLike,max_size:Optional[int]=None,replace:bool=False,dtype=None)->CNQueue[T]: Создает очередь из элементов
+    __getitem__(index:int|slice)->T|np.ndarray: Возвращает элемент (срез в виде массива) очереди по индексу
+    __setitem__(index:int|slice,value:T|npt.ArrayLike)->None: Заменяет элемент (срез) очереди по индексу
+    __contains__(value:T)->bool: Проверяет вхождение значения в очередь
+    count(value:T)->int: Возвращает количество вхождений значения
+    segments()->tuple[np.ndarray,...]: Возвращает элементы очереди не более чем двумя представлениями буфера
+    to_list()->list[T]: Возвращает элементы очереди списком
+    to_array(typecode:str)->array: Возвращает элементы очереди в array.array
+    to_numpy(dtype:Optional[npt.DTypeLike]=None)->np.ndarray: Возвращает копию элементов очереди (с приведением типа)
+    __reversed__()->Iterator[T]: Обход очереди от последнего элемента к первому
+    window(start:int=0,stop:Optional[int]=None,step:int=1)->Iterator[T]: Обход части очереди, как itertools.islice
+    __getstate__()->dict[str,Any]: Возвращает состояние для pickle (отрезки буфера, протокол 5 - внеполосно)
+    __setstate__(state:dict[str,Any])->None: Восстанавливает очередь из состояния pickle
+    dump(path:str)->int: Записывает снимок очереди в файл
+    load(path:str)->CNQueue: Восстанавливает очередь из снимка (classmethod)
+    """
+
+    def __init__(self,max_size:int,dtype:npt.DTypeLike = np.float64,overflow:Optional[OverflowPolicy[T]] = None) -> None:
+        """
+        Инициализация пустой очереди
+
+        param:
+        max_size (int): Размер очереди
+        dtype (npt.DTypeLike): Тип элементов очереди
+        overflow (Optional[OverflowPolicy[T]]): Политика переполнения push()/push_many() (None - QFullError)
+        """
+        assert max_size>0,"Очередь не может быть отрицательной или равной 0"
+        self._count: int = 0
+        self._max_size: int = max_size
+        self._front: int = 0
+        self._buf: np.ndarray = np.empty(max_size,dtype=dtype)
+        self._overflow: Optional[OverflowPolicy[T]] = overflow
+
+    @property
+    def dtype(self)->np.dtype:
+        """Тип элементов очереди."""
+        return self._buf.dtype
+
+    def empty(self)->bool:
+        """
+        Проверяет, пуста ли очередь.
+
+        return:
+        (bool): True, если очередь пуста, иначе False.
+        """
+        return self._count==0
+
+    def is_full(self)->bool:
+        """
+        Проверяет, полная ли очередь
+
+        return:
+        (bool): True, если очередь полная, иначе False.
+        """
+        return self._count==self._max_size
+
+    def length(self)->int:
+        """
+        Возвращает количество элементов в очереди.
+
+        return:
+        (int): Количество элементов в очереди.
+        """
+        return self._count
+
+    def front(self)->T:
+        """
+        Возвращает первый элемент очереди без его удаления.
+
+        raise:
+        (QEmptyError): Если очередь пуста.
+
+        return:
+        (T): Первый элемент очереди.
+        """
+        if self.empty():
+            raise QEmptyError()
+        return self._buf[self._front]
+
+    def back(self)->T:
+        """
+        Возвращает последний элемент очереди без его удаления.
+
+        raise:
+        (QEmptyError): Если очередь пуста.
+
+        return:
+        (T): Последний элемент очереди.
+        """
+        if self.empty():
+            raise QEmptyError()
+        return self._buf[(self._front+self._count-1)%self._max_size]
+
+    def push(self,value:T,replace:bool = False)->None:
+        """
+        Добавляет элемент в конец очереди.
+        1)Если очередь переполнена и replace= False, то поднимаем исключение (или применяем политику overflow).
+        2)Если очередь переполнена и replace= True, то удаляем первый элемент очереди и вставляем новый.
+
+        raise:
+        (QFullError): Если очередь заполнена.
+
+        param:
+        value (T): Элемент для добавления в очередь.
+        replace (bool): Указывает на то, что нужно ли удалять первый элемент при переполнении или поднять исключение
+        """
+        if self._count==self._max_size:
+            if replace:
+                # Новый элемент занимает ячейку первого элемента
+                self._buf[self._front] = value
+                self._front = (self._front+1)%self._max_size
+                return
+            if self._overflow is None:
+                raise QFullError()
+            if not self._overflow.admit(self,value):
+                return
+        self._buf[(self._front+self._count)%self._max_size] = value
+        self._count+=1
+
+    def pop(self)->T:
+        """
+        Удаляет и возвращает первый элемент очереди.
+
+        raise:
+        (QEmptyError): Если очередь пуста.
+
+        return:
+        value (T) : Удаленный первый элемент очереди.
+        """
+        if self.empty():
+            raise QEmptyError()
+
+        value:T = self._buf[self._front]
+        if self._buf.dtype.hasobject:
+            self._buf[self._front] = None
+        self._count-=1
+        self._front = 0 if self._count==0 else (self._front+1)%self._max_size
+        return value
+
+    def _segments(self,start:int,k:int)->tuple[np.ndarray,...]:
+        """
+        Возвращает не более двух представлений (view) буфера, покрывающих k элементов с физического индекса start.
+
+        param:
+        start (int): Физический индекс первого элемента
+        k (int): Количество элементов
+
+        return:
+        (tuple[np.ndarray,...]): Представления буфера в логическом порядке
+        """
+        end = start+k
+        if end<=self._max_size:
+            return (self._buf[start:end],)
+        return (self._buf[start:],self._buf[:end-self._max_size])
+
+    def _read(self,start:int,k:int)->np.ndarray:
+        """
+        Копирует k элементов, начиная с физического индекса start.
+
+        param:
+        start (int): Физический индекс первого элемента
+        k (int): Количество элементов
+
+        return:
+        (np.ndarray): Копия элементов в логическом порядке
+        """
+        segments = self._segments(start,k)
+        if len(segments)==1:
+            return segments[0].copy()
+        return np.concatenate(segments)
+
+    def _write(self,start:int,values:np.ndarray)->None:
+        """
+        Записывает элементы, начиная с физического индекса start, не более чем двумя срезами.
+
+        param:
+        start (int): Физический индекс первого элемента
+        values (np.ndarray): Элементы для записи (не больше размера очереди)
+        """
+        offset = 0
+        for segment in self._segments(start,len(values)):
+            segment[:] = values[offset:offset+len(segment)]
+            offset+=len(segment)
+
+    def _discard(self,k:int)->None:
+        """
+        Удаляет k первых элементов очереди без их возврата.
+
+        param:
+        k (int): Количество удаляемых элементов (не больше количества элементов в очереди)
+        """
+        if k<=0:
+            return
+        if self._buf.dtype.hasobject:
+            for segment in self._segments(self._front,k):
+                segment[:] = None
+        self._count-=k
+        self._front = 0 if self._count==0 else (self._front+k)%self._max_size
+
+    def _asvalues(self,values:npt.ArrayLike)->np.ndarray:
+        """
+        Приводит элементы к одномерному массиву с типом очереди.
+
+        raise:
+        (ValueError): Если массив не одномерный
+
+        param:
+        values (npt.ArrayLike): Элементы
+
+        return:
+        (np.ndarray): Одномерный массив элементов
+        """
+        if not isinstance(values,np.ndarray) and not hasattr(values,"__len__"):
+            values = list(values)
+        values = np.asarray(values,dtype=self._buf.dtype)
+        if values.ndim!=1:
+            raise ValueError("Ожидается одномерный массив элементов")
+        return values
+
+    def push_many(self,values:npt.ArrayLike,replace:bool = False)->None:
+        """
+        Добавляет элементы в конец очереди, копируя их не более чем двумя срезами.
+        1)Если элементы не помещаются и replace= False, то поднимаем исключение, очередь не изменяется (или применяем политику overflow).
+        2)Если элементы не помещаются и replace= True, то удаляем первые элементы очереди и вставляем новые.
+
+        raise:
+        (QFullError): Если элементы не помещаются в очередь.
+        (ValueError): Если массив не одномерный
+
+        param:
+        values (npt.ArrayLike): Элементы для добавления в очередь (np.ndarray или последовательность).
+        replace (bool): Указывает на то, что нужно ли удалять первые элементы при переполнении или поднять исключение
+        """
+        values = self._asvalues(values)
+        k = len(values)
+        if k == 0:
+            return
+
+        free = self._max_size-self._count
+        if k>free:
+            if not replace:
+                if self._overflow is None:
+                    raise QFullError()
+                self._overflow.admit_many(self,values,free)
+                return
+            if k>=self._max_size:
+                # В очереди останутся только последние max_size новых элементов
+                self._buf[:] = values[k-self._max_size:]
+                self._front,self._count = 0,self._max_size
+                return
+            self._discard(k-free)
+
+        self._write((self._front+self._count)%self._max_size,values)
+        self._count+=k
+
+    def extend(self,values:npt.ArrayLike)->None:
+        """
+        Добавляет элементы в конец очереди (аналог push_many с replace=False).
+
+        raise:
+        (QFullError): Если элементы не помещаются в очередь.
+
+        param:
+        values (npt.ArrayLike): Элементы для добавления в очередь.
+        """
+        self.push_many(values)
+
+    def pop_many(self,n:int)->np.ndarray:
+        """
+        Удаляет и возвращает до n первых элементов очереди одним массивом.
+        Если в очереди меньше n элементов, то возвращаются все элементы.
+
+        raise:
+        (QEmptyError): Если очередь пуста.
+        (ValueError): Если n отрицательное.
+
+        param:
+        n (int): Максимальное количество удаляемых элементов
+
+        return:
+        (np.ndarray) : Удаленные элементы в порядке очереди.
+        """
+        if n<0:
+            raise ValueError("Количество элементов не может быть отрицательным")
+        if self.empty():
+            raise QEmptyError()
+
+        k = min(n,self._count)
+        values = self._read(self._front,k)
+        self._discard(k)
+        return values
+
+    @classmethod
+    def from_iterable(cls,values:npt.ArrayLike,max_size:Optional[int] = None,replace:bool = False,dtype:npt.DTypeLike = None)->'CNQueue[T]':
+        """
+        Создает очередь из элементов.
+
+        raise:
+        (QFullError): Если элементы не помещаются в очередь и replace= False.
+
+        param:
+        values (npt.ArrayLike): Элементы для добавления в очередь.
+        max_size (Optional[int]): Размер очереди, по умолчанию равен количеству элементов (не меньше 1)
+        replace (bool): Указывает на то, что нужно ли удалять первые элементы при переполнении
+        dtype (npt.DTypeLike): Тип элементов очереди, по умолчанию тип массива values
+
+        return:
+        (CNQueue[T]): Новая очередь
+        """
+        if not isinstance(values,np.ndarray) and not hasattr(values,"__len__"):
+            values = list(values)
+        values = np.asarray(values,dtype=dtype)
+        queue = cls(max(1,len(values)) if max_size is None else max_size,dtype=values.dtype)
+        queue.push_many(values,replace)
+        return queue
+
+    def resize(self,new_size:int)->None:
+        """
+        Изменяет размер очереди. При уменьшении сохраняются последние элементы.
+
+        raise:
+        (ValueError): Если размер отрицательный
+
+        param:
+        new_size (int): Размер очереди
+        """
+        if new_size<=0:
+            raise ValueError("Размер очереди должен быть больше 0")
+
+        offset = max(0,self._count-new_size) # Если новый размер меньше, то смещаем
+        count = self._count-offset
+        new_buf = np.empty(new_size,dtype=self._buf.dtype)
+        new_buf[:count] = self._read((self._front+offset)%self._max_size,count)
+
+        # Обновляем данные
+        self._buf = new_buf
+        self._max_size = new_size
+        self._count = count
+        self._front = 0
+
+    def _replace_all(self,values:np.ndarray)->None:
+        """
+        Заменяет содержимое очереди, размещая элементы с начала буфера.
+
+        param:
+        values (np.ndarray): Новые элементы очереди (не больше размера очереди)
+        """
+        self._buf[:len(values)] = values
+        if self._buf.dtype.hasobject:
+            self._buf[len(values):] = None
+        self._front = 0
+        self._count = len(values)
+
+    def insert(self,index:int, value:T)->None:
+        """
+        Вставляет элемент в очередь по индексу.
+
+        Если индекс отрицательный, то элемент вставляется в начало очереди.
+        Если индекс больше кол-ва находящихся элементов в очереди, то
+        элемент вставляется в конец очереди.
+
+        raise:
+        (QFullError): Если очередь заполнена.
+
+        param:
+        index (int): Вставка элемента в позициию указаным индексом.
+        value (T): Элемент для добавления в очередь.
+        """
+        if self.is_full():
+            raise QFullError()
+
+        index = self._count if index>self._count else 0 if index<0 else index
+        values = self._read(self._front,self._count)
+        self._replace_all(np.insert(values,index,np.array(value,dtype=self._buf.dtype)))
+
+    def remove(self,value:T)->None:
+        """
+        Удаляет первое вхождение значения из очереди
+
+        raise:
+        (QEmptyError): Если очередь пуста.
+        (ValueError): Если очередь не имеет элемент с указаным значением
+
+        param:
+        value (T): Элемент для удаления из очереди.
+        """
+        if self.empty():
+            raise QEmptyError()
+
+        values = self._read(self._front,self._count)
+        found = np.flatnonzero(values==value)
+        if len(found)==0:
+            raise ValueError("Очередь не имеет элемент с указаным значением")
+        self._replace_all(np.delete(values,found[0]))
+
+    def __len__(self)->int:
+        """
+        Возвращает количество элементов в очереди (магический метод).
+
+        return:
+        (int): Количество элементов в очереди.
+        """
+        return self.length()
+
+    def _index(self,index:int)->int:
+        """
+        Нормализует логический индекс элемента (отрицательный индекс считается с конца очереди).
+
+        raise:
+        (IndexError): Если индекс вне диапазона очереди
+
+        param:
+        index (int): Логический индекс
+
+        return:
+        (int): Логический индекс от 0 до length()-1
+        """
+        if index<0:
+            index+=self._count
+        if not 0<=index<self._count:
+            raise IndexError("Индекс вне диапазона очереди")
+        return index
+
+    def __getitem__(self,index:int|slice)->T|np.ndarray:
+        """
+        Возвращает элемент очереди по логическому индексу (0 - первый, -1 - последний) или копию среза в виде массива.
+        Срез с шагом 1 копируется не более чем двумя срезами буфера, с другим шагом - выборкой по массиву индексов.
+
+        raise:
+        (IndexError): Если индекс вне диапазона очереди
+
+        param:
+        index (int|slice): Индекс или срез
+
+        return:
+        (T|np.ndarray): Элемент или массив элементов
+        """
+        if isinstance(index,slice):
+            start,stop,step = index.indices(self._count)
+            if step==1:
+                return self._read((self._front+start)%self._max_size,max(0,stop-start))
+            return self._buf[(self._front+np.arange(start,stop,step))%self._max_size]
+        return self._buf[(self._front+self._index(index))%self._max_size]
+
+    def __setitem__(self,index:int|slice,value:T|npt.ArrayLike)->None:
+        """
+        Заменяет элемент очереди по логическому индексу или элементы среза.
+        Срез заменяется элементами того же количества (размер очереди не меняется).
+
+        raise:
+        (IndexError): Если индекс вне диапазона очереди
+        (ValueError): Если количество элементов не совпадает с длиной среза
+
+        param:
+        index (int|slice): Индекс или срез
+        value (T|npt.ArrayLike): Элемент или элементы среза
+        """
+        if isinstance(index,slice):
+            start,stop,step = index.indices(self._count)
+            positions = np.arange(start,stop,step)
+            values = self._asvalues(value)
+            if len(values)!=len(positions):
+                raise ValueError("Количество элементов не совпадает с длиной среза")
+            if step==1 and len(positions)>0:
+                self._write((self._front+start)%self._max_size,values)
+            else:
+                self._buf[(self._front+positions)%self._max_size] = values
+            return
+        self._buf[(self._front+self._index(index))%self._max_size] = value
+
+    def __contains__(self,value:T)->bool:
+        """
+        Проверяет вхождение значения в очередь (магический метод) сравнением массива.
+
+        param:
+        value (T): Искомое значение
+
+        return:
+        (bool): True, если значение есть в очереди, иначе False
+        """
+        return bool(self.count(value))
+
+    def count(self,value:T)->int:
+        """
+        Возвращает количество вхождений значения в очередь (сравнением массива).
+
+        param:
+        value (T): Искомое значение
+
+        return:
+        (int): Количество вхождений
+        """
+        return int(np.count_nonzero(self._read(self._front,self._count)==value))
+
+    def __iter__(self)->Generator[T,None,None]:
+        """
+        Генератор, который позволяет итерировать по элементам очереди (магический метод).
+
+        return:
+        (Generator[T,None,None]): Генератор, который возвращает элементы очереди один за другим.
+        """
+        for segment in self._segments(self._front,self._count):
+            yield from segment
+
+    def __reversed__(self)->Generator[T,None,None]:
+        """
+        Генератор, который обходит элементы очереди от последнего к первому (магический метод).
+
+        return:
+        (Generator[T,None,None]): Генератор, который возвращает элементы очереди в обратном порядке.
+        """
+        for segment in reversed(self.segments()):
+            yield from segment[::-1]
+
+    def window(self,start:int = 0,stop:Optional[int] = None,step:int = 1)->Generator[T,None,None]:
+        """
+        Обходит элементы очереди с логическими индексами range(start,stop,step), как itertools.islice,
+        по представлениям буфера без копирования.
+
+        raise:
+        (ValueError): Если start или stop отрицательные или step не положительный
+
+        param:
+        start (int): Первый логический индекс
+        stop (Optional[int]): Логический индекс после последнего (None - до конца очереди)
+        step (int): Шаг
+
+        return:
+        (Generator[T,None,None]): Генератор элементов окна
+        """
+        if start<0 or (stop is not None and stop<0) or step<=0:
+            raise ValueError("Индексы окна должны быть неотрицательными, а шаг - положительным")
+        stop = self._count if stop is None else min(stop,self._count)
+        start = min(start,stop)
+        first = self._max_size-self._front # Количество элементов до конца буфера
+        yield from self._buf[self._front+start:self._front+min(stop,first):step]
+        if stop>first:
+            # Первый логический индекс второго отрезка с тем же шагом
+            second = start if start>=first else start-(start-first)//step*step
+            yield from self._buf[second-first:stop-first:step]
+
+    def segments(self)->tuple[np.ndarray,...]:
+        """
+        Возвращает элементы очереди не более чем двумя представлениями (view) буфера в логическом порядке.
+        Представления действительны до следующего изменения очереди.
+
+        return:
+        (tuple[np.ndarray,...]): Представления буфера (пустой кортеж для пустой очереди)
+        """
+        return self._segments(self._front,self._count) if self._count else ()
+
+    def to_numpy(self,dtype:Optional[npt.DTypeLike] = None)->np.ndarray:
+        """
+        Возвращает копию элементов очереди в виде массива NumPy, приводя тип при копировании представлений.
+
+        param:
+        dtype (Optional[npt.DTypeLike]): Тип элементов массива (None - тип буфера)
+
+        return:
+        (np.ndarray): Массив элементов очереди.
+        """
+        if dtype is None or np.dtype(dtype)==self._buf.dtype:
+            return self.asarray()
+        result = np.empty(self._count,dtype=dtype)
+        offset = 0
+        for segment in self.segments():
+            result[offset:offset+len(segment)] = segment
+            offset+=len(segment)
+        return result
+
+    def to_list(self)->list[T]:
+        """
+        Возвращает список всех элементов очереди (элементы приводятся к типам Python).
+
+        return:
+        (list[T]): Список элементов очереди.
+        """
+        result:list[T] = []
+        for segment in self.segments():
+            result+=segment.tolist()
+        return result
+
+    def to_array(self,typecode:str)->array:
+        """
+        Возвращает элементы очереди в array.array, копируя байты представлений буфера.
+
+        param:
+        typecode (str): Код типа array.array (например, "q" или "d")
+
+        return:
+        (array): Массив элементов очереди.
+        """
+        result = array(typecode)
+        for segment in self.segments():
+            result.frombytes(segment.astype(np.dtype(typecode),copy=False).tobytes())
+        return result
+
+    def asarray(self)->np.ndarray:
+        """
+        Возвращает копию элементов очереди в виде массива NumPy.
+
+        return:
+        (np.ndarray): Массив элементов очереди.
+        """
+        return self._read(self._front,self._count)
+
+    def aslist(self)->list[T]:
+        """
+        Возвращает список всех элементов очереди.
+
+        return:
+        (list[T]): Список элементов очереди.
+        """
+        return self.to_list()
+
+    def __getstate__(self)->dict[str,Any]:
+        """
+        Возвращает состояние для pickle: параметры очереди и элементы очереди не более чем двумя представлениями буфера.
+        С протоколом 5 NumPy передает представления внеполосными буферами, без копирования в поток pickle.
+
+        return:
+        (dict[str,Any]): Состояние очереди
+        """
+        return {"max_size":self._max_size,"dtype":self._buf.dtype,"overflow":self._overflow,"segments":self.segments()}
+
+    def __setstate__(self,state:dict[str,Any])->None:
+        """
+        Восстанавливает очередь из состояния __getstate__() (отрезки копируются в начало нового буфера).
+
+        param:
+        state (dict[str,Any]): Состояние очереди
+        """
+        self.__init__(state["max_size"],state["dtype"],state["overflow"])
+        for segment in state["segments"]:
+            self._buf[self._count:self._count+len(segment)] = segment
+            self._count+=len(segment)
+
+    def __repr__(self) -> str:
+        """
+        Представляет очередь в виде строки для печати (магический метод).
+
+        return:
+        (str): Строковое представление очереди.
+        """
+        return f"CNQueue({self.aslist()}, max_size={self._max_size}, dtype={self._buf.dtype})"
+
+    def clear(self)->None:
+        """
+        Очищает очередь, удаляя все элементы.
+
+        return:
+        (None)
+        """
+        self._discard(self._count)
+
+    def __del__(self)->None:
+        """
+        Очищает очередь перед уничтожением.
+        """
+        self.clear()
+
+
+if __name__ == "__main__":
+    a = CNQueue[int](5,dtype=np.int64)
+    a.push_many(np.arange(4))
+    print(a)
+    print(a.pop_many(2))
+    a.push_many(np.arange(10,13))
+    print(a)
+    print(a.front())
+    print(a.back())
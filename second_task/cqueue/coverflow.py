@@ -0,0 +1,329 @@
+"""
+Модуль coverflow, реализует политики переполнения циклических очередей с учетом отброшенных элементов.
+
+Политика передается в конструктор очереди (параметр overflow) и вызывается только из ветки
+переполнения push()/push_many() с replace=False, поэтому добавление в незаполненную очередь
+выполняется без дополнительных проверок. Без политики очередь, как и раньше, поднимает QFullError.
+
+Класс OverflowPolicy, базовый класс политики переполнения со счетчиками отброшенных элементов.
+Класс DropNewest, отбрасывает новый элемент.
+Класс DropOldest, удаляет первый элемент очереди и добавляет новый.
+Класс Reject, отклоняет новый элемент: вызывает callback и поднимает QFullError.
+Класс Sample, при переполнении добавляет каждый n-й новый элемент (вытесняя первый), остальные отбрасывает.
+"""
+
+from typing import Optional,TypeVar,Generic,Any,Callable,Sequence
+try:
+    from qexception import QFullError
+except ImportError:
+    from .qexception import QFullError
+
+T = TypeVar("T") # Обобщенный тип данных
+
+
+class OverflowPolicy(Generic[T]):
+
+    """
+    Базовый класс политики переполнения.
+
+    Очередь вызывает admit(queue,value), когда заполнена, и admit_many(queue,values,free), когда
+    пакет не помещается. Политика может освободить место через queue.pop() (тогда элемент добавляется)
+    или отбросить элемент. Каждый отброшенный элемент передается в callback.
+
+    attr:
+    callback (Optional[Callable[[T],None]]): Функция, вызываемая для каждого отброшенного элемента
+    dropped (int): Количество отброшенных новых элементов
+    evicted (int): Количество удаленных первых элементов очереди
+
+    method:
+    admit(queue:Any,value:T)->bool: Обрабатывает переполнение при добавлении элемента
+    admit_many(queue:Any,values:Sequence[T],free:int)->None: Обрабатывает переполнение при добавлении пакета
+    reset()->None: Обнуляет счетчики
+    shed (int): Общее количество отброшенных элементов (свойство)
+    """
+
+    def __init__(self,callback:Optional[Callable[[T],None]] = None) -> None:
+        """
+        Инициализация политики с нулевыми счетчиками
+
+        param:
+        callback (Optional[Callable[[T],None]]): Функция, вызываемая для каждого отброшенного элемента
+        """
+        self.callback: Optional[Callable[[T],None]] = callback
+        self.dropped: int = 0
+        self.evicted: int = 0
+
+    @property
+    def shed(self)->int:
+        """
+        Общее количество отброшенных элементов (новых и удаленных из очереди).
+        """
+        return self.dropped+self.evicted
+
+    def reset(self)->None:
+        """
+        Обнуляет счетчики.
+
+        return:
+        (None)
+        """
+        self.dropped = 0
+        self.evicted = 0
+
+    def _drop(self,values:Sequence[T])->None:
+        """
+        Учитывает отброшенные новые элементы.
+
+        param:
+        values (Sequence[T]): Отброшенные элементы
+        """
+        self.dropped+=len(values)
+        if self.callback is not None:
+            for value in values:
+                self.callback(value)
+
+    def _evict_one(self,queue:Any)->None:
+        """
+        Удаляет первый элемент очереди через pop() и учитывает его.
+
+        param:
+        queue (Any): Заполненная очередь
+        """
+        value = queue.pop()
+        self.evicted+=1
+        if self.callback is not None:
+            self.callback(value)
+
+    def _evict(self,queue:Any,n:int)->None:
+        """
+        Удаляет n первых элементов очереди и учитывает их.
+
+        param:
+        queue (Any): Заполненная очередь
+        n (int): Количество удаляемых элементов (не больше длины очереди)
+        """
+        if n<=0:
+            return
+        self.evicted+=n
+        if self.callback is None:
+            queue.pop_many(n)
+        else:
+            for value in queue.pop_many(n):
+                self.callback(value)
+
+    def admit(self,queue:Any,value:T)->bool:
+        """
+        Обрабатывает переполнение при добавлении элемента в заполненную очередь.
+
+        param:
+        queue (Any): Заполненная очередь
+        value (T): Добавляемый элемент
+
+        return:
+        (bool): True, если место освобождено и элемент нужно добавить, False - если элемент отброшен
+        """
+        raise NotImplementedError
+
+    def admit_many(self,queue:Any,values:Sequence[T],free:int)->None:
+        """
+        Обрабатывает переполнение при добавлении пакета, который не помещается в очередь.
+        По умолчанию пакет заполняет свободные места, а остальные элементы добавляются по одному через push().
+
+        param:
+        queue (Any): Очередь
+        values (Sequence[T]): Добавляемые элементы
+        free (int): Количество свободных мест в очереди
+        """
+        if free>0:
+            queue.push_many(values[:free])
+        for value in values[free:]:
+            queue.push(value)
+
+    def __repr__(self) -> str:
+        """
+        Представляет политику в виде строки для печати (магический метод).
+
+        return:
+        (str): Строковое представление политики.
+        """
+        return f"{type(self).__name__}(dropped={self.dropped}, evicted={self.evicted})"
+
+
+class DropNewest(OverflowPolicy[T]):
+
+    """
+    Политика, отбрасывающая новые элементы, которые не помещаются в очередь.
+    """
+
+    def admit(self,queue:Any,value:T)->bool:
+        """
+        Отбрасывает новый элемент.
+
+        param:
+        queue (Any): Заполненная очередь
+        value (T): Добавляемый элемент
+
+        return:
+        (bool): False
+        """
+        self.dropped+=1
+        if self.callback is not None:
+            self.callback(value)
+        return False
+
+    def admit_many(self,queue:Any,values:Sequence[T],free:int)->None:
+        """
+        Добавляет элементы, которые помещаются в очередь, остальные отбрасывает.
+
+        param:
+        queue (Any): Очередь
+        values (Sequence[T]): Добавляемые элементы
+        free (int): Количество свободных мест в очереди
+        """
+        if free>0:
+            queue.push_many(values[:free])
+        self._drop(values[free:])
+
+
+class DropOldest(OverflowPolicy[T]):
+
+    """
+    Политика, удаляющая первые элементы очереди (как replace=True, но с учетом удаленных элементов).
+    """
+
+    def admit(self,queue:Any,value:T)->bool:
+        """
+        Удаляет первый элемент очереди.
+
+        param:
+        queue (Any): Заполненная очередь
+        value (T): Добавляемый элемент
+
+        return:
+        (bool): True
+        """
+        self._evict_one(queue)
+        return True
+
+    def admit_many(self,queue:Any,values:Sequence[T],free:int)->None:
+        """
+        Удаляет столько первых элементов, сколько нужно для пакета, одним pop_many().
+        Если пакет больше очереди, то отбрасываются и его первые элементы.
+
+        param:
+        queue (Any): Очередь
+        values (Sequence[T]): Добавляемые элементы
+        free (int): Количество свободных мест в очереди
+        """
+        need = len(values)-free
+        count = len(queue)
+        self._evict(queue,min(need,count))
+        if need>count:
+            # Первые элементы пакета вытесняются последними
+            self.evicted+=need-count
+            if self.callback is not None:
+                for value in values[:need-count]:
+                    self.callback(value)
+            values = values[need-count:]
+        queue.push_many(values)
+
+
+class Reject(OverflowPolicy[T]):
+
+    """
+    Политика, отклоняющая новые элементы: элемент учитывается, передается в callback, затем поднимается QFullError.
+    Пакет, который не помещается, отклоняется целиком, очередь не изменяется.
+    """
+
+    def admit(self,queue:Any,value:T)->bool:
+        """
+        Отклоняет новый элемент.
+
+        raise:
+        (QFullError): Всегда
+
+        param:
+        queue (Any): Заполненная очередь
+        value (T): Добавляемый элемент
+        """
+        self._drop((value,))
+        raise QFullError()
+
+    def admit_many(self,queue:Any,values:Sequence[T],free:int)->None:
+        """
+        Отклоняет пакет целиком.
+
+        raise:
+        (QFullError): Всегда
+
+        param:
+        queue (Any): Очередь
+        values (Sequence[T]): Добавляемые элементы
+        free (int): Количество свободных мест в очереди
+        """
+        self._drop(values)
+        raise QFullError()
+
+
+class Sample(OverflowPolicy[T]):
+
+    """
+    Политика выборки при перегрузке: из новых элементов, пришедших в заполненную очередь,
+    добавляется каждый n-й (вытесняя первый элемент очереди), остальные отбрасываются.
+
+    attr:
+    n (int): Шаг выборки
+    _seen (int): Количество новых элементов, пришедших в заполненную очередь
+    """
+
+    def __init__(self,n:int,callback:Optional[Callable[[T],None]] = None) -> None:
+        """
+        Инициализация политики
+
+        param:
+        n (int): Шаг выборки (1 - добавлять все элементы, как DropOldest)
+        callback (Optional[Callable[[T],None]]): Функция, вызываемая для каждого отброшенного элемента
+        """
+        assert n>0,"Шаг выборки не может быть отрицательным или равным 0"
+        super().__init__(callback)
+        self.n: int = n
+        self._seen: int = 0
+
+    def reset(self)->None:
+        """
+        Обнуляет счетчики и шаг выборки.
+
+        return:
+        (None)
+        """
+        super().reset()
+        self._seen = 0
+
+    def admit(self,queue:Any,value:T)->bool:
+        """
+        Добавляет каждый n-й элемент, вытесняя первый элемент очереди, остальные отбрасывает.
+
+        param:
+        queue (Any): Заполненная очередь
+        value (T): Добавляемый элемент
+
+        return:
+        (bool): True, если элемент нужно добавить, иначе False
+        """
+        self._seen+=1
+        if self._seen%self.n:
+            self._drop((value,))
+            return False
+        self._evict_one(queue)
+        return True
+
+
+if __name__ == "__main__":
+    try:
+        from cdqueue import CDQueue
+    except ImportError:
+        from .cdqueue import CDQueue
+    policy = Sample[int](3)
+    a = CDQueue[int](3,overflow=policy)
+    a.push_many(range(10))
+    print(a.aslist(),policy)
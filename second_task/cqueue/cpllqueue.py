@@ -0,0 +1,648 @@
+"""
+Модуль cpllqueue, реализует структуру данных циклической очереди на основе связного списка (Linked List).
+Данный связный список заранее проинициализирован: кольцо из max_size узлов связывается при создании очереди!
+
+Класса CPLLQueue, представляет циклическую очередь.
+Очередь предоставляет возможности:
+- добавления элемента
+- удаления элемента и его возврат
+- возвращение ссылки на первый элемент
+- возвращение ссылки на последний элемент
+- проверка на пустоту
+- проверка на заполненость
+- колличество элементов
+- очищение очереди
+- преобразование очереди в список
+- вставка элемента по индексу
+- удаление конкретного элемента
+- изменение размерности очереди
+- пакетное добавление и удаление элементов
+- доступ к элементам и срезам по индексу (в том числе отрицательному)
+- снимок очереди (pickle, dump/load) без свободных узлов кольца
+"""
+from typing import Optional,TypeVar,Generic,Generator,Any,Iterable
+try:
+    from qexception import QFullError,QEmptyError
+    from coverflow import OverflowPolicy
+    import csnapshot
+    from cllqueue import Node
+except ImportError:
+    from .qexception import QFullError,QEmptyError
+    from .coverflow import OverflowPolicy
+    from . import csnapshot
+    from .cllqueue import Node
+
+T = TypeVar("T") # Обобщенный тип данных
+
+
+class CPLLQueue(csnapshot.CSnapshotMixin,Generic[T]):
+
+    """
+    Реализация циклической структуры данных FIFO на основе заранее проинициализированного связного списка
+
+    Кольцо из max_size узлов связывается один раз при создании очереди. Операции push/pop только
+    перемещают ссылки на первый и последний узлы и перезаписывают value, поэтому в установившемся
+    режиме очередь не создает объектов. Свободные узлы лежат в кольце между последним и первым
+    элементами: _back.next - всегда узел для следующего push.
+    resize() вставляет или вырезает цепочку свободных узлов, не перестраивая кольцо.
+
+    attr:
+    _count (int): количество элементов в очереди
+    _max_size (int): максимальное количество элементов в очереди
+    _front (Node[T]): Ссылка на первый элемент в очереди (если очередь пуста - на _back.next)
+    _back (Node[T]): Ссылка на последний элемент в очереди (если очередь пуста - на узел перед _front)
+    _overflow (Optional[OverflowPolicy[T]]): Политика переполнения push()/push_many() (None - QFullError)
+
+    method:
+    empty()->None: Возращает True, если очередь пустая иначе False
+    is_full()->bool: Возращает True, если очередь полная иначу False
+    length()->int: Возвращает количество элементов в очереди
+    clear()->None: Очищение очереди
+    front()->T: Возращает ссылку на первый элемент в очереди
+    back()->T: Возращает ссылку на последний элемент в очереди
+    pop()->T: Удаляет и возращает первый элемент в очереди
+    push(value:T,raplace:bool=False)->None: Добавляет элемент в конец очереди
+    aslist()->list[T]: Возращает очередь в виде списка
+    resize(new_size:int)->None: Изменяет размер очереди
+    insert(index:int, value:T)->None: Вставляет элемент в очередь по индексу
+    remove(value:T)->None: Удаляет первое вхождение значения из очереди
+    push_many(values:Iterable[T],replace:bool=False)->None: Добавляет элементы в конец очереди
+    pop_many(n:int)->list[T]: Удаляет и возращает до n первых элементов очереди
+    extend(values:Iterable[T])->None: Добавляет элементы в конец очереди (аналог push_many)
+    from_iterable(values:Iterable[T],max_size:Optional[int]=None,replace:bool=False)->CPLLQueue[T]: Создает очередь из элементов
+    __getitem__(index:int|slice)->T|list[T]: Возвращает элемент (срез) очереди по индексу за O(index)
+    __setitem__(index:int|slice,value:T|Iterable[T])->None: Заменяет элемент (срез) очереди по индексу
+    __contains__(value:T)->bool: Проверяет вхождение значения в очередь
+    count(value:T)->int: Возвращает количество вхождений значения
+    __getstate__()->dict[str,Any]: Возвращает состояние для pickle (элементы в логическом порядке)
+    __setstate__(state:dict[str,Any])->None: Восстанавливает очередь из состояния pickle
+    dump(path:str)->int: Записывает снимок очереди в файл
+    load(path:str)->CPLLQueue: Восстанавливает очередь из снимка (classmethod)
+    """
+
+    def __init__(self,max_size:int,overflow:Optional[OverflowPolicy[T]] = None) -> None:
+        """
+        Инициализация пустой очереди и кольца из max_size узлов
+
+        param:
+        max_size (int): Размер очереди
+        overflow (Optional[OverflowPolicy[T]]): Политика переполнения push()/push_many() (None - QFullError)
+        """
+        assert max_size>0,"Очередь не может быть отрицательной или равной 0"
+        self._count:int = 0
+        self._max_size:int = max_size
+        first,last = self._chain(max_size)
+        last.next = first
+        self._back: Node[T] = last
+        self._front: Node[T] = first
+        self._overflow: Optional[OverflowPolicy[T]] = overflow
+
+    @staticmethod
+    def _chain(k:int)->tuple[Node[T],Node[T]]:
+        """
+        Создает цепочку из k пустых узлов.
+
+        param:
+        k (int): Количество узлов (больше 0)
+
+        return:
+        (tuple[Node[T],Node[T]]): Первый и последний узлы цепочки
+        """
+        first:Node[T] = Node(None)
+        last:Node[T] = first
+        for _ in range(k-1):
+            last.next = Node(None)
+            last = last.next
+        return first,last
+
+    def empty(self)->bool:
+        """
+        Проверяет, пуста ли очередь.
+
+        return:
+        (bool): True, если очередь пуста, иначе False.
+        """
+        return self._count==0
+
+    def is_full(self)->bool:
+        """
+        Проверяет, полная ли очередь
+
+        return:
+        (bool): True, если очередь полная, иначе False.
+        """
+        return self._count==self._max_size
+
+    def length(self)->int:
+        """
+        Возвращает количество элементов в очереди.
+
+        return:
+        (int): Количество элементов в очереди.
+        """
+        return self._count
+
+    def clear(self)->None:
+        """
+        Очищает очередь, удаляя все элементы (узлы остаются в кольце).
+
+        return:
+        (None)
+        """
+        node = self._front
+        for _ in range(self._count):
+            node.value = None
+            node = node.next
+        self._count = 0
+        self._front = self._back.next
+
+    def __len__(self)->int:
+        """
+        Возвращает количество элементов в очереди (магический метод).
+
+        return:
+        (int): Количество элементов в очереди.
+        """
+        return self.length()
+
+    def front(self)->T:
+        """
+        Возвращает ссылку на первый элемент очереди без его удаления.
+
+        raise:
+        (QEmptyError): Если очередь пуста.
+
+        return:
+        (T): Первый элемент очереди.
+        """
+        if self.empty():
+            raise QEmptyError()
+        return self._front.value
+
+    def back(self)->T:
+        """
+        Возвращает ссылку на последний элемент очереди без его удаления.
+
+        raise:
+        (QEmptyError): Если очередь пуста.
+
+        return:
+        (T): Последний элемент очереди.
+        """
+        if self.empty():
+            raise QEmptyError()
+        return self._back.value
+
+    def pop(self)->T:
+        """
+        Удаляет и возвращает первый элемент очереди.
+
+        raise:
+        (QEmptyError): Если очередь пуста.
+
+        return:
+        value (T) : Удаленный первый элемент очереди.
+        """
+        if self._count==0:
+            raise QEmptyError()
+
+        node = self._front
+        value:T = node.value
+        node.value = None # Узел становится свободным
+        self._front = node.next
+        self._count-=1
+        return value
+
+    def push(self,value:T,replace:bool = False)->None:
+        """
+        Добавляет элемент в конец очереди.
+        1)Если очередь переполнена и replace= False, то поднимаем исключение (или применяем политику overflow).
+        2)Если очередь переполнена и replace= True, то удаляем первый элемент очереди и вставляем новый.
+
+        raise:
+        (QFullError): Если очередь заполнена.
+
+        param:
+        value (T): Элемент для добавления в очередь.
+        replace (bool): Указывает на то, что нужно ли удалять первый элемент при переполнении
+        """
+        if self._count==self._max_size:
+            if replace:
+                # Следующий узел после последнего - первый элемент, он перезаписывается
+                self._front = self._front.next
+                self._count-=1
+            elif self._overflow is None:
+                raise QFullError()
+            elif not self._overflow.admit(self,value):
+                return
+        self._back = self._back.next
+        self._back.value = value
+        self._count+=1
+
+    def push_many(self,values:Iterable[T],replace:bool = False)->None:
+        """
+        Добавляет элементы в конец очереди.
+        1)Если элементы не помещаются и replace= False, то поднимаем исключение, очередь не изменяется (или применяем политику overflow).
+        2)Если элементы не помещаются и replace= True, то удаляем первые элементы очереди и вставляем новые.
+
+        raise:
+        (QFullError): Если элементы не помещаются в очередь.
+
+        param:
+        values (Iterable[T]): Элементы для добавления в очередь.
+        replace (bool): Указывает на то, что нужно ли удалять первые элементы при переполнении
+        """
+        values = list(values)
+        k = len(values)
+        if k>self._max_size-self._count:
+            if not replace:
+                if self._overflow is None:
+                    raise QFullError()
+                self._overflow.admit_many(self,values,self._max_size-self._count)
+                return
+            if k>self._max_size:
+                values = values[k-self._max_size:]
+                k = self._max_size
+            self._discard(k-(self._max_size-self._count))
+
+        node = self._back
+        for value in values:
+            node = node.next
+            node.value = value
+        self._back = node
+        self._count+=k
+
+    def extend(self,values:Iterable[T])->None:
+        """
+        Добавляет элементы в конец очереди (аналог push_many с replace=False).
+
+        raise:
+        (QFullError): Если элементы не помещаются в очередь.
+
+        param:
+        values (Iterable[T]): Элементы для добавления в очередь.
+        """
+        self.push_many(values)
+
+    def _discard(self,k:int)->None:
+        """
+        Удаляет k первых элементов очереди без их возврата.
+
+        param:
+        k (int): Количество удаляемых элементов (не больше количества элементов в очереди)
+        """
+        node = self._front
+        for _ in range(k):
+            node.value = None
+            node = node.next
+        self._front = node
+        self._count-=k
+
+    def pop_many(self,n:int)->list[T]:
+        """
+        Удаляет и возвращает до n первых элементов очереди.
+        Если в очереди меньше n элементов, то возвращаются все элементы.
+
+        raise:
+        (QEmptyError): Если очередь пуста.
+        (ValueError): Если n отрицательное.
+
+        param:
+        n (int): Максимальное количество удаляемых элементов
+
+        return:
+        (list[T]) : Удаленные элементы в порядке очереди.
+        """
+        if n<0:
+            raise ValueError("Количество элементов не может быть отрицательным")
+        if self.empty():
+            raise QEmptyError()
+
+        k = min(n,self._count)
+        values:list[T] = []
+        node = self._front
+        for _ in range(k):
+            values.append(node.value)
+            node.value = None
+            node = node.next
+        self._front = node
+        self._count-=k
+        return values
+
+    @classmethod
+    def from_iterable(cls,values:Iterable[T],max_size:Optional[int] = None,replace:bool = False)->'CPLLQueue[T]':
+        """
+        Создает очередь из элементов.
+
+        raise:
+        (QFullError): Если элементы не помещаются в очередь и replace= False.
+
+        param:
+        values (Iterable[T]): Элементы для добавления в очередь.
+        max_size (Optional[int]): Размер очереди, по умолчанию равен количеству элементов (не меньше 1)
+        replace (bool): Указывает на то, что нужно ли удалять первые элементы при переполнении
+
+        return:
+        (CPLLQueue[T]): Новая очередь
+        """
+        values = list(values)
+        queue = cls(max(1,len(values)) if max_size is None else max_size)
+        queue.push_many(values,replace)
+        return queue
+
+    def resize(self,new_size:int)->None:
+        """
+        Изменяет размер очереди. При уменьшении сохраняются последние элементы.
+        Новые узлы вставляются цепочкой после последнего элемента, лишние свободные узлы вырезаются цепочкой.
+
+        raise:
+        (ValueError): Если размер отрицательный
+
+        param:
+        new_size (int): Размер очереди
+        """
+        if new_size<=0:
+            raise ValueError("Размер очереди должен быть больше 0")
+
+        if new_size>self._max_size:
+            first,last = self._chain(new_size-self._max_size)
+            last.next = self._back.next
+            self._back.next = first
+        elif new_size<self._max_size:
+            # Удаляем старые значения
+            self._discard(max(0,self._count-new_size))
+            # Вырезаем цепочку свободных узлов после последнего элемента
+            cut = self._back.next
+            for _ in range(self._max_size-new_size):
+                cut = cut.next
+            self._back.next = cut
+        self._max_size = new_size
+        if self._count==0:
+            self._front = self._back.next
+
+    def _take_free(self)->Node[T]:
+        """
+        Вырезает из кольца свободный узел после последнего элемента (очередь не должна быть заполнена).
+
+        return:
+        (Node[T]): Свободный узел
+        """
+        node = self._back.next
+        self._back.next = node.next
+        return node
+
+    def insert(self,index:int, value:T)->None:
+        """
+        Вставляет элемент в очередь по индексу.
+
+        Если индекс отрицательный, то элемент вставляется в начало очереди.
+        Если индекс больше кол-ва находящихся элементов в очереди, то
+        элемент вставляется в конец очереди.
+
+        raise:
+        (QFullError): Если очередь заполнена.
+
+        param:
+        index (int): Вставка элемента в позициию указаным индексом.
+        value (T): Элемент для добавления в очередь.
+        """
+        if self.is_full():
+            raise QFullError()
+
+        index = self._count if index>self._count else 0 if index<0 else index
+        if index==self._count:
+            self.push(value)
+            return
+
+        node = self._take_free()
+        prev = self._front
+        for _ in range(index-1):
+            prev = prev.next
+        node.next = prev.next
+        prev.next = node
+        if index==0:
+            # Узел встал после первого: меняем значения местами
+            node.value,prev.value = prev.value,value
+            if self._back is prev:
+                self._back = node
+        else:
+            node.value = value
+            if self._back is prev:
+                self._back = node
+        self._count+=1
+
+    def remove(self,value:T)->None:
+        """
+        Удаляет первое вхождение значения из очереди
+
+        raise:
+        (QEmptyError): Если очередь пуста.
+        (ValueError): Если очередь не имеет элемент с указаным значением
+
+        param:
+        value (T): Элемент для удаления из очереди.
+        """
+        if self.empty():
+            raise QEmptyError()
+
+        prev:Optional[Node[T]] = None
+        node = self._front
+        for _ in range(self._count):
+            if node.value == value:
+                break
+            prev,node = node,node.next
+        else:
+            raise ValueError("Очередь не имеет элемент с указаным значением")
+
+        node.value = None
+        self._count-=1
+        if prev is None:
+            self._front = node.next # Узел остается в кольце свободным
+        elif node is self._back:
+            self._back = prev # Узел остается в кольце свободным
+        else:
+            # Переносим узел в свободную часть кольца
+            prev.next = node.next
+            node.next = self._back.next
+            self._back.next = node
+
+    def aslist(self)->list[T]:
+        """
+        Возвращает список всех элементов очереди.
+
+        return:
+        (list[T]): Список элементов очереди.
+        """
+        return [i for i in self]
+
+    def _index(self,index:int)->int:
+        """
+        Нормализует логический индекс элемента (отрицательный индекс считается с конца очереди).
+
+        raise:
+        (IndexError): Если индекс вне диапазона очереди
+
+        param:
+        index (int): Логический индекс
+
+        return:
+        (int): Логический индекс от 0 до length()-1
+        """
+        if index<0:
+            index+=self._count
+        if not 0<=index<self._count:
+            raise IndexError("Индекс вне диапазона очереди")
+        return index
+
+    def _span(self,start:int,k:int)->Generator[Node[T],None,None]:
+        """
+        Генератор k подряд идущих узлов, начиная с логического индекса start (проход от первого узла).
+
+        param:
+        start (int): Логический индекс первого узла
+        k (int): Количество узлов
+
+        return:
+        (Generator[Node[T],None,None]): Узлы очереди
+        """
+        node = self._front
+        if start==self._count-1:
+            node = self._back
+        else:
+            for _ in range(start):
+                node = node.next
+        for _ in range(k):
+            yield node
+            node = node.next
+
+    def __getitem__(self,index:int|slice)->T|list[T]:
+        """
+        Возвращает элемент очереди по логическому индексу (0 - первый, -1 - последний) или срез в виде списка.
+
+        raise:
+        (IndexError): Если индекс вне диапазона очереди
+
+        param:
+        index (int|slice): Индекс или срез
+
+        return:
+        (T|list[T]): Элемент или список элементов
+        """
+        if isinstance(index,slice):
+            start,stop,step = index.indices(self._count)
+            positions = range(start,stop,step)
+            if len(positions)==0:
+                return []
+            low = min(positions[0],positions[-1])
+            span = [node.value for node in self._span(low,abs(positions[-1]-positions[0])+1)]
+            return span if step==1 else span[positions[0]-low::step]
+        return next(self._span(self._index(index),1)).value
+
+    def __setitem__(self,index:int|slice,value:T|Iterable[T])->None:
+        """
+        Заменяет элемент очереди по логическому индексу или элементы среза.
+        Срез заменяется элементами того же количества (размер очереди не меняется).
+
+        raise:
+        (IndexError): Если индекс вне диапазона очереди
+        (ValueError): Если количество элементов не совпадает с длиной среза
+
+        param:
+        index (int|slice): Индекс или срез
+        value (T|Iterable[T]): Элемент или элементы среза
+        """
+        if isinstance(index,slice):
+            positions = range(*index.indices(self._count))
+            values = list(value)
+            if len(values)!=len(positions):
+                raise ValueError("Количество элементов не совпадает с длиной среза")
+            if len(positions)==0:
+                return
+            low = min(positions[0],positions[-1])
+            nodes = list(self._span(low,abs(positions[-1]-positions[0])+1))[positions[0]-low::positions.step]
+            for node,el in zip(nodes,values):
+                node.value = el
+            return
+        next(self._span(self._index(index),1)).value = value
+
+    def __contains__(self,value:T)->bool:
+        """
+        Проверяет вхождение значения в очередь (магический метод) проходом по списку.
+
+        param:
+        value (T): Искомое значение
+
+        return:
+        (bool): True, если значение есть в очереди, иначе False
+        """
+        return any(el==value for el in self)
+
+    def count(self,value:T)->int:
+        """
+        Возвращает количество вхождений значения в очередь (проходом по списку).
+
+        param:
+        value (T): Искомое значение
+
+        return:
+        (int): Количество вхождений
+        """
+        return sum(1 for el in self if el==value)
+
+    def __iter__(self)->Generator[T,None,None]:
+        """
+        Генератор, который позволяет итерировать по элементам очереди (магический метод).
+
+        return:
+        (Generator[T,None,None]): Генератор, который возвращает элементы очереди один за другим.
+        """
+        node = self._front
+        for _ in range(self._count):
+            yield node.value
+            node = node.next
+
+    def __getstate__(self)->dict[str,Any]:
+        """
+        Возвращает состояние для pickle: параметры очереди и только элементы очереди в логическом порядке (без кольца узлов).
+
+        return:
+        (dict[str,Any]): Состояние очереди
+        """
+        return {"max_size":self._max_size,"overflow":self._overflow,"values":self.aslist()}
+
+    def __setstate__(self,state:dict[str,Any])->None:
+        """
+        Восстанавливает очередь из состояния __getstate__() (кольцо узлов строится заново).
+
+        param:
+        state (dict[str,Any]): Состояние очереди
+        """
+        self.__init__(state["max_size"],state["overflow"])
+        self.push_many(state["values"])
+
+    def __repr__(self) -> str:
+        """
+        Представляет очередь в виде строки для печати (магический метод).
+
+        return:
+        (str): Строковое представление очереди.
+        """
+        return f"CPLLQueue({self.aslist()}, max_size={self._max_size})"
+
+    def __del__(self)->None:
+        """
+        Очищает очередь перед уничтожением.
+        """
+        self.clear()
+
+
+if __name__ == "__main__":
+    a = CPLLQueue[int](5)
+    a.push_many([1,2,3])
+    a.insert(0,0)
+    a.remove(2)
+    print(a)
+    a.resize(2)
+    print(a)
+    print(a.front())
+    print(a.back())
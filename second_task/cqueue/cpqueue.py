@@ -0,0 +1,395 @@
+"""
+Модуль cpqueue, реализует многополосную очередь с приоритетами поверх существующих очередей пакета.
+
+Класса CPQueue, представляет очередь из K ограниченных циклических полос (по одной на приоритет).
+Очередь предоставляет возможности:
+- добавления элемента в полосу приоритета
+- удаления элемента и его возврат (строгий приоритет или взвешенный циклический обход полос)
+- возвращение ссылки на следующий извлекаемый элемент
+- проверка на пустоту
+- проверка на заполненость
+- колличество элементов (всего и по полосам)
+- очищение очереди
+- преобразование очереди в список
+- изменение размерности полос
+- пакетное добавление и удаление элементов
+- размер и политика переполнения для каждой полосы
+"""
+
+from typing import Optional,TypeVar,Generic,Generator,Any,Callable,Iterable,Sequence
+try:
+    from qexception import QEmptyError
+    from cdqueue import CDQueue
+    from coverflow import OverflowPolicy
+except ImportError:
+    from .qexception import QEmptyError
+    from .cdqueue import CDQueue
+    from .coverflow import OverflowPolicy
+
+T = TypeVar("T") # Обобщенный тип данных
+
+
+class CPQueue(Generic[T]):
+
+    """
+    Многополосная очередь с приоритетами.
+
+    Каждый приоритет - отдельная циклическая очередь пакета (CAQueue, CDQueue, CLLQueue, CPLLQueue, CSQueue, CNQueue)
+    со своим размером и политикой переполнения, поэтому заполненная полоса массовых данных не мешает
+    добавлять управляющие сообщения в другую полосу. Полоса 0 - наивысший приоритет.
+    Непустые полосы отмечены битами целого числа _mask, поэтому следующая полоса находится за O(1)
+    (младший установленный бит: (mask & -mask).bit_length()-1), без перебора пустых полос.
+    Режимы извлечения:
+    1)Строгий приоритет (weights=None): всегда извлекается элемент самой приоритетной непустой полосы.
+    2)Взвешенный циклический обход (weights): полоса i выдает до weights[i] элементов подряд, затем
+    обход переходит к следующей непустой полосе. Опустевшая полоса пропускается, поэтому низкий приоритет
+    не голодает, а свободная доля достается остальным полосам.
+    Внутри полосы порядок FIFO.
+
+    attr:
+    _lanes (list[CAQueue[T]|CDQueue[T]|CLLQueue[T]|CPLLQueue[T]|CSQueue[T]|CNQueue[T]]): Полосы, по одной на приоритет
+    _mask (int): Битовая маска непустых полос
+    _weights (Optional[tuple[int,...]]): Веса полос (None - строгий приоритет)
+    _lane (int): Текущая полоса взвешенного обхода
+    _credit (int): Количество элементов, которое текущая полоса еще может выдать в этом обходе
+
+    method:
+    empty()->None: Возращает True, если очередь пустая иначе False
+    is_full()->bool: Возращает True, если заполнены все полосы иначу False
+    length()->int: Возвращает количество элементов в очереди
+    lengths()->list[int]: Возвращает количество элементов в каждой полосе
+    lane(priority:int)->CAQueue[T]|CDQueue[T]|CLLQueue[T]|CPLLQueue[T]|CSQueue[T]|CNQueue[T]: Возвращает полосу приоритета
+    clear()->None: Очищение очереди
+    front()->T: Возращает ссылку на следующий извлекаемый элемент
+    pop()->T: Удаляет и возращает следующий элемент по режиму извлечения
+    push(value:T,priority:int=-1,raplace:bool=False)->None: Добавляет элемент в конец полосы приоритета
+    push_many(values:Iterable[T],priority:int=-1,replace:bool=False)->None: Добавляет элементы в конец полосы приоритета
+    pop_many(n:int)->list[T]: Удаляет и возращает до n элементов по режиму извлечения
+    aslist()->list[T]: Возращает элементы полос в порядке приоритета
+    resize(new_size:int,priority:Optional[int]=None)->None: Изменяет размер одной или всех полос
+    lanes (int): Количество полос (свойство)
+    weights (Optional[tuple[int,...]]): Веса полос (свойство)
+    """
+
+    def __init__(self,max_size:int|Sequence[int],lanes:int = 2,backend:Callable[...,Any] = CDQueue,weights:Optional[Sequence[int]] = None,
+                 overflow:Optional[OverflowPolicy[T]|Sequence[Optional[OverflowPolicy[T]]]] = None,**kwargs:Any) -> None:
+        """
+        Инициализация пустой очереди
+
+        raise:
+        (ValueError): Если количество размеров, весов или политик не совпадает с количеством полос или вес не положительный
+
+        param:
+        max_size (int|Sequence[int]): Размер каждой полосы или размеры полос по приоритетам
+        lanes (int): Количество полос (приоритетов), если max_size - число
+        backend (Callable[...,Any]): Класс очереди для полос (по умолчанию CDQueue)
+        weights (Optional[Sequence[int]]): Веса полос для взвешенного обхода (None - строгий приоритет)
+        overflow (Optional[OverflowPolicy[T]|Sequence[Optional[OverflowPolicy[T]]]]): Политика переполнения всех полос или каждой полосы
+        kwargs (Any): Дополнительные параметры конструктора очереди (например, dtype для CNQueue)
+        """
+        sizes = [max_size]*lanes if isinstance(max_size,int) else list(max_size)
+        assert len(sizes)>0,"Количество полос должно быть больше 0"
+        for size in sizes:
+            assert size>0,"Очередь не может быть отрицательной или равной 0"
+        policies = list(overflow) if isinstance(overflow,Sequence) else [overflow]*len(sizes)
+        if len(policies)!=len(sizes):
+            raise ValueError("Количество политик переполнения не совпадает с количеством полос")
+        if weights is not None:
+            if len(weights)!=len(sizes):
+                raise ValueError("Количество весов не совпадает с количеством полос")
+            if min(weights)<=0:
+                raise ValueError("Вес полосы должен быть больше 0")
+        self._lanes = [backend(size,overflow=policy,**kwargs) for size,policy in zip(sizes,policies)]
+        self._mask:int = 0
+        self._weights:Optional[tuple[int,...]] = None if weights is None else tuple(weights)
+        self._lane:int = len(self._lanes)-1 # Первый обход начинается с полосы 0
+        self._credit:int = 0
+
+    @property
+    def lanes(self)->int:
+        """
+        Количество полос (приоритетов).
+        """
+        return len(self._lanes)
+
+    @property
+    def weights(self)->Optional[tuple[int,...]]:
+        """
+        Веса полос (None - строгий приоритет).
+        """
+        return self._weights
+
+    def _index(self,priority:int)->int:
+        """
+        Переводит приоритет (в том числе отрицательный, как индекс списка) в номер полосы.
+
+        raise:
+        (IndexError): Если полосы с таким приоритетом нет
+
+        param:
+        priority (int): Приоритет
+
+        return:
+        (int): Номер полосы
+        """
+        k = len(self._lanes)
+        if not -k<=priority<k:
+            raise IndexError("Полосы с таким приоритетом нет")
+        return priority%k
+
+    def _next(self)->int:
+        """
+        Выбирает полосу следующего извлекаемого элемента (очередь не пуста).
+        В режиме взвешенного обхода переходит к следующей непустой полосе, если текущая пуста или исчерпала вес.
+
+        return:
+        (int): Номер полосы
+        """
+        mask = self._mask
+        if self._weights is None:
+            return (mask & -mask).bit_length()-1
+        lane = self._lane
+        if self._credit<=0 or not (mask>>lane)&1:
+            higher = mask>>(lane+1)<<(lane+1) # Непустые полосы после текущей, иначе обход начинается сначала
+            mask = higher or mask
+            lane = (mask & -mask).bit_length()-1
+            self._lane = lane
+            self._credit = self._weights[lane]
+        return lane
+
+    def empty(self)->bool:
+        """
+        Проверяет, пуста ли очередь.
+
+        return:
+        (bool): True, если очередь пуста, иначе False.
+        """
+        return self._mask==0
+
+    def is_full(self)->bool:
+        """
+        Проверяет, заполнены ли все полосы.
+
+        return:
+        (bool): True, если все полосы заполнены, иначе False.
+        """
+        return all(lane.is_full() for lane in self._lanes)
+
+    def length(self)->int:
+        """
+        Возвращает количество элементов во всех полосах.
+
+        return:
+        (int): Количество элементов в очереди.
+        """
+        return sum(lane.length() for lane in self._lanes)
+
+    def lengths(self)->list[int]:
+        """
+        Возвращает количество элементов в каждой полосе.
+
+        return:
+        (list[int]): Количество элементов по приоритетам.
+        """
+        return [lane.length() for lane in self._lanes]
+
+    def __len__(self)->int:
+        """
+        Возвращает количество элементов во всех полосах (магический метод).
+
+        return:
+        (int): Количество элементов в очереди.
+        """
+        return self.length()
+
+    def lane(self,priority:int)->Any:
+        """
+        Возвращает полосу приоритета (например, для чтения счетчиков ее политики переполнения).
+        Элементы, добавленные или удаленные напрямую через полосу, не учитываются маской непустых полос.
+
+        raise:
+        (IndexError): Если полосы с таким приоритетом нет
+
+        param:
+        priority (int): Приоритет
+
+        return:
+        (CAQueue[T]|CDQueue[T]|CLLQueue[T]|CPLLQueue[T]|CSQueue[T]|CNQueue[T]): Полоса
+        """
+        return self._lanes[self._index(priority)]
+
+    def clear(self)->None:
+        """
+        Очищает все полосы и начинает взвешенный обход сначала.
+
+        return:
+        (None)
+        """
+        for lane in self._lanes:
+            lane.clear()
+        self._mask = 0
+        self._lane = len(self._lanes)-1
+        self._credit = 0
+
+    def front(self)->T:
+        """
+        Возвращает ссылку на элемент, который будет извлечен следующим, без его удаления.
+
+        raise:
+        (QEmptyError): Если очередь пуста.
+
+        return:
+        (T): Следующий элемент очереди.
+        """
+        if self._mask==0:
+            raise QEmptyError()
+        return self._lanes[self._next()].front()
+
+    def push(self,value:T,priority:int = -1,replace:bool = False)->None:
+        """
+        Добавляет элемент в конец полосы приоритета.
+        1)Если полоса заполнена и replace= False, то поднимаем исключение (или применяем политику overflow полосы).
+        2)Если полоса заполнена и replace= True, то удаляем первый элемент полосы и вставляем новый.
+
+        raise:
+        (QFullError): Если полоса заполнена.
+        (IndexError): Если полосы с таким приоритетом нет
+
+        param:
+        value (T): Элемент для добавления в очередь.
+        priority (int): Приоритет (0 - наивысший, по умолчанию -1 - наинизший)
+        replace (bool): Указывает на то, что нужно ли удалять первый элемент полосы при переполнении
+        """
+        k = len(self._lanes)
+        if not -k<=priority<k: # Проверка _index() без вызова метода: push() - горячий путь
+            raise IndexError("Полосы с таким приоритетом нет")
+        lane = priority%k
+        self._lanes[lane].push(value,replace)
+        self._mask|=1<<lane # После добавления (или политики переполнения) полоса не пуста
+
+    def push_many(self,values:Iterable[T],priority:int = -1,replace:bool = False)->None:
+        """
+        Добавляет элементы в конец полосы приоритета.
+        1)Если элементы не помещаются и replace= False, то поднимаем исключение (или применяем политику overflow полосы).
+        2)Если элементы не помещаются и replace= True, то удаляем первые элементы полосы и вставляем новые.
+
+        raise:
+        (QFullError): Если элементы не помещаются в полосу.
+        (IndexError): Если полосы с таким приоритетом нет
+
+        param:
+        values (Iterable[T]): Элементы для добавления в очередь.
+        priority (int): Приоритет (0 - наивысший, по умолчанию -1 - наинизший)
+        replace (bool): Указывает на то, что нужно ли удалять первые элементы полосы при переполнении
+        """
+        lane = self._index(priority)
+        queue = self._lanes[lane]
+        queue.push_many(values,replace)
+        if not queue.empty():
+            self._mask|=1<<lane
+
+    def pop(self)->T:
+        """
+        Удаляет и возвращает следующий элемент: из самой приоритетной непустой полосы
+        или из текущей полосы взвешенного обхода.
+
+        raise:
+        (QEmptyError): Если очередь пуста.
+
+        return:
+        value (T) : Удаленный элемент.
+        """
+        mask = self._mask
+        if mask==0:
+            raise QEmptyError()
+        lane = (mask & -mask).bit_length()-1 if self._weights is None else self._next()
+        queue = self._lanes[lane]
+        value:T = queue.pop()
+        self._credit-=1
+        if queue.empty():
+            self._mask&=~(1<<lane)
+        return value
+
+    def pop_many(self,n:int)->list[T]:
+        """
+        Удаляет и возвращает до n элементов в том же порядке, что и n вызовов pop().
+        Элементы извлекаются из полос пакетами (pop_many() полосы).
+
+        raise:
+        (QEmptyError): Если очередь пуста.
+        (ValueError): Если n отрицательное.
+
+        param:
+        n (int): Максимальное количество удаляемых элементов
+
+        return:
+        (list[T]) : Удаленные элементы.
+        """
+        if n<0:
+            raise ValueError("Количество элементов не может быть отрицательным")
+        if self._mask==0:
+            raise QEmptyError()
+        values:list[T] = []
+        while len(values)<n and self._mask:
+            lane = self._next()
+            queue = self._lanes[lane]
+            k = n-len(values) if self._weights is None else min(n-len(values),self._credit)
+            popped = queue.pop_many(k)
+            values.extend(popped)
+            self._credit-=len(popped)
+            if queue.empty():
+                self._mask&=~(1<<lane)
+        return values
+
+    def resize(self,new_size:int,priority:Optional[int] = None)->None:
+        """
+        Изменяет размер одной или всех полос. При уменьшении удаляются первые элементы полосы.
+
+        raise:
+        (ValueError): Если размер отрицательный
+        (IndexError): Если полосы с таким приоритетом нет
+
+        param:
+        new_size (int): Размер полосы
+        priority (Optional[int]): Приоритет полосы (None - все полосы)
+        """
+        lanes = range(len(self._lanes)) if priority is None else (self._index(priority),)
+        for lane in lanes:
+            self._lanes[lane].resize(new_size)
+
+    def aslist(self)->list[T]:
+        """
+        Возвращает элементы всех полос в порядке приоритета (не в порядке извлечения взвешенного обхода).
+
+        return:
+        (list[T]): Список элементов очереди.
+        """
+        return [value for lane in self._lanes for value in lane.aslist()]
+
+    def __iter__(self)->Generator[T,None,None]:
+        """
+        Генератор, который позволяет итерировать по элементам полос в порядке приоритета (магический метод).
+
+        return:
+        (Generator[T,None,None]): Генератор, который возвращает элементы очереди один за другим.
+        """
+        for lane in self._lanes:
+            yield from lane
+
+    def __repr__(self) -> str:
+        """
+        Представляет очередь в виде строки для печати (магический метод).
+
+        return:
+        (str): Строковое представление очереди.
+        """
+        mode = "strict" if self._weights is None else f"weights={list(self._weights)}"
+        return f"CPQueue({[lane.aslist() for lane in self._lanes]}, {mode})"
+
+
+if __name__ == "__main__":
+    a = CPQueue[str](4,lanes=2,weights=[3,1])
+    a.push_many(["bulk1","bulk2","bulk3"])
+    a.push_many(["ctl1","ctl2","ctl3","ctl4"],0)
+    print(a)
+    print(a.pop_many(7))
@@ -0,0 +1,408 @@
+"""
+Модуль cshmqueue, реализует циклическую очередь для передачи данных между процессами через общую память
+(multiprocessing.shared_memory).
+
+Класса CSHMQueue, представляет очередь с одним производителем и одним потребителем (SPSC) без блокировок.
+Очередь предоставляет возможности:
+- добавления элемента (записи фиксированного размера)
+- удаления элемента и его возврат
+- возвращение первого элемента
+- возвращение последнего элемента
+- проверка на пустоту
+- проверка на заполненость
+- колличество элементов
+- очищение очереди (потребителем)
+- пакетное добавление и удаление элементов массивами NumPy
+- представления (view) NumPy на элементы в общей памяти без копирования
+"""
+
+from multiprocessing import shared_memory
+from typing import Optional,TypeVar,Generic,Generator,Any
+import numpy as np
+import numpy.typing as npt
+try:
+    from qexception import QFullError,QEmptyError
+except ImportError:
+    from .qexception import QFullError,QEmptyError
+
+T = TypeVar("T") # Обобщенный тип данных
+
+# Расположение заголовка: счетчики производителя и потребителя лежат в разных строках кэша,
+# чтобы процессы не инвалидировали строки друг друга при каждой операции
+_HEAD = 0       # Количество добавленных элементов (пишет только производитель)
+_TAIL = 8       # Количество удаленных элементов (пишет только потребитель)
+_MAX_SIZE = 16  # Размер очереди
+_ITEMSIZE = 17  # Размер записи в байтах
+_HEADER_SIZE = 192 # Размер заголовка в байтах (int64 по смещениям выше * 8)
+
+
+class CSHMQueue(Generic[T]):
+
+    """
+    Циклическая очередь FIFO в общей памяти для одного производителя и одного потребителя.
+
+    Записи фиксированного размера (dtype NumPy) копируются в общую память без сериализации (pickle).
+    Вместо индексов первого и последнего элемента хранятся два монотонных счетчика:
+    head (пишет только производитель) и tail (пишет только потребитель), количество элементов
+    равно head-tail, а физический индекс - счетчик по модулю размера очереди. Так каждый
+    счетчик изменяет ровно один процесс и блокировки не нужны.
+    Производитель вызывает только push()/push_many(), потребитель - pop()/pop_many()/clear().
+
+    attr:
+    _shm (Optional[shared_memory.SharedMemory]): Блок общей памяти (None после close())
+    _name (str): Имя блока общей памяти
+    _header (np.ndarray): Заголовок (счетчики и параметры очереди)
+    _buf (np.ndarray): Контейнер очереди в общей памяти
+    _max_size (int): максимальное количество элементов в очереди
+    _owner (bool): True, если блок общей памяти создан этим объектом
+
+    method:
+    empty()->None: Возращает True, если очередь пустая иначе False
+    is_full()->bool: Возращает True, если очередь полная иначу False
+    length()->int: Возвращает количество элементов в очереди
+    clear()->None: Очищение очереди (потребитель)
+    front()->T: Возращает первый элемент в очереди
+    back()->T: Возращает последний элемент в очереди
+    pop()->T: Удаляет и возращает первый элемент в очереди (потребитель)
+    push(value:T)->None: Добавляет элемент в конец очереди (производитель)
+    push_many(values:npt.ArrayLike)->None: Добавляет массив элементов в конец очереди (производитель)
+    pop_many(n:int)->np.ndarray: Удаляет и возращает до n первых элементов очереди (потребитель)
+    segments()->tuple[np.ndarray,...]: Возвращает представления элементов в общей памяти без копирования
+    aslist()->list[T]: Возращает очередь в виде списка
+    attach(name:str,dtype)->CSHMQueue[T]: Подключается к существующей очереди по имени блока
+    close()->None: Отключается от блока общей памяти
+    unlink()->None: Удаляет блок общей памяти (создатель очереди)
+    """
+
+    def __init__(self,max_size:int,dtype:npt.DTypeLike = np.float64,name:Optional[str] = None,
+                 _shm:Optional[shared_memory.SharedMemory] = None) -> None:
+        """
+        Инициализация пустой очереди в новом блоке общей памяти
+
+        param:
+        max_size (int): Размер очереди
+        dtype (npt.DTypeLike): Тип записи (например, np.float64, "S64" или структурный dtype)
+        name (Optional[str]): Имя блока общей памяти, по умолчанию генерируется
+        """
+        assert max_size>0,"Очередь не может быть отрицательной или равной 0"
+        dtype = np.dtype(dtype)
+        assert not dtype.hasobject,"Записи в общей памяти не могут содержать объекты Python"
+        self._owner: bool = _shm is None
+        if _shm is None:
+            _shm = shared_memory.SharedMemory(name=name,create=True,size=_HEADER_SIZE+max_size*dtype.itemsize)
+        self._shm: Optional[shared_memory.SharedMemory] = _shm
+        self._name: str = _shm.name
+        self._header: np.ndarray = np.ndarray(_HEADER_SIZE//8,dtype=np.int64,buffer=_shm.buf)
+        if self._owner:
+            self._header[:] = 0
+            self._header[_MAX_SIZE] = max_size
+            self._header[_ITEMSIZE] = dtype.itemsize
+        self._max_size: int = max_size
+        self._buf: np.ndarray = np.ndarray(max_size,dtype=dtype,buffer=_shm.buf,offset=_HEADER_SIZE)
+
+    @classmethod
+    def attach(cls,name:str,dtype:npt.DTypeLike = np.float64)->'CSHMQueue[T]':
+        """
+        Подключается к очереди, созданной в другом процессе.
+
+        raise:
+        (ValueError): Если размер записи не совпадает с размером записи очереди
+
+        param:
+        name (str): Имя блока общей памяти
+        dtype (npt.DTypeLike): Тип записи (должен совпадать с типом очереди)
+
+        return:
+        (CSHMQueue[T]): Очередь над существующим блоком
+        """
+        shm = shared_memory.SharedMemory(name=name)
+        header = np.ndarray(_HEADER_SIZE//8,dtype=np.int64,buffer=shm.buf)
+        max_size,itemsize = int(header[_MAX_SIZE]),int(header[_ITEMSIZE])
+        del header
+        if np.dtype(dtype).itemsize!=itemsize:
+            shm.close()
+            raise ValueError("Размер записи не совпадает с размером записи очереди")
+        return cls(max_size,dtype,_shm=shm)
+
+    @property
+    def name(self)->str:
+        """Имя блока общей памяти для attach() в другом процессе."""
+        return self._name
+
+    @property
+    def dtype(self)->np.dtype:
+        """Тип записи очереди."""
+        return self._buf.dtype
+
+    def length(self)->int:
+        """
+        Возвращает количество элементов в очереди.
+
+        return:
+        (int): Количество элементов в очереди.
+        """
+        header = self._header
+        return int(header[_HEAD]-header[_TAIL])
+
+    def empty(self)->bool:
+        """
+        Проверяет, пуста ли очередь.
+
+        return:
+        (bool): True, если очередь пуста, иначе False.
+        """
+        return self.length()==0
+
+    def is_full(self)->bool:
+        """
+        Проверяет, полная ли очередь
+
+        return:
+        (bool): True, если очередь полная, иначе False.
+        """
+        return self.length()==self._max_size
+
+    def front(self)->T:
+        """
+        Возвращает копию первого элемента очереди без его удаления.
+
+        raise:
+        (QEmptyError): Если очередь пуста.
+
+        return:
+        (T): Первый элемент очереди.
+        """
+        tail = int(self._header[_TAIL])
+        if self._header[_HEAD]==tail:
+            raise QEmptyError()
+        return self._buf[tail%self._max_size].copy()
+
+    def back(self)->T:
+        """
+        Возвращает копию последнего элемента очереди без его удаления.
+
+        raise:
+        (QEmptyError): Если очередь пуста.
+
+        return:
+        (T): Последний элемент очереди.
+        """
+        head = int(self._header[_HEAD])
+        if head==self._header[_TAIL]:
+            raise QEmptyError()
+        return self._buf[(head-1)%self._max_size].copy()
+
+    def push(self,value:T)->None:
+        """
+        Добавляет элемент в конец очереди (вызывается только производителем).
+        Вытеснение первого элемента (replace) не поддерживается: счетчик tail принадлежит потребителю.
+
+        raise:
+        (QFullError): Если очередь заполнена.
+
+        param:
+        value (T): Элемент для добавления в очередь.
+        """
+        header = self._header
+        head = int(header[_HEAD])
+        if head-header[_TAIL]==self._max_size:
+            raise QFullError()
+        self._buf[head%self._max_size] = value
+        header[_HEAD] = head+1 # Публикуем элемент только после записи
+
+    def pop(self)->T:
+        """
+        Удаляет и возвращает копию первого элемента очереди (вызывается только потребителем).
+
+        raise:
+        (QEmptyError): Если очередь пуста.
+
+        return:
+        value (T) : Удаленный первый элемент очереди.
+        """
+        header = self._header
+        tail = int(header[_TAIL])
+        if header[_HEAD]==tail:
+            raise QEmptyError()
+        value = self._buf[tail%self._max_size].copy()
+        header[_TAIL] = tail+1 # Освобождаем ячейку только после чтения
+        return value
+
+    def _segments(self,start:int,k:int)->tuple[np.ndarray,...]:
+        """
+        Возвращает не более двух представлений буфера, покрывающих k элементов со счетчика start.
+
+        param:
+        start (int): Счетчик первого элемента
+        k (int): Количество элементов
+
+        return:
+        (tuple[np.ndarray,...]): Представления буфера в логическом порядке
+        """
+        start%=self._max_size
+        end = start+k
+        if end<=self._max_size:
+            return (self._buf[start:end],)
+        return (self._buf[start:],self._buf[:end-self._max_size])
+
+    def push_many(self,values:npt.ArrayLike)->None:
+        """
+        Добавляет элементы в конец очереди не более чем двумя копиями срезов (вызывается только производителем).
+        Если элементы не помещаются, то очередь не изменяется.
+
+        raise:
+        (QFullError): Если элементы не помещаются в очередь.
+
+        param:
+        values (npt.ArrayLike): Элементы для добавления в очередь.
+        """
+        values = np.asarray(values,dtype=self._buf.dtype)
+        header = self._header
+        head = int(header[_HEAD])
+        if head-header[_TAIL]+len(values)>self._max_size:
+            raise QFullError()
+        offset = 0
+        for segment in self._segments(head,len(values)):
+            segment[:] = values[offset:offset+len(segment)]
+            offset+=len(segment)
+        header[_HEAD] = head+len(values)
+
+    def pop_many(self,n:int)->np.ndarray:
+        """
+        Удаляет и возвращает до n первых элементов очереди одним массивом (вызывается только потребителем).
+
+        raise:
+        (QEmptyError): Если очередь пуста.
+        (ValueError): Если n отрицательное.
+
+        param:
+        n (int): Максимальное количество удаляемых элементов
+
+        return:
+        (np.ndarray) : Удаленные элементы в порядке очереди.
+        """
+        if n<0:
+            raise ValueError("Количество элементов не может быть отрицательным")
+        header = self._header
+        tail = int(header[_TAIL])
+        k = min(n,int(header[_HEAD])-tail)
+        if k<=0 and n>0:
+            raise QEmptyError()
+        segments = self._segments(tail,k)
+        values = segments[0].copy() if len(segments)==1 else np.concatenate(segments)
+        header[_TAIL] = tail+k
+        return values
+
+    def segments(self)->tuple[np.ndarray,...]:
+        """
+        Возвращает не более двух представлений (view) NumPy на элементы очереди в общей памяти без копирования.
+        Представления действительны, пока потребитель не удалит эти элементы.
+
+        return:
+        (tuple[np.ndarray,...]): Представления элементов в логическом порядке
+        """
+        tail = int(self._header[_TAIL])
+        return self._segments(tail,int(self._header[_HEAD])-tail)
+
+    def clear(self)->None:
+        """
+        Очищает очередь, удаляя все элементы (вызывается только потребителем).
+
+        return:
+        (None)
+        """
+        self._header[_TAIL] = self._header[_HEAD]
+
+    def __len__(self)->int:
+        """
+        Возвращает количество элементов в очереди (магический метод).
+
+        return:
+        (int): Количество элементов в очереди.
+        """
+        return self.length()
+
+    def __iter__(self)->Generator[T,None,None]:
+        """
+        Генератор, который позволяет итерировать по элементам очереди (магический метод).
+
+        return:
+        (Generator[T,None,None]): Генератор, который возвращает элементы очереди один за другим.
+        """
+        for segment in self.segments():
+            yield from segment
+
+    def aslist(self)->list[T]:
+        """
+        Возвращает список всех элементов очереди.
+
+        return:
+        (list[T]): Список элементов очереди.
+        """
+        return [el for segment in self.segments() for el in segment.tolist()]
+
+    def __repr__(self) -> str:
+        """
+        Представляет очередь в виде строки для печати (магический метод).
+
+        return:
+        (str): Строковое представление очереди.
+        """
+        return f"CSHMQueue({self.aslist()}, max_size={self._max_size}, name={self.name!r})"
+
+    def close(self)->None:
+        """
+        Отключается от блока общей памяти. Все представления из segments() должны быть освобождены.
+        """
+        if self._shm is None:
+            return
+        self._header = None
+        self._buf = None
+        self._shm.close()
+        self._shm = None
+
+    def unlink(self)->None:
+        """
+        Удаляет блок общей памяти (вызывается создателем очереди после завершения работы).
+        После close() блок находится по имени.
+
+        raise:
+        (FileNotFoundError): Если блок общей памяти уже удален
+        """
+        shm = self._shm
+        self.close()
+        if shm is None:
+            shm = shared_memory.SharedMemory(name=self._name)
+            shm.close()
+        shm.unlink()
+
+    def __enter__(self)->'CSHMQueue[T]':
+        """Вход в контекстный менеджер."""
+        return self
+
+    def __exit__(self,*exc:Any)->None:
+        """Выход из контекстного менеджера: создатель удаляет блок, остальные отключаются."""
+        if self._owner:
+            self.unlink()
+        else:
+            self.close()
+
+    def __del__(self)->None:
+        """
+        Отключается от блока общей памяти перед уничтожением.
+        """
+        try:
+            self.close()
+        except (BufferError,AttributeError):
+            pass
+
+
+if __name__ == "__main__":
+    with CSHMQueue[float](4) as a:
+        b = CSHMQueue[float].attach(a.name)
+        a.push_many([1,2,3])
+        print(b.pop())
+        a.push(4)
+        print(b.segments())
+        print(b)
+        b.close()
@@ -0,0 +1,151 @@
+"""
+Модуль csnapshot, реализует компактный двоичный формат снимка очереди (pickle протокола 5 с внеполосными буферами).
+
+Функции:
+- dump(queue, path): записывает снимок очереди в файл
+- load(path): восстанавливает очередь из файла
+
+Классы:
+- CSnapshotMixin: примесь методов dump()/load() для классов очередей
+
+Формат файла:
+- заголовок (_HEADER): сигнатура, версия, количество внеполосных буферов, длина потока pickle
+- длины внеполосных буферов (uint64 на буфер)
+- поток pickle протокола 5 (параметры очереди и элементы в логическом порядке, см. __getstate__ очередей)
+- внеполосные буферы подряд (байты массивов CNQueue и CByteQueue без копирования в поток pickle)
+"""
+
+import os
+import pickle
+import struct
+from typing import Any,TypeVar
+
+_SIGNATURE = b"CQSNAP" # Сигнатура файла
+_VERSION = 1           # Версия формата
+_HEADER = struct.Struct("<6sHIQ") # Сигнатура, версия, количество буферов, длина потока pickle
+
+S = TypeVar("S",bound="CSnapshotMixin")
+
+
+def dump(queue:Any,path:str)->int:
+    """
+    Записывает снимок очереди в файл. Буферы массивов записываются в файл напрямую из памяти очереди.
+    Файл сначала записывается под временным именем и затем заменяет path (os.replace), поэтому при сбое
+    остается предыдущий снимок.
+
+    param:
+    queue (Any): Очередь (любой объект, поддерживающий pickle)
+    path (str): Путь к файлу снимка
+
+    return:
+    (int): Размер файла в байтах
+    """
+    buffers:list[pickle.PickleBuffer] = []
+    data = pickle.dumps(queue,protocol=5,buffer_callback=buffers.append)
+    raws = [buffer.raw() for buffer in buffers]
+    tmp = f"{path}.tmp"
+    with open(tmp,"wb") as file:
+        file.write(_HEADER.pack(_SIGNATURE,_VERSION,len(raws),len(data)))
+        file.write(struct.pack(f"<{len(raws)}Q",*(raw.nbytes for raw in raws)))
+        file.write(data)
+        for raw in raws:
+            file.write(raw)
+        size = file.tell()
+    os.replace(tmp,path)
+    return size
+
+
+def load(path:str)->Any:
+    """
+    Восстанавливает очередь из снимка. Файл читается целиком, внеполосные буферы передаются в pickle
+    представлениями (memoryview) прочитанных байтов без копирования.
+
+    raise:
+    (ValueError): Если файл не является снимком очереди или поврежден
+
+    param:
+    path (str): Путь к файлу снимка
+
+    return:
+    (Any): Восстановленная очередь
+    """
+    with open(path,"rb") as file:
+        content = file.read()
+    view = memoryview(content)
+    if len(view)<_HEADER.size:
+        raise ValueError("Файл не является снимком очереди")
+    signature,version,count,size = _HEADER.unpack_from(view)
+    if signature!=_SIGNATURE or version!=_VERSION:
+        raise ValueError("Файл не является снимком очереди")
+    offset = _HEADER.size+8*count
+    if len(view)<offset:
+        raise ValueError("Снимок очереди поврежден") # Количество буферов в заголовке больше, чем есть длин
+    lengths = struct.unpack_from(f"<{count}Q",view,_HEADER.size)
+    if offset+size+sum(lengths)!=len(view):
+        raise ValueError("Снимок очереди поврежден")
+    data = view[offset:offset+size]
+    offset+=size
+    buffers = []
+    for length in lengths:
+        buffers.append(view[offset:offset+length])
+        offset+=length
+    return pickle.loads(data,buffers=buffers)
+
+
+class CSnapshotMixin:
+
+    """
+    Примесь снимков для классов очередей, поддерживающих pickle: методы dump() и load()
+    записывают и читают файл в формате модуля.
+
+    method:
+    dump(path:str)->int: Записывает снимок очереди в файл
+    load(path:str)->S: Восстанавливает очередь из снимка (classmethod)
+    """
+
+    __slots__ = ()
+
+    def dump(self,path:str)->int:
+        """
+        Записывает снимок очереди в файл (формат csnapshot: pickle протокола 5 с внеполосными буферами).
+
+        param:
+        path (str): Путь к файлу снимка
+
+        return:
+        (int): Размер файла в байтах
+        """
+        return dump(self,path)
+
+    @classmethod
+    def load(cls:type[S],path:str)->S:
+        """
+        Восстанавливает очередь из снимка, записанного dump().
+
+        raise:
+        (ValueError): Если файл не является снимком очереди
+        (TypeError): Если в снимке очередь другого класса
+
+        param:
+        path (str): Путь к файлу снимка
+
+        return:
+        (S): Восстановленная очередь
+        """
+        queue = load(path) # Функция модуля, а не этот метод
+        if not isinstance(queue,cls):
+            raise TypeError(f"В снимке очередь {type(queue).__name__}, а не {cls.__name__}")
+        return queue
+
+
+if __name__ == "__main__":
+    import tempfile
+    import numpy as np
+    from cnqueue import CNQueue
+    a = CNQueue[int](8,dtype=np.int64)
+    a.push_many(np.arange(6))
+    a.pop_many(4)
+    a.push_many(np.arange(10,15))
+    path = os.path.join(tempfile.gettempdir(),"cnqueue.snap")
+    print(dump(a,path),load(path))
+    os.remove(path)
@@ -0,0 +1,803 @@
+"""
+Модуль csqueue, реализует структуру данных циклической очереди на основе кольца блоков (сегментов).
+Блоки - массивы фиксированного размера, связанные в двусвязное кольцо, как в collections.deque.
+
+Класса CSQueue, представляет циклическую очередь.
+Очередь предоставляет возможности:
+- добавления элемента
+- удаления элемента и его возврат
+- возвращение ссылки на первый элемент
+- возвращение ссылки на последний элемент
+- проверка на пустоту
+- проверка на заполненость
+- колличество элементов
+- очищение очереди
+- преобразование очереди в список
+- вставка элемента по индексу
+- удаление конкретного элемента
+- изменение размерности очереди без копирования элементов
+- пакетное добавление и удаление элементов
+- доступ к элементам и срезам по индексу (в том числе отрицательному)
+- проверка вхождения и подсчет значений
+- снимок очереди (pickle, dump/load) без кольца блоков
+"""
+from dataclasses import dataclass,field
+from typing import Optional,TypeVar,Generic,Generator,Any,Iterable
+try:
+    from qexception import QFullError,QEmptyError
+    from coverflow import OverflowPolicy
+    import csnapshot
+except ImportError:
+    from .qexception import QFullError,QEmptyError
+    from .coverflow import OverflowPolicy
+    from . import csnapshot
+
+T = TypeVar("T") # Обобщенный тип данных
+
+
+@dataclass(slots=True)
+class Block(Generic[T]):
+    """
+    Блок кольца: массив фиксированного размера и ссылки на соседние блоки (двусвязный список)
+
+    attr:
+    data (list[Optional[T]]): Ячейки блока
+    prev (Optional[Block[T]]): Ссылка на предыдущий блок
+    next (Optional[Block[T]]): Ссылка на следующий блок
+    """
+    data: list
+    prev: Optional['Block[T]'] = field(default=None,repr=False)
+    next: Optional['Block[T]'] = field(default=None,repr=False)
+
+
+class CSQueue(csnapshot.CSnapshotMixin,Generic[T]):
+
+    """
+    Реализация циклической структуры данных FIFO на основе кольца блоков (Segmented)
+
+    Элементы лежат подряд в блоках по block_size ячеек, блоки связаны в двусвязное кольцо.
+    Блоки выделяются по мере заполнения очереди и освобождаются по мере ее опустошения
+    (в кольце остается не более одного свободного блока), поэтому увеличение размера очереди
+    не копирует элементы, а память пропорциональна количеству элементов, а не max_size.
+    Внутри блока элементы копируются срезами, доступ по индексу - проход по блокам за O(n/block_size).
+
+    attr:
+    _count (int): количество элементов в очереди
+    _max_size (int): максимальное количество элементов в очереди
+    _block_size (int): Количество ячеек в блоке
+    _blocks (int): Количество блоков в кольце
+    _front (Block[T]): Блок с первым элементом очереди
+    _front_off (int): Индекс первого элемента в блоке _front
+    _back (Block[T]): Блок с последним элементом очереди
+    _back_off (int): Индекс последнего элемента в блоке _back (если очередь пуста - _front_off-1)
+    _overflow (Optional[OverflowPolicy[T]]): Политика переполнения push()/push_many() (None - QFullError)
+
+    method:
+    empty()->None: Возращает True, если очередь пустая иначе False
+    is_full()->bool: Возращает True, если очередь полная иначу False
+    length()->int: Возвращает количество элементов в очереди
+    clear()->None: Очищение очереди
+    front()->T: Возращает ссылку на первый элемент в очереди
+    back()->T: Возращает ссылку на последний элемент в очереди
+    pop()->T: Удаляет и возращает первый элемент в очереди
+    push(value:T,raplace:bool=False)->None: Добавляет элемент в конец очереди
+    aslist()->list[T]: Возращает очередь в виде списка
+    resize(new_size:int)->None: Изменяет размер очереди
+    insert(index:int, value:T)->None: Вставляет элемент в очередь по индексу
+    remove(value:T)->None: Удаляет первое вхождение значения из очереди
+    push_many(values:Iterable[T],replace:bool=False)->None: Добавляет элементы в конец очереди
+    pop_many(n:int)->list[T]: Удаляет и возращает до n первых элементов очереди
+    extend(values:Iterable[T])->None: Добавляет элементы в конец очереди (аналог push_many)
+    from_iterable(values:Iterable[T],max_size:Optional[int]=None,replace:bool=False)->CSQueue[T]: Создает очередь из элементов
+    __getitem__(index:int|slice)->T|list[T]: Возвращает элемент (срез) очереди по индексу за O(n/block_size)
+    __setitem__(index:int|slice,value:T|Iterable[T])->None: Заменяет элемент (срез) очереди по индексу
+    __contains__(value:T)->bool: Проверяет вхождение значения в очередь
+    count(value:T)->int: Возвращает количество вхождений значения
+    __getstate__()->dict[str,Any]: Возвращает состояние для pickle (элементы в логическом порядке)
+    __setstate__(state:dict[str,Any])->None: Восстанавливает очередь из состояния pickle
+    dump(path:str)->int: Записывает снимок очереди в файл
+    load(path:str)->CSQueue: Восстанавливает очередь из снимка (classmethod)
+    """
+
+    def __init__(self,max_size:int,block_size:int = 64,overflow:Optional[OverflowPolicy[T]] = None) -> None:
+        """
+        Инициализация пустой очереди из одного блока
+
+        param:
+        max_size (int): Размер очереди
+        block_size (int): Количество ячеек в блоке
+        overflow (Optional[OverflowPolicy[T]]): Политика переполнения push()/push_many() (None - QFullError)
+        """
+        assert max_size>0,"Очередь не может быть отрицательной или равной 0"
+        assert block_size>0,"Размер блока не может быть отрицательным или равным 0"
+        self._count:int = 0
+        self._max_size:int = max_size
+        self._block_size:int = block_size
+        self._overflow: Optional[OverflowPolicy[T]] = overflow
+        self._reset()
+
+    def _reset(self)->None:
+        """
+        Оставляет в кольце один пустой блок.
+        """
+        block:Block[T] = Block([None]*self._block_size)
+        block.prev = block.next = block
+        self._blocks:int = 1
+        self._front:Block[T] = block
+        self._back:Block[T] = block
+        self._front_off:int = 0
+        self._back_off:int = -1
+
+    def _link(self,after:Block[T])->Block[T]:
+        """
+        Вставляет в кольцо новый блок после блока after.
+
+        param:
+        after (Block[T]): Блок, после которого вставляется новый блок
+
+        return:
+        (Block[T]): Новый блок
+        """
+        block:Block[T] = Block([None]*self._block_size,after,after.next)
+        after.next.prev = block
+        after.next = block
+        self._blocks+=1
+        return block
+
+    def _trim(self)->None:
+        """
+        Освобождает свободные блоки кольца (между последним и первым блоками), кроме одного.
+        """
+        used = (self._front_off+self._count-1)//self._block_size+1 if self._count else 1
+        while self._blocks-used>1:
+            block = self._back.next
+            self._back.next = block.next
+            block.next.prev = self._back
+            self._blocks-=1
+
+    def _locate(self,index:int)->tuple[Block[T],int]:
+        """
+        Возвращает блок и индекс в блоке для логического индекса: проход от ближайшего конца по блокам.
+
+        param:
+        index (int): Логический индекс от 0 до length()
+
+        return:
+        (tuple[Block[T],int]): Блок и индекс ячейки в блоке
+        """
+        pos = self._front_off+index
+        j = pos//self._block_size
+        last = (self._front_off+self._count-1)//self._block_size
+        if j<=last-j or j>last:
+            block = self._front
+            for _ in range(j):
+                block = block.next
+        else:
+            block = self._back
+            for _ in range(last-j):
+                block = block.prev
+        return block,pos%self._block_size
+
+    def _segments(self,start:int,k:int)->Generator[tuple[list[Optional[T]],int,int],None,None]:
+        """
+        Генератор частей блоков, покрывающих k элементов с логического индекса start.
+
+        param:
+        start (int): Логический индекс первого элемента
+        k (int): Количество элементов
+
+        return:
+        (Generator[tuple[list[Optional[T]],int,int],None,None]): Ячейки блока, индекс начала и длина части
+        """
+        if k<=0:
+            return
+        block,off = self._locate(start)
+        while k>0:
+            n = min(self._block_size-off,k)
+            yield block.data,off,n
+            k-=n
+            block = block.next
+            off = 0
+
+    def _read(self,start:int,k:int)->list[T]:
+        """
+        Копирует k элементов, начиная с логического индекса start, одним срезом на блок.
+
+        param:
+        start (int): Логический индекс первого элемента
+        k (int): Количество элементов
+
+        return:
+        (list[T]): Элементы в логическом порядке
+        """
+        values:list[T] = []
+        for data,off,n in self._segments(start,k):
+            values+=data[off:off+n]
+        return values
+
+    def empty(self)->bool:
+        """
+        Проверяет, пуста ли очередь.
+
+        return:
+        (bool): True, если очередь пуста, иначе False.
+        """
+        return self._count==0
+
+    def is_full(self)->bool:
+        """
+        Проверяет, полная ли очередь
+
+        return:
+        (bool): True, если очередь полная, иначе False.
+        """
+        return self._count==self._max_size
+
+    def length(self)->int:
+        """
+        Возвращает количество элементов в очереди.
+
+        return:
+        (int): Количество элементов в очереди.
+        """
+        return self._count
+
+    def clear(self)->None:
+        """
+        Очищает очередь, удаляя все элементы и освобождая блоки.
+
+        return:
+        (None)
+        """
+        self._count = 0
+        self._reset()
+
+    def __len__(self)->int:
+        """
+        Возвращает количество элементов в очереди (магический метод).
+
+        return:
+        (int): Количество элементов в очереди.
+        """
+        return self.length()
+
+    def front(self)->T:
+        """
+        Возвращает ссылку на первый элемент очереди без его удаления.
+
+        raise:
+        (QEmptyError): Если очередь пуста.
+
+        return:
+        (T): Первый элемент очереди.
+        """
+        if self.empty():
+            raise QEmptyError()
+        return self._front.data[self._front_off]
+
+    def back(self)->T:
+        """
+        Возвращает ссылку на последний элемент очереди без его удаления.
+
+        raise:
+        (QEmptyError): Если очередь пуста.
+
+        return:
+        (T): Последний элемент очереди.
+        """
+        if self.empty():
+            raise QEmptyError()
+        return self._back.data[self._back_off]
+
+    def _grow_back(self)->None:
+        """
+        Добавляет ячейку в конец очереди (берет свободный блок кольца или создает новый).
+        """
+        if self._back_off==self._block_size-1:
+            self._back = self._back.next if self._back.next is not self._front else self._link(self._back)
+            self._back_off = 0
+        else:
+            self._back_off+=1
+        self._count+=1
+
+    def _grow_front(self)->None:
+        """
+        Добавляет ячейку в начало непустой очереди (берет свободный блок кольца или создает новый).
+        """
+        if self._front_off==0:
+            self._front = self._front.prev if self._front.prev is not self._back else self._link(self._back)
+            self._front_off = self._block_size-1
+        else:
+            self._front_off-=1
+        self._count+=1
+
+    def _pop_back(self)->None:
+        """
+        Удаляет последний элемент очереди без его возврата.
+        """
+        self._back.data[self._back_off] = None
+        self._count-=1
+        if self._count==0:
+            self._reset()
+        elif self._back_off==0:
+            self._back = self._back.prev
+            self._back_off = self._block_size-1
+            self._trim()
+        else:
+            self._back_off-=1
+
+    def pop(self)->T:
+        """
+        Удаляет и возвращает первый элемент очереди.
+
+        raise:
+        (QEmptyError): Если очередь пуста.
+
+        return:
+        value (T) : Удаленный первый элемент очереди.
+        """
+        if self._count==0:
+            raise QEmptyError()
+
+        data = self._front.data
+        value:T = data[self._front_off]
+        data[self._front_off] = None
+        self._count-=1
+        if self._count==0:
+            self._front_off = 0
+            self._back_off = -1
+            self._trim()
+        elif self._front_off==self._block_size-1:
+            # Блок опустел и становится свободным блоком кольца
+            self._front = self._front.next
+            self._front_off = 0
+            self._trim()
+        else:
+            self._front_off+=1
+        return value
+
+    def push(self,value:T,replace:bool = False)->None:
+        """
+        Добавляет элемент в конец очереди.
+        1)Если очередь переполнена и replace= False, то поднимаем исключение (или применяем политику overflow).
+        2)Если очередь переполнена и replace= True, то удаляем первый элемент очереди и вставляем новый.
+
+        raise:
+        (QFullError): Если очередь заполнена.
+
+        param:
+        value (T): Элемент для добавления в очередь.
+        replace (bool): Указывает на то, что нужно ли удалять первый элемент при переполнении
+        """
+        if self._count==self._max_size:
+            if replace:
+                self.pop()
+            elif self._overflow is None:
+                raise QFullError()
+            elif not self._overflow.admit(self,value):
+                return
+        self._grow_back()
+        self._back.data[self._back_off] = value
+
+    def push_many(self,values:Iterable[T],replace:bool = False)->None:
+        """
+        Добавляет элементы в конец очереди, копируя их одним срезом на блок.
+        1)Если элементы не помещаются и replace= False, то поднимаем исключение, очередь не изменяется (или применяем политику overflow).
+        2)Если элементы не помещаются и replace= True, то удаляем первые элементы очереди и вставляем новые.
+
+        raise:
+        (QFullError): Если элементы не помещаются в очередь.
+
+        param:
+        values (Iterable[T]): Элементы для добавления в очередь.
+        replace (bool): Указывает на то, что нужно ли удалять первые элементы при переполнении
+        """
+        values = list(values)
+        k = len(values)
+        if k == 0:
+            return
+
+        free = self._max_size-self._count
+        if k>free:
+            if not replace:
+                if self._overflow is None:
+                    raise QFullError()
+                self._overflow.admit_many(self,values,free)
+                return
+            if k>=self._max_size:
+                # В очереди останутся только последние max_size новых элементов
+                values = values[k-self._max_size:]
+                k = self._max_size
+                self.clear()
+            else:
+                self._discard(k-free)
+
+        offset = 0
+        while offset<k:
+            if self._back_off==self._block_size-1:
+                self._back = self._back.next if self._back.next is not self._front else self._link(self._back)
+                self._back_off = -1
+            start = self._back_off+1
+            n = min(self._block_size-start,k-offset)
+            self._back.data[start:start+n] = values[offset:offset+n]
+            self._back_off+=n
+            offset+=n
+        self._count+=k
+
+    def extend(self,values:Iterable[T])->None:
+        """
+        Добавляет элементы в конец очереди (аналог push_many с replace=False).
+
+        raise:
+        (QFullError): Если элементы не помещаются в очередь.
+
+        param:
+        values (Iterable[T]): Элементы для добавления в очередь.
+        """
+        self.push_many(values)
+
+    def _discard(self,k:int)->None:
+        """
+        Удаляет k первых элементов очереди без их возврата, освобождая опустевшие блоки.
+
+        param:
+        k (int): Количество удаляемых элементов (не больше количества элементов в очереди)
+        """
+        if k<=0:
+            return
+        if k>=self._count:
+            self.clear()
+            return
+        for data,off,n in self._segments(0,k):
+            data[off:off+n] = [None]*n
+        pos = self._front_off+k
+        for _ in range(pos//self._block_size):
+            self._front = self._front.next
+        self._front_off = pos%self._block_size
+        self._count-=k
+        self._trim()
+
+    def pop_many(self,n:int)->list[T]:
+        """
+        Удаляет и возвращает до n первых элементов очереди.
+        Если в очереди меньше n элементов, то возвращаются все элементы.
+
+        raise:
+        (QEmptyError): Если очередь пуста.
+        (ValueError): Если n отрицательное.
+
+        param:
+        n (int): Максимальное количество удаляемых элементов
+
+        return:
+        (list[T]) : Удаленные элементы в порядке очереди.
+        """
+        if n<0:
+            raise ValueError("Количество элементов не может быть отрицательным")
+        if self.empty():
+            raise QEmptyError()
+
+        k = min(n,self._count)
+        values = self._read(0,k)
+        self._discard(k)
+        return values
+
+    @classmethod
+    def from_iterable(cls,values:Iterable[T],max_size:Optional[int] = None,replace:bool = False)->'CSQueue[T]':
+        """
+        Создает очередь из элементов.
+
+        raise:
+        (QFullError): Если элементы не помещаются в очередь и replace= False.
+
+        param:
+        values (Iterable[T]): Элементы для добавления в очередь.
+        max_size (Optional[int]): Размер очереди, по умолчанию равен количеству элементов (не меньше 1)
+        replace (bool): Указывает на то, что нужно ли удалять первые элементы при переполнении
+
+        return:
+        (CSQueue[T]): Новая очередь
+        """
+        values = list(values)
+        queue = cls(max(1,len(values)) if max_size is None else max_size)
+        queue.push_many(values,replace)
+        return queue
+
+    def resize(self,new_size:int)->None:
+        """
+        Изменяет размер очереди. Блоки не копируются: при увеличении новые блоки выделяются по мере
+        добавления элементов, при уменьшении удаляются первые элементы и освобождаются их блоки.
+
+        raise:
+        (ValueError): Если размер отрицательный
+
+        param:
+        new_size (int): Размер очереди
+        """
+        if new_size<=0:
+            raise ValueError("Размер очереди должен быть больше 0")
+        self._discard(self._count-new_size)
+        self._max_size = new_size
+
+    def _shift_right(self,start:int,k:int,fill:Optional[T])->Optional[T]:
+        """
+        Сдвигает k элементов с логического индекса start на одну позицию к концу в пределах этих k ячеек:
+        в первую ячейку записывается fill, значение последней ячейки возвращается. Одно копирование среза на блок.
+
+        param:
+        start (int): Логический индекс первой ячейки
+        k (int): Количество ячеек
+        fill (Optional[T]): Значение для первой ячейки
+
+        return:
+        (Optional[T]): Вытесненное значение последней ячейки
+        """
+        carry = fill
+        for data,off,n in self._segments(start,k):
+            last = data[off+n-1]
+            data[off+1:off+n] = data[off:off+n-1]
+            data[off] = carry
+            carry = last
+        return carry
+
+    def _shift_left(self,start:int,k:int,fill:Optional[T])->Optional[T]:
+        """
+        Сдвигает k элементов с логического индекса start на одну позицию к началу в пределах этих k ячеек:
+        в последнюю ячейку записывается fill, значение первой ячейки возвращается. Одно копирование среза на блок.
+
+        param:
+        start (int): Логический индекс первой ячейки
+        k (int): Количество ячеек
+        fill (Optional[T]): Значение для последней ячейки
+
+        return:
+        (Optional[T]): Вытесненное значение первой ячейки
+        """
+        parts = list(self._segments(start,k))
+        first = parts[0][0][parts[0][1]]
+        for i,(data,off,n) in enumerate(parts):
+            data[off:off+n-1] = data[off+1:off+n]
+            if i+1<len(parts):
+                data[off+n-1] = parts[i+1][0][parts[i+1][1]]
+            else:
+                data[off+n-1] = fill
+        return first
+
+    def insert(self,index:int, value:T)->None:
+        """
+        Вставляет элемент в очередь по индексу.
+
+        Если индекс отрицательный, то элемент вставляется в начало очереди.
+        Если индекс больше кол-ва находящихся элементов в очереди, то
+        элемент вставляется в конец очереди.
+
+        raise:
+        (QFullError): Если очередь заполнена.
+
+        param:
+        index (int): Вставка элемента в позициию указаным индексом.
+        value (T): Элемент для добавления в очередь.
+        """
+        if self.is_full():
+            raise QFullError()
+
+        if self.empty():
+            self.push(value)
+            return
+        index = self._count if index>self._count else 0 if index<0 else index
+        # Сдвигаем элементы со стороны ближайшего конца очереди
+        if index<self._count-index:
+            self._grow_front()
+            self._shift_left(0,index+1,value)
+        else:
+            self._grow_back()
+            self._shift_right(index,self._count-index,value)
+
+    def _find(self,value:T)->Optional[int]:
+        """
+        Ищет первое вхождение значения поиском по блокам.
+
+        param:
+        value (T): Искомое значение
+
+        return:
+        (Optional[int]): Логический индекс элемента или None, если значения нет
+        """
+        index = 0
+        for data,off,n in self._segments(0,self._count):
+            try:
+                return index+data.index(value,off,off+n)-off
+            except ValueError:
+                index+=n
+        return None
+
+    def remove(self,value:T)->None:
+        """
+        Удаляет первое вхождение значения из очереди
+
+        raise:
+        (QEmptyError): Если очередь пуста.
+        (ValueError): Если очередь не имеет элемент с указаным значением
+
+        param:
+        value (T): Элемент для удаления из очереди.
+        """
+        if self.empty():
+            raise QEmptyError()
+
+        index = self._find(value)
+        if index is None:
+            raise ValueError("Очередь не имеет элемент с указаным значением")
+        # Сдвигаем элементы со стороны ближайшего конца очереди
+        if index<self._count-1-index:
+            self._shift_right(0,index+1,None)
+            self.pop()
+        else:
+            self._shift_left(index,self._count-index,None)
+            self._pop_back()
+
+    def aslist(self)->list[T]:
+        """
+        Возвращает список всех элементов очереди.
+
+        return:
+        (list[T]): Список элементов очереди.
+        """
+        return self._read(0,self._count)
+
+    def _index(self,index:int)->int:
+        """
+        Нормализует логический индекс элемента (отрицательный индекс считается с конца очереди).
+
+        raise:
+        (IndexError): Если индекс вне диапазона очереди
+
+        param:
+        index (int): Логический индекс
+
+        return:
+        (int): Логический индекс от 0 до length()-1
+        """
+        if index<0:
+            index+=self._count
+        if not 0<=index<self._count:
+            raise IndexError("Индекс вне диапазона очереди")
+        return index
+
+    def __getitem__(self,index:int|slice)->T|list[T]:
+        """
+        Возвращает элемент очереди по логическому индексу (0 - первый, -1 - последний) или срез в виде списка.
+        Блок находится проходом от ближайшего конца очереди, срез копируется одним срезом на блок.
+
+        raise:
+        (IndexError): Если индекс вне диапазона очереди
+
+        param:
+        index (int|slice): Индекс или срез
+
+        return:
+        (T|list[T]): Элемент или список элементов
+        """
+        if isinstance(index,slice):
+            start,stop,step = index.indices(self._count)
+            positions = range(start,stop,step)
+            if len(positions)==0:
+                return []
+            low = min(positions[0],positions[-1])
+            span = self._read(low,abs(positions[-1]-positions[0])+1)
+            return span if step==1 else span[positions[0]-low::step]
+        block,off = self._locate(self._index(index))
+        return block.data[off]
+
+    def __setitem__(self,index:int|slice,value:T|Iterable[T])->None:
+        """
+        Заменяет элемент очереди по логическому индексу или элементы среза.
+        Срез заменяется элементами того же количества (размер очереди не меняется).
+
+        raise:
+        (IndexError): Если индекс вне диапазона очереди
+        (ValueError): Если количество элементов не совпадает с длиной среза
+
+        param:
+        index (int|slice): Индекс или срез
+        value (T|Iterable[T]): Элемент или элементы среза
+        """
+        if isinstance(index,slice):
+            positions = range(*index.indices(self._count))
+            values = list(value)
+            if len(values)!=len(positions):
+                raise ValueError("Количество элементов не совпадает с длиной среза")
+            if len(positions)==0:
+                return
+            if positions.step==1:
+                offset = 0
+                for data,off,n in self._segments(positions[0],len(values)):
+                    data[off:off+n] = values[offset:offset+n]
+                    offset+=n
+            else:
+                for i,el in zip(positions,values):
+                    block,off = self._locate(i)
+                    block.data[off] = el
+            return
+        block,off = self._locate(self._index(index))
+        block.data[off] = value
+
+    def __contains__(self,value:T)->bool:
+        """
+        Проверяет вхождение значения в очередь (магический метод) поиском по блокам.
+
+        param:
+        value (T): Искомое значение
+
+        return:
+        (bool): True, если значение есть в очереди, иначе False
+        """
+        return self._find(value) is not None
+
+    def count(self,value:T)->int:
+        """
+        Возвращает количество вхождений значения в очередь (подсчетом по блокам).
+
+        param:
+        value (T): Искомое значение
+
+        return:
+        (int): Количество вхождений
+        """
+        return sum(data[off:off+n].count(value) for data,off,n in self._segments(0,self._count))
+
+    def __iter__(self)->Generator[T,None,None]:
+        """
+        Генератор, который позволяет итерировать по элементам очереди (магический метод).
+
+        return:
+        (Generator[T,None,None]): Генератор, который возвращает элементы очереди один за другим.
+        """
+        for data,off,n in self._segments(0,self._count):
+            yield from data[off:off+n]
+
+    def __getstate__(self)->dict[str,Any]:
+        """
+        Возвращает состояние для pickle: параметры очереди и только элементы очереди в логическом порядке (без кольца блоков).
+
+        return:
+        (dict[str,Any]): Состояние очереди
+        """
+        return {"max_size":self._max_size,"block_size":self._block_size,"overflow":self._overflow,"values":self.aslist()}
+
+    def __setstate__(self,state:dict[str,Any])->None:
+        """
+        Восстанавливает очередь из состояния __getstate__() (кольцо блоков строится заново).
+
+        param:
+        state (dict[str,Any]): Состояние очереди
+        """
+        self.__init__(state["max_size"],state["block_size"],state["overflow"])
+        self.push_many(state["values"])
+
+    def __repr__(self) -> str:
+        """
+        Представляет очередь в виде строки для печати (магический метод).
+
+        return:
+        (str): Строковое представление очереди.
+        """
+        return f"CSQueue({self.aslist()}, max_size={self._max_size})"
+
+    def __del__(self)->None:
+        """
+        Очищает очередь перед уничтожением.
+        """
+        self.clear()
+
+
+if __name__ == "__main__":
+    a = CSQueue[int](10,block_size=4)
+    a.push_many(range(7))
+    a.insert(1,100)
+    a.remove(5)
+    print(a)
+    a.resize(3)
+    print(a)
+    print(a.front())
+    print(a.back())
@@ -0,0 +1,519 @@
+"""
+Модуль cswqueue, реализует скользящее окно с агрегатами за O(1) поверх существующих очередей пакета.
+
+Класса CSWQueue, представляет циклическую очередь, которая при каждом добавлении и вытеснении обновляет
+сумму, сумму квадратов и монотонные очереди минимумов и максимумов.
+Очередь предоставляет возможности:
+- добавления элемента (с вытеснением первого элемента при replace=True)
+- удаления элемента и его возврат
+- возвращение ссылки на первый элемент
+- возвращение ссылки на последний элемент
+- проверка на пустоту
+- проверка на заполненость
+- колличество элементов
+- очищение очереди
+- преобразование очереди в список
+- пакетное добавление (в том числе массивов NumPy) и удаление элементов
+- сумма, среднее, минимум, максимум, дисперсия и стандартное отклонение окна за O(1)
+"""
+
+import math
+import operator
+from collections import deque
+from typing import Optional,TypeVar,Generic,Generator,Any,Callable,Iterable
+import numpy as np
+try:
+    from qexception import QFullError,QEmptyError
+    from caqueue import CAQueue
+except ImportError:
+    from .qexception import QFullError,QEmptyError
+    from .caqueue import CAQueue
+
+T = TypeVar("T") # Обобщенный тип данных
+
+
+class CSWQueue(Generic[T]):
+
+    """
+    Циклическая очередь FIFO со статистикой скользящего окна.
+
+    Хранение элементов делегируется одной из очередей пакета (по умолчанию CAQueue, для числовых массивов - CNQueue).
+    Сумма и сумма квадратов обновляются при добавлении и вытеснении, поэтому sum(), mean(), var() и std() - O(1).
+    Минимум и максимум хранятся в монотонных очередях пар (номер элемента, значение): при добавлении с конца
+    удаляются значения, которые уже не могут стать минимумом (максимумом), при вытеснении с начала удаляется
+    вытесненный номер. Каждый элемент попадает в монотонную очередь и удаляется из нее не более одного раза,
+    поэтому обновление - амортизированное O(1), а min() и max() - O(1).
+    Для вещественных чисел суммы пересчитываются заново (math.fsum) после каждых max_size вытеснений,
+    чтобы ошибка округления не накапливалась; целые числа суммируются точно.
+    Вставка и удаление по значению или индексу не поддерживаются: они нарушили бы монотонные очереди.
+
+    attr:
+    _queue (CAQueue[T]|CDQueue[T]|CLLQueue[T]|CPLLQueue[T]|CSQueue[T]|CNQueue[T]): Очередь, в которой хранятся элементы
+    _dtype (Optional[np.dtype]): Тип элементов хранилища (None - хранилище не типизировано)
+    _max_size (int): Размер окна
+    _sum (Any): Сумма элементов
+    _sumsq (Any): Сумма квадратов элементов
+    _min (deque[tuple[int,T]]): Монотонная (неубывающая) очередь кандидатов в минимум
+    _max (deque[tuple[int,T]]): Монотонная (невозрастающая) очередь кандидатов в максимум
+    _head (int): Номер первого элемента очереди
+    _evicted (int): Количество вытеснений после последнего пересчета сумм
+
+    method:
+    empty()->bool: Возращает True, если очередь пустая иначе False
+    is_full()->bool: Возращает True, если очередь полная иначу False
+    length()->int: Возвращает количество элементов в очереди
+    clear()->None: Очищение очереди
+    front()->T: Возращает первый элемент в очереди
+    back()->T: Возращает последний элемент в очереди
+    pop()->T: Удаляет и возращает первый элемент в очереди
+    push(value:T,raplace:bool=False)->None: Добавляет элемент в конец очереди
+    push_many(values:Iterable[T]|np.ndarray,replace:bool=False)->None: Добавляет элементы в конец очереди (массивы NumPy - векторно)
+    pop_many(n:int)->list[T]|np.ndarray: Удаляет и возращает до n первых элементов очереди
+    extend(values:Iterable[T]|np.ndarray)->None: Добавляет элементы в конец очереди (аналог push_many)
+    aslist()->list[T]: Возращает очередь в виде списка
+    sum()->Any: Сумма элементов окна
+    mean()->float: Среднее элементов окна
+    min()->T: Минимум окна
+    max()->T: Максимум окна
+    var(ddof:int=0)->float: Дисперсия элементов окна
+    std(ddof:int=0)->float: Стандартное отклонение элементов окна
+    """
+
+    def __init__(self,max_size:int,backend:Callable[...,Any] = CAQueue,**kwargs:Any) -> None:
+        """
+        Инициализация пустой очереди
+
+        param:
+        max_size (int): Размер окна
+        backend (Callable[...,Any]): Класс очереди для хранения элементов (по умолчанию CAQueue)
+        kwargs (Any): Дополнительные параметры конструктора очереди (например, dtype для CNQueue)
+        """
+        assert max_size>0,"Очередь не может быть отрицательной или равной 0"
+        assert kwargs.get("overflow") is None,"Политика overflow вытесняла бы элементы без обновления статистики"
+        self._queue = backend(max_size,**kwargs)
+        self._dtype:Optional[np.dtype] = getattr(self._queue,"dtype",None) # Типизированное хранилище (CNQueue) приводит элементы к dtype
+        self._max_size:int = max_size
+        self._sum:Any = 0
+        self._sumsq:Any = 0
+        self._min:deque[tuple[int,T]] = deque()
+        self._max:deque[tuple[int,T]] = deque()
+        self._head:int = 0
+        self._evicted:int = 0
+
+    def _add(self,value:T)->None:
+        """
+        Учитывает добавленный в конец очереди элемент в суммах и монотонных очередях.
+
+        param:
+        value (T): Добавленный элемент
+        """
+        number = value.item() if isinstance(value,np.generic) else value # Скаляр NumPy переполнился бы в типе хранилища
+        self._sum+=number
+        self._sumsq+=number*number
+        index = self._head+self._queue.length()-1
+        low,high = self._min,self._max
+        while low and low[-1][1]>value:
+            low.pop()
+        low.append((index,value))
+        while high and high[-1][1]<value:
+            high.pop()
+        high.append((index,value))
+
+    def _remove(self,k:int,total:Any,squares:Any)->None:
+        """
+        Учитывает k вытесненных первых элементов с суммой total и суммой квадратов squares.
+
+        param:
+        k (int): Количество вытесненных элементов
+        total (Any): Сумма вытесненных элементов
+        squares (Any): Сумма квадратов вытесненных элементов
+        """
+        self._head+=k
+        low,high = self._min,self._max
+        while low and low[0][0]<self._head:
+            low.popleft()
+        while high and high[0][0]<self._head:
+            high.popleft()
+        if self._queue.empty():
+            self._sum,self._sumsq,self._evicted = 0,0,0
+            return
+        self._sum-=total
+        self._sumsq-=squares
+        if isinstance(self._sum,float) or isinstance(self._sumsq,float):
+            self._evicted+=k
+            if self._evicted>=self._max_size:
+                self._resync()
+
+    def _resync(self)->None:
+        """
+        Пересчитывает суммы вещественных элементов по содержимому очереди (амортизированное O(1) на вытеснение).
+        """
+        values = self._queue.aslist()
+        self._sum = math.fsum(values) if isinstance(self._sum,float) else sum(values)
+        self._sumsq = math.fsum(value*value for value in values) if isinstance(self._sumsq,float) else sum(map(operator.mul,values,values))
+        self._evicted = 0
+
+    def _values(self,values:Iterable[T]|np.ndarray)->list[T]|np.ndarray:
+        """
+        Приводит элементы пакета к списку или к одномерному массиву с типом хранилища (если он есть).
+
+        raise:
+        (ValueError): Если массив не одномерный
+
+        param:
+        values (Iterable[T]|np.ndarray): Элементы
+
+        return:
+        (list[T]|np.ndarray): Элементы, которые будут храниться в очереди
+        """
+        if isinstance(values,np.ndarray) or self._dtype is not None:
+            values = np.asarray(values if hasattr(values,"__len__") else list(values),dtype=self._dtype)
+            if values.ndim!=1:
+                raise ValueError("Ожидается одномерный массив элементов")
+            return values
+        return list(values)
+
+    @staticmethod
+    def _sums(values:list[T]|np.ndarray)->tuple[Any,Any]:
+        """
+        Возвращает сумму и сумму квадратов элементов в типах Python.
+        Вещественный массив NumPy суммируется векторно (np.sum, np.dot), целые - точно, без переполнения int64.
+
+        param:
+        values (list[T]|np.ndarray): Элементы
+
+        return:
+        (tuple[Any,Any]): Сумма и сумма квадратов
+        """
+        if isinstance(values,np.ndarray):
+            if values.dtype.kind=="f":
+                return values.sum().item(),np.dot(values,values).item()
+            values = values.tolist()
+        return sum(values),sum(map(operator.mul,values,values))
+
+    def _extrema(self,values:list[T]|np.ndarray,start:int)->None:
+        """
+        Добавляет пакет элементов с номерами start, start+1, ... в монотонные очереди.
+        Для массива NumPy кандидаты пакета выбираются векторно: в очередь максимумов попадают только элементы,
+        не меньшие всех следующих элементов пакета (обратный накопленный максимум), аналогично для минимумов.
+
+        param:
+        values (list[T]|np.ndarray): Добавленные элементы
+        start (int): Номер первого элемента пакета
+        """
+        low,high = self._min,self._max
+        if not isinstance(values,np.ndarray):
+            for index,value in enumerate(values,start):
+                while low and low[-1][1]>value:
+                    low.pop()
+                low.append((index,value))
+                while high and high[-1][1]<value:
+                    high.pop()
+                high.append((index,value))
+            return
+        for queue,accumulate,keeps,drops in ((low,np.minimum,np.less_equal,operator.gt),(high,np.maximum,np.greater_equal,operator.lt)):
+            suffix = accumulate.accumulate(values[::-1])[::-1] # suffix[i] - минимум (максимум) values[i:]
+            best = suffix[0].item()
+            while queue and drops(queue[-1][1],best):
+                queue.pop()
+            keep = np.flatnonzero(keeps(values[:-1],suffix[1:]))
+            queue.extend(zip((keep+start).tolist(),values[keep].tolist()))
+            queue.append((start+len(values)-1,values[-1].item()))
+
+    def empty(self)->bool:
+        """
+        Проверяет, пуста ли очередь.
+
+        return:
+        (bool): True, если очередь пуста, иначе False.
+        """
+        return self._queue.empty()
+
+    def is_full(self)->bool:
+        """
+        Проверяет, полная ли очередь.
+
+        return:
+        (bool): True, если очередь полная, иначе False.
+        """
+        return self._queue.is_full()
+
+    def length(self)->int:
+        """
+        Возвращает количество элементов в очереди.
+
+        return:
+        (int): Количество элементов в очереди.
+        """
+        return self._queue.length()
+
+    def __len__(self)->int:
+        """
+        Возвращает количество элементов в очереди (магический метод).
+
+        return:
+        (int): Количество элементов в очереди.
+        """
+        return self._queue.length()
+
+    def clear(self)->None:
+        """
+        Очищает очередь и статистику.
+
+        return:
+        (None)
+        """
+        self._queue.clear()
+        self._min.clear()
+        self._max.clear()
+        self._sum,self._sumsq,self._evicted = 0,0,0
+
+    def front(self)->T:
+        """
+        Возвращает ссылку на первый элемент очереди без его удаления.
+
+        raise:
+        (QEmptyError): Если очередь пуста.
+
+        return:
+        (T): Первый элемент очереди.
+        """
+        return self._queue.front()
+
+    def back(self)->T:
+        """
+        Возвращает ссылку на последний элемент очереди без его удаления.
+
+        raise:
+        (QEmptyError): Если очередь пуста.
+
+        return:
+        (T): Последний элемент очереди.
+        """
+        return self._queue.back()
+
+    def push(self,value:T,replace:bool = False)->None:
+        """
+        Добавляет элемент в конец очереди и обновляет статистику за амортизированное O(1).
+        1)Если очередь переполнена и replace= False, то поднимаем исключение.
+        2)Если очередь переполнена и replace= True, то вытесняем первый элемент очереди и вставляем новый (скользящее окно).
+
+        raise:
+        (QFullError): Если очередь заполнена и replace= False.
+
+        param:
+        value (T): Элемент для добавления в очередь.
+        replace (bool): Указывает на то, что нужно ли вытеснять первый элемент при переполнении
+        """
+        if self._queue.is_full():
+            if not replace:
+                raise QFullError()
+            self.pop()
+        self._queue.push(value)
+        self._add(value if self._dtype is None else self._queue.back()) # Значение в типе хранилища
+
+    def pop(self)->T:
+        """
+        Удаляет и возвращает первый элемент очереди, обновляя статистику.
+
+        raise:
+        (QEmptyError): Если очередь пуста.
+
+        return:
+        value (T) : Удаленный первый элемент очереди.
+        """
+        value:T = self._queue.pop()
+        number = value.item() if isinstance(value,np.generic) else value
+        self._remove(1,number,number*number)
+        return value
+
+    def push_many(self,values:Iterable[T]|np.ndarray,replace:bool = False)->None:
+        """
+        Добавляет элементы в конец очереди. Суммы пакета и кандидаты в минимум и максимум для
+        массива NumPy вычисляются векторно, без цикла Python по элементам.
+        1)Если элементы не помещаются и replace= False, то поднимаем исключение, очередь не изменяется.
+        2)Если элементы не помещаются и replace= True, то вытесняем первые элементы очереди,
+        а из пакета длиннее окна остаются последние max_size элементов.
+
+        raise:
+        (QFullError): Если элементы не помещаются в очередь и replace= False.
+        (ValueError): Если массив не одномерный
+
+        param:
+        values (Iterable[T]|np.ndarray): Элементы для добавления в очередь.
+        replace (bool): Указывает на то, что нужно ли вытеснять первые элементы при переполнении
+        """
+        values = self._values(values)
+        k = len(values)
+        if k==0:
+            return
+        overflow = self._queue.length()+k-self._max_size
+        if overflow>0:
+            if not replace:
+                raise QFullError()
+            if k>=self._max_size:
+                # В окне останутся только последние max_size новых элементов
+                self.clear()
+                self._head+=k-self._max_size
+                values = values[k-self._max_size:]
+                k = self._max_size
+            else:
+                self.pop_many(overflow)
+        start = self._head+self._queue.length()
+        # Нетипизированное хранилище получает элементы в типах Python, как при push()
+        self._queue.push_many(values.tolist() if isinstance(values,np.ndarray) and self._dtype is None else values)
+        total,squares = self._sums(values)
+        self._sum+=total
+        self._sumsq+=squares
+        self._extrema(values,start)
+
+    def extend(self,values:Iterable[T]|np.ndarray)->None:
+        """
+        Добавляет элементы в конец очереди (аналог push_many с replace=False).
+
+        raise:
+        (QFullError): Если элементы не помещаются в очередь.
+
+        param:
+        values (Iterable[T]|np.ndarray): Элементы для добавления в очередь.
+        """
+        self.push_many(values)
+
+    def pop_many(self,n:int)->list[T]|np.ndarray:
+        """
+        Удаляет и возвращает до n первых элементов очереди, обновляя статистику одним пакетом.
+
+        raise:
+        (QEmptyError): Если очередь пуста.
+        (ValueError): Если n отрицательное.
+
+        param:
+        n (int): Максимальное количество удаляемых элементов
+
+        return:
+        (list[T]|np.ndarray) : Удаленные элементы в порядке очереди (тип как у pop_many() хранилища).
+        """
+        values = self._queue.pop_many(n)
+        if len(values):
+            total,squares = self._sums(values)
+            self._remove(len(values),total,squares)
+        return values
+
+    def sum(self)->Any:
+        """
+        Возвращает сумму элементов окна за O(1).
+
+        return:
+        (Any): Сумма элементов (0 для пустой очереди)
+        """
+        return self._sum
+
+    def mean(self)->float:
+        """
+        Возвращает среднее элементов окна за O(1).
+
+        raise:
+        (QEmptyError): Если очередь пуста.
+
+        return:
+        (float): Среднее
+        """
+        n = self._queue.length()
+        if n==0:
+            raise QEmptyError()
+        return self._sum/n
+
+    def min(self)->T:
+        """
+        Возвращает минимум окна за O(1).
+
+        raise:
+        (QEmptyError): Если очередь пуста.
+
+        return:
+        (T): Минимальный элемент
+        """
+        if not self._min:
+            raise QEmptyError()
+        return self._min[0][1]
+
+    def max(self)->T:
+        """
+        Возвращает максимум окна за O(1).
+
+        raise:
+        (QEmptyError): Если очередь пуста.
+
+        return:
+        (T): Максимальный элемент
+        """
+        if not self._max:
+            raise QEmptyError()
+        return self._max[0][1]
+
+    def var(self,ddof:int = 0)->float:
+        """
+        Возвращает дисперсию элементов окна за O(1): (sumsq-sum*sum/n)/(n-ddof).
+
+        raise:
+        (QEmptyError): Если элементов не больше ddof.
+
+        param:
+        ddof (int): Поправка степеней свободы (0 - дисперсия генеральной совокупности, 1 - выборочная)
+
+        return:
+        (float): Дисперсия
+        """
+        n = self._queue.length()
+        if n<=ddof:
+            raise QEmptyError()
+        return max(0.0,(self._sumsq-self._sum*self._sum/n)/(n-ddof)) # Округление не делает дисперсию отрицательной
+
+    def std(self,ddof:int = 0)->float:
+        """
+        Возвращает стандартное отклонение элементов окна за O(1).
+
+        raise:
+        (QEmptyError): Если элементов не больше ddof.
+
+        param:
+        ddof (int): Поправка степеней свободы
+
+        return:
+        (float): Стандартное отклонение
+        """
+        return math.sqrt(self.var(ddof))
+
+    def aslist(self)->list[T]:
+        """
+        Возвращает список всех элементов очереди.
+
+        return:
+        (list[T]): Список элементов очереди.
+        """
+        return self._queue.aslist()
+
+    def __iter__(self)->Generator[T,None,None]:
+        """
+        Генератор, который позволяет итерировать по элементам очереди (магический метод).
+
+        return:
+        (Generator[T,None,None]): Генератор, который возвращает элементы очереди один за другим.
+        """
+        yield from self._queue
+
+    def __repr__(self) -> str:
+        """
+        Представляет очередь в виде строки для печати (магический метод).
+
+        return:
+        (str): Строковое представление очереди.
+        """
+        return f"CSWQueue({self.aslist()}, max_size={self._max_size})"
+
+
+if __name__ == "__main__":
+    a = CSWQueue[int](3)
+    for i in (5,1,4,2,8):
+        a.push(i,replace=True)
+        print(a,a.sum(),a.min(),a.max(),round(a.var(),3))
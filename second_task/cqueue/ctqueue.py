@@ -0,0 +1,311 @@
+"""
+Модуль ctqueue, реализует циклическую очередь на основе массива с меткой времени у каждого элемента.
+
+Класса CTQueue, представляет циклическую очередь CAQueue, в которой рядом с массивом элементов хранится
+массив монотонных меток времени с теми же физическими индексами.
+Очередь предоставляет возможности CAQueue (кроме вставки по индексу), а также:
+- добавления элемента и пакета элементов с меткой времени (по умолчанию time.monotonic())
+- выборки элементов за интервал времени и начиная с момента времени за O(log n + k)
+- удаления элементов старше момента времени за O(log n + k)
+"""
+
+import operator
+import time
+from itertools import islice
+from typing import Optional,TypeVar,Callable,Iterable,Any
+try:
+    from caqueue import CAQueue,BArray
+except ImportError:
+    from .caqueue import CAQueue,BArray
+
+T = TypeVar("T") # Обобщенный тип данных
+
+
+class CTQueue(CAQueue[T]):
+
+    """
+    Циклическая очередь FIFO на основе массива с метками времени.
+
+    Метка времени элемента хранится в массиве _times по тому же физическому индексу, что и элемент в _buf,
+    поэтому переход через конец массива, вытеснение и удаление с начала выполняются кодом CAQueue,
+    а метки освобожденных ячеек просто перезаписываются при следующем добавлении.
+    Метки не убывают от первого элемента к последнему, поэтому живая часть _times - это не более двух
+    отсортированных отрезков массива (_ranges()): поиск момента времени - двоичный поиск сначала в первом
+    отрезке, затем, если момент позже всех его меток, во втором. Выборка копирует найденные элементы
+    не более чем двумя срезами, поэтому range(), since() и evict_older_than() - O(log n + k).
+    Вставка по индексу не поддерживается (нарушила бы порядок меток), remove() сдвигает метки вместе с элементами.
+    Политики переполнения не поддерживаются: политика добавляет элементы без меток.
+
+    attr:
+    _times (BArray[float]): Метки времени элементов (физические индексы совпадают с _buf)
+    _clock (Callable[[],float]): Источник меток времени по умолчанию
+
+    method:
+    push(value:T,replace:bool=False,timestamp:Optional[float]=None)->None: Добавляет элемент с меткой времени в конец очереди
+    push_many(values:Iterable[T],replace:bool=False,timestamps:Optional[Iterable[float]]=None)->None: Добавляет элементы с метками времени
+    timestamps()->list[float]: Возвращает метки времени элементов очереди
+    range(t0:float,t1:float)->list[T]: Возвращает элементы с метками t0<=t<t1
+    since(t:float)->list[T]: Возвращает элементы с метками не раньше t
+    evict_older_than(t:float)->int: Удаляет элементы с метками раньше t
+    __getstate__()->dict[str,Any]: Возвращает состояние для pickle (элементы и метки в логическом порядке)
+    __setstate__(state:dict[str,Any])->None: Восстанавливает очередь из состояния pickle
+    """
+
+    def __init__(self,max_size:int,indexed:bool = False,clock:Callable[[],float] = time.monotonic) -> None:
+        """
+        Инициализация пустой очереди
+
+        param:
+        max_size (int): Размер очереди
+        indexed (bool): Вести хеш-индекс значений для __contains__, count() и remove()
+        clock (Callable[[],float]): Источник меток времени для элементов, добавленных без метки
+        """
+        super().__init__(max_size,indexed)
+        self._times:BArray[float] = BArray(max_size)
+        self._clock: Callable[[],float] = clock
+
+    def _check(self,timestamp:float)->None:
+        """
+        Проверяет, что метка не раньше метки последнего элемента.
+
+        raise:
+        (ValueError): Если метка раньше метки последнего элемента
+
+        param:
+        timestamp (float): Метка времени
+        """
+        if self._count and timestamp<self._times[self._back]:
+            raise ValueError("Метки времени должны не убывать")
+
+    def _tread(self,start:int,k:int)->list[float]:
+        """
+        Копирует k меток, начиная с физического индекса start, не более чем двумя срезами.
+
+        param:
+        start (int): Физический индекс первой метки
+        k (int): Количество меток
+
+        return:
+        (list[float]): Метки в логическом порядке
+        """
+        end = start+k
+        if end<=self._max_size:
+            return self._times[start:end]
+        return self._times[start:self._max_size]+self._times[0:end-self._max_size]
+
+    def _twrite(self,start:int,times:list[float])->None:
+        """
+        Записывает метки, начиная с физического индекса start, не более чем двумя срезами.
+
+        param:
+        start (int): Физический индекс первой метки
+        times (list[float]): Метки для записи (не больше размера очереди)
+        """
+        first = min(len(times),self._max_size-start)
+        self._times[start:start+first] = times[:first]
+        if first<len(times):
+            self._times[0:len(times)-first] = times[first:]
+
+    def push(self,value:T,replace:bool = False,timestamp:Optional[float] = None)->None:
+        """
+        Добавляет элемент с меткой времени в конец очереди.
+        1)Если очередь переполнена и replace= False, то поднимаем исключение.
+        2)Если очередь переполнена и replace= True, то удаляем первый элемент очереди и вставляем новый.
+
+        raise:
+        (QFullError): Если очередь заполнена.
+        (ValueError): Если метка раньше метки последнего элемента
+
+        param:
+        value (T): Элемент для добавления в очередь.
+        replace (bool): Указывает на то, что нужно ли удалять первый элемент при переполнении или поднять исключение
+        timestamp (Optional[float]): Метка времени (None - текущее время источника clock)
+        """
+        if timestamp is None:
+            timestamp = self._clock()
+        self._check(timestamp)
+        super().push(value,replace)
+        self._times[self._back] = timestamp
+
+    def push_many(self,values:Iterable[T],replace:bool = False,timestamps:Optional[Iterable[float]] = None)->None:
+        """
+        Добавляет элементы с метками времени в конец очереди, копируя элементы и метки не более чем двумя срезами.
+        1)Если элементы не помещаются и replace= False, то поднимаем исключение, очередь не изменяется.
+        2)Если элементы не помещаются и replace= True, то удаляем первые элементы очереди и вставляем новые.
+
+        raise:
+        (QFullError): Если элементы не помещаются в очередь.
+        (ValueError): Если количество меток не совпадает с количеством элементов или метки убывают
+
+        param:
+        values (Iterable[T]): Элементы для добавления в очередь.
+        replace (bool): Указывает на то, что нужно ли удалять первые элементы при переполнении или поднять исключение
+        timestamps (Optional[Iterable[float]]): Неубывающие метки элементов (None - у всех текущее время источника clock)
+        """
+        values = list(values)
+        k = len(values)
+        if k == 0:
+            return
+        if timestamps is None:
+            times = [self._clock()]*k
+        else:
+            times = list(timestamps)
+            if len(times)!=k:
+                raise ValueError("Количество меток не совпадает с количеством элементов")
+            if any(map(operator.gt,times,islice(times,1,None))):
+                raise ValueError("Метки времени должны не убывать")
+        self._check(times[0])
+        super().push_many(values,replace)
+        m = min(k,self._max_size) # При k>max_size в очереди остаются последние max_size элементов
+        self._twrite((self._back-m+1)%self._max_size,times[k-m:])
+
+    def resize(self,new_size:int)->None:
+        """
+        Изменяет размер очереди. При уменьшении удаляются первые элементы.
+        Элементы и метки копируются в новые массивы не более чем двумя срезами.
+
+        raise:
+        (ValueError): Если размер отрицательный
+
+        param:
+        new_size (int): Размер очереди
+        """
+        count = min(self._count,max(new_size,0))
+        times = self._tread((self._front+self._count-count)%self._max_size,count) if count else []
+        super().resize(new_size)
+        self._times = BArray(new_size)
+        self._times[0:count] = times
+
+    def insert(self,index:int,value:T)->None:
+        """
+        Вставка по индексу не поддерживается: метки времени должны не убывать, а вставленный элемент
+        получил бы метку вне порядка. Очередь не изменяется.
+
+        raise:
+        (TypeError): Всегда
+        """
+        raise TypeError("CTQueue не поддерживает вставку по индексу: метки времени должны не убывать")
+
+    def _move(self,src:int,dst:int,k:int)->None:
+        """
+        Перемещает k подряд идущих элементов и их метки с физического индекса src на физический индекс dst.
+
+        param:
+        src (int): Физический индекс первого перемещаемого элемента
+        dst (int): Физический индекс, куда перемещается первый элемент
+        k (int): Количество элементов
+        """
+        for src,dst,n in self._parts(src,dst,k):
+            self._buf[dst:dst+n] = self._buf[src:src+n]
+            self._times[dst:dst+n] = self._times[src:src+n]
+
+    def _bisect(self,t:float,right:bool = False)->int:
+        """
+        Двоичный поиск момента времени в не более чем двух отсортированных отрезках меток.
+
+        param:
+        t (float): Момент времени
+        right (bool): False - первый элемент с меткой не раньше t, True - первый элемент с меткой позже t
+
+        return:
+        (int): Логический индекс (length(), если таких элементов нет)
+        """
+        ranges = self._ranges(0,self._count,1)
+        offset = 0
+        for indices in ranges:
+            pos = self._times.bisect(t,indices.start,indices.stop,right)
+            if pos<indices.stop:
+                return offset+pos-indices.start
+            offset+=len(indices)
+        return offset
+
+    def timestamps(self)->list[float]:
+        """
+        Возвращает метки времени элементов очереди (не более двух срезов массива).
+
+        return:
+        (list[float]): Метки в порядке очереди.
+        """
+        return self._tread(self._front,self._count) if self._count else []
+
+    def range(self,t0:float,t1:float)->list[T]:
+        """
+        Возвращает элементы с метками t0<=t<t1 за O(log n + k).
+
+        param:
+        t0 (float): Начало интервала (включительно)
+        t1 (float): Конец интервала (не включительно)
+
+        return:
+        (list[T]): Элементы интервала в порядке очереди
+        """
+        if t1<=t0:
+            return []
+        return self[self._bisect(t0):self._bisect(t1)]
+
+    def since(self,t:float)->list[T]:
+        """
+        Возвращает элементы с метками не раньше t за O(log n + k).
+
+        param:
+        t (float): Момент времени
+
+        return:
+        (list[T]): Элементы в порядке очереди
+        """
+        return self[self._bisect(t):]
+
+    def evict_older_than(self,t:float)->int:
+        """
+        Удаляет из начала очереди элементы с метками раньше t за O(log n + k).
+
+        param:
+        t (float): Момент времени
+
+        return:
+        (int): Количество удаленных элементов
+        """
+        k = self._bisect(t)
+        self._discard(k)
+        return k
+
+    def __getstate__(self)->dict[str,Any]:
+        """
+        Возвращает состояние для pickle: состояние CAQueue, метки в логическом порядке и источник меток.
+
+        return:
+        (dict[str,Any]): Состояние очереди
+        """
+        state = super().__getstate__()
+        del state["overflow"]
+        state["timestamps"] = self.timestamps()
+        state["clock"] = self._clock
+        return state
+
+    def __setstate__(self,state:dict[str,Any])->None:
+        """
+        Восстанавливает очередь из состояния __getstate__() (элементы и метки записываются не более чем двумя срезами).
+
+        param:
+        state (dict[str,Any]): Состояние очереди
+        """
+        self.__init__(state["max_size"],state["indexed"],state["clock"])
+        self.push_many(state["values"],timestamps=state["timestamps"])
+
+    def __repr__(self) -> str:
+        """
+        Представляет очередь в виде строки для печати (магический метод).
+
+        return:
+        (str): Строковое представление очереди.
+        """
+        return f"CTQueue({self.aslist()}, max_size={self._max_size})"
+
+
+if __name__ == "__main__":
+    a = CTQueue[str](4)
+    for t,event in enumerate("abcdef"):
+        a.push(event,replace=True,timestamp=float(t))
+    print(a,a.timestamps())
+    print(a.range(3.0,5.0),a.since(4.0))
+    print(a.evict_older_than(4.0),a)
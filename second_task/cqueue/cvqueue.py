@@ -0,0 +1,774 @@
+"""
+Модуль cvqueue, реализует циклическую очередь из отрезков фиксированного размера со снимками при копировании при записи (copy-on-write).
+
+Класса CVQueue, представляет циклическую очередь, снимок которой создается за O(1) и разделяет
+отрезки с очередью: очередь копирует отрезок только перед первой записью в него после снимка.
+Класса CVSnapshot, представляет неизменяемый снимок очереди.
+Очередь предоставляет возможности:
+- добавления элемента
+- удаления элемента и его возврат
+- возвращение ссылки на первый элемент
+- возвращение ссылки на последний элемент
+- проверка на пустоту
+- проверка на заполненость
+- колличество элементов
+- очищение очереди
+- преобразование очереди в список
+- изменение размерности очереди
+- пакетное добавление и удаление элементов
+- доступ к элементам и срезам по индексу (в том числе отрицательному)
+- неизменяемые снимки за O(1) с учетом открытых снимков по эпохам
+- снимок очереди (pickle, dump/load) без отрезков кольца
+"""
+
+import threading
+import weakref
+from typing import Optional,TypeVar,Generic,Generator,Any,Iterable
+try:
+    from qexception import QFullError,QEmptyError
+    from coverflow import OverflowPolicy
+    import csnapshot
+except ImportError:
+    from .qexception import QFullError,QEmptyError
+    from .coverflow import OverflowPolicy
+    from . import csnapshot
+
+T = TypeVar("T") # Обобщенный тип данных
+
+
+def _spans(cell:int,k:int,cells:int,size:int)->Generator[tuple[int,int,int],None,None]:
+    """
+    Генератор частей отрезков, покрывающих k ячеек кольца с физической ячейки cell.
+    Количество ячеек кольца кратно размеру отрезка, поэтому часть не пересекает конец кольца.
+
+    param:
+    cell (int): Физическая ячейка первого элемента (может быть больше cells)
+    k (int): Количество ячеек
+    cells (int): Количество ячеек кольца
+    size (int): Размер отрезка
+
+    return:
+    (Generator[tuple[int,int,int],None,None]): Номер отрезка, индекс начала в отрезке и длина части
+    """
+    cell%=cells
+    while k>0:
+        i,off = divmod(cell,size)
+        n = min(size-off,k)
+        yield i,off,n
+        k-=n
+        cell = (cell+n)%cells
+
+
+def _collect(chunks:list[list[Optional[T]]],cell:int,k:int,cells:int,size:int)->list[T]:
+    """
+    Копирует k элементов кольца с физической ячейки cell одним срезом на отрезок.
+
+    param:
+    chunks (list[list[Optional[T]]]): Отрезки кольца
+    cell (int): Физическая ячейка первого элемента
+    k (int): Количество элементов
+    cells (int): Количество ячеек кольца
+    size (int): Размер отрезка
+
+    return:
+    (list[T]): Элементы в логическом порядке
+    """
+    values:list[T] = []
+    for i,off,n in _spans(cell,k,cells,size):
+        values+=chunks[i][off:off+n]
+    return values
+
+
+def _release(ref:'weakref.ReferenceType[CVQueue]',epoch:int)->None:
+    """
+    Снимает учет снимка эпохи epoch (вызывается при закрытии или сборке мусора снимка).
+
+    param:
+    ref (weakref.ReferenceType[CVQueue]): Слабая ссылка на очередь
+    epoch (int): Эпоха снимка
+    """
+    queue = ref()
+    if queue is not None:
+        queue._release(epoch)
+
+
+class CVSnapshot(Generic[T]):
+
+    """
+    Неизменяемый снимок очереди CVQueue.
+
+    Снимок хранит ссылку на каталог отрезков очереди, первую ячейку и количество элементов на момент
+    создания. Очередь не изменяет разделяемые каталог и отрезки, пока снимок открыт, поэтому читать снимок
+    можно из другого потока без блокировки очереди. Снимок закрывается close(), выходом из with или
+    при сборке мусора; после закрытия очередь снова пишет в отрезки на месте, а чтение снимка запрещено.
+
+    attr:
+    _chunks (list[list[Optional[T]]]): Каталог отрезков очереди на момент снимка
+    _head (int): Физическая ячейка первого элемента
+    _count (int): Количество элементов
+    _cells (int): Количество ячеек кольца
+    _size (int): Размер отрезка
+    _epoch (int): Эпоха снимка
+    _finalizer (weakref.finalize): Снятие учета снимка в очереди
+
+    method:
+    length()->int: Возвращает количество элементов снимка
+    empty()->bool: Возращает True, если снимок пустой иначе False
+    front()->T: Возращает первый элемент снимка
+    back()->T: Возращает последний элемент снимка
+    aslist()->list[T]: Возращает элементы снимка в виде списка
+    close()->None: Закрывает снимок
+    closed->bool: Закрыт ли снимок (свойство)
+    epoch->int: Эпоха снимка (свойство)
+    __getitem__(index:int|slice)->T|list[T]: Возвращает элемент (срез) снимка по индексу
+    __iter__()->Generator[T,None,None]: Обход элементов снимка
+    """
+
+    def __init__(self,queue:'CVQueue[T]',epoch:int) -> None:
+        """
+        Создает снимок текущего состояния очереди (без копирования элементов).
+
+        param:
+        queue (CVQueue[T]): Очередь
+        epoch (int): Эпоха снимка, зарегистрированная в очереди
+        """
+        self._chunks:list[list[Optional[T]]] = queue._chunks
+        self._head:int = queue._head
+        self._count:int = queue._count
+        self._cells:int = queue._cells
+        self._size:int = queue._size
+        self._epoch:int = epoch
+        self._finalizer = weakref.finalize(self,_release,weakref.ref(queue),epoch)
+
+    def _check(self)->None:
+        """
+        Проверяет, что снимок не закрыт.
+
+        raise:
+        (ValueError): Если снимок закрыт
+        """
+        if not self._finalizer.alive:
+            raise ValueError("Снимок закрыт")
+
+    @property
+    def epoch(self)->int:
+        """Эпоха снимка."""
+        return self._epoch
+
+    @property
+    def closed(self)->bool:
+        """Закрыт ли снимок."""
+        return not self._finalizer.alive
+
+    def close(self)->None:
+        """
+        Закрывает снимок: очередь перестает копировать отрезки для него. Повторный вызов ничего не делает.
+        """
+        self._finalizer()
+
+    def __enter__(self)->'CVSnapshot[T]':
+        """
+        Возвращает снимок для блока with.
+
+        return:
+        (CVSnapshot[T]): Снимок
+        """
+        return self
+
+    def __exit__(self,*exc:Any)->None:
+        """
+        Закрывает снимок при выходе из блока with.
+        """
+        self.close()
+
+    def length(self)->int:
+        """
+        Возвращает количество элементов снимка.
+
+        return:
+        (int): Количество элементов снимка.
+        """
+        return self._count
+
+    def __len__(self)->int:
+        """
+        Возвращает количество элементов снимка (магический метод).
+
+        return:
+        (int): Количество элементов снимка.
+        """
+        return self._count
+
+    def empty(self)->bool:
+        """
+        Проверяет, пуст ли снимок.
+
+        return:
+        (bool): True, если снимок пуст, иначе False.
+        """
+        return self._count==0
+
+    def __getitem__(self,index:int|slice)->T|list[T]:
+        """
+        Возвращает элемент снимка по логическому индексу (0 - первый, -1 - последний) или срез в виде списка.
+
+        raise:
+        (IndexError): Если индекс вне диапазона снимка
+        (ValueError): Если снимок закрыт
+
+        param:
+        index (int|slice): Индекс или срез
+
+        return:
+        (T|list[T]): Элемент или список элементов
+        """
+        self._check()
+        if isinstance(index,slice):
+            start,stop,step = index.indices(self._count)
+            positions = range(start,stop,step)
+            if len(positions)==0:
+                return []
+            low = min(positions[0],positions[-1])
+            span = _collect(self._chunks,self._head+low,abs(positions[-1]-positions[0])+1,self._cells,self._size)
+            return span if step==1 else span[positions[0]-low::step]
+        if index<0:
+            index+=self._count
+        if not 0<=index<self._count:
+            raise IndexError("Индекс вне диапазона снимка")
+        i,off = divmod((self._head+index)%self._cells,self._size)
+        return self._chunks[i][off]
+
+    def front(self)->T:
+        """
+        Возвращает первый элемент снимка.
+
+        raise:
+        (QEmptyError): Если снимок пуст.
+        (ValueError): Если снимок закрыт
+
+        return:
+        (T): Первый элемент снимка.
+        """
+        if self._count==0:
+            raise QEmptyError()
+        return self[0]
+
+    def back(self)->T:
+        """
+        Возвращает последний элемент снимка.
+
+        raise:
+        (QEmptyError): Если снимок пуст.
+        (ValueError): Если снимок закрыт
+
+        return:
+        (T): Последний элемент снимка.
+        """
+        if self._count==0:
+            raise QEmptyError()
+        return self[-1]
+
+    def aslist(self)->list[T]:
+        """
+        Возвращает список элементов снимка (один срез на отрезок).
+
+        raise:
+        (ValueError): Если снимок закрыт
+
+        return:
+        (list[T]): Список элементов снимка.
+        """
+        self._check()
+        return _collect(self._chunks,self._head,self._count,self._cells,self._size)
+
+    def __iter__(self)->Generator[T,None,None]:
+        """
+        Генератор, который обходит элементы снимка по отрезкам (магический метод).
+
+        raise:
+        (ValueError): Если снимок закрыт
+
+        return:
+        (Generator[T,None,None]): Генератор, который возвращает элементы снимка один за другим.
+        """
+        self._check()
+        for i,off,n in _spans(self._head,self._count,self._cells,self._size):
+            self._check()
+            yield from self._chunks[i][off:off+n]
+
+    def __repr__(self) -> str:
+        """
+        Представляет снимок в виде строки для печати (магический метод).
+
+        return:
+        (str): Строковое представление снимка.
+        """
+        if self.closed:
+            return f"CVSnapshot(closed, epoch={self._epoch})"
+        return f"CVSnapshot({self.aslist()}, epoch={self._epoch})"
+
+
+class CVQueue(csnapshot.CSnapshotMixin,Generic[T]):
+
+    """
+    Реализация циклической структуры данных FIFO на основе кольца отрезков со снимками copy-on-write.
+
+    Ячейки кольца разбиты на отрезки по chunk_size ячеек, каталог _chunks хранит ссылки на отрезки.
+    snapshot() за O(1) запоминает каталог, первую ячейку и количество элементов и регистрирует эпоху снимка.
+    У каталога и каждого отрезка есть эпоха, в которой очередь получила их в собственность (создала или
+    скопировала). Пока открыт снимок более поздней эпохи (_latest), каталог и отрезок считаются разделяемыми:
+    перед первой записью в такой отрезок очередь копирует его (и один раз - каталог ссылок на отрезки),
+    а следующие записи в этот отрезок идут на месте. Если открытых снимков нет, _latest равен 0 и
+    запись не несет дополнительных затрат, кроме сравнения эпох.
+    При удалении элементов из разделяемого отрезка ссылки в нем не обнуляются (их держит снимок).
+    Вставка и удаление по значению или индексу не поддерживаются.
+    Очередь не потокобезопасна: для одновременной работы писателя и читателей снимки создаются под
+    блокировкой писателя (CBQueue(max_size, CVQueue).snapshot()), а читаются без нее.
+
+    attr:
+    _max_size (int): максимальное количество элементов в очереди
+    _size (int): Количество ячеек в отрезке
+    _cells (int): Количество ячеек кольца (кратно размеру отрезка)
+    _chunks (list[list[Optional[T]]]): Каталог отрезков кольца
+    _stamps (list[int]): Эпоха, в которой очередь получила отрезок в собственность
+    _chunks_stamp (int): Эпоха, в которой очередь получила каталог в собственность
+    _head (int): Физическая ячейка первого элемента
+    _count (int): количество элементов в очереди
+    _epoch (int): Счетчик эпох (количество созданных снимков)
+    _readers (set[int]): Эпохи открытых снимков
+    _latest (int): Эпоха последнего открытого снимка (0 - открытых снимков нет)
+    _readers_lock (threading.RLock): Блокировка учета снимков (снимок закрывается из любого потока)
+    _copies (int): Количество скопированных отрезков
+    _overflow (Optional[OverflowPolicy[T]]): Политика переполнения push()/push_many() (None - QFullError)
+
+    method:
+    empty()->bool: Возращает True, если очередь пустая иначе False
+    is_full()->bool: Возращает True, если очередь полная иначу False
+    length()->int: Возвращает количество элементов в очереди
+    clear()->None: Очищение очереди
+    front()->T: Возращает ссылку на первый элемент в очереди
+    back()->T: Возращает ссылку на последний элемент в очереди
+    pop()->T: Удаляет и возращает первый элемент в очереди
+    push(value:T,raplace:bool=False)->None: Добавляет элемент в конец очереди
+    push_many(values:Iterable[T],replace:bool=False)->None: Добавляет элементы в конец очереди
+    pop_many(n:int)->list[T]: Удаляет и возращает до n первых элементов очереди
+    extend(values:Iterable[T])->None: Добавляет элементы в конец очереди (аналог push_many)
+    resize(new_size:int)->None: Изменяет размер очереди
+    aslist()->list[T]: Возращает очередь в виде списка
+    __getitem__(index:int|slice)->T|list[T]: Возвращает элемент (срез) очереди по индексу
+    snapshot()->CVSnapshot[T]: Возвращает неизменяемый снимок очереди за O(1)
+    snapshots->int: Количество открытых снимков (свойство)
+    copies->int: Количество отрезков, скопированных при записи (свойство)
+    __getstate__()->dict[str,Any]: Возвращает состояние для pickle (элементы в логическом порядке)
+    __setstate__(state:dict[str,Any])->None: Восстанавливает очередь из состояния pickle
+    dump(path:str)->int: Записывает снимок очереди в файл
+    load(path:str)->CVQueue: Восстанавливает очередь из снимка (classmethod)
+    """
+
+    def __init__(self,max_size:int,chunk_size:int = 256,overflow:Optional[OverflowPolicy[T]] = None) -> None:
+        """
+        Инициализация пустой очереди
+
+        param:
+        max_size (int): Размер очереди
+        chunk_size (int): Количество ячеек в отрезке (единица копирования при записи)
+        overflow (Optional[OverflowPolicy[T]]): Политика переполнения push()/push_many() (None - QFullError)
+        """
+        assert max_size>0,"Очередь не может быть отрицательной или равной 0"
+        assert chunk_size>0,"Размер отрезка не может быть отрицательным или равным 0"
+        self._max_size:int = max_size
+        self._size:int = chunk_size
+        self._overflow: Optional[OverflowPolicy[T]] = overflow
+        self._epoch:int = 0
+        self._readers:set[int] = set()
+        self._latest:int = 0
+        self._readers_lock = threading.RLock()
+        self._copies:int = 0
+        self._allocate()
+
+    def _allocate(self)->None:
+        """
+        Создает пустое кольцо отрезков на _max_size элементов (старые отрезки остаются у снимков).
+        """
+        n = -(-self._max_size//self._size)
+        self._cells:int = n*self._size
+        self._chunks:list[list[Optional[T]]] = [[None]*self._size for _ in range(n)]
+        self._stamps:list[int] = [self._epoch]*n
+        self._chunks_stamp:int = self._epoch
+        self._head:int = 0
+        self._count:int = 0
+
+    def _own(self,i:int)->list[Optional[T]]:
+        """
+        Копирует разделяемый со снимком отрезок перед записью (и каталог, если он тоже разделяемый).
+
+        param:
+        i (int): Номер отрезка
+
+        return:
+        (list[Optional[T]]): Отрезок в собственности очереди
+        """
+        if self._chunks_stamp<self._latest:
+            self._chunks = self._chunks.copy()
+            self._chunks_stamp = self._epoch
+        chunk = self._chunks[i].copy()
+        self._chunks[i] = chunk
+        self._stamps[i] = self._epoch
+        self._copies+=1
+        return chunk
+
+    def snapshot(self)->CVSnapshot[T]:
+        """
+        Возвращает неизменяемый снимок очереди за O(1): элементы не копируются, отрезки разделяются
+        с очередью до первой записи в них.
+
+        return:
+        (CVSnapshot[T]): Снимок очереди
+        """
+        with self._readers_lock:
+            self._epoch+=1
+            self._readers.add(self._epoch)
+            self._latest = self._epoch
+            return CVSnapshot(self,self._epoch)
+
+    def _release(self,epoch:int)->None:
+        """
+        Снимает учет закрытого снимка и пересчитывает эпоху последнего открытого снимка.
+
+        param:
+        epoch (int): Эпоха снимка
+        """
+        with self._readers_lock:
+            self._readers.discard(epoch)
+            self._latest = max(self._readers,default=0)
+
+    @property
+    def snapshots(self)->int:
+        """Количество открытых снимков."""
+        return len(self._readers)
+
+    @property
+    def copies(self)->int:
+        """Количество отрезков, скопированных при записи после снимков."""
+        return self._copies
+
+    def empty(self)->bool:
+        """
+        Проверяет, пуста ли очередь.
+
+        return:
+        (bool): True, если очередь пуста, иначе False.
+        """
+        return self._count==0
+
+    def is_full(self)->bool:
+        """
+        Проверяет, полная ли очередь
+
+        return:
+        (bool): True, если очередь полная, иначе False.
+        """
+        return self._count==self._max_size
+
+    def length(self)->int:
+        """
+        Возвращает количество элементов в очереди.
+
+        return:
+        (int): Количество элементов в очереди.
+        """
+        return self._count
+
+    def __len__(self)->int:
+        """
+        Возвращает количество элементов в очереди (магический метод).
+
+        return:
+        (int): Количество элементов в очереди.
+        """
+        return self._count
+
+    def clear(self)->None:
+        """
+        Очищает очередь, создавая новые отрезки (старые остаются у открытых снимков).
+
+        return:
+        (None)
+        """
+        self._allocate()
+
+    def front(self)->T:
+        """
+        Возвращает ссылку на первый элемент очереди без его удаления.
+
+        raise:
+        (QEmptyError): Если очередь пуста.
+
+        return:
+        (T): Первый элемент очереди.
+        """
+        if self._count==0:
+            raise QEmptyError()
+        i,off = divmod(self._head,self._size)
+        return self._chunks[i][off]
+
+    def back(self)->T:
+        """
+        Возвращает ссылку на последний элемент очереди без его удаления.
+
+        raise:
+        (QEmptyError): Если очередь пуста.
+
+        return:
+        (T): Последний элемент очереди.
+        """
+        if self._count==0:
+            raise QEmptyError()
+        i,off = divmod((self._head+self._count-1)%self._cells,self._size)
+        return self._chunks[i][off]
+
+    def push(self,value:T,replace:bool = False)->None:
+        """
+        Добавляет элемент в конец очереди (копируя отрезок, если он разделяется со снимком).
+        1)Если очередь переполнена и replace= False, то поднимаем исключение (или применяем политику overflow).
+        2)Если очередь переполнена и replace= True, то удаляем первый элемент очереди и вставляем новый.
+
+        raise:
+        (QFullError): Если очередь заполнена.
+
+        param:
+        value (T): Элемент для добавления в очередь.
+        replace (bool): Указывает на то, что нужно ли удалять первый элемент при переполнении
+        """
+        if self._count==self._max_size:
+            if replace:
+                self.pop()
+            elif self._overflow is None:
+                raise QFullError()
+            elif not self._overflow.admit(self,value):
+                return
+        i,off = divmod((self._head+self._count)%self._cells,self._size)
+        chunk = self._chunks[i] if self._stamps[i]>=self._latest else self._own(i)
+        chunk[off] = value
+        self._count+=1
+
+    def pop(self)->T:
+        """
+        Удаляет и возвращает первый элемент очереди.
+
+        raise:
+        (QEmptyError): Если очередь пуста.
+
+        return:
+        value (T) : Удаленный первый элемент очереди.
+        """
+        if self._count==0:
+            raise QEmptyError()
+        i,off = divmod(self._head,self._size)
+        chunk = self._chunks[i]
+        value:T = chunk[off]
+        if self._stamps[i]>=self._latest:
+            chunk[off] = None # В разделяемом отрезке ссылку держит снимок
+        self._head = (self._head+1)%self._cells
+        self._count-=1
+        return value
+
+    def push_many(self,values:Iterable[T],replace:bool = False)->None:
+        """
+        Добавляет элементы в конец очереди одним срезом на отрезок (разделяемые отрезки копируются).
+        1)Если элементы не помещаются и replace= False, то поднимаем исключение, очередь не изменяется (или применяем политику overflow).
+        2)Если элементы не помещаются и replace= True, то удаляем первые элементы очереди и вставляем новые.
+
+        raise:
+        (QFullError): Если элементы не помещаются в очередь.
+
+        param:
+        values (Iterable[T]): Элементы для добавления в очередь.
+        replace (bool): Указывает на то, что нужно ли удалять первые элементы при переполнении
+        """
+        values = list(values)
+        k = len(values)
+        if k == 0:
+            return
+
+        free = self._max_size-self._count
+        if k>free:
+            if not replace:
+                if self._overflow is None:
+                    raise QFullError()
+                self._overflow.admit_many(self,values,free)
+                return
+            if k>=self._max_size:
+                # В очереди останутся только последние max_size новых элементов
+                values = values[k-self._max_size:]
+                k = self._max_size
+                self._discard(self._count)
+            else:
+                self._discard(k-free)
+
+        offset = 0
+        for i,off,n in _spans(self._head+self._count,k,self._cells,self._size):
+            chunk = self._chunks[i] if self._stamps[i]>=self._latest else self._own(i)
+            chunk[off:off+n] = values[offset:offset+n]
+            offset+=n
+        self._count+=k
+
+    def extend(self,values:Iterable[T])->None:
+        """
+        Добавляет элементы в конец очереди (аналог push_many с replace=False).
+
+        raise:
+        (QFullError): Если элементы не помещаются в очередь.
+
+        param:
+        values (Iterable[T]): Элементы для добавления в очередь.
+        """
+        self.push_many(values)
+
+    def _discard(self,k:int)->None:
+        """
+        Удаляет k первых элементов очереди без их возврата (ссылки обнуляются только в собственных отрезках).
+
+        param:
+        k (int): Количество удаляемых элементов (не больше количества элементов в очереди)
+        """
+        if k<=0:
+            return
+        for i,off,n in _spans(self._head,k,self._cells,self._size):
+            if self._stamps[i]>=self._latest:
+                self._chunks[i][off:off+n] = [None]*n
+        self._head = (self._head+k)%self._cells
+        self._count-=k
+
+    def pop_many(self,n:int)->list[T]:
+        """
+        Удаляет и возвращает до n первых элементов очереди.
+        Если в очереди меньше n элементов, то возвращаются все элементы.
+
+        raise:
+        (QEmptyError): Если очередь пуста.
+        (ValueError): Если n отрицательное.
+
+        param:
+        n (int): Максимальное количество удаляемых элементов
+
+        return:
+        (list[T]) : Удаленные элементы в порядке очереди.
+        """
+        if n<0:
+            raise ValueError("Количество элементов не может быть отрицательным")
+        if self._count==0:
+            raise QEmptyError()
+
+        k = min(n,self._count)
+        values = _collect(self._chunks,self._head,k,self._cells,self._size)
+        self._discard(k)
+        return values
+
+    def resize(self,new_size:int)->None:
+        """
+        Изменяет размер очереди. При уменьшении удаляются первые элементы.
+        Элементы копируются в новые отрезки (старые остаются у открытых снимков).
+
+        raise:
+        (ValueError): Если размер отрицательный
+
+        param:
+        new_size (int): Размер очереди
+        """
+        if new_size<=0:
+            raise ValueError("Размер очереди должен быть больше 0")
+        count = min(self._count,new_size)
+        values = _collect(self._chunks,self._head+self._count-count,count,self._cells,self._size)
+        self._max_size = new_size
+        self._allocate()
+        self.push_many(values)
+
+    def aslist(self)->list[T]:
+        """
+        Возвращает список всех элементов очереди (один срез на отрезок).
+
+        return:
+        (list[T]): Список элементов очереди.
+        """
+        return _collect(self._chunks,self._head,self._count,self._cells,self._size)
+
+    def __getitem__(self,index:int|slice)->T|list[T]:
+        """
+        Возвращает элемент очереди по логическому индексу (0 - первый, -1 - последний) или срез в виде списка.
+
+        raise:
+        (IndexError): Если индекс вне диапазона очереди
+
+        param:
+        index (int|slice): Индекс или срез
+
+        return:
+        (T|list[T]): Элемент или список элементов
+        """
+        if isinstance(index,slice):
+            start,stop,step = index.indices(self._count)
+            positions = range(start,stop,step)
+            if len(positions)==0:
+                return []
+            low = min(positions[0],positions[-1])
+            span = _collect(self._chunks,self._head+low,abs(positions[-1]-positions[0])+1,self._cells,self._size)
+            return span if step==1 else span[positions[0]-low::step]
+        if index<0:
+            index+=self._count
+        if not 0<=index<self._count:
+            raise IndexError("Индекс вне диапазона очереди")
+        i,off = divmod((self._head+index)%self._cells,self._size)
+        return self._chunks[i][off]
+
+    def __iter__(self)->Generator[T,None,None]:
+        """
+        Генератор, который позволяет итерировать по элементам очереди (магический метод).
+        Очередь нельзя изменять во время обхода - для обхода при изменениях используется snapshot().
+
+        return:
+        (Generator[T,None,None]): Генератор, который возвращает элементы очереди один за другим.
+        """
+        for i,off,n in _spans(self._head,self._count,self._cells,self._size):
+            yield from self._chunks[i][off:off+n]
+
+    def __getstate__(self)->dict[str,Any]:
+        """
+        Возвращает состояние для pickle: параметры очереди и только элементы очереди в логическом порядке
+        (без отрезков кольца и учета снимков).
+
+        return:
+        (dict[str,Any]): Состояние очереди
+        """
+        return {"max_size":self._max_size,"chunk_size":self._size,"overflow":self._overflow,"values":self.aslist()}
+
+    def __setstate__(self,state:dict[str,Any])->None:
+        """
+        Восстанавливает очередь из состояния __getstate__() (отрезки создаются заново, снимков нет).
+
+        param:
+        state (dict[str,Any]): Состояние очереди
+        """
+        self.__init__(state["max_size"],state["chunk_size"],state["overflow"])
+        self.push_many(state["values"])
+
+    def __repr__(self) -> str:
+        """
+        Представляет очередь в виде строки для печати (магический метод).
+
+        return:
+        (str): Строковое представление очереди.
+        """
+        return f"CVQueue({self.aslist()}, max_size={self._max_size})"
+
+
+if __name__ == "__main__":
+    a = CVQueue[int](6,chunk_size=2)
+    a.push_many(range(5))
+    with a.snapshot() as view:
+        a.pop()
+        a.push(5)
+        a.push(6)
+        print(a,view,a.copies)
+    a.push(7,replace=True)
+    print(a,a.snapshots,a.copies)
@@ -0,0 +1,356 @@
+"""
+Модуль cwqueue, реализует потокобезопасную очередь из нескольких шардов с перехватом работы (work stealing).
+
+Класса CWQueue, представляет очередь, в которой каждый поток работает со своим шардом под отдельной блокировкой.
+Очередь предоставляет возможности:
+- добавления элемента в шард потока
+- удаления элемента и его возврат из шарда потока, а при его опустошении - перехват пакета из другого шарда
+- пакетное добавление и удаление элементов
+- привязка потока к шарду
+- проверка на пустоту
+- проверка на заполненость
+- приблизительное колличество элементов (без блокировок)
+- очищение очереди
+"""
+
+import threading
+from itertools import count
+from typing import Optional,TypeVar,Generic,Any,Callable,Iterable
+try:
+    from qexception import QFullError,QEmptyError
+    from cdqueue import CDQueue
+except ImportError:
+    from .qexception import QFullError,QEmptyError
+    from .cdqueue import CDQueue
+
+T = TypeVar("T") # Обобщенный тип данных
+
+
+class CWQueue(Generic[T]):
+
+    """
+    Потокобезопасная шардированная очередь с перехватом работы.
+
+    Элементы хранятся в нескольких очередях пакета (шардах, по умолчанию CDQueue), у каждого шарда своя блокировка,
+    поэтому потоки, работающие с разными шардами, не конкурируют за одну блокировку.
+    Поток при первом обращении получает шард по кругу (или явно через bind()) и дальше добавляет и удаляет
+    элементы в нем. Если шард потока пуст, pop() перехватывает половину элементов (не больше steal_batch)
+    из первого непустого шарда: первый перехваченный элемент возвращается, остальные переносятся в шард потока,
+    чтобы следующие pop() снова выполнялись без обращения к чужим шардам.
+    Перехватываются первые элементы чужого шарда, поэтому порядок FIFO внутри каждого шарда сохраняется;
+    общего порядка FIFO между шардами нет.
+    При перехвате захватываются обе блокировки в порядке номеров шардов, поэтому взаимоблокировки нет.
+
+    attr:
+    _shards (list[CAQueue[T]|CDQueue[T]|CLLQueue[T]|CPLLQueue[T]|CSQueue[T]|CNQueue[T]]): Шарды
+    _locks (list[threading.Lock]): Блокировки шардов
+    _steals (list[int]): Количество перехватов в каждый шард
+    _max_size (int): Размер каждого шарда
+    _steal_batch (int): Максимальное количество элементов одного перехвата
+    _local (threading.local): Номер шарда текущего потока
+    _next (count): Счетчик для распределения потоков по шардам
+
+    method:
+    empty()->bool: Возращает True, если все шарды пусты иначе False (приблизительно)
+    is_full()->bool: Возращает True, если все шарды заполнены иначу False
+    length()->int: Возвращает приблизительное количество элементов без блокировок
+    lengths()->list[int]: Возвращает приблизительное количество элементов в каждом шарде
+    clear()->None: Очищение очереди
+    bind(shard:int)->None: Привязывает текущий поток к шарду
+    shard()->int: Возвращает номер шарда текущего потока
+    push(value:T,replace:bool=False)->None: Добавляет элемент в шард потока (или в первый незаполненный шард)
+    pop()->T: Удаляет и возращает первый элемент шарда потока или перехватывает элементы другого шарда
+    push_many(values:Iterable[T],replace:bool=False)->None: Добавляет элементы в шард потока
+    pop_many(n:int)->list[T]: Удаляет и возращает до n первых элементов шарда потока (с перехватом)
+    aslist()->list[T]: Возращает элементы шардов в виде списка
+    shards (int): Количество шардов (свойство)
+    steals (int): Количество перехватов (свойство)
+    """
+
+    def __init__(self,max_size:int,shards:int = 4,backend:Callable[...,Any] = CDQueue,steal_batch:Optional[int] = None,**kwargs:Any) -> None:
+        """
+        Инициализация пустой очереди
+
+        param:
+        max_size (int): Размер каждого шарда
+        shards (int): Количество шардов
+        backend (Callable[...,Any]): Класс очереди для шардов (по умолчанию CDQueue)
+        steal_batch (Optional[int]): Максимальное количество элементов одного перехвата (None - размер шарда)
+        kwargs (Any): Дополнительные параметры конструктора очереди (например, dtype для CNQueue)
+        """
+        assert max_size>0,"Очередь не может быть отрицательной или равной 0"
+        assert shards>0,"Количество шардов должно быть больше 0"
+        assert steal_batch is None or steal_batch>0,"Размер перехвата должен быть больше 0"
+        self._shards = [backend(max_size,**kwargs) for _ in range(shards)]
+        self._locks = [threading.Lock() for _ in range(shards)]
+        self._steals:list[int] = [0]*shards
+        self._max_size:int = max_size
+        self._steal_batch:int = max_size if steal_batch is None else steal_batch
+        self._local = threading.local()
+        self._next = count()
+
+    @property
+    def shards(self)->int:
+        """
+        Количество шардов.
+        """
+        return len(self._shards)
+
+    @property
+    def steals(self)->int:
+        """
+        Количество перехватов элементов из чужих шардов.
+        """
+        return sum(self._steals)
+
+    def shard(self)->int:
+        """
+        Возвращает номер шарда текущего потока, при первом обращении назначая шарды потокам по кругу.
+
+        return:
+        (int): Номер шарда
+        """
+        try:
+            return self._local.shard
+        except AttributeError:
+            self._local.shard = next(self._next)%len(self._shards) # next() для count атомарен
+            return self._local.shard
+
+    def bind(self,shard:int)->None:
+        """
+        Привязывает текущий поток к шарду.
+
+        raise:
+        (IndexError): Если шарда с таким номером нет
+
+        param:
+        shard (int): Номер шарда
+        """
+        if not 0<=shard<len(self._shards):
+            raise IndexError("Шарда с таким номером нет")
+        self._local.shard = shard
+
+    def push(self,value:T,replace:bool = False)->None:
+        """
+        Добавляет элемент в конец шарда потока.
+        1)Если шард заполнен и replace= False, то элемент добавляется в первый незаполненный шард,
+        а если заполнены все шарды, то поднимаем исключение.
+        2)Если шард заполнен и replace= True, то удаляем первый элемент шарда и вставляем новый.
+
+        raise:
+        (QFullError): Если все шарды заполнены.
+
+        param:
+        value (T): Элемент для добавления в очередь.
+        replace (bool): Указывает на то, что нужно ли удалять первый элемент шарда при переполнении
+        """
+        home = self.shard()
+        with self._locks[home]:
+            queue = self._shards[home]
+            if replace or not queue.is_full():
+                queue.push(value,replace)
+                return
+        for shard in self._others(home):
+            with self._locks[shard]:
+                queue = self._shards[shard]
+                if not queue.is_full():
+                    queue.push(value)
+                    return
+        raise QFullError()
+
+    def push_many(self,values:Iterable[T],replace:bool = False)->None:
+        """
+        Добавляет элементы в конец шарда потока одной операцией под блокировкой.
+
+        raise:
+        (QFullError): Если элементы не помещаются в шард и replace= False, шард не изменяется.
+
+        param:
+        values (Iterable[T]): Элементы для добавления в очередь.
+        replace (bool): Указывает на то, что нужно ли удалять первые элементы шарда при переполнении
+        """
+        home = self.shard()
+        with self._locks[home]:
+            self._shards[home].push_many(values,replace)
+
+    def _others(self,home:int)->list[int]:
+        """
+        Возвращает номера остальных шардов, начиная со следующего за home (по кругу),
+        чтобы потоки разных шардов начинали поиск с разных шардов.
+
+        param:
+        home (int): Номер шарда потока
+
+        return:
+        (list[int]): Номера шардов
+        """
+        n = len(self._shards)
+        return [(home+i)%n for i in range(1,n)]
+
+    def _steal(self,home:int,n:int)->list[T]:
+        """
+        Перехватывает половину элементов (не больше steal_batch) первого непустого чужого шарда.
+        Первые n перехваченных элементов возвращаются, остальные переносятся в шард home.
+
+        param:
+        home (int): Номер шарда потока
+        n (int): Количество возвращаемых элементов
+
+        return:
+        (list[T]): Возвращаемые элементы (пустой список, если все шарды пусты)
+        """
+        local = self._shards[home]
+        for victim in self._others(home):
+            if self._shards[victim].empty(): # Проверка без блокировки, повторяется под блокировкой
+                continue
+            first,second = sorted((home,victim)) # Порядок захвата по номерам шардов
+            with self._locks[first],self._locks[second]:
+                queue = self._shards[victim]
+                if queue.empty():
+                    continue
+                free = self._max_size-local.length() # Перенесенные элементы должны поместиться в шард потока
+                k = max(n,min((queue.length()+1)//2,self._steal_batch,n+free))
+                stolen = list(queue.pop_many(k))
+                if len(stolen)>n:
+                    local.push_many(stolen[n:])
+                self._steals[home]+=1
+                return stolen[:n]
+        return []
+
+    def pop(self)->T:
+        """
+        Удаляет и возвращает первый элемент шарда потока.
+        Если шард потока пуст, перехватывает элементы другого шарда.
+
+        raise:
+        (QEmptyError): Если все шарды пусты.
+
+        return:
+        value (T) : Удаленный элемент.
+        """
+        home = self.shard()
+        with self._locks[home]:
+            queue = self._shards[home]
+            if not queue.empty():
+                return queue.pop()
+        stolen = self._steal(home,1)
+        if not stolen:
+            raise QEmptyError()
+        return stolen[0]
+
+    def pop_many(self,n:int)->list[T]:
+        """
+        Удаляет и возвращает до n первых элементов шарда потока.
+        Если шард потока пуст, перехватывает элементы другого шарда.
+
+        raise:
+        (QEmptyError): Если все шарды пусты.
+        (ValueError): Если n отрицательное.
+
+        param:
+        n (int): Максимальное количество удаляемых элементов
+
+        return:
+        (list[T]) : Удаленные элементы (в порядке FIFO своего шарда).
+        """
+        if n<0:
+            raise ValueError("Количество элементов не может быть отрицательным")
+        home = self.shard()
+        with self._locks[home]:
+            queue = self._shards[home]
+            if not queue.empty():
+                return list(queue.pop_many(n))
+        if n==0:
+            return []
+        stolen = self._steal(home,n)
+        if not stolen:
+            raise QEmptyError()
+        return stolen
+
+    def length(self)->int:
+        """
+        Возвращает приблизительное количество элементов: длины шардов читаются без блокировок,
+        поэтому при одновременных изменениях результат может не совпадать ни с одним состоянием очереди.
+
+        return:
+        (int): Количество элементов в очереди.
+        """
+        return sum(queue.length() for queue in self._shards)
+
+    def lengths(self)->list[int]:
+        """
+        Возвращает приблизительное количество элементов в каждом шарде (без блокировок).
+
+        return:
+        (list[int]): Количество элементов по шардам.
+        """
+        return [queue.length() for queue in self._shards]
+
+    def __len__(self)->int:
+        """
+        Возвращает приблизительное количество элементов (магический метод).
+
+        return:
+        (int): Количество элементов в очереди.
+        """
+        return self.length()
+
+    def empty(self)->bool:
+        """
+        Проверяет, пусты ли все шарды (приблизительно, без блокировок).
+
+        return:
+        (bool): True, если очередь пуста, иначе False.
+        """
+        return all(queue.empty() for queue in self._shards)
+
+    def is_full(self)->bool:
+        """
+        Проверяет, заполнены ли все шарды (приблизительно, без блокировок).
+
+        return:
+        (bool): True, если все шарды заполнены, иначе False.
+        """
+        return all(queue.is_full() for queue in self._shards)
+
+    def clear(self)->None:
+        """
+        Очищает все шарды.
+
+        return:
+        (None)
+        """
+        for lock,queue in zip(self._locks,self._shards):
+            with lock:
+                queue.clear()
+
+    def aslist(self)->list[T]:
+        """
+        Возвращает элементы шардов по порядку номеров шардов.
+
+        return:
+        (list[T]): Список элементов очереди.
+        """
+        values:list[T] = []
+        for lock,queue in zip(self._locks,self._shards):
+            with lock:
+                values.extend(queue.aslist())
+        return values
+
+    def __repr__(self) -> str:
+        """
+        Представляет очередь в виде строки для печати (магический метод).
+
+        return:
+        (str): Строковое представление очереди.
+        """
+        return f"CWQueue({self.lengths()}, steals={self.steals})"
+
+
+if __name__ == "__main__":
+    a = CWQueue[int](8,shards=2)
+    a.bind(0)
+    a.push_many(range(6))
+    a.bind(1)
+    print(a,a.pop(),a)
+    print(a.pop_many(10),a.pop_many(10),a)
@@ -2,7 +2,7 @@
 Модуль для тестирования различных реализаций циклической очереди.
 
 Этот модуль содержит классы тестов для проверки функционала различных реализаций циклической очереди, а так же их время на тестрирование:
-TestCAQueue, TestCLLQueue, TestCDQueue.
+TestCAQueue, TestCLLQueue, TestCPLLQueue, TestCSQueue, TestCDQueue, TestCNQueue.
 """
 import sys
 
@@ -12,11 +12,20 @@ setup.setup() # доступ к родительскому каталогу
 
 import unittest
 import abc
+import os
+import pickle
+import random
+import tempfile
 import timeit
+from array import array
+from itertools import islice
 from typing import TypeVar
 
-from cqueue import CAQueue,CLLQueue,CDQueue
+import numpy as np
+
+from cqueue import CAQueue,CLLQueue,CPLLQueue,CSQueue,CDQueue,CNQueue
 from cqueue import QFullError,QEmptyError
+from cqueue import DropNewest,DropOldest,Reject,Sample
 
 T = TypeVar("T") # Обобщенный тип данных
 
@@ -25,7 +34,7 @@ class AbstractTestCQueue(abc.ABC):
     Абстрактный класс для тестирования функционала очереди. 
     
     attr:
-    queue (CAQueue|CDQueue|CLLQueue): Экзампляр класса очереди 
+    queue (CAQueue|CDQueue|CLLQueue|CPLLQueue|CSQueue|CNQueue): Экзампляр класса очереди 
     
     method:
     setUp(): Установка начальных условий (абстрактный метод)
@@ -43,6 +52,20 @@ class AbstractTestCQueue(abc.ABC):
     test_remove(): Проверка метода remove()
     test_insert(): Проверка метода insert()
     test_resize(): Проверка метода resize()
+    test_push_many(): Проверка метода push_many()
+    test_push_many_replace(): Проверка метода push_many() с установкой второго параметра replace=True
+    test_pop_many(): Проверка метода pop_many()
+    test_extend(): Проверка метода extend()
+    test_from_iterable(): Проверка метода from_iterable()
+    test_getitem(): Проверка доступа к элементу по индексу
+    test_getitem_slice(): Проверка доступа к срезу очереди
+    test_setitem(): Проверка замены элементов по индексу и срезу
+    test_contains_count(): Проверка __contains__ и count()
+    test_hash_index(): Проверка хеш-индекса значений во всех изменяющих операциях (если очередь его поддерживает)
+    test_overflow_policy(): Проверка политик переполнения и счетчиков отброшенных элементов
+    test_segments_export(): Проверка segments(), to_list(), to_array() и to_numpy() (если очередь их поддерживает)
+    test_reversed_window(): Проверка обратного обхода и метода window() (если очередь их поддерживает)
+    test_pickle_snapshot(): Проверка pickle (протоколы 2-5, внеполосные буферы) и снимка dump()/load()
     
     test_stress_pop(): Проверка добавления большого количества элементов в очередь
     test_stress_push(): Проверка добавление большого количества элементов в очередь и их последовательное удаление
@@ -51,6 +74,11 @@ class AbstractTestCQueue(abc.ABC):
     test_stress_remove(): Проверка удаления элементов по значению из большой очереди
     test_stress_resize(): Проверка добавления элементов в большую очередь
     test_stress_insert(): Проверка изменения размерности большой очереди
+    test_stress_push_many_cycle(): Проверка цикличности очереди при пакетном добавлении и удалении
+    test_stress_getitem(): Проверка доступа по индексу к элементам большой очереди
+    test_stress_hash_remove(): Проверка удаления по значению из большой очереди с хеш-индексом
+    test_stress_export(): Проверка выгрузки большой очереди в list, array.array и np.ndarray
+    test_stress_snapshot(): Проверка снимка большой очереди в сравнении с pickle состояния по умолчанию
     
     test_stress_push_another_class(): Проверка добавления большого количества Экземпляров класса в очередь
     """   
@@ -60,7 +88,7 @@ class AbstractTestCQueue(abc.ABC):
         """
         Установка начальных условий перед каждым тестом.
         """
-        self.queue: CAQueue[T]|CDQueue[T]|CLLQueue[T]
+        self.queue: CAQueue[T]|CDQueue[T]|CLLQueue[T]|CPLLQueue[T]|CSQueue[T]|CNQueue[T]
         self.start_time:float
     
     @abc.abstractmethod
@@ -224,7 +252,357 @@ class AbstractTestCQueue(abc.ABC):
         self.assertEqual(self.queue.aslist(), [6,7])
         self.assertEqual(self.queue.front(), 6)
         self.assertEqual(self.queue.back(), 7)
+    
+    def test_push_many(self):
+        """
+        Проверка метода push_many()
+        """
+        self.queue.push_many([])
+        self.assertTrue(self.queue.empty())
+        self.queue.push(1)
+        self.queue.pop()
+        self.queue.push_many(iter([1, 2]))
+        self.assertEqual(self.queue.aslist(), [1, 2])
+        self.queue.pop()
+        self.queue.push_many([3, 4])
+        self.assertEqual(self.queue.aslist(), [2, 3, 4])
+        self.assertEqual(self.queue.front(), 2)
+        self.assertEqual(self.queue.back(), 4)
+        with self.assertRaises(QFullError):
+            self.queue.push_many([5])
+        self.queue.pop()
+        with self.assertRaises(QFullError):
+            self.queue.push_many([5, 6])
+        self.assertEqual(self.queue.aslist(), [3, 4])
+    
+    def test_push_many_replace(self):
+        """
+        Проверка метода push_many() с установкой второго параметра replace=True
+        """
+        self.queue.push_many([1, 2])
+        self.queue.push_many([3, 4], replace=True)
+        self.assertEqual(self.queue.aslist(), [2, 3, 4])
+        self.queue.push_many([5, 6, 7, 8, 9], replace=True)
+        self.assertEqual(self.queue.aslist(), [7, 8, 9])
+        self.assertEqual(self.queue.front(), 7)
+        self.assertEqual(self.queue.back(), 9)
+        self.assertEqual(self.queue.pop(), 7)
+        self.queue.push(10)
+        self.assertEqual(self.queue.aslist(), [8, 9, 10])
+    
+    def test_pop_many(self):
+        """
+        Проверка метода pop_many()
+        """
+        with self.assertRaises(QEmptyError):
+            self.queue.pop_many(1)
+        self.queue.push_many([1, 2, 3])
+        self.queue.pop()
+        self.queue.push(4)
+        with self.assertRaises(ValueError):
+            self.queue.pop_many(-1)
+        self.assertEqual(list(self.queue.pop_many(0)), [])
+        self.assertEqual(list(self.queue.pop_many(2)), [2, 3])
+        self.assertEqual(self.queue.aslist(), [4])
+        self.assertEqual(self.queue.front(), 4)
+        self.queue.push_many([5, 6])
+        self.assertEqual(list(self.queue.pop_many(10)), [4, 5, 6])
+        self.assertTrue(self.queue.empty())
+        self.queue.push(7)
+        self.assertEqual(self.queue.front(), 7)
+        self.assertEqual(self.queue.back(), 7)
+    
+    def test_extend(self):
+        """
+        Проверка метода extend()
+        """
+        self.queue.extend(range(2))
+        self.queue.extend([2])
+        self.assertEqual(self.queue.aslist(), [0, 1, 2])
+        with self.assertRaises(QFullError):
+            self.queue.extend([3])
+    
+    def test_from_iterable(self):
+        """
+        Проверка метода from_iterable()
+        """
+        queue = self.queue.__class__[int].from_iterable(range(5))
+        self.assertTrue(queue.is_full())
+        self.assertEqual(queue.aslist(), [0, 1, 2, 3, 4])
+        queue = self.queue.__class__[int].from_iterable(range(5), max_size=3, replace=True)
+        self.assertEqual(queue.aslist(), [2, 3, 4])
+        with self.assertRaises(QFullError):
+            self.queue.__class__[int].from_iterable(range(5), max_size=3)
+        queue = self.queue.__class__[int].from_iterable([]) # Пустая очередь размера 1
+        self.assertTrue(queue.empty())
+        queue.push(1)
+        self.assertTrue(queue.is_full())
+    
+    
+    def test_getitem(self):
+        """
+        Проверка доступа к элементу по индексу
+        """
+        with self.assertRaises(IndexError):
+            self.queue[0]
+        self.queue.push_many([1, 2, 3])
+        self.queue.pop()
+        self.queue.push(4) # Очередь переходит через границу буфера
+        self.assertEqual([self.queue[i] for i in range(3)], [2, 3, 4])
+        self.assertEqual(self.queue[-1], 4)
+        self.assertEqual(self.queue[-3], 2)
+        with self.assertRaises(IndexError):
+            self.queue[3]
+        with self.assertRaises(IndexError):
+            self.queue[-4]
+    
+    def test_getitem_slice(self):
+        """
+        Проверка доступа к срезу очереди
+        """
+        self.assertEqual(list(self.queue[:]), [])
+        self.queue.push_many([1, 2, 3])
+        self.queue.pop_many(2)
+        self.queue.push_many([4, 5])
+        self.assertEqual(list(self.queue[:]), [3, 4, 5])
+        self.assertEqual(list(self.queue[1:]), [4, 5])
+        self.assertEqual(list(self.queue[:-1]), [3, 4])
+        self.assertEqual(list(self.queue[::2]), [3, 5])
+        self.assertEqual(list(self.queue[::-1]), [5, 4, 3])
+        self.assertEqual(list(self.queue[2:0:-1]), [5, 4])
+        self.assertEqual(list(self.queue[2:1]), [])
+    
+    def test_setitem(self):
+        """
+        Проверка замены элементов по индексу и срезу
+        """
+        self.queue.push_many([1, 2, 3])
+        self.queue.pop()
+        self.queue.push(4)
+        self.queue[0] = 7
+        self.queue[-1] = 9
+        self.assertEqual(self.queue.aslist(), [7, 3, 9])
+        self.assertEqual(self.queue.front(), 7)
+        self.assertEqual(self.queue.back(), 9)
+        self.queue[1:] = [5, 6]
+        self.assertEqual(self.queue.aslist(), [7, 5, 6])
+        self.queue[::-2] = [1, 2]
+        self.assertEqual(self.queue.aslist(), [2, 5, 1])
+        with self.assertRaises(IndexError):
+            self.queue[3] = 0
+        with self.assertRaises(ValueError):
+            self.queue[:2] = [1]
+        self.assertEqual(self.queue.aslist(), [2, 5, 1])
+    
+    
+    def test_contains_count(self):
+        """
+        Проверка __contains__ и count()
+        """
+        self.assertNotIn(1, self.queue)
+        self.assertEqual(self.queue.count(1), 0)
+        self.queue.push_many([1, 2, 1])
+        self.queue.pop()
+        self.queue.push(1)
+        self.assertIn(2, self.queue)
+        self.assertNotIn(3, self.queue)
+        self.assertEqual(self.queue.count(1), 2)
+        self.assertEqual(self.queue.count(2), 1)
+    
+    def test_hash_index(self):
+        """
+        Проверка хеш-индекса значений во всех изменяющих операциях (если очередь его поддерживает)
+        """
+        if not hasattr(self.queue, "_hindex"):
+            self.skipTest("Очередь не поддерживает хеш-индекс")
+        queue = self.queue.__class__[int](6, indexed=True)
+        
+        def check():
+            values = queue.aslist()
+            for value in set(values) | {-1}:
+                self.assertEqual(queue.count(value), values.count(value))
+                self.assertEqual(value in queue, value in values)
+        
+        queue.push_many([1, 2, 3, 2])
+        check()
+        queue.pop()
+        queue.push(4)
+        queue.insert(1, 7)
+        check()
+        queue.push(2)
+        queue.push(5, replace=True)
+        check()
+        queue.remove(2)
+        self.assertEqual(queue.aslist(), [7, 3, 4, 2, 5])
+        check()
+        queue.remove(5)
+        queue.push(5)
+        check()
+        with self.assertRaises(ValueError):
+            queue.remove(-1)
+        queue[0] = 9
+        queue[-2:] = [9, 8]
+        check()
+        queue.push_many([6, 6, 6], replace=True)
+        check()
+        queue.pop_many(2)
+        check()
+        queue.resize(2)
+        check()
+        queue.push_many(range(10), replace=True)
+        check()
+        queue.clear()
+        check()
+        self.assertEqual(queue._hindex, {})
+    
+    def test_overflow_policy(self):
+        """
+        Проверка политик переполнения и счетчиков отброшенных элементов
+        """
+        cls = self.queue.__class__
+        shed = []
+        policy = DropNewest[int](shed.append)
+        queue = cls[int](3, overflow=policy)
+        queue.push_many([1, 2, 3])
+        queue.push(4)
+        queue.push_many([5, 6])
+        self.assertEqual(queue.aslist(), [1, 2, 3])
+        queue.pop()
+        queue.push_many([7, 8])
+        self.assertEqual(queue.aslist(), [2, 3, 7])
+        self.assertEqual((policy.dropped, policy.evicted), (4, 0))
+        self.assertEqual(shed, [4, 5, 6, 8])
+        
+        policy = DropOldest[int]()
+        queue = cls[int](3, overflow=policy)
+        queue.push_many([1, 2])
+        queue.push(3)
+        queue.push(4)
+        self.assertEqual(queue.aslist(), [2, 3, 4])
+        queue.push_many([5, 6])
+        self.assertEqual(queue.aslist(), [4, 5, 6])
+        queue.push_many(range(10, 15))
+        self.assertEqual(queue.aslist(), [12, 13, 14])
+        self.assertEqual((policy.dropped, policy.evicted), (0, 8))
+        queue.push(15, replace=True) # replace=True не использует политику
+        self.assertEqual(policy.shed, 8)
+        
+        shed.clear()
+        policy = Reject[int](shed.append)
+        queue = cls[int](3, overflow=policy)
+        queue.push_many([1, 2, 3])
+        with self.assertRaises(QFullError):
+            queue.push(4)
+        queue.pop()
+        with self.assertRaises(QFullError):
+            queue.push_many([5, 6])
+        self.assertEqual(queue.aslist(), [2, 3])
+        self.assertEqual((policy.dropped, shed), (3, [4, 5, 6]))
+        
+        policy = Sample[int](2)
+        queue = cls[int](3, overflow=policy)
+        queue.push_many(range(1, 10))
+        self.assertEqual(queue.aslist(), [5, 7, 9])
+        self.assertEqual((policy.dropped, policy.evicted), (3, 3))
+        policy.reset()
+        self.assertEqual(policy.shed, 0)
         
+        if hasattr(queue, "_hindex"):
+            queue = cls[int](3, indexed=True, overflow=DropOldest[int]())
+            queue.push_many([1, 1, 2])
+            queue.push(3)
+            queue.push_many([4, 4])
+            self.assertEqual(queue.aslist(), [3, 4, 4])
+            self.assertEqual((queue.count(1), queue.count(4)), (0, 2))
+    
+    def test_segments_export(self):
+        """
+        Проверка segments(), to_list(), to_array() и to_numpy() (если очередь их поддерживает)
+        """
+        if not hasattr(self.queue, "segments"):
+            self.skipTest("Очередь не поддерживает выгрузку отрезками")
+        queue = self.queue.__class__[int](5)
+        self.assertEqual(queue.segments(), ())
+        self.assertEqual((queue.to_list(), len(queue.to_array("q")), len(queue.to_numpy())), ([], 0, 0))
+        queue.push_many([1, 2, 3, 4])
+        self.assertEqual([list(segment) for segment in queue.segments()], [[1, 2, 3, 4]])
+        queue.pop_many(3)
+        queue.push_many([5, 6, 7]) # Элементы пересекают границу массива
+        self.assertEqual([list(segment) for segment in queue.segments()], [[4, 5], [6, 7]])
+        self.assertEqual(queue.to_list(), [4, 5, 6, 7])
+        self.assertEqual(queue.aslist(), [4, 5, 6, 7])
+        self.assertEqual(queue.to_array("q"), array("q", [4, 5, 6, 7]))
+        self.assertEqual(queue.to_array("d"), array("d", [4, 5, 6, 7]))
+        exported = queue.to_numpy(np.int32)
+        self.assertEqual(exported.dtype, np.int32)
+        np.testing.assert_array_equal(exported, [4, 5, 6, 7])
+        np.testing.assert_array_equal(queue.to_numpy(), [4, 5, 6, 7])
+        exported[0] = 0 # Выгрузка - копия
+        self.assertEqual(queue.front(), 4)
+    
+    def test_reversed_window(self):
+        """
+        Проверка обратного обхода и метода window() (если очередь их поддерживает)
+        """
+        if not hasattr(self.queue, "window"):
+            self.skipTest("Очередь не поддерживает обход окна")
+        queue = self.queue.__class__[int](7)
+        self.assertEqual((list(reversed(queue)), list(queue.window())), ([], []))
+        queue.push_many(range(5))
+        queue.pop_many(4)
+        queue.push_many(range(5, 11)) # Физически: [7, 8, 9, 10, _, 4, 5, 6]
+        values = list(range(4, 11))
+        self.assertEqual(list(reversed(queue)), values[::-1])
+        for start, stop, step in [(0, None, 1), (2, 5, 1), (1, None, 2), (0, 7, 3), (2, 3, 4), (5, 100, 1), (9, None, 1), (4, 2, 1)]:
+            self.assertEqual(list(queue.window(start, stop, step)), list(islice(values, start, stop, step)))
+        for args in [(-1,), (0, -1), (0, 3, 0)]:
+            with self.assertRaises(ValueError):
+                list(queue.window(*args))
+    
+    
+    def test_pickle_snapshot(self):
+        """
+        Проверка pickle (протоколы 2-5, внеполосные буферы) и снимка dump()/load()
+        """
+        cls = self.queue.__class__
+        queue = cls[int](6, overflow=DropOldest[int]())
+        queue.push_many([1, 2, 3, 4, 5])
+        queue.pop_many(3)
+        queue.push_many([6, 7, 8]) # Элементы пересекают границу массива
+        for protocol in range(2, pickle.HIGHEST_PROTOCOL+1):
+            restored = pickle.loads(pickle.dumps(queue, protocol))
+            self.assertIs(type(restored), cls)
+            self.assertEqual(restored.aslist(), [4, 5, 6, 7, 8])
+            self.assertIsInstance(restored._overflow, DropOldest)
+        buffers = []
+        data = pickle.dumps(queue, 5, buffer_callback=buffers.append)
+        restored = pickle.loads(data, buffers=buffers)
+        restored.push_many([9, 10]) # Политика переполнения восстановлена
+        self.assertEqual(restored.aslist(), [5, 6, 7, 8, 9, 10])
+        self.assertEqual(queue.aslist(), [4, 5, 6, 7, 8]) # Исходная очередь не изменилась
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "queue.snap")
+            self.assertEqual(queue.dump(path), os.path.getsize(path))
+            restored = cls.load(path)
+            self.assertEqual((restored.aslist(), restored.length()), ([4, 5, 6, 7, 8], 5))
+            self.assertFalse(restored.is_full())
+            cls[int](2).dump(path) # Пустая очередь
+            self.assertTrue(cls.load(path).empty())
+            with open(path, "wb") as file:
+                file.write(b"not a snapshot")
+            with self.assertRaises(ValueError):
+                cls.load(path)
+            queue.dump(path)
+            with open(path, "r+b") as file:
+                file.seek(8)
+                file.write((1 << 30).to_bytes(4, "little")) # Поврежденное количество буферов
+            with self.assertRaises(ValueError):
+                cls.load(path)
+        if hasattr(queue, "_hindex"):
+            queue = cls[int](4, indexed=True)
+            queue.push_many([1, 2, 2])
+            restored = pickle.loads(pickle.dumps(queue))
+            self.assertEqual((restored.count(2), 1 in restored, 3 in restored), (2, True, False))
     
     
     # Нагруженные тесты
@@ -248,11 +626,9 @@ class AbstractTestCQueue(abc.ABC):
         self.queue = self.queue.__class__[int](size)   
         for i in range(1,size+1):
             self.queue.push(i)
-        start = timeit.default_timer()
         for i in range(1,size+1):
             popped = self.queue.pop()
             self.assertEqual(popped, i)
-        print(f"{self.id()}(only pop()): { round(timeit.default_timer() - start,3)}s")
         self.assertEqual(self.queue.length(), 0)
         self.assertTrue(self.queue.empty())
 
@@ -310,10 +686,8 @@ class AbstractTestCQueue(abc.ABC):
         for i in range(size-21):
             self.queue.push(i)
         
-        start = timeit.default_timer()
         for i in range(21):
             self.queue.insert(i*(size//20), 9999)
-        print(f"{self.id()}(only insert()): { round(timeit.default_timer() - start,3)}s")
         self.assertEqual(self.queue.front(), 9999)
         self.assertEqual(self.queue.back(), 9999)
 
@@ -325,10 +699,8 @@ class AbstractTestCQueue(abc.ABC):
         self.queue = self.queue.__class__[int](size)   
         for i in range(size):
             self.queue.push(i)        
-        start = timeit.default_timer()
         for i in range(1,22):
             self.queue.remove(i+2000)
-        print(f"{self.id()}(only remove()): { round(timeit.default_timer() - start,3)}s")
   
         self.assertEqual(self.queue.front(), 0)
         self.assertEqual(self.queue.back(), 999999)
@@ -342,7 +714,6 @@ class AbstractTestCQueue(abc.ABC):
         for i in range(size):
             self.queue.push(i)
             
-        start = timeit.default_timer()
         self.queue.resize(200000)
         self.assertEqual(self.queue.length(), 200000)
         self.queue.resize(20000)
@@ -351,7 +722,89 @@ class AbstractTestCQueue(abc.ABC):
         self.assertEqual(self.queue.length(), 2000)
         self.queue.resize(200)
         self.assertEqual(self.queue.length(), 200)
-        print(f"{self.id()}(only resize()): { round(timeit.default_timer() - start,3)}s")
+
+    def test_stress_push_many_cycle(self):
+        """
+        Проверка цикличности очереди при пакетном добавлении и удалении
+        """
+        size = 1000000
+        batch = 1000
+        self.queue = self.queue.__class__[int](size)
+        self.queue.push_many(range(size//2))
+        for i in range(size//2, 2*size, batch):
+            self.queue.push_many(range(i, i+batch))
+            popped = self.queue.pop_many(batch)
+            self.assertEqual(popped[0], i-size//2)
+        self.assertEqual(self.queue.length(), size//2)
+        self.assertEqual(self.queue.back(), 2*size-1)
+
+    def test_stress_getitem(self):
+        """
+        Проверка доступа по индексу к элементам большой очереди
+        """
+        size = 100000
+        self.queue = self.queue.__class__[int](size)
+        self.queue.push_many(range(size))
+        self.queue.pop_many(size//3)
+        self.queue.push_many(range(size, size+size//3))
+        for i in range(0, size, size//200):
+            self.assertEqual(self.queue[i], size//3+i)
+            self.assertEqual(self.queue[-i-1], size+size//3-1-i)
+        self.assertEqual(list(self.queue[size//2:size//2+100]), list(range(size//3+size//2, size//3+size//2+100)))
+
+    def test_stress_hash_remove(self):
+        """
+        Проверка удаления по значению из большой очереди с хеш-индексом
+        """
+        if not hasattr(self.queue, "_hindex"):
+            self.skipTest("Очередь не поддерживает хеш-индекс")
+        size = 200000
+        self.queue = self.queue.__class__[int](size, indexed=True)
+        self.queue.push_many(range(size))
+        for i in range(size-1000, size-500):
+            self.assertIn(i, self.queue)
+            self.queue.remove(i)
+            self.assertNotIn(i, self.queue)
+            with self.assertRaises(ValueError):
+                self.queue.remove(-i)
+        self.assertEqual(self.queue.length(), size-500)
+        self.assertEqual(self.queue.count(size-1), 1)
+
+    def test_stress_export(self):
+        """
+        Проверка выгрузки большой очереди в list, array.array и np.ndarray
+        """
+        if not hasattr(self.queue, "segments"):
+            self.skipTest("Очередь не поддерживает выгрузку отрезками")
+        size = 1000000
+        self.queue = self.queue.__class__[int](size)
+        self.queue.push_many(range(size))
+        self.queue.pop_many(size//2)
+        self.queue.push_many(range(size, size+size//2))
+        values = self.queue.to_list()
+        self.assertEqual(values, list(range(size//2, size+size//2)))
+        exported = self.queue.to_numpy(np.int64)
+        self.assertEqual(int(exported.sum()), sum(values))
+        self.assertEqual(len(self.queue.to_array("q")), size)
+        self.assertEqual(next(reversed(self.queue)), size+size//2-1)
+        self.assertEqual(list(self.queue.window(size//2-1, size//2+1)), [size-1, size])
+
+    def test_stress_snapshot(self):
+        """
+        Проверка снимка большой очереди в сравнении с pickle состояния по умолчанию
+        """
+        size = 1000000
+        self.queue = self.queue.__class__[int](size)
+        self.queue.push_many(range(size//2))
+        data = pickle.dumps(self.queue, 5)
+        try:
+            default = len(pickle.dumps(object.__getstate__(self.queue), 5))
+            self.assertLess(len(data), default) # Пустые ячейки и внутренняя структура не сохраняются
+        except RecursionError:
+            pass # Цепочку узлов pickle по умолчанию не сохраняет
+        restored = pickle.loads(data)
+        self.assertEqual(restored.length(), size//2)
+        self.assertEqual((restored.front(), restored.back()), (0, size//2-1))
 
         
 
@@ -395,8 +848,192 @@ class TestCLLQueue(unittest.TestCase, AbstractTestCQueue):
         Установка конечных условий после каждого теста CLLQueue.
         """
         print(f"{self.id()}: { round(timeit.default_timer() - self.startTime,3)}s")
+    
+    def test_node_pool(self):
+        """
+        Проверка повторного использования удаленных узлов и ограничения пула
+        """
+        self.queue.push_many([1, 2, 3])
+        nodes = {id(self.queue._back), id(self.queue._back.next), id(self.queue._back.next.next)}
+        self.assertEqual(self.queue.pop_many(3), [1, 2, 3])
+        self.assertEqual(self.queue._pool_count, 3)
+        self.queue.push(4)
+        self.queue.push(5, replace=True)
+        self.queue.insert(0, 6)
+        self.assertEqual(self.queue._pool_count, 0)
+        self.assertEqual({id(self.queue._back), id(self.queue._back.next), id(self.queue._back.next.next)}, nodes)
+        self.queue.push(7, replace=True)
+        self.assertEqual(self.queue.aslist(), [4, 5, 7])
+        self.queue.remove(5)
+        self.assertEqual(self.queue._pool_count, 1)
+        
+        queue = CLLQueue[int](3, pool_limit=1)
+        queue.push_many([1, 2, 3])
+        queue.pop_many(3)
+        self.assertEqual(queue._pool_count, 1)
+        self.assertIsNone(queue._pool.value)
+    
+    def test_skip_index(self):
+        """
+        Проверка поддержки индекса опорных узлов при добавлении, удалении, вставке и вытеснении элементов
+        """
+        self.queue = CLLQueue[int](50)
+        expected = list(range(40))
+        self.queue.push_many(expected)
+        self.assertEqual(self.queue[17], 17)
+        self.assertEqual(self.queue._skip_step, 6)
+        for i in range(40, 400):
+            if i%7==0:
+                self.queue.pop_many(3)
+                del expected[:3]
+            elif i%11==0 and not self.queue.is_full():
+                self.queue.insert(5, i)
+                expected.insert(5, i)
+            elif self.queue.is_full():
+                self.queue.push(i, replace=True)
+                expected = expected[1:]+[i]
+            else:
+                self.queue.push_many([i, -i], replace=True)
+                expected = (expected+[i, -i])[-50:]
+            self.assertEqual([self.queue[j] for j in range(len(expected))], expected)
+    
+    def test_skip_index_remove(self):
+        """
+        Проверка исправления индекса опорных узлов на месте при удалении по хеш-индексу
+        """
+        rnd = random.Random(10)
+        expected = list(range(400))
+        self.queue = CLLQueue[int](400, indexed=True)
+        self.queue.push_many(expected)
+        self.assertEqual(self.queue[200], 200)
+        skip = self.queue._skip
+        while len(expected)>5:
+            value = rnd.choice((expected[0], expected[-1], expected[1], rnd.choice(expected)))
+            self.queue.remove(value)
+            expected.remove(value)
+            self.assertIs(self.queue._skip, skip) # Индекс не строится заново
+            self.assertEqual([self.queue[j] for j in range(len(expected))], expected)
+        self.assertEqual(self.queue.aslist(), expected)
                
 
+class TestCPLLQueue(unittest.TestCase, AbstractTestCQueue):
+    """
+    Класс для тестирования функционала CPLLQueue.
+    """
+    def setUp(self):
+        """
+        Установка начальных условий перед каждым тестом CPLLQueue.
+        """
+        self.startTime = timeit.default_timer()
+        self.queue = CPLLQueue[int](3)
+        
+    
+    def tearDown(self):
+        """
+        Установка конечных условий после каждого теста CPLLQueue.
+        """
+        print(f"{self.id()}: { round(timeit.default_timer() - self.startTime,3)}s")
+    
+    def nodes(self) -> list:
+        """
+        Возвращает узлы кольца, начиная с первого элемента.
+        """
+        result, node = [], self.queue._front
+        for _ in range(self.queue._max_size):
+            result.append(node)
+            node = node.next
+        self.assertIs(node, self.queue._front)
+        return result
+    
+    def test_ring_reuse(self):
+        """
+        Проверка того, что push/pop/insert/remove используют узлы кольца без создания новых
+        """
+        ring = {id(node) for node in self.nodes()}
+        for i in range(10):
+            self.queue.push(i, replace=True)
+            if i % 3 == 0:
+                self.queue.pop()
+        self.queue.insert(0, 100)
+        self.queue.remove(100)
+        self.queue.insert(1, 200)
+        self.assertEqual({id(node) for node in self.nodes()}, ring)
+    
+    def test_resize_splice(self):
+        """
+        Проверка того, что resize() вставляет и вырезает узлы, не перестраивая кольцо
+        """
+        self.queue.push_many([1, 2, 3])
+        old = self.nodes()
+        self.queue.resize(6)
+        self.assertEqual(self.nodes()[:3], old)
+        self.queue.push_many([4, 5])
+        self.queue.resize(2)
+        self.assertEqual(self.queue.aslist(), [4, 5])
+        self.assertEqual(len(self.nodes()), 2)
+        self.queue.clear()
+        self.queue.resize(1)
+        self.queue.push(6)
+        self.assertEqual(self.queue.aslist(), [6])
+
+
+
+class TestCSQueue(unittest.TestCase, AbstractTestCQueue):
+    """
+    Класс для тестирования функционала CSQueue.
+    Маленький размер блока, чтобы базовые тесты переходили через границы блоков.
+    """
+    def setUp(self):
+        """
+        Установка начальных условий перед каждым тестом CSQueue.
+        """
+        self.startTime = timeit.default_timer()
+        self.queue = CSQueue[int](3, block_size=2)
+        
+    
+    def tearDown(self):
+        """
+        Установка конечных условий после каждого теста CSQueue.
+        """
+        print(f"{self.id()}: { round(timeit.default_timer() - self.startTime,3)}s")
+    
+    def blocks(self) -> list:
+        """
+        Возвращает блоки кольца, начиная с первого, и проверяет связи prev/next.
+        """
+        result, block = [], self.queue._front
+        for _ in range(self.queue._blocks):
+            self.assertIs(block.next.prev, block)
+            result.append(block)
+            block = block.next
+        self.assertIs(block, self.queue._front)
+        return result
+    
+    def test_blocks(self):
+        """
+        Проверка выделения и освобождения блоков целиком и сохранения блоков при resize()
+        """
+        self.queue = CSQueue[int](8, block_size=2)
+        self.assertEqual(len(self.blocks()), 1)
+        self.queue.push_many(range(7))
+        self.assertEqual(len(self.blocks()), 4)
+        old = [id(block) for block in self.blocks()]
+        self.queue.resize(100)
+        self.queue.push(7)
+        self.assertEqual([id(block) for block in self.blocks()], old)
+        self.queue.insert(0, -1)
+        self.assertEqual(self.queue.aslist(), list(range(-1, 8)))
+        self.assertEqual(len(self.blocks()), 5)
+        self.queue.pop_many(6)
+        self.assertEqual(self.queue.aslist(), [5, 6, 7])
+        self.assertLessEqual(len(self.blocks()), 3) # Используемые блоки и не более одного свободного
+        self.queue.resize(1)
+        self.assertEqual(self.queue.aslist(), [7])
+        self.assertLessEqual(len(self.blocks()), 2)
+        self.queue.clear()
+        self.assertEqual(len(self.blocks()), 1)
+
+
 class TestCDQueue(unittest.TestCase, AbstractTestCQueue):
     """
     Класс для тестирования функционала CDQueue.
@@ -414,11 +1051,72 @@ class TestCDQueue(unittest.TestCase, AbstractTestCQueue):
         Установка конечных условий после каждого теста CDQueue.
         """
         print(f"{self.id()}: { round(timeit.default_timer() - self.startTime,3)}s")
+
+
+class TestCNQueue(unittest.TestCase, AbstractTestCQueue):
+    """
+    Класс для тестирования функционала CNQueue.
+    """
+    def setUp(self):
+        """
+        Установка начальных условий перед каждым тестом CNQueue.
+        """
+        self.startTime = timeit.default_timer()
+        self.queue = CNQueue[int](3)
         
+    
+    def tearDown(self):
+        """
+        Установка конечных условий после каждого теста CNQueue.
+        """
+        print(f"{self.id()}: { round(timeit.default_timer() - self.startTime,3)}s")
+    
+    def test_stress_push_another_class(self):
+        """
+        Проверка добавления большого количества Экземпляров класса в очередь (dtype=object)
+        """
+        size = 1000000
+        class TestAnotherClass:
+            def __init__(self,el:int) -> None:
+                self.el = el
+                
+        self.queue = CNQueue[TestAnotherClass](size, dtype=object)
+        for i in range(1,size+1):
+            self.queue.push(TestAnotherClass(i))
+        self.assertEqual(self.queue.length(), size)
+        self.assertEqual(self.queue.front().el, 1)
+        self.assertEqual(self.queue.back().el, size)
+    
+    def test_dtype(self):
+        """
+        Проверка хранения элементов в массиве заданного типа
+        """
+        queue = CNQueue[int](4, dtype=np.int32)
+        queue.push_many(np.array([1, 2, 3], dtype=np.int64))
+        self.assertEqual(queue.dtype, np.int32)
+        self.assertEqual(queue.asarray().dtype, np.int32)
+        self.assertEqual(queue._buf.nbytes, 16)
+        with self.assertRaises(ValueError):
+            queue.push_many(np.zeros((2, 2)))
+    
+    def test_push_many_array(self):
+        """
+        Проверка пакетного добавления и удаления массивов NumPy через границу буфера
+        """
+        queue = CNQueue[int](5, dtype=np.int64)
+        queue.push_many(np.arange(4))
+        np.testing.assert_array_equal(queue.pop_many(3), [0, 1, 2])
+        queue.push_many(np.arange(4, 8))
+        self.assertEqual(queue._front, 3)
+        popped = queue.pop_many(5)
+        self.assertIsInstance(popped, np.ndarray)
+        np.testing.assert_array_equal(popped, [3, 4, 5, 6, 7])
+        self.assertTrue(queue.empty())
+
 if __name__ == '__main__':
 
    
-    for TestQueue in [TestCLLQueue,TestCAQueue,TestCDQueue]:
+    for TestQueue in [TestCLLQueue,TestCPLLQueue,TestCSQueue,TestCAQueue,TestCDQueue,TestCNQueue]:
         print(f"Running test {TestQueue.__name__}")
         suite = unittest.TestLoader().loadTestsFromTestCase(TestQueue)
         res = unittest.TextTestRunner(verbosity=0).run(suite)
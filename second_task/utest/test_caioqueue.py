@@ -0,0 +1,163 @@
+"""
+Модуль для тестирования асинхронной очереди CAIOQueue поверх различных реализаций циклической очереди.
+"""
+import setup
+setup.setup() # доступ к родительскому каталогу
+
+
+import unittest
+import asyncio
+import timeit
+
+from cqueue import CAQueue,CLLQueue,CDQueue,CAIOQueue
+from cqueue import QFullError,QEmptyError
+
+
+class TestCAIOQueue(unittest.IsolatedAsyncioTestCase):
+    """
+    Класс для тестирования функционала CAIOQueue.
+
+    method:
+    test_push_pop(): Проверка методов push() и pop()
+    test_nowait(): Проверка методов push_nowait() и pop_nowait()
+    test_replace(): Проверка метода push() с установкой параметра replace=True
+    test_pop_many(): Проверка метода pop_many()
+    test_waiters(): Проверка ожидания производителей и потребителей
+    test_wakeup_one(): Проверка пробуждения только одного ожидающего на элемент
+    test_cancel(): Проверка отмены ожидающей корутины
+    test_stress_tasks(): Передача большого количества элементов несколькими задачами
+    """
+    backends = (CAQueue,CLLQueue,CDQueue)
+
+    def setUp(self):
+        """
+        Установка начальных условий перед каждым тестом CAIOQueue.
+        """
+        self.startTime = timeit.default_timer()
+
+    def tearDown(self):
+        """
+        Установка конечных условий после каждого теста CAIOQueue.
+        """
+        print(f"{self.id()}: { round(timeit.default_timer() - self.startTime,3)}s")
+
+    async def test_push_pop(self):
+        """
+        Проверка методов push() и pop()
+        """
+        for backend in self.backends:
+            queue = CAIOQueue[int](3,backend)
+            await queue.push(1)
+            await queue.push(2)
+            self.assertEqual(queue.length(), 2)
+            self.assertEqual(await queue.pop(), 1)
+            self.assertEqual(await queue.pop(), 2)
+            self.assertTrue(queue.empty())
+
+    async def test_nowait(self):
+        """
+        Проверка методов push_nowait() и pop_nowait()
+        """
+        queue = CAIOQueue[int](1)
+        with self.assertRaises(QEmptyError):
+            queue.pop_nowait()
+        queue.push_nowait(1)
+        with self.assertRaises(QFullError):
+            queue.push_nowait(2)
+        self.assertEqual(queue.pop_nowait(), 1)
+
+    async def test_replace(self):
+        """
+        Проверка метода push() с установкой параметра replace=True (без ожидания)
+        """
+        queue = CAIOQueue[int](2,CAQueue)
+        for i in range(4):
+            await asyncio.wait_for(queue.push(i,replace=True),timeout=1)
+        self.assertEqual(await queue.pop_many(10), [2, 3])
+
+    async def test_pop_many(self):
+        """
+        Проверка метода pop_many()
+        """
+        queue = CAIOQueue[int](5,CAQueue)
+        for i in range(4):
+            await queue.push(i)
+        self.assertEqual(await queue.pop_many(0), [])
+        self.assertEqual(await queue.pop_many(3), [0, 1, 2])
+        self.assertEqual(await queue.pop_many(3), [3])
+        with self.assertRaises(ValueError):
+            await queue.pop_many(-1)
+
+    async def test_waiters(self):
+        """
+        Проверка ожидания производителя при заполненной очереди и потребителя при пустой
+        """
+        queue = CAIOQueue[int](1)
+        consumer = asyncio.create_task(queue.pop())
+        await asyncio.sleep(0)
+        await queue.push(1)
+        self.assertEqual(await consumer, 1)
+
+        await queue.push(2)
+        producer = asyncio.create_task(queue.push(3))
+        await asyncio.sleep(0)
+        self.assertFalse(producer.done())
+        self.assertEqual(await queue.pop(), 2)
+        await producer
+        self.assertEqual(await queue.pop(), 3)
+
+    async def test_wakeup_one(self):
+        """
+        Проверка пробуждения только одного ожидающего на каждый добавленный элемент
+        """
+        queue = CAIOQueue[int](3)
+        consumers = [asyncio.create_task(queue.pop()) for _ in range(3)]
+        await asyncio.sleep(0)
+        self.assertEqual(len(queue._getters), 3)
+        queue.push_nowait(1)
+        self.assertEqual(len(queue._getters), 2)
+        queue.push_nowait(2)
+        queue.push_nowait(3)
+        self.assertEqual(sorted(await asyncio.gather(*consumers)), [1, 2, 3])
+
+    async def test_cancel(self):
+        """
+        Проверка отмены ожидающей корутины
+        """
+        queue = CAIOQueue[int](1)
+        consumer = asyncio.create_task(queue.pop())
+        await asyncio.sleep(0)
+        consumer.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await consumer
+        self.assertEqual(len(queue._getters), 0)
+        with self.assertRaises(asyncio.TimeoutError):
+            await asyncio.wait_for(queue.pop(),timeout=0.01)
+        await queue.push(1)
+        self.assertEqual(await queue.pop(), 1)
+
+    async def test_stress_tasks(self):
+        """
+        Передача большого количества элементов несколькими производителями и потребителями
+        """
+        size = 100000
+        tasks = 4
+        for backend in self.backends:
+            queue = CAIOQueue[int](64,backend)
+            results:list[list[int]] = [[] for _ in range(tasks)]
+
+            async def produce(k:int)->None:
+                for i in range(k,size,tasks):
+                    await queue.push(i)
+
+            async def consume(out:list[int])->None:
+                while len(out)<size//tasks:
+                    out.extend(await queue.pop_many(size//tasks-len(out)))
+
+            await asyncio.gather(*[produce(k) for k in range(tasks)],*[consume(out) for out in results])
+            self.assertEqual(sorted(sum(results,[])), list(range(size)))
+            self.assertTrue(queue.empty())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,142 @@
+"""
+Модуль для тестирования блокирующей очереди CBQueue поверх различных реализаций циклической очереди.
+"""
+import setup
+setup.setup() # доступ к родительскому каталогу
+
+
+import unittest
+import threading
+import timeit
+
+from cqueue import CAQueue,CLLQueue,CDQueue,CBQueue
+from cqueue import QFullError,QEmptyError
+
+
+class TestCBQueue(unittest.TestCase):
+    """
+    Класс для тестирования функционала CBQueue.
+
+    method:
+    test_put_get(): Проверка методов put() и get()
+    test_timeout(): Проверка исключений по истечении таймаута
+    test_replace(): Проверка метода put() с установкой параметра replace=True
+    test_get_many(): Проверка метода get_many()
+    test_blocking(): Проверка ожидания производителя и потребителя
+    test_stress_threads(): Передача большого количества элементов несколькими потоками
+    """
+    backends = (CAQueue,CLLQueue,CDQueue)
+
+    def setUp(self):
+        """
+        Установка начальных условий перед каждым тестом CBQueue.
+        """
+        self.startTime = timeit.default_timer()
+
+    def tearDown(self):
+        """
+        Установка конечных условий после каждого теста CBQueue.
+        """
+        print(f"{self.id()}: { round(timeit.default_timer() - self.startTime,3)}s")
+
+    def test_put_get(self):
+        """
+        Проверка методов put() и get()
+        """
+        for backend in self.backends:
+            queue = CBQueue[int](3,backend)
+            queue.put(1)
+            queue.put(2)
+            self.assertEqual(queue.length(), 2)
+            self.assertEqual(queue.get(), 1)
+            self.assertEqual(queue.get(), 2)
+            self.assertTrue(queue.empty())
+
+    def test_timeout(self):
+        """
+        Проверка исключений по истечении таймаута
+        """
+        queue = CBQueue[int](1)
+        with self.assertRaises(QEmptyError):
+            queue.get(timeout=0)
+        with self.assertRaises(QEmptyError):
+            queue.get_many(2,timeout=0.01)
+        queue.put(1)
+        with self.assertRaises(QFullError):
+            queue.put(2,timeout=0)
+        start = timeit.default_timer()
+        with self.assertRaises(QFullError):
+            queue.put(2,timeout=0.05)
+        self.assertGreaterEqual(timeit.default_timer()-start, 0.04)
+
+    def test_replace(self):
+        """
+        Проверка метода put() с установкой параметра replace=True
+        """
+        queue = CBQueue[int](2)
+        for i in range(4):
+            queue.put(i,timeout=0,replace=True)
+        self.assertEqual(queue.get_many(10), [2, 3])
+
+    def test_get_many(self):
+        """
+        Проверка метода get_many()
+        """
+        queue = CBQueue[int](5,CAQueue)
+        for i in range(4):
+            queue.put(i)
+        self.assertEqual(queue.get_many(0), [])
+        self.assertEqual(queue.get_many(3), [0, 1, 2])
+        self.assertEqual(queue.get_many(3), [3])
+        with self.assertRaises(ValueError):
+            queue.get_many(-1)
+
+    def test_blocking(self):
+        """
+        Проверка ожидания производителя при заполненной очереди и потребителя при пустой
+        """
+        queue = CBQueue[int](1)
+        result:list[int] = []
+        consumer = threading.Thread(target=lambda: result.append(queue.get(timeout=5)))
+        consumer.start()
+        queue.put(1)
+        consumer.join()
+        self.assertEqual(result, [1])
+
+        queue.put(2)
+        producer = threading.Thread(target=lambda: queue.put(3,timeout=5))
+        producer.start()
+        self.assertEqual(queue.get(timeout=5), 2)
+        producer.join()
+        self.assertEqual(queue.get(timeout=5), 3)
+
+    def test_stress_threads(self):
+        """
+        Передача большого количества элементов несколькими производителями и потребителями
+        """
+        size = 100000
+        threads = 4
+        for backend in self.backends:
+            queue = CBQueue[int](64,backend)
+            results:list[list[int]] = [[] for _ in range(threads)]
+
+            def produce(k:int)->None:
+                for i in range(k,size,threads):
+                    queue.put(i,timeout=5)
+
+            def consume(out:list[int])->None:
+                while len(out)<size//threads:
+                    out.extend(queue.get_many(size//threads-len(out),timeout=5))
+
+            workers = [threading.Thread(target=produce,args=(k,)) for k in range(threads)]
+            workers+= [threading.Thread(target=consume,args=(out,)) for out in results]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+            self.assertEqual(sorted(sum(results,[])), list(range(size)))
+            self.assertTrue(queue.empty())
+
+
+if __name__ == '__main__':
+    unittest.main()
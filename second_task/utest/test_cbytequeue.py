@@ -0,0 +1,216 @@
+"""
+Модуль для тестирования циклического буфера байтов CByteQueue.
+"""
+import setup
+setup.setup() # доступ к родительскому каталогу
+
+
+import unittest
+import io
+import os
+import pickle
+import socket
+import tempfile
+import timeit
+
+from cqueue import CByteQueue
+from cqueue import QFullError,QEmptyError
+
+
+class TestCByteQueue(unittest.TestCase):
+    """
+    Класс для тестирования функционала CByteQueue.
+
+    method:
+    test_write_read(): Проверка методов write(), read() и readinto() через границу буфера
+    test_peek_consume(): Проверка методов peek() и consume() без копирования
+    test_errors(): Проверка вызова исключений
+    test_writable_commit(): Проверка записи в свободное место через writable() и commit()
+    test_recv_into(): Проверка заполнения из сокета и файла
+    test_find(): Проверка поиска через границу буфера
+    test_resize(): Проверка метода resize()
+    test_pickle_snapshot(): Проверка pickle (внеполосные буферы протокола 5) и снимка dump()/load()
+    test_stress_stream(): Проверка передачи большого потока байтов пакетами
+    """
+
+    def setUp(self):
+        """
+        Установка начальных условий перед каждым тестом CByteQueue.
+        """
+        self.startTime = timeit.default_timer()
+        self.queue = CByteQueue(8)
+
+    def tearDown(self):
+        """
+        Установка конечных условий после каждого теста CByteQueue.
+        """
+        print(f"{self.id()}: { round(timeit.default_timer() - self.startTime,3)}s")
+
+    def test_write_read(self):
+        """
+        Проверка методов write(), read() и readinto() через границу буфера
+        """
+        self.assertEqual(self.queue.write(b"abcdef"), 6)
+        self.assertEqual(self.queue.read(4), b"abcd")
+        self.queue.write(bytearray(b"ghijk"))
+        self.assertEqual((self.queue.length(), self.queue.free()), (7, 1))
+        buffer = bytearray(5)
+        self.assertEqual(self.queue.readinto(buffer), 5)
+        self.assertEqual(buffer, b"efghi")
+        self.assertEqual(self.queue.readinto(memoryview(buffer)[1:]), 2)
+        self.assertEqual(buffer, b"ejkhi")
+        self.assertTrue(self.queue.empty())
+        self.queue.write(memoryview(b"12345678"))
+        self.assertTrue(self.queue.is_full())
+        self.assertEqual(bytes(self.queue), b"12345678")
+
+    def test_peek_consume(self):
+        """
+        Проверка методов peek() и consume() без копирования
+        """
+        self.queue.write(b"abcdef")
+        self.queue.consume(5)
+        self.queue.write(b"ghij")
+        views = self.queue.peek()
+        self.assertEqual(len(views), 2) # Данные пересекают границу буфера
+        self.assertEqual([bytes(view) for view in views], [b"fgh", b"ij"])
+        self.assertEqual(views[0].obj, self.queue._buf) # Представления буфера, а не копии
+        self.assertEqual([bytes(view) for view in self.queue.peek(2)], [b"fg"])
+        self.assertEqual(self.queue.length(), 5)
+        self.queue.consume(3)
+        self.assertEqual(self.queue.tobytes(), b"ij")
+        self.queue.consume(2)
+        self.assertEqual(self.queue._front, 0) # Пустая очередь начинается с начала буфера
+
+    def test_errors(self):
+        """
+        Проверка вызова исключений
+        """
+        with self.assertRaises(QEmptyError):
+            self.queue.peek()
+        with self.assertRaises(QEmptyError):
+            self.queue.readinto(bytearray(1))
+        self.queue.write(b"abc")
+        with self.assertRaises(QFullError):
+            self.queue.write(b"123456")
+        with self.assertRaises(QEmptyError):
+            self.queue.consume(4)
+        with self.assertRaises(ValueError):
+            self.queue.consume(-1)
+        self.assertEqual(self.queue.tobytes(), b"abc") # Очередь не изменилась
+        self.queue.write(b"12345")
+        with self.assertRaises(QFullError):
+            self.queue.writable()
+        with self.assertRaises(QFullError):
+            self.queue.commit(1)
+
+    def test_writable_commit(self):
+        """
+        Проверка записи в свободное место через writable() и commit()
+        """
+        self.queue.write(b"abcdef")
+        self.queue.consume(4)
+        views = self.queue.writable()
+        self.assertEqual([len(view) for view in views], [2, 4])
+        views[0][:] = b"gh"
+        views[1][:2] = b"ij"
+        self.queue.commit(4)
+        self.assertEqual(self.queue.tobytes(), b"efghij")
+        self.assertEqual([len(view) for view in self.queue.writable(1)], [1])
+        self.queue.clear()
+        self.assertEqual([len(view) for view in self.queue.writable()], [8])
+
+    def test_recv_into(self):
+        """
+        Проверка заполнения из сокета и файла
+        """
+        left, right = socket.socketpair()
+        with left, right:
+            self.queue.write(b"xxxxxx_")
+            self.queue.consume(6)
+            left.sendall(b"hello")
+            self.assertEqual(self.queue.recv_into(right), 1) # Только непрерывный отрезок до конца буфера
+            self.assertEqual(self.queue.recv_into(right), 4)
+            self.assertEqual(self.queue.tobytes(), b"_hello")
+            left.sendall(b"world")
+            self.assertEqual(self.queue.recv_into(right, 5), 2) # Не больше свободного места
+            self.assertEqual(self.queue.read(), b"_hellowo")
+        self.assertEqual(self.queue.recv_into(io.BytesIO(b"file")), 4)
+        self.assertEqual(self.queue.recv_into(io.BytesIO(b"")), 0)
+        self.assertEqual(self.queue.read(), b"file")
+
+    def test_find(self):
+        """
+        Проверка поиска через границу буфера
+        """
+        self.queue.write(b"abcdef")
+        self.queue.consume(5)
+        self.queue.write(b"\r\n\r\nab") # Физически: "f\r\n" в конце буфера, "\r\nab" в начале
+        self.assertEqual(self.queue.tobytes(), b"f\r\n\r\nab")
+        self.assertEqual(self.queue.find(b"\r\n"), 1)
+        self.assertEqual(self.queue.find(b"\r\n", 2), 3)
+        self.assertEqual(self.queue.find(b"\n\r"), 2)
+        self.assertEqual(self.queue.find(b"ab"), 5)
+        self.assertEqual(self.queue.find(b"abc"), -1)
+        self.assertEqual(self.queue.find(b"f", 1), -1)
+        self.assertEqual(self.queue.find(b""), 0)
+
+    def test_resize(self):
+        """
+        Проверка метода resize()
+        """
+        self.queue.write(b"abcdef")
+        self.queue.consume(5)
+        self.queue.write(b"ghij")
+        self.queue.resize(16)
+        self.assertEqual(self.queue.tobytes(), b"fghij")
+        self.assertEqual(len(self.queue.peek()), 1)
+        self.queue.write(b"k"*11)
+        self.assertTrue(self.queue.is_full())
+        with self.assertRaises(ValueError):
+            self.queue.resize(15)
+        with self.assertRaises(ValueError):
+            self.queue.resize(0)
+
+    def test_pickle_snapshot(self):
+        """
+        Проверка pickle (внеполосные буферы протокола 5) и снимка dump()/load()
+        """
+        self.queue.write(b"abcdef")
+        self.queue.consume(4)
+        self.queue.write(b"ghij") # Байты пересекают границу буфера
+        for protocol in range(2, pickle.HIGHEST_PROTOCOL+1):
+            restored = pickle.loads(pickle.dumps(self.queue, protocol))
+            self.assertEqual((restored.tobytes(), restored.free()), (b"efghij", 2))
+        buffers = []
+        data = pickle.dumps(self.queue, 5, buffer_callback=buffers.append)
+        self.assertEqual([bytes(buffer) for buffer in buffers], [b"efgh", b"ij"]) # Отрезки без копирования
+        self.assertNotIn(b"efgh", data)
+        restored = pickle.loads(data, buffers=buffers)
+        restored.write(b"kl")
+        self.assertEqual((restored.tobytes(), self.queue.tobytes()), (b"efghijkl", b"efghij"))
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "bytes.snap")
+            self.queue.dump(path)
+            self.assertEqual(CByteQueue.load(path).tobytes(), b"efghij")
+            CByteQueue(4).dump(path)
+            self.assertTrue(CByteQueue.load(path).empty())
+
+    def test_stress_stream(self):
+        """
+        Проверка передачи большого потока байтов пакетами
+        """
+        self.queue = CByteQueue(65536)
+        chunk = bytes(range(256))*16
+        buffer = bytearray(3000)
+        total = 0
+        for _ in range(20000):
+            self.queue.write(chunk)
+            while self.queue.length()>=len(buffer):
+                total+=self.queue.readinto(buffer)
+        self.assertEqual(total+self.queue.length(), 20000*len(chunk))
+        self.assertEqual(self.queue.peek(1)[0][0], total%256)
+
+
+if __name__ == '__main__':
+    unittest.main()
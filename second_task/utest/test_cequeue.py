@@ -0,0 +1,206 @@
+"""
+Модуль для тестирования эластичной очереди CEQueue поверх различных реализаций циклической очереди.
+"""
+import setup
+setup.setup() # доступ к родительскому каталогу
+
+
+import unittest
+import timeit
+
+import numpy as np
+
+from cqueue import CAQueue,CLLQueue,CPLLQueue,CSQueue,CDQueue,CNQueue,CBQueue,CEQueue,CapacityPolicy
+from cqueue import QFullError,QEmptyError,DropOldest
+
+
+class TestCEQueue(unittest.TestCase):
+    """
+    Класс для тестирования функционала CEQueue.
+
+    method:
+    test_grow(): Проверка увеличения размера при заполнении
+    test_ceiling(): Проверка QFullError и вытеснения при достижении ceiling
+    test_overflow(): Проверка политики переполнения хранилища при достижении ceiling
+    test_shrink_hysteresis(): Проверка уменьшения размера с гистерезисом
+    test_resize_clear(): Проверка методов resize() и clear()
+    test_policy(): Проверка параметров политики
+    test_backends(): Проверка работы поверх всех реализаций очереди
+    test_blocking_backend(): Проверка CEQueue в качестве хранилища CBQueue
+    test_stress_amortized(): Проверка количества изменений размера при большом количестве элементов
+    """
+    backends = (CAQueue,CLLQueue,CPLLQueue,CSQueue,CDQueue)
+
+    def setUp(self):
+        """
+        Установка начальных условий перед каждым тестом CEQueue.
+        """
+        self.startTime = timeit.default_timer()
+
+    def tearDown(self):
+        """
+        Установка конечных условий после каждого теста CEQueue.
+        """
+        print(f"{self.id()}: { round(timeit.default_timer() - self.startTime,3)}s")
+
+    def test_grow(self):
+        """
+        Проверка увеличения размера при заполнении
+        """
+        queue = CEQueue[int](2)
+        queue.push(1)
+        queue.push(2)
+        self.assertEqual((queue.capacity, queue.resize_count), (2, 0))
+        queue.push(3)
+        self.assertEqual((queue.capacity, queue.resize_count), (4, 1))
+        queue.push_many(range(4, 12))
+        self.assertEqual((queue.capacity, queue.resize_count), (16, 2)) # Один resize() на пакет
+        queue.insert(0, 0)
+        self.assertEqual(queue.aslist(), list(range(12)))
+        self.assertFalse(queue.is_full())
+
+    def test_ceiling(self):
+        """
+        Проверка QFullError и вытеснения при достижении ceiling
+        """
+        queue = CEQueue[int](2, policy=CapacityPolicy(growth=2, ceiling=5))
+        queue.push_many(range(5))
+        self.assertEqual(queue.capacity, 5)
+        self.assertTrue(queue.is_full())
+        with self.assertRaises(QFullError):
+            queue.push(5)
+        with self.assertRaises(QFullError):
+            queue.insert(0, 5)
+        queue.pop()
+        with self.assertRaises(QFullError):
+            queue.push_many([5, 6])
+        self.assertEqual(queue.aslist(), [1, 2, 3, 4])
+        small = CEQueue[int](2, policy=CapacityPolicy(growth=2, ceiling=8))
+        small.push(0)
+        with self.assertRaises(QFullError):
+            small.push_many(range(9))
+        self.assertEqual((small.aslist(), small.capacity, small.resize_count), ([0], 2, 0)) # Размер не увеличился
+        queue.push(5)
+        queue.push(6, replace=True)
+        queue.push_many([7, 8], replace=True)
+        self.assertEqual(queue.aslist(), [4, 5, 6, 7, 8])
+        self.assertEqual(queue.capacity, 5)
+
+    def test_overflow(self):
+        """
+        Проверка политики переполнения хранилища при достижении ceiling
+        """
+        policy = DropOldest[int]()
+        queue = CEQueue[int](2, policy=CapacityPolicy(ceiling=4), overflow=policy)
+        queue.push_many(range(3))
+        self.assertEqual(policy.evicted, 0) # До ceiling размер увеличивается
+        queue.push_many(range(3, 6))
+        queue.push(6)
+        self.assertEqual(queue.aslist(), [3, 4, 5, 6])
+        self.assertEqual((queue.capacity, policy.evicted), (4, 3))
+
+    def test_shrink_hysteresis(self):
+        """
+        Проверка уменьшения размера с гистерезисом
+        """
+        queue = CEQueue[int](4, policy=CapacityPolicy(growth=2, shrink_below=0.25))
+        queue.push_many(range(64))
+        self.assertEqual(queue.capacity, 64)
+        queue.pop_many(48)
+        self.assertEqual(queue.capacity, 64) # 16 из 64 - ровно на пороге
+        queue.pop()
+        self.assertEqual(queue.capacity, 32)
+        resizes = queue.resize_count
+        for i in range(100):
+            # Колебания у границы не меняют размер
+            queue.push(i)
+            queue.pop()
+        self.assertEqual(queue.resize_count, resizes)
+        queue.pop_many(15)
+        self.assertTrue(queue.empty())
+        self.assertEqual(queue.capacity, 4) # Не меньше начального размера
+        with self.assertRaises(QEmptyError):
+            queue.pop_many(1)
+
+    def test_resize_clear(self):
+        """
+        Проверка методов resize() и clear()
+        """
+        queue = CEQueue[int](2, policy=CapacityPolicy(ceiling=16))
+        queue.push_many(range(10))
+        queue.resize(8)
+        self.assertEqual(queue.aslist(), list(range(2, 10)))
+        self.assertEqual(queue.capacity, 8)
+        with self.assertRaises(ValueError):
+            queue.resize(17)
+        queue.clear()
+        self.assertTrue(queue.empty())
+        self.assertEqual(queue.capacity, 8) # resize() меняет и минимальный размер
+        queue.push_many(range(3))
+        queue.remove(1)
+        self.assertIn(2, queue)
+        self.assertEqual(queue.count(0), 1)
+        self.assertEqual(queue[-1], 2)
+
+    def test_policy(self):
+        """
+        Проверка параметров политики
+        """
+        with self.assertRaises(ValueError):
+            CapacityPolicy(growth=1)
+        with self.assertRaises(ValueError):
+            CapacityPolicy(growth=2, shrink_below=0.5) # Нет гистерезиса
+        with self.assertRaises(ValueError):
+            CapacityPolicy(ceiling=0)
+        policy = CapacityPolicy(growth=1.5, ceiling=100, shrink_below=0)
+        self.assertEqual(policy.grow(2, 3), 3)
+        self.assertEqual(policy.grow(10, 1000), 100)
+        self.assertEqual(policy.shrink(100, 0, 1), 100)
+
+    def test_backends(self):
+        """
+        Проверка работы поверх всех реализаций очереди
+        """
+        for backend in self.backends:
+            queue = CEQueue[int](1, backend)
+            for i in range(10):
+                queue.push(i)
+            self.assertEqual(queue.capacity, 16)
+            self.assertEqual(queue.pop_many(8), list(range(8)))
+            self.assertEqual(queue.aslist(), [8, 9])
+            self.assertEqual(queue.capacity, 8) # 2 из 8 - не ниже порога
+        queue = CEQueue[float](1, CNQueue, dtype=np.float64)
+        queue.push_many(np.arange(10.0))
+        self.assertEqual(queue.capacity, 16)
+        self.assertEqual(list(queue.pop_many(8)), list(range(8)))
+
+    def test_blocking_backend(self):
+        """
+        Проверка CEQueue в качестве хранилища CBQueue
+        """
+        queue = CBQueue[int](1, CEQueue, policy=CapacityPolicy(ceiling=4))
+        for i in range(4):
+            queue.put(i, timeout=0)
+        with self.assertRaises(QFullError):
+            queue.put(4, timeout=0)
+        self.assertEqual(queue.get_many(4), [0, 1, 2, 3])
+
+    def test_stress_amortized(self):
+        """
+        Проверка количества изменений размера при большом количестве элементов
+        """
+        size = 1000000
+        for backend in (CAQueue,CSQueue,CDQueue):
+            queue = CEQueue[int](1, backend)
+            start = timeit.default_timer()
+            for i in range(size):
+                queue.push(i)
+            for i in range(size):
+                queue.pop()
+            print(f"{self.id()}({backend.__name__} only push()/pop()): { round(timeit.default_timer() - start,3)}s")
+            self.assertLessEqual(queue.resize_count, 40) # Не больше log2(size) увеличений и столько же уменьшений
+            self.assertEqual(queue.capacity, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
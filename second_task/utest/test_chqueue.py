@@ -0,0 +1,207 @@
+"""
+Модуль для тестирования гибридной очереди CHQueue (кольцо в памяти и сегменты на диске).
+"""
+import setup
+setup.setup() # доступ к родительскому каталогу
+
+
+import unittest
+import os
+import tempfile
+import timeit
+
+import numpy as np
+
+from cqueue import CAQueue,CLLQueue,CPLLQueue,CSQueue,CDQueue,CNQueue,CHQueue
+from cqueue import QFullError,QEmptyError
+
+
+class TestCHQueue(unittest.TestCase):
+    """
+    Класс для тестирования функционала CHQueue.
+
+    method:
+    test_push_pop(): Проверка порядка FIFO через кольцо, сегменты и буфер записи
+    test_segments(): Проверка записи сегментов пакетами и удаления прочитанных файлов
+    test_prefetch(): Проверка фонового чтения следующего сегмента
+    test_push_many_pop_many(): Проверка пакетных методов
+    test_errors(): Проверка вызова исключений
+    test_max_items(): Проверка ограничения max_items и вытеснения
+    test_clear_close(): Проверка методов clear() и close()
+    test_backends(): Проверка работы поверх всех реализаций очереди
+    test_stress_spill(): Проверка всплеска, многократно превышающего кольцо
+    """
+    backends = (CAQueue,CLLQueue,CPLLQueue,CSQueue,CDQueue)
+
+    def setUp(self):
+        """
+        Установка начальных условий перед каждым тестом CHQueue.
+        """
+        self.startTime = timeit.default_timer()
+        self.dir = tempfile.TemporaryDirectory()
+        self.queue = CHQueue[int](4, segment_size=3, directory=self.dir.name)
+
+    def tearDown(self):
+        """
+        Установка конечных условий после каждого теста CHQueue.
+        """
+        self.queue.close()
+        self.dir.cleanup()
+        print(f"{self.id()}: { round(timeit.default_timer() - self.startTime,3)}s")
+
+    def files(self) -> list:
+        """
+        Возвращает файлы сегментов в каталоге очереди.
+        """
+        return sorted(os.listdir(self.dir.name))
+
+    def test_push_pop(self):
+        """
+        Проверка порядка FIFO через кольцо, сегменты и буфер записи
+        """
+        for i in range(11):
+            self.queue.push(i)
+        self.assertEqual(self.queue.length(), 11)
+        self.assertEqual(self.queue.front(), 0)
+        self.assertEqual(self.queue.back(), 10)
+        self.assertEqual(self.queue.aslist(), list(range(11)))
+        for i in range(5):
+            self.assertEqual(self.queue.pop(), i)
+        self.queue.push(11) # Пока часть очереди на диске, новые элементы идут в буфер записи
+        self.assertEqual(self.queue.aslist(), list(range(5, 12)))
+        self.assertEqual([self.queue.pop() for _ in range(7)], list(range(5, 12)))
+        self.assertTrue(self.queue.empty())
+        self.queue.push(12)
+        self.assertEqual(self.queue.segment_count, 0)
+        self.assertEqual(self.queue.front(), 12)
+
+    def test_segments(self):
+        """
+        Проверка записи сегментов пакетами и удаления прочитанных файлов
+        """
+        self.queue.push_many(range(4))
+        self.assertEqual(self.files(), [])
+        self.queue.push_many(range(4, 12))
+        self.assertEqual(self.files(), ["00000000.seg", "00000001.seg"]) # 6 элементов, 2 в буфере записи
+        self.assertEqual((self.queue.spilled, self.queue.segment_count), (6, 2))
+        self.assertEqual(self.queue.back(), 11)
+        self.queue.pop_many(4)
+        self.queue.pop()
+        self.assertEqual(self.queue.spilled, 0)
+        self.queue.pop_many(10)
+        self.assertEqual(self.files(), [])
+
+    def test_prefetch(self):
+        """
+        Проверка фонового чтения следующего сегмента
+        """
+        self.queue.push_many(range(4+3*3))
+        self.assertIsNone(self.queue._prefetch) # Пока потребитель не дошел до сегментов, чтения нет
+        self.queue.pop_many(5)
+        self.assertIsNotNone(self.queue._prefetch)
+        self.queue._prefetch.result()
+        self.assertEqual(self.files(), []) # Последний сегмент прочитан заранее, файл удален
+        self.queue.push_many(range(13, 16)) # Новый сегмент пока читается предыдущий
+        self.assertEqual(self.queue.pop_many(20), list(range(5, 16)))
+        self.assertIsNone(self.queue._prefetch)
+        self.assertEqual(self.files(), [])
+
+    def test_push_many_pop_many(self):
+        """
+        Проверка пакетных методов
+        """
+        self.queue.push_many([])
+        self.queue.extend(range(2))
+        self.queue.push_many(range(2, 20))
+        self.assertEqual(self.queue.pop_many(0), [])
+        self.assertEqual(self.queue.pop_many(7), list(range(7)))
+        self.queue.push_many(range(20, 25))
+        self.assertEqual(self.queue.pop_many(100), list(range(7, 25)))
+        with self.assertRaises(QEmptyError):
+            self.queue.pop_many(1)
+
+    def test_errors(self):
+        """
+        Проверка вызова исключений
+        """
+        with self.assertRaises(QEmptyError):
+            self.queue.pop()
+        with self.assertRaises(QEmptyError):
+            self.queue.front()
+        with self.assertRaises(QEmptyError):
+            self.queue.back()
+        self.queue.push(1)
+        with self.assertRaises(ValueError):
+            self.queue.pop_many(-1)
+        self.assertFalse(self.queue.is_full())
+
+    def test_max_items(self):
+        """
+        Проверка ограничения max_items и вытеснения
+        """
+        queue = CHQueue[int](2, segment_size=2, max_items=5)
+        queue.push_many(range(5))
+        self.assertTrue(queue.is_full())
+        with self.assertRaises(QFullError):
+            queue.push(5)
+        with self.assertRaises(QFullError):
+            queue.push_many([5])
+        queue.push(5, replace=True)
+        self.assertEqual(queue.aslist(), [1, 2, 3, 4, 5])
+        queue.push_many(range(6, 9), replace=True)
+        self.assertEqual(queue.aslist(), [4, 5, 6, 7, 8])
+        queue.push_many(range(10, 20), replace=True)
+        self.assertEqual(queue.aslist(), list(range(15, 20)))
+        queue.close()
+
+    def test_clear_close(self):
+        """
+        Проверка методов clear() и close()
+        """
+        self.queue.push_many(range(20))
+        self.queue.pop_many(5)
+        self.queue.clear()
+        self.assertTrue(self.queue.empty())
+        self.assertEqual((self.queue.spilled, self.files()), (0, []))
+        self.queue.push_many(range(10))
+        self.assertEqual(self.queue.aslist(), list(range(10)))
+        with CHQueue[int](1, segment_size=1) as queue:
+            queue.push_many(range(3))
+            directory = queue._dir
+            self.assertEqual(len(os.listdir(directory)), 2)
+        self.assertFalse(os.path.exists(directory)) # Временный каталог удаляется
+
+    def test_backends(self):
+        """
+        Проверка работы поверх всех реализаций очереди
+        """
+        for backend in self.backends:
+            with CHQueue[int](3, backend, segment_size=2) as queue:
+                queue.push_many(range(5))
+                for i in range(5, 9):
+                    queue.push(i)
+                self.assertEqual(queue.aslist(), list(range(9)))
+                self.assertEqual(queue.pop_many(4), list(range(4)))
+                self.assertEqual([queue.pop() for _ in range(5)], list(range(4, 9)))
+        with CHQueue[int](3, CNQueue, segment_size=2, dtype=np.int64) as queue:
+            queue.push_many(np.arange(9))
+            self.assertEqual(list(queue.pop_many(9)), list(range(9)))
+
+    def test_stress_spill(self):
+        """
+        Проверка всплеска, многократно превышающего кольцо
+        """
+        size = 1000000
+        queue = CHQueue[int](1024, CAQueue, segment_size=65536, directory=self.dir.name)
+        for i in range(size):
+            queue.push(i)
+        self.assertEqual(queue.spilled, (size-1024)//65536*65536)
+        self.assertEqual(queue.length(), size)
+        for i in range(size):
+            self.assertEqual(queue.pop(), i)
+        self.assertEqual(self.files(), [])
+        queue.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,294 @@
+"""
+Модуль для тестирования очереди со статистикой CIQueue.
+"""
+import setup
+setup.setup() # доступ к родительскому каталогу
+
+
+import unittest
+import functools
+import json
+import random
+import threading
+import timeit
+
+import numpy as np
+
+from cqueue import CIQueue,CAQueue,CDQueue,CLLQueue,CNQueue,CEQueue,CBQueue,CapacityPolicy
+from cqueue import DropNewest,DropOldest,Reject,Sample
+from cqueue import QFullError,QEmptyError
+
+
+class FakeClock:
+    """
+    Источник времени, который возвращает заданное время (в секундах).
+    """
+    def __init__(self)->None:
+        self.now = 0.0
+
+    def __call__(self)->float:
+        return self.now
+
+
+class TestCIQueue(unittest.TestCase):
+    """
+    Класс для тестирования функционала CIQueue.
+
+    method:
+    test_counters(): Проверка счетчиков добавлений, удалений, вытеснений и исключений
+    test_high_water(): Проверка максимальной длины и сброса статистики
+    test_resize_events(): Проверка событий изменения размера
+    test_latency(): Проверка времени ожидания и гистограммы с заданным источником времени
+    test_sampling(): Проверка выборки каждого sample-го элемента
+    test_overflow_policies(): Проверка учета политик переполнения хранилища
+    test_backends(): Проверка статистики поверх разных хранилищ (в том числе CEQueue и CNQueue)
+    test_insert_remove(): Проверка insert(), remove() и замены по индексу
+    test_cbqueue_backend(): Проверка CIQueue как бэкенда CBQueue
+    test_stress_latency(): Проверка времени ожидания при случайных операциях в сравнении с моделью
+    """
+
+    def setUp(self):
+        """
+        Установка начальных условий перед каждым тестом CIQueue.
+        """
+        self.startTime = timeit.default_timer()
+        self.clock = FakeClock()
+        self.queue = CIQueue[int](4,sample=1,clock=self.clock)
+
+    def tearDown(self):
+        """
+        Установка конечных условий после каждого теста CIQueue.
+        """
+        print(f"{self.id()}: { round(timeit.default_timer() - self.startTime,3)}s")
+
+    def test_counters(self):
+        """
+        Проверка счетчиков добавлений, удалений, вытеснений и исключений
+        """
+        self.queue.push_many(range(3))
+        self.queue.push(3)
+        self.queue.push(4,replace=True)
+        self.queue.push_many(range(5,11),replace=True)
+        with self.assertRaises(QFullError):
+            self.queue.push(11)
+        with self.assertRaises(QFullError):
+            self.queue.push_many([11,12])
+        self.assertEqual(self.queue.pop(), 7)
+        self.assertEqual(self.queue.pop_many(10), [8,9,10])
+        with self.assertRaises(QEmptyError):
+            self.queue.pop()
+        with self.assertRaises(QEmptyError):
+            self.queue.pop_many(1)
+        stats = self.queue.stats()
+        self.assertEqual((stats["pushes"],stats["pops"],stats["replaced"],stats["dropped"]), (11,4,7,0))
+        self.assertEqual((stats["full_errors"],stats["empty_errors"],stats["length"]), (2,2,0))
+        self.assertEqual(self.queue.aslist(), [])
+
+    def test_high_water(self):
+        """
+        Проверка максимальной длины и сброса статистики
+        """
+        self.queue.push_many(range(3))
+        self.queue.pop_many(2)
+        self.queue.push(3)
+        self.assertEqual(self.queue.stats()["high_water"], 3)
+        self.queue.reset_stats()
+        stats = self.queue.stats()
+        self.assertEqual((stats["high_water"],stats["pushes"],stats["pops"],stats["latency"]["count"]), (2,0,0,0))
+        self.queue.push_many([4,5])
+        self.assertEqual(self.queue.stats()["high_water"], 4)
+        self.assertEqual(self.queue.pop_many(3), [2,3,4]) # отметки времени сохраняются при сбросе
+        self.assertEqual(self.queue.stats()["latency"]["count"], 3)
+
+    def test_resize_events(self):
+        """
+        Проверка событий изменения размера
+        """
+        self.queue.push_many(range(4))
+        self.clock.now = 1.5
+        self.queue.resize(8)
+        self.clock.now = 2.5
+        self.queue.resize(2)
+        stats = self.queue.stats()
+        self.assertEqual(stats["resizes"], 2)
+        self.assertEqual(stats["capacity"], 2)
+        self.assertEqual(stats["resize_events"], [{"time":1.5,"old":4,"new":8},{"time":2.5,"old":8,"new":2}])
+        self.assertEqual(self.queue.aslist(), [2,3])
+        self.assertEqual(self.queue.pop_many(2), [2,3])
+        self.assertEqual(self.queue.stats()["latency"]["count"], 2) # вытесненные resize() не замеряются
+        for _ in range(20):
+            self.queue.resize(3)
+        self.assertEqual(len(self.queue.stats()["resize_events"]), 16)
+
+    def test_latency(self):
+        """
+        Проверка времени ожидания и гистограммы с заданным источником времени
+        """
+        self.queue.push(0)
+        self.clock.now = 0.5e-6
+        self.queue.push(1)
+        self.clock.now = 1.0e-6
+        self.assertEqual(self.queue.pop(), 0) # 1 мкс
+        self.clock.now = 10.5e-6
+        self.queue.push_many([2,3])
+        self.clock.now = 110.5e-6
+        self.queue.pop_many(3) # 110 мкс, 100 мкс, 100 мкс
+        latency = self.queue.stats()["latency"]
+        self.assertEqual(latency["count"], 4)
+        self.assertAlmostEqual(latency["max"], 110e-6)
+        self.assertAlmostEqual(latency["mean"], 311e-6/4)
+        self.assertEqual(latency["buckets"], [{"le":2e-6,"count":1},{"le":128e-6,"count":3}])
+        self.assertEqual((latency["p50"],latency["p99"]), (128e-6,128e-6))
+        self.assertEqual(CIQueue[int](2).stats()["latency"]["p50"], None)
+        self.clock.now = 1e6
+        self.queue.push(4)
+        self.clock.now = 1e7
+        self.queue.pop()
+        latency = self.queue.stats()["latency"]
+        self.assertEqual(latency["buckets"][-1], {"le":None,"count":1})
+        self.assertEqual(latency["p99"], latency["max"])
+        json.dumps(self.queue.stats(),allow_nan=False)
+
+    def test_sampling(self):
+        """
+        Проверка выборки каждого sample-го элемента
+        """
+        queue = CIQueue[int](100,sample=10,clock=self.clock)
+        queue.push_many(range(35))
+        for i in range(35,50):
+            queue.push(i)
+        queue.pop_many(40)
+        self.assertEqual(queue.stats()["latency"]["count"], 4)
+        queue.pop_many(10)
+        self.assertEqual(queue.stats()["latency"]["count"], 5)
+        queue = CIQueue[int](100,sample=0,clock=self.clock)
+        queue.push_many(range(50))
+        queue.pop_many(50)
+        self.assertEqual(queue.stats()["latency"]["count"], 0)
+
+    def test_overflow_policies(self):
+        """
+        Проверка учета политик переполнения хранилища
+        """
+        for policy,expected,stats in ((DropNewest(),[0,1,2,3],(4,2,0)),
+                                      (DropOldest(),[2,3,4,5],(6,0,2)),
+                                      (Sample(2),[1,2,3,5],(5,1,1))):
+            queue = CIQueue[int](4,backend=CAQueue,sample=1,clock=self.clock,overflow=policy)
+            queue.push_many(range(4))
+            queue.push(4)
+            queue.push(5)
+            self.assertEqual(queue.aslist(), expected)
+            result = queue.stats()
+            self.assertEqual((result["pushes"],result["dropped"],result["replaced"]), stats)
+            self.assertEqual(queue.pop_many(4), expected)
+            self.assertEqual(queue.stats()["latency"]["count"], 4)
+        queue = CIQueue[int](4,backend=CDQueue,overflow=DropNewest())
+        queue.push_many(range(3))
+        queue.push_many(range(3,6))
+        self.assertEqual(queue.aslist(), [0,1,2,3])
+        self.assertEqual((queue.stats()["pushes"],queue.stats()["dropped"]), (4,2))
+        queue = CIQueue[int](2,backend=CAQueue,overflow=Reject())
+        queue.push_many([0,1])
+        with self.assertRaises(QFullError):
+            queue.push(2)
+        self.assertEqual(queue.stats()["full_errors"], 1)
+
+    def test_backends(self):
+        """
+        Проверка статистики поверх разных хранилищ (в том числе CEQueue и CNQueue)
+        """
+        for backend,kwargs in ((CAQueue,{}),(CLLQueue,{}),(CNQueue,{"dtype":np.int64}),
+                               (CEQueue,{"policy":CapacityPolicy(ceiling=16)})):
+            queue = CIQueue[int](4,backend,sample=1,clock=self.clock,**kwargs)
+            queue.push_many(range(10),replace=True)
+            queue.push(10,replace=True)
+            elastic = backend is CEQueue # CEQueue увеличивает размер вместо вытеснения
+            self.assertEqual(list(queue.pop_many(2)), [0,1] if elastic else [7,8])
+            stats = queue.stats()
+            self.assertEqual(stats["pushes"], 11)
+            self.assertEqual(stats["replaced"], 0 if elastic else 7)
+            self.assertEqual(stats["high_water"], 11 if elastic else 4)
+            self.assertEqual(stats["latency"]["count"], 2)
+            self.assertEqual(stats["capacity"], 16 if elastic else 4) # Размер CEQueue после увеличения
+
+    def test_insert_remove(self):
+        """
+        Проверка insert(), remove() и замены по индексу
+        """
+        self.queue.push_many([0,1])
+        self.queue.insert(1,5)
+        self.assertEqual(self.queue.aslist(), [0,5,1])
+        self.assertEqual((self.queue.stats()["pushes"],self.queue.stats()["high_water"]), (3,3))
+        self.queue.push(2)
+        self.queue.remove(5)
+        self.queue[0] = 7
+        self.assertIn(7,self.queue)
+        self.assertEqual(self.queue.count(2), 1)
+        self.queue.push(3)
+        self.assertEqual(self.queue.pop_many(4), [7,1,2,3])
+        self.assertEqual(self.queue.stats()["latency"]["count"], 1) # замеряется только элемент после изменений
+        with self.assertRaises(QEmptyError):
+            self.queue.remove(9)
+        self.queue.push(8)
+        with self.assertRaises(ValueError):
+            self.queue.remove(9)
+        self.assertEqual(self.queue.stats()["empty_errors"], 1)
+
+    def test_cbqueue_backend(self):
+        """
+        Проверка CIQueue как бэкенда CBQueue
+        """
+        queue = CBQueue[int](64,functools.partial(CIQueue,backend=CAQueue,sample=1))
+        total = 5000
+        consumer = threading.Thread(target=lambda: [queue.get() for _ in range(total)])
+        consumer.start()
+        for i in range(total):
+            queue.put(i)
+        consumer.join()
+        stats = queue._queue.stats()
+        self.assertEqual((stats["pushes"],stats["pops"],stats["latency"]["count"]), (total,total,total))
+        self.assertLessEqual(stats["high_water"], 64)
+
+    def test_stress_latency(self):
+        """
+        Проверка времени ожидания при случайных операциях в сравнении с моделью
+        """
+        rnd = random.Random(25)
+        size = 50
+        queue = CIQueue[int](size,backend=CAQueue,sample=1,clock=self.clock)
+        model:list[tuple[int,float]] = []
+        waits:list[float] = []
+        counter = 0
+        for step in range(20000):
+            self.clock.now = float(step)
+            op = rnd.random()
+            if op<0.35:
+                queue.push(counter,replace=True)
+                model = (model+[(counter,self.clock.now)])[-size:]
+                counter+=1
+            elif op<0.5:
+                k = rnd.randint(1,80)
+                queue.push_many(range(counter,counter+k),replace=True)
+                model = (model+[(value,self.clock.now) for value in range(counter,counter+k)])[-size:]
+                counter+=k
+            elif op<0.75 and model:
+                self.assertEqual(queue.pop(), model[0][0])
+                waits.append(self.clock.now-model.pop(0)[1])
+            elif op<0.98 and model:
+                k = rnd.randint(1,20)
+                self.assertEqual(queue.pop_many(k), [value for value,_ in model[:k]])
+                waits+=[self.clock.now-t for _,t in model[:k]]
+                model = model[k:]
+            elif op>=0.98:
+                size = rnd.randint(10,80)
+                queue.resize(size)
+                model = model[-size:]
+        latency = queue.stats()["latency"]
+        self.assertEqual(latency["count"], len(waits))
+        self.assertEqual(latency["max"], max(waits))
+        self.assertAlmostEqual(latency["mean"], sum(waits)/len(waits))
+        self.assertEqual(queue.stats()["pops"], len(waits))
+
+
+if __name__ == "__main__":
+    unittest.main()
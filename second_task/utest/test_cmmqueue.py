@@ -0,0 +1,183 @@
+"""
+Модуль для тестирования персистентной очереди CMMQueue.
+"""
+import setup
+setup.setup() # доступ к родительскому каталогу
+
+
+import unittest
+import os
+import tempfile
+import timeit
+
+import numpy as np
+
+from cqueue import CMMQueue
+from cqueue import QFullError,QEmptyError
+
+
+class TestCMMQueue(unittest.TestCase):
+    """
+    Класс для тестирования функционала CMMQueue.
+
+    method:
+    test_push_pop(): Проверка методов push(), pop(), front() и back()
+    test_errors(): Проверка вызова исключений
+    test_push_replace(): Проверка метода push() с установкой второго параметра replace=True
+    test_push_many(): Проверка пакетных методов через границу буфера
+    test_reopen(): Проверка восстановления очереди из файла
+    test_resize(): Проверка метода resize() с переотображением файла
+    test_header_recovery(): Проверка согласования заголовка после сбоя между записями полей
+    test_sync_policy(): Проверка сброса на диск каждые N операций
+    test_stress_push_cycle(): Проверка цикличности большой очереди
+    """
+
+    def setUp(self):
+        """
+        Установка начальных условий перед каждым тестом CMMQueue.
+        """
+        self.startTime = timeit.default_timer()
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, "queue.bin")
+        self.queue = CMMQueue[int](self.path, 3, np.int64)
+
+    def tearDown(self):
+        """
+        Установка конечных условий после каждого теста CMMQueue.
+        """
+        self.queue.close()
+        self.dir.cleanup()
+        print(f"{self.id()}: { round(timeit.default_timer() - self.startTime,3)}s")
+
+    def test_push_pop(self):
+        """
+        Проверка методов push(), pop(), front() и back()
+        """
+        self.queue.push(1)
+        self.queue.push(2)
+        self.assertEqual(self.queue.front(), 1)
+        self.assertEqual(self.queue.back(), 2)
+        self.assertEqual(self.queue.pop(), 1)
+        self.queue.push(3)
+        self.queue.push(4)
+        self.assertEqual(self.queue.aslist(), [2, 3, 4])
+        self.assertEqual(list(self.queue), [2, 3, 4])
+        self.queue.clear()
+        self.assertTrue(self.queue.empty())
+
+    def test_errors(self):
+        """
+        Проверка вызова исключений QEmptyError, QFullError и ValueError
+        """
+        with self.assertRaises(QEmptyError):
+            self.queue.pop()
+        with self.assertRaises(QEmptyError):
+            self.queue.back()
+        self.queue.push_many([1, 2, 3])
+        with self.assertRaises(QFullError):
+            self.queue.push(4)
+        with self.assertRaises(QFullError):
+            self.queue.push_many([4])
+        self.queue.close()
+        with self.assertRaises(ValueError):
+            CMMQueue[int](self.path, 3, np.int32)
+
+    def test_push_replace(self):
+        """
+        Проверка метода push() с установкой второго параметра replace=True
+        """
+        for i in range(5):
+            self.queue.push(i, replace=True)
+        self.assertEqual(self.queue.aslist(), [2, 3, 4])
+        self.assertEqual(self.queue.front(), 2)
+        self.assertEqual(self.queue.back(), 4)
+
+    def test_push_many(self):
+        """
+        Проверка пакетных методов через границу буфера
+        """
+        self.queue.push_many([1, 2])
+        self.assertEqual(self.queue.pop(), 1)
+        self.queue.push_many([3, 4])
+        self.assertEqual(self.queue.aslist(), [2, 3, 4])
+        self.queue.push_many([5, 6], replace=True)
+        self.assertEqual(self.queue.aslist(), [4, 5, 6])
+        self.queue.push_many(range(10), replace=True)
+        self.assertEqual(self.queue.aslist(), [7, 8, 9])
+        np.testing.assert_array_equal(self.queue.pop_many(2), [7, 8])
+        np.testing.assert_array_equal(self.queue.pop_many(5), [9])
+
+    def test_reopen(self):
+        """
+        Проверка восстановления очереди из файла после закрытия
+        """
+        self.queue.push_many([1, 2, 3])
+        self.queue.pop()
+        self.queue.push(4)
+        self.queue.close()
+        self.queue = CMMQueue[int](self.path, 100, np.int64)
+        self.assertEqual(self.queue.aslist(), [2, 3, 4])
+        self.assertTrue(self.queue.is_full())
+        self.assertEqual(self.queue.front(), 2)
+        self.assertEqual(self.queue.back(), 4)
+
+    def test_resize(self):
+        """
+        Проверка метода resize() с переотображением файла
+        """
+        self.queue.push_many([1, 2, 3])
+        self.queue.pop()
+        self.queue.push(4)
+        self.queue.resize(10)
+        self.assertEqual(os.path.getsize(self.path), 64+10*8)
+        self.queue.push_many([5, 6, 7])
+        self.assertEqual(self.queue.aslist(), [2, 3, 4, 5, 6, 7])
+        self.queue.resize(2)
+        self.assertEqual(self.queue.aslist(), [6, 7])
+        self.assertFalse(os.path.exists(self.path+".tmp"))
+        self.queue.close()
+        self.queue = CMMQueue[int](self.path, 3, np.int64)
+        self.assertEqual(self.queue.aslist(), [6, 7])
+        self.assertTrue(self.queue.is_full())
+        self.assertEqual(os.path.getsize(self.path), 64+2*8)
+
+    def test_header_recovery(self):
+        """
+        Проверка согласования заголовка после сбоя между записями полей
+        """
+        self.queue.push_many([1, 2, 3])
+        self.queue.push(4, replace=True)
+        self.queue._header[2] = 2 # Сбой после записи FRONT: BACK остался прежним
+        self.queue.close()
+        self.queue = CMMQueue[int](self.path, 3, np.int64)
+        self.assertEqual((self.queue.aslist(), self.queue.back()), ([2, 3, 4], 4))
+        self.queue.push(5, replace=True)
+        self.assertEqual(self.queue.aslist(), [3, 4, 5])
+
+    def test_sync_policy(self):
+        """
+        Проверка сброса на диск каждые N операций
+        """
+        self.queue.close()
+        self.queue = CMMQueue[int](self.path, 3, np.int64, sync_every=2)
+        self.queue.push(1)
+        self.assertEqual(self.queue._ops, 1)
+        self.queue.push(2)
+        self.assertEqual(self.queue._ops, 0)
+
+    def test_stress_push_cycle(self):
+        """
+        Проверка цикличности большой очереди
+        """
+        size = 100000
+        self.queue.resize(size)
+        for i in range(size):
+            self.queue.push(i)
+        for i in range(size):
+            self.assertEqual(self.queue.pop(), i)
+        self.queue.push_many(np.arange(size))
+        np.testing.assert_array_equal(self.queue.pop_many(size), np.arange(size))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,211 @@
+"""
+Модуль для тестирования многополосной очереди с приоритетами CPQueue.
+"""
+import setup
+setup.setup() # доступ к родительскому каталогу
+
+
+import unittest
+import random
+import timeit
+
+import numpy as np
+
+from cqueue import CAQueue,CLLQueue,CPLLQueue,CSQueue,CDQueue,CNQueue,CPQueue
+from cqueue import QFullError,QEmptyError
+from cqueue import DropNewest,DropOldest
+
+
+class TestCPQueue(unittest.TestCase):
+    """
+    Класс для тестирования функционала CPQueue.
+
+    method:
+    test_strict(): Проверка строгого приоритета и порядка FIFO внутри полосы
+    test_weighted(): Проверка взвешенного циклического обхода полос
+    test_front(): Проверка метода front() в обоих режимах
+    test_pop_many(): Проверка совпадения pop_many() с последовательностью pop()
+    test_lane_capacity(): Проверка размеров и политик переполнения полос
+    test_errors(): Проверка вызова исключений
+    test_backends(): Проверка работы поверх всех реализаций очереди
+    test_stress_starvation(): Проверка доли массовых данных при постоянном потоке управляющих сообщений
+    """
+    backends = (CAQueue,CLLQueue,CPLLQueue,CSQueue,CDQueue)
+
+    def setUp(self):
+        """
+        Установка начальных условий перед каждым тестом CPQueue.
+        """
+        self.startTime = timeit.default_timer()
+        self.queue = CPQueue[int](8, lanes=3)
+
+    def tearDown(self):
+        """
+        Установка конечных условий после каждого теста CPQueue.
+        """
+        print(f"{self.id()}: { round(timeit.default_timer() - self.startTime,3)}s")
+
+    def test_strict(self):
+        """
+        Проверка строгого приоритета и порядка FIFO внутри полосы
+        """
+        self.assertTrue(self.queue.empty())
+        self.queue.push_many([20, 21])
+        self.queue.push(10, 1)
+        self.queue.push(0, 0)
+        self.queue.push(22, -1)
+        self.queue.push(11, 1)
+        self.assertEqual(self.queue.lengths(), [1, 2, 3])
+        self.assertEqual(self.queue.length(), 6)
+        self.assertEqual(self.queue.aslist(), [0, 10, 11, 20, 21, 22])
+        self.assertEqual([self.queue.pop() for _ in range(3)], [0, 10, 11])
+        self.queue.push(1, 0) # Управляющее сообщение обгоняет массовые данные
+        self.assertEqual([self.queue.pop() for _ in range(4)], [1, 20, 21, 22])
+        self.assertTrue(self.queue.empty())
+        self.assertEqual(self.queue._mask, 0)
+
+    def test_weighted(self):
+        """
+        Проверка взвешенного циклического обхода полос
+        """
+        queue = CPQueue[str](10, lanes=3, weights=[3, 2, 1])
+        self.assertEqual(queue.weights, (3, 2, 1))
+        for lane, name in enumerate("abc"):
+            queue.push_many([f"{name}{i}" for i in range(6)], lane)
+        self.assertEqual([queue.pop() for _ in range(12)],
+                         ["a0", "a1", "a2", "b0", "b1", "c0", "a3", "a4", "a5", "b2", "b3", "c1"])
+        queue.push("a6", 0) # Полоса 0 пропускала ход, обход продолжается с нее
+        self.assertEqual([queue.pop() for _ in range(6)], ["a6", "b4", "b5", "c2", "c3", "c4"])
+        queue.clear()
+        queue.push("c", 2)
+        queue.push("b", 1)
+        self.assertEqual(queue.pop_many(5), ["b", "c"])
+
+    def test_front(self):
+        """
+        Проверка метода front() в обоих режимах
+        """
+        self.queue.push(2)
+        self.assertEqual(self.queue.front(), 2)
+        self.queue.push(1, 1)
+        self.assertEqual(self.queue.front(), 1)
+        queue = CPQueue[int](4, lanes=2, weights=[1, 1])
+        queue.push_many([1, 2], 0)
+        queue.push_many([3, 4], 1)
+        order = []
+        while not queue.empty():
+            front = queue.front()
+            self.assertEqual(front, queue.front()) # front() не меняет порядок обхода
+            order.append(queue.pop())
+            self.assertEqual(order[-1], front)
+        self.assertEqual(order, [1, 3, 2, 4])
+
+    def test_pop_many(self):
+        """
+        Проверка совпадения pop_many() с последовательностью pop()
+        """
+        rng = random.Random(5)
+        for weights in (None, [4, 2, 1], [1, 1, 3]):
+            first = CPQueue[int](6, lanes=3, weights=weights)
+            second = CPQueue[int](6, lanes=3, weights=weights)
+            for _ in range(500):
+                if rng.random()<0.55:
+                    value, lane = rng.randrange(100), rng.randrange(3)
+                    first.push(value, lane, replace=True)
+                    second.push(value, lane, replace=True)
+                elif not first.empty():
+                    n = rng.randint(1, 6)
+                    self.assertEqual(first.pop_many(n), [second.pop() for _ in range(min(n, len(second)))])
+            self.assertEqual(first.aslist(), second.aslist())
+        self.queue.push(1)
+        self.assertEqual(self.queue.pop_many(0), [])
+
+    def test_lane_capacity(self):
+        """
+        Проверка размеров и политик переполнения полос
+        """
+        drop = DropNewest[int]()
+        queue = CPQueue[int]([2, 4], overflow=[None, drop])
+        self.assertEqual(queue.lanes, 2)
+        queue.push_many(range(6), 1)
+        self.assertEqual(queue.lengths(), [0, 4])
+        self.assertEqual(drop.dropped, 2)
+        queue.push_many([10, 11], 0) # Заполненная полоса массовых данных не мешает управляющим сообщениям
+        with self.assertRaises(QFullError):
+            queue.push(12, 0)
+        queue.push(12, 0, replace=True)
+        self.assertEqual(queue.pop_many(3), [11, 12, 0])
+        self.assertFalse(queue.is_full())
+        queue.push_many([13, 14], 0)
+        queue.push(4, 1)
+        self.assertTrue(queue.is_full())
+        queue.resize(8, 1)
+        self.assertEqual([queue.lane(i).is_full() for i in range(2)], [True, False])
+        oldest = DropOldest[int]()
+        queue = CPQueue[int](2, lanes=2, overflow=oldest)
+        queue.push_many(range(3), 0)
+        queue.push_many(range(3), 1)
+        self.assertEqual((oldest.evicted, queue.aslist()), (2, [1, 2, 1, 2]))
+
+    def test_errors(self):
+        """
+        Проверка вызова исключений
+        """
+        with self.assertRaises(QEmptyError):
+            self.queue.pop()
+        with self.assertRaises(QEmptyError):
+            self.queue.pop_many(1)
+        with self.assertRaises(QEmptyError):
+            self.queue.front()
+        with self.assertRaises(IndexError):
+            self.queue.push(1, 3)
+        with self.assertRaises(IndexError):
+            self.queue.push_many([1], -4)
+        self.queue.push_many([])
+        self.assertTrue(self.queue.empty())
+        self.queue.push(1)
+        with self.assertRaises(ValueError):
+            self.queue.pop_many(-1)
+        with self.assertRaises(ValueError):
+            CPQueue[int](4, lanes=2, weights=[1])
+        with self.assertRaises(ValueError):
+            CPQueue[int](4, lanes=2, weights=[1, 0])
+        with self.assertRaises(ValueError):
+            CPQueue[int](4, lanes=2, overflow=[None])
+        with self.assertRaises(AssertionError):
+            CPQueue[int]([4, 0])
+
+    def test_backends(self):
+        """
+        Проверка работы поверх всех реализаций очереди
+        """
+        for backend in self.backends:
+            queue = CPQueue[int](4, lanes=2, backend=backend, weights=[2, 1])
+            queue.push_many(range(3), 1)
+            queue.push_many(range(10, 14), 0)
+            self.assertEqual(queue.pop_many(7), [10, 11, 0, 12, 13, 1, 2])
+        queue = CPQueue[int](4, lanes=2, backend=CNQueue, dtype=np.int64)
+        queue.push_many(np.arange(3), 1)
+        queue.push(7, 0)
+        self.assertEqual(queue.pop_many(4), [7, 0, 1, 2])
+
+    def test_stress_starvation(self):
+        """
+        Проверка доли массовых данных при постоянном потоке управляющих сообщений
+        """
+        size = 300000
+        queue = CPQueue[int]([size, 1024], weights=[4, 1])
+        queue.push_many(range(1024), 1)
+        bulk = 0
+        for i in range(size):
+            queue.push(i, 0)
+            if queue.lane(1).empty():
+                queue.push(i, 1)
+            if queue.pop()>=0 and queue._lane==1:
+                bulk+=1
+        self.assertAlmostEqual(bulk/size, 1/5, delta=0.01) # В строгом режиме массовые данные не извлекались бы
+        self.assertEqual(queue.lengths()[0], bulk) # Каждое извлечение массовых данных оставляет управляющее сообщение
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,168 @@
+"""
+Модуль для тестирования очереди в общей памяти CSHMQueue.
+"""
+import setup
+setup.setup() # доступ к родительскому каталогу
+
+
+import unittest
+import multiprocessing
+import time
+import timeit
+
+import numpy as np
+
+from cqueue import CSHMQueue
+from cqueue import QFullError,QEmptyError
+
+
+def produce(name:str,size:int)->None:
+    """
+    Производитель в дочернем процессе: подключается к очереди и добавляет числа от 0 до size.
+    """
+    queue = CSHMQueue[int].attach(name,np.int64)
+    i = 0
+    while i<size:
+        try:
+            queue.push(i)
+            i+=1
+        except QFullError:
+            time.sleep(0) # Отдаем процессор потребителю
+    queue.close()
+
+
+class TestCSHMQueue(unittest.TestCase):
+    """
+    Класс для тестирования функционала CSHMQueue.
+
+    method:
+    test_push_pop(): Проверка методов push(), pop(), front() и back()
+    test_errors(): Проверка вызова исключений QEmptyError и QFullError
+    test_push_many(): Проверка пакетных методов через границу буфера
+    test_records(): Проверка записей структурного типа и представлений segments()
+    test_attach(): Проверка подключения к очереди по имени
+    test_close_unlink(): Проверка удаления блока общей памяти после close()
+    test_stress_process(): Передача большого количества элементов из другого процесса
+    """
+
+    def setUp(self):
+        """
+        Установка начальных условий перед каждым тестом CSHMQueue.
+        """
+        self.startTime = timeit.default_timer()
+        self.queue = CSHMQueue[int](3,np.int64)
+
+    def tearDown(self):
+        """
+        Установка конечных условий после каждого теста CSHMQueue.
+        """
+        self.queue.unlink()
+        print(f"{self.id()}: { round(timeit.default_timer() - self.startTime,3)}s")
+
+    def test_push_pop(self):
+        """
+        Проверка методов push(), pop(), front() и back()
+        """
+        self.queue.push(1)
+        self.queue.push(2)
+        self.assertEqual(self.queue.length(), 2)
+        self.assertEqual(self.queue.front(), 1)
+        self.assertEqual(self.queue.back(), 2)
+        self.assertEqual(self.queue.pop(), 1)
+        self.queue.push(3)
+        self.queue.push(4)
+        self.assertTrue(self.queue.is_full())
+        self.assertEqual(self.queue.aslist(), [2, 3, 4])
+        self.queue.clear()
+        self.assertTrue(self.queue.empty())
+
+    def test_errors(self):
+        """
+        Проверка вызова исключений QEmptyError и QFullError
+        """
+        with self.assertRaises(QEmptyError):
+            self.queue.pop()
+        with self.assertRaises(QEmptyError):
+            self.queue.front()
+        with self.assertRaises(QEmptyError):
+            self.queue.pop_many(1)
+        self.queue.push_many([1, 2, 3])
+        with self.assertRaises(QFullError):
+            self.queue.push(4)
+
+    def test_push_many(self):
+        """
+        Проверка пакетных методов через границу буфера
+        """
+        self.queue.push_many([1, 2])
+        self.assertEqual(self.queue.pop(), 1)
+        self.queue.push_many(np.array([3, 4]))
+        self.assertEqual(len(self.queue.segments()), 2)
+        with self.assertRaises(QFullError):
+            self.queue.push_many([5])
+        np.testing.assert_array_equal(self.queue.pop_many(5), [2, 3, 4])
+        self.assertEqual(list(self.queue.pop_many(0)), [])
+
+    def test_records(self):
+        """
+        Проверка записей структурного типа и представлений segments() без копирования
+        """
+        record = np.dtype([("ts", np.float64), ("payload", "S8")])
+        with CSHMQueue(4, record) as queue:
+            queue.push((1.5, b"abc"))
+            queue.push_many(np.array([(2.5, b"def")], dtype=record))
+            view = queue.segments()[0]
+            self.assertEqual(view["payload"].tolist(), [b"abc", b"def"])
+            view["ts"][0] = 9.0 # представление смотрит в общую память
+            self.assertEqual(queue.pop()["ts"], 9.0)
+            del view
+
+    def test_attach(self):
+        """
+        Проверка подключения к очереди по имени
+        """
+        other = CSHMQueue[int].attach(self.queue.name, np.int64)
+        self.queue.push(1)
+        self.assertEqual(other.pop(), 1)
+        other.push(2)
+        self.assertEqual(self.queue.front(), 2)
+        other.close()
+        with self.assertRaises(ValueError):
+            CSHMQueue[int].attach(self.queue.name, np.int32)
+
+    def test_close_unlink(self):
+        """
+        Проверка удаления блока общей памяти после close()
+        """
+        queue = CSHMQueue[int](3, np.int64)
+        name = queue.name
+        queue.close()
+        queue.close()
+        self.assertEqual(queue.name, name)
+        queue.unlink()
+        with self.assertRaises(FileNotFoundError):
+            CSHMQueue[int].attach(name, np.int64)
+        with self.assertRaises(FileNotFoundError):
+            queue.unlink()
+
+    def test_stress_process(self):
+        """
+        Передача большого количества элементов из другого процесса
+        """
+        size = 100000
+        self.queue.unlink()
+        self.queue = CSHMQueue[int](1024, np.int64)
+        process = multiprocessing.Process(target=produce, args=(self.queue.name, size))
+        process.start()
+        received:list[int] = []
+        while len(received)<size:
+            try:
+                received.extend(self.queue.pop_many(size).tolist())
+            except QEmptyError:
+                time.sleep(0) # Отдаем процессор производителю
+        process.join()
+        self.assertEqual(received, list(range(size)))
+
+
+if __name__ == '__main__':
+    unittest.main()
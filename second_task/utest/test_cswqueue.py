@@ -0,0 +1,216 @@
+"""
+Модуль для тестирования скользящего окна с агрегатами CSWQueue.
+"""
+import setup
+setup.setup() # доступ к родительскому каталогу
+
+
+import unittest
+import math
+import random
+import statistics
+import timeit
+
+import numpy as np
+
+from cqueue import CAQueue,CLLQueue,CPLLQueue,CSQueue,CDQueue,CNQueue,CSWQueue
+from cqueue import QFullError,QEmptyError,DropOldest
+
+
+class TestCSWQueue(unittest.TestCase):
+    """
+    Класс для тестирования функционала CSWQueue.
+
+    method:
+    test_push_replace(): Проверка агрегатов окна при вытеснении через push(replace=True)
+    test_min_max(): Проверка монотонных очередей минимума и максимума
+    test_push_many_numpy(): Проверка пакетного добавления массивов NumPy
+    test_small_dtype(): Проверка поэлементного добавления в хранилище с узким целым типом
+    test_pop_many(): Проверка агрегатов после pop() и pop_many()
+    test_errors(): Проверка вызова исключений
+    test_float_drift(): Проверка пересчета сумм вещественных чисел
+    test_backends(): Проверка работы поверх всех реализаций очереди
+    test_stress_window(): Проверка агрегатов большого потока в сравнении с пересчетом окна
+    """
+    backends = (CAQueue,CLLQueue,CPLLQueue,CSQueue,CDQueue)
+
+    def setUp(self):
+        """
+        Установка начальных условий перед каждым тестом CSWQueue.
+        """
+        self.startTime = timeit.default_timer()
+        self.queue = CSWQueue[int](4)
+
+    def tearDown(self):
+        """
+        Установка конечных условий после каждого теста CSWQueue.
+        """
+        print(f"{self.id()}: { round(timeit.default_timer() - self.startTime,3)}s")
+
+    def check(self, queue, values):
+        """
+        Сравнивает агрегаты очереди с пересчетом по элементам.
+        """
+        self.assertEqual(queue.aslist(), values)
+        self.assertAlmostEqual(queue.sum(), sum(values))
+        self.assertAlmostEqual(queue.mean(), statistics.fmean(values))
+        self.assertEqual((queue.min(), queue.max()), (min(values), max(values)))
+        self.assertAlmostEqual(queue.var(), statistics.pvariance(values))
+        if len(values)>1:
+            self.assertAlmostEqual(queue.std(1), statistics.stdev(values))
+
+    def test_push_replace(self):
+        """
+        Проверка агрегатов окна при вытеснении через push(replace=True)
+        """
+        self.assertEqual(self.queue.sum(), 0)
+        values = []
+        for value in [5, 1, 4, 2, 8, 3, 3, 9]:
+            self.queue.push(value, replace=True)
+            values = (values+[value])[-4:]
+            self.check(self.queue, values)
+        self.assertIsInstance(self.queue.sum(), int) # Целые суммируются точно
+        self.assertTrue(self.queue.is_full())
+        self.queue.clear()
+        self.assertEqual((self.queue.sum(), self.queue.length()), (0, 0))
+
+    def test_min_max(self):
+        """
+        Проверка монотонных очередей минимума и максимума
+        """
+        for value in [1, 2, 3, 4]:
+            self.queue.push(value)
+        self.assertEqual(len(self.queue._max), 1) # Возрастающая последовательность: кандидат в максимум один
+        self.assertEqual(len(self.queue._min), 4)
+        self.queue.push(0, replace=True)
+        self.assertEqual((self.queue.min(), self.queue.max()), (0, 4))
+        self.assertEqual(len(self.queue._min), 1)
+        for value in [7, 7, 7]:
+            self.queue.push(value, replace=True)
+        self.assertEqual((self.queue.min(), self.queue.max()), (0, 7))
+        self.queue.push(7, replace=True)
+        self.assertEqual((self.queue.min(), self.queue.max()), (7, 7))
+        self.queue.pop_many(3)
+        self.assertEqual((self.queue.min(), self.queue.max()), (7, 7))
+
+    def test_push_many_numpy(self):
+        """
+        Проверка пакетного добавления массивов NumPy
+        """
+        queue = CSWQueue[float](5, CNQueue)
+        queue.push_many(np.array([3.0, 1.0, 2.0]))
+        self.check(queue, [3.0, 1.0, 2.0])
+        queue.push_many(np.array([5.0, 0.5, 4.0]), replace=True)
+        self.check(queue, [1.0, 2.0, 5.0, 0.5, 4.0])
+        queue.push_many(np.arange(20.0), replace=True) # Пакет длиннее окна
+        self.check(queue, [15.0, 16.0, 17.0, 18.0, 19.0])
+        queue = CSWQueue[int](4, CNQueue, dtype=np.int32)
+        queue.push_many(np.array([2.7, 1.2])) # Агрегаты по значениям в типе хранилища
+        queue.push_many([7, 3])
+        self.check(queue, [2, 1, 7, 3])
+        with self.assertRaises(ValueError):
+            queue.push_many(np.zeros((2, 2)))
+        self.queue.push_many(np.array([4, 9, 1]))
+        self.queue.push_many(range(2), replace=True)
+        self.check(self.queue, [9, 1, 0, 1])
+        self.assertIsInstance(self.queue.sum(), int)
+
+    def test_small_dtype(self):
+        """
+        Проверка поэлементного добавления в хранилище с узким целым типом
+        """
+        queue = CSWQueue[int](2, CNQueue, dtype=np.int8)
+        queue.push(100)
+        queue.push(-100)
+        self.assertEqual(queue.var(), float(np.var(np.array([100, -100]))))
+        self.assertEqual(queue.pop(), 100)
+        self.assertEqual((queue.sum(), queue._sumsq), (-100, 10000))
+        queue = CSWQueue[int](3, CNQueue, dtype=np.int16)
+        for _ in range(5):
+            queue.push(200, replace=True)
+        self.assertEqual((queue.sum(), queue._sumsq, queue.var()), (600, 120000, 0.0))
+        other = CSWQueue[int](3, CNQueue, dtype=np.int16)
+        other.push_many([200]*5, replace=True)
+        self.assertEqual((other.sum(), other._sumsq), (queue.sum(), queue._sumsq)) # push() и push_many() согласованы
+
+    def test_pop_many(self):
+        """
+        Проверка агрегатов после pop() и pop_many()
+        """
+        self.queue.push_many([6, 2, 8, 4])
+        self.assertEqual(self.queue.pop(), 6)
+        self.check(self.queue, [2, 8, 4])
+        self.assertEqual(self.queue.pop_many(2), [2, 8])
+        self.check(self.queue, [4])
+        self.assertEqual((self.queue.front(), self.queue.back()), (4, 4))
+        self.queue.pop_many(5)
+        self.assertEqual((self.queue.sum(), len(self.queue._min), len(self.queue._max)), (0, 0, 0))
+        self.queue.push(3)
+        self.check(self.queue, [3])
+
+    def test_errors(self):
+        """
+        Проверка вызова исключений
+        """
+        for method in (self.queue.mean, self.queue.min, self.queue.max, self.queue.var, self.queue.pop):
+            with self.assertRaises(QEmptyError):
+                method()
+        self.queue.push(1)
+        with self.assertRaises(QEmptyError):
+            self.queue.var(ddof=1)
+        self.queue.push_many([2, 3, 4])
+        with self.assertRaises(QFullError):
+            self.queue.push(5)
+        with self.assertRaises(QFullError):
+            self.queue.push_many([5])
+        self.check(self.queue, [1, 2, 3, 4]) # Очередь не изменилась
+        with self.assertRaises(AssertionError):
+            CSWQueue[int](4, overflow=DropOldest())
+
+    def test_float_drift(self):
+        """
+        Проверка пересчета сумм вещественных чисел
+        """
+        queue = CSWQueue[float](10)
+        for i in range(10000):
+            queue.push(1e9 if i%2 else 1e-3, replace=True)
+        values = queue.aslist()
+        self.assertEqual(queue.sum(), math.fsum(values))
+        self.assertLess(queue._evicted, 10)
+        self.assertAlmostEqual(queue.var(), statistics.pvariance(values), delta=1e-3*queue.var())
+        queue.push_many([1.0]*10, replace=True)
+        self.assertEqual(queue.var(), 0.0) # Не отрицательная из-за округления
+
+    def test_backends(self):
+        """
+        Проверка работы поверх всех реализаций очереди
+        """
+        for backend in self.backends:
+            queue = CSWQueue[int](3, backend)
+            queue.push_many([4, 1, 6])
+            queue.push(2, replace=True)
+            queue.push_many([5, 0], replace=True)
+            self.check(queue, [2, 5, 0])
+            self.assertEqual(list(queue), [2, 5, 0])
+
+    def test_stress_window(self):
+        """
+        Проверка агрегатов большого потока в сравнении с пересчетом окна
+        """
+        size, window = 200000, 1000
+        rng = random.Random(3)
+        values = [rng.randint(-1000, 1000) for _ in range(size)]
+        queue = CSWQueue[int](window)
+        for value in values:
+            queue.push(value, replace=True)
+            queue.sum(), queue.min(), queue.max()
+        self.check(queue, values[-window:])
+        queue = CSWQueue[float](window, CNQueue)
+        array = np.array(values, dtype=np.float64)
+        for i in range(0, size, 500):
+            queue.push_many(array[i:i+500], replace=True)
+        self.check(queue, values[-window:])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,231 @@
+"""
+Модуль для тестирования очереди с метками времени CTQueue.
+"""
+import setup
+setup.setup() # доступ к родительскому каталогу
+
+
+import unittest
+import os
+import pickle
+import random
+import tempfile
+import timeit
+
+from cqueue import CTQueue,CAQueue,CDQueue
+from cqueue import QFullError,QEmptyError
+
+
+class TestCTQueue(unittest.TestCase):
+    """
+    Класс для тестирования функционала CTQueue.
+
+    method:
+    test_push_timestamps(): Проверка меток времени при добавлении и вытеснении
+    test_wrap_queries(): Проверка range() и since() при переходе через конец массива
+    test_evict_older_than(): Проверка удаления элементов старше момента времени
+    test_push_many(): Проверка пакетного добавления с метками
+    test_resize_remove(): Проверка сохранения меток при resize() и remove()
+    test_errors(): Проверка вызова исключений
+    test_clock(): Проверка меток источника времени по умолчанию
+    test_pickle_snapshot(): Проверка сохранения меток в pickle и снимке dump()/load()
+    test_stress_queries(): Проверка запросов большого потока в сравнении с просмотром списка
+    """
+
+    def setUp(self):
+        """
+        Установка начальных условий перед каждым тестом CTQueue.
+        """
+        self.startTime = timeit.default_timer()
+        self.queue = CTQueue[str](5)
+
+    def tearDown(self):
+        """
+        Установка конечных условий после каждого теста CTQueue.
+        """
+        print(f"{self.id()}: { round(timeit.default_timer() - self.startTime,3)}s")
+
+    def fill(self, events):
+        """
+        Добавляет события (метка, значение) с вытеснением.
+        """
+        for t, value in events:
+            self.queue.push(value, replace=True, timestamp=t)
+
+    def test_push_timestamps(self):
+        """
+        Проверка меток времени при добавлении и вытеснении
+        """
+        self.fill([(1.0, "a"), (2.0, "b"), (2.0, "c")])
+        self.assertEqual(self.queue.timestamps(), [1.0, 2.0, 2.0])
+        self.fill([(3.0, "d"), (4.0, "e"), (5.0, "f"), (6.0, "g")])
+        self.assertEqual(self.queue.aslist(), ["c", "d", "e", "f", "g"])
+        self.assertEqual(self.queue.timestamps(), [2.0, 3.0, 4.0, 5.0, 6.0])
+        self.assertEqual(self.queue.pop(), "c")
+        self.assertEqual(self.queue.timestamps(), [3.0, 4.0, 5.0, 6.0])
+        self.queue.clear()
+        self.assertEqual((self.queue.timestamps(), self.queue.since(0.0)), ([], []))
+        self.queue.push("h", timestamp=0.5) # После очистки метки начинаются заново
+        self.assertEqual(self.queue.timestamps(), [0.5])
+
+    def test_wrap_queries(self):
+        """
+        Проверка range() и since() при переходе через конец массива
+        """
+        self.fill([(float(t), chr(ord("a")+t)) for t in range(8)]) # Физически: f g h d e (front=3)
+        self.assertEqual(self.queue.aslist(), ["d", "e", "f", "g", "h"])
+        self.assertEqual(len(self.queue.segments()), 2)
+        self.assertEqual(self.queue.since(4.0), ["e", "f", "g", "h"])
+        self.assertEqual(self.queue.since(5.5), ["g", "h"]) # Момент во втором отрезке
+        self.assertEqual(self.queue.since(0.0), ["d", "e", "f", "g", "h"])
+        self.assertEqual(self.queue.since(7.5), [])
+        self.assertEqual(self.queue.range(4.0, 6.0), ["e", "f"])
+        self.assertEqual(self.queue.range(4.5, 7.0), ["f", "g"])
+        self.assertEqual(self.queue.range(0.0, 100.0), self.queue.aslist())
+        self.assertEqual(self.queue.range(6.0, 6.0), [])
+        self.assertEqual(self.queue.range(6.0, 5.0), [])
+        self.fill([(8.0, "i"), (8.0, "j"), (8.0, "k")])
+        self.assertEqual(self.queue.range(8.0, 9.0), ["i", "j", "k"]) # Равные метки в обоих отрезках
+        self.assertEqual(self.queue.range(7.0, 8.0), ["h"])
+
+    def test_evict_older_than(self):
+        """
+        Проверка удаления элементов старше момента времени
+        """
+        self.fill([(float(t), str(t)) for t in range(7)])
+        self.assertEqual(self.queue.evict_older_than(4.0), 2)
+        self.assertEqual(self.queue.aslist(), ["4", "5", "6"])
+        self.assertEqual(self.queue.evict_older_than(1.0), 0)
+        self.assertEqual(self.queue.evict_older_than(6.5), 3)
+        self.assertTrue(self.queue.empty())
+        self.assertEqual(self.queue.evict_older_than(10.0), 0)
+        self.fill([(7.0, "7"), (8.0, "8")])
+        self.assertEqual((self.queue.front(), self.queue.back()), ("7", "8"))
+        self.assertEqual(self.queue.since(8.0), ["8"])
+
+    def test_push_many(self):
+        """
+        Проверка пакетного добавления с метками
+        """
+        self.queue.push_many("abc", timestamps=[1.0, 1.5, 2.0])
+        self.queue.push_many("de", True, [3.0, 3.0])
+        self.assertEqual(self.queue.timestamps(), [1.0, 1.5, 2.0, 3.0, 3.0])
+        self.queue.push_many("fg", True, [4.0, 5.0])
+        self.assertEqual(self.queue.timestamps(), [2.0, 3.0, 3.0, 4.0, 5.0])
+        self.assertEqual(self.queue.range(3.0, 4.5), ["d", "e", "f"])
+        self.queue.push_many("hijklmn", True, range(6, 13)) # Пакет длиннее очереди
+        self.assertEqual(self.queue.aslist(), list("jklmn"))
+        self.assertEqual(self.queue.timestamps(), [8, 9, 10, 11, 12])
+        self.assertEqual(self.queue.pop_many(2), ["j", "k"])
+        self.assertEqual(self.queue.since(11), ["m", "n"])
+        queue = CTQueue.from_iterable("xyz")
+        self.assertEqual(queue.since(float("-inf")), ["x", "y", "z"])
+
+    def test_resize_remove(self):
+        """
+        Проверка сохранения меток при resize() и remove()
+        """
+        self.fill([(float(t), str(t)) for t in range(8)])
+        self.queue.resize(8)
+        self.assertEqual(self.queue.timestamps(), [3.0, 4.0, 5.0, 6.0, 7.0])
+        self.fill([(8.0, "8"), (9.0, "9")])
+        self.assertEqual(self.queue.since(6.0), ["6", "7", "8", "9"])
+        self.queue.resize(3)
+        self.assertEqual(self.queue.timestamps(), [7.0, 8.0, 9.0])
+        self.fill([(10.0, "10")]) # 8 9 | 10 после вытеснения
+        self.queue.remove("9")
+        self.assertEqual(self.queue.timestamps(), [8.0, 10.0])
+        self.assertEqual(self.queue.range(9.0, 11.0), ["10"])
+        queue = CTQueue[int](4, indexed=True)
+        queue.push_many([1, 2, 3], timestamps=[1, 2, 3])
+        queue.remove(1)
+        self.assertEqual((queue.timestamps(), 1 in queue, queue.since(2)), ([2, 3], False, [2, 3]))
+
+    def test_errors(self):
+        """
+        Проверка вызова исключений
+        """
+        with self.assertRaises(QEmptyError):
+            self.queue.pop()
+        self.fill([(1.0, "a"), (2.0, "b")])
+        with self.assertRaises(ValueError):
+            self.queue.push("c", timestamp=1.5)
+        with self.assertRaises(ValueError):
+            self.queue.push_many("cd", timestamps=[3.0, 2.5])
+        with self.assertRaises(ValueError):
+            self.queue.push_many("cd", timestamps=[3.0])
+        with self.assertRaises(ValueError):
+            self.queue.push_many("cd", timestamps=[1.0, 3.0])
+        with self.assertRaises(TypeError):
+            self.queue.insert(0, "z")
+        self.assertEqual(self.queue.aslist(), ["a", "b"]) # Очередь не изменилась
+        self.queue.push_many("cde", timestamps=[3.0, 4.0, 5.0])
+        with self.assertRaises(QFullError):
+            self.queue.push("f", timestamp=6.0)
+        with self.assertRaises(QFullError):
+            self.queue.push_many("f", timestamps=[6.0])
+        self.assertEqual(self.queue.timestamps(), [1.0, 2.0, 3.0, 4.0, 5.0]) # Очередь не изменилась
+        with self.assertRaises(ValueError):
+            self.queue.resize(0)
+        with self.assertRaises(AssertionError):
+            CTQueue[int](0)
+
+    def test_clock(self):
+        """
+        Проверка меток источника времени по умолчанию
+        """
+        ticks = iter(range(100))
+        queue = CTQueue[str](4, clock=lambda: next(ticks))
+        queue.push("a")
+        queue.push_many("bc") # Один вызов clock на пакет
+        queue.push("d")
+        self.assertEqual(queue.timestamps(), [0, 1, 1, 2])
+        self.assertEqual(queue.since(1), ["b", "c", "d"])
+        queue = CTQueue[str](2)
+        queue.push("x")
+        queue.push("y")
+        self.assertLessEqual(*queue.timestamps()) # time.monotonic()
+
+    def test_pickle_snapshot(self):
+        """
+        Проверка сохранения меток в pickle и снимке dump()/load()
+        """
+        self.fill([(float(t), str(t)) for t in range(7)])
+        restored = pickle.loads(pickle.dumps(self.queue))
+        self.assertEqual((restored.aslist(), restored.timestamps()), (self.queue.aslist(), self.queue.timestamps()))
+        self.assertEqual(restored.range(3.0, 5.0), ["3", "4"])
+        with self.assertRaises(ValueError):
+            restored.push("x", timestamp=5.0)
+        restored.push("7", replace=True) # Источник меток восстановлен (time.monotonic())
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "events.snap")
+            self.queue.dump(path)
+            self.assertEqual(CTQueue.load(path).since(5.0), ["5", "6"])
+            self.assertIsInstance(CAQueue.load(path), CTQueue)
+            with self.assertRaises(TypeError):
+                CDQueue.load(path)
+
+    def test_stress_queries(self):
+        """
+        Проверка запросов большого потока в сравнении с просмотром списка
+        """
+        size, items, window = 1000, 100000, 10.0
+        rng = random.Random(5)
+        queue = CTQueue[int](size)
+        t = 0.0
+        for i in range(items):
+            t += rng.expovariate(100.0)
+            queue.push(i, replace=True, timestamp=t)
+            if i%100 == 0:
+                queue.evict_older_than(t-window)
+                queue.since(t-1.0)
+        events = list(zip(queue.timestamps(), queue.aslist()))
+        self.assertEqual(queue.aslist()[-1], items-1)
+        for _ in range(200):
+            t0, t1 = sorted(rng.uniform(t-12.0, t+1.0) for _ in range(2))
+            self.assertEqual(queue.range(t0, t1), [v for ts, v in events if t0<=ts<t1])
+            self.assertEqual(queue.since(t0), [v for ts, v in events if ts>=t0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,263 @@
+"""
+Модуль для тестирования очереди со снимками copy-on-write CVQueue.
+"""
+import setup
+setup.setup() # доступ к родительскому каталогу
+
+
+import unittest
+import gc
+import os
+import pickle
+import random
+import tempfile
+import threading
+import timeit
+
+from cqueue import CVQueue,CBQueue,CDQueue
+from cqueue import QFullError,QEmptyError
+
+
+class TestCVQueue(unittest.TestCase):
+    """
+    Класс для тестирования функционала CVQueue.
+
+    method:
+    test_fifo(): Проверка основных операций очереди при переходе через конец кольца
+    test_getitem(): Проверка доступа по индексу и срезу
+    test_snapshot_isolation(): Проверка неизменности снимка при добавлении и удалении элементов
+    test_copy_on_write(): Проверка копирования только изменяемых отрезков
+    test_snapshot_release(): Проверка учета открытых снимков (close(), with, сборка мусора)
+    test_snapshot_batch_resize(): Проверка снимка при push_many(), pop_many(), resize() и clear()
+    test_errors(): Проверка вызова исключений
+    test_pickle_snapshot(): Проверка pickle и снимка dump()/load()
+    test_cbqueue_snapshot(): Проверка снимков CBQueue при работающем производителе
+    test_stress_snapshots(): Проверка случайных операций со снимками в сравнении со списками
+    """
+
+    def setUp(self):
+        """
+        Установка начальных условий перед каждым тестом CVQueue.
+        """
+        self.startTime = timeit.default_timer()
+        self.queue = CVQueue[int](10,chunk_size=4)
+
+    def tearDown(self):
+        """
+        Установка конечных условий после каждого теста CVQueue.
+        """
+        print(f"{self.id()}: { round(timeit.default_timer() - self.startTime,3)}s")
+
+    def test_fifo(self):
+        """
+        Проверка основных операций очереди при переходе через конец кольца
+        """
+        self.assertTrue(self.queue.empty())
+        for i in range(30):
+            self.queue.push(i,replace=True)
+        self.assertTrue(self.queue.is_full())
+        self.assertEqual(self.queue.aslist(), list(range(20,30)))
+        self.assertEqual(list(self.queue), list(range(20,30)))
+        self.assertEqual((self.queue.front(),self.queue.back()), (20,29))
+        self.assertEqual(self.queue.pop(), 20)
+        self.assertEqual(self.queue.pop_many(3), [21,22,23])
+        self.queue.extend([30,31])
+        self.assertEqual(len(self.queue), 8)
+        self.assertEqual(self.queue.aslist(), list(range(24,32)))
+
+    def test_getitem(self):
+        """
+        Проверка доступа по индексу и срезу
+        """
+        self.queue.push_many(range(7))
+        self.queue.pop_many(5)
+        self.queue.push_many(range(7,15))
+        expected = [5,6]+list(range(7,15))
+        self.assertEqual(self.queue[0], 5)
+        self.assertEqual(self.queue[-1], 14)
+        for index in (slice(None),slice(2,8),slice(None,None,3),slice(None,None,-2),slice(8,1,-1)):
+            self.assertEqual(self.queue[index], expected[index])
+        with self.assertRaises(IndexError):
+            self.queue[10]
+
+    def test_snapshot_isolation(self):
+        """
+        Проверка неизменности снимка при добавлении и удалении элементов
+        """
+        self.queue.push_many(range(8))
+        view = self.queue.snapshot()
+        for i in range(8,40):
+            self.queue.push(i,replace=True)
+            self.queue.pop()
+        self.assertEqual(view.aslist(), list(range(8)))
+        self.assertEqual(list(view), list(range(8)))
+        self.assertEqual((len(view),view.front(),view.back(),view[-3],view[1:4]), (8,0,7,5,[1,2,3]))
+        self.assertEqual(self.queue.aslist(), list(range(32,40)))
+
+    def test_copy_on_write(self):
+        """
+        Проверка копирования только изменяемых отрезков
+        """
+        queue = CVQueue[int](1000,chunk_size=100)
+        queue.push_many(range(500))
+        self.assertEqual(queue.copies, 0)
+        with queue.snapshot():
+            for i in range(500,550):
+                queue.push(i)
+            self.assertEqual(queue.copies, 1) # скопирован только отрезок 5
+            for i in range(550,650):
+                queue.push(i)
+            self.assertEqual(queue.copies, 2) # и отрезок 6 (пустые отрезки тоже разделяются со снимком)
+            queue.pop_many(150) # удаление из разделяемых отрезков не копирует их
+            self.assertEqual(queue.copies, 2)
+        queue.push_many(range(650,900))
+        self.assertEqual(queue.copies, 2)
+        self.assertEqual(queue.aslist(), list(range(150,900)))
+
+    def test_snapshot_release(self):
+        """
+        Проверка учета открытых снимков (close(), with, сборка мусора)
+        """
+        self.queue.push_many(range(5))
+        first = self.queue.snapshot()
+        with self.queue.snapshot() as second:
+            self.assertEqual(self.queue.snapshots, 2)
+            self.assertEqual(second.epoch, first.epoch+1)
+        self.assertTrue(second.closed)
+        self.assertEqual(self.queue.snapshots, 1)
+        self.assertEqual(self.queue._latest, first.epoch)
+        first.close()
+        first.close()
+        self.assertEqual((self.queue.snapshots,self.queue._latest), (0,0))
+        with self.assertRaises(ValueError):
+            first.aslist()
+        with self.assertRaises(ValueError):
+            list(second)
+        self.queue.snapshot()
+        gc.collect()
+        self.assertEqual(self.queue.snapshots, 0)
+        copies = self.queue.copies
+        self.queue.push(5)
+        self.assertEqual(self.queue.copies, copies)
+
+    def test_snapshot_batch_resize(self):
+        """
+        Проверка снимка при push_many(), pop_many(), resize() и clear()
+        """
+        self.queue.push_many(range(10))
+        views = [self.queue.snapshot()]
+        self.queue.push_many(range(10,16),replace=True)
+        views.append(self.queue.snapshot())
+        self.queue.pop_many(3)
+        self.queue.resize(20)
+        self.queue.push_many(range(16,29))
+        views.append(self.queue.snapshot())
+        self.queue.clear()
+        self.queue.push_many(range(100,104))
+        self.assertEqual(views[0].aslist(), list(range(10)))
+        self.assertEqual(views[1].aslist(), list(range(6,16)))
+        self.assertEqual(views[2].aslist(), list(range(9,29)))
+        self.assertEqual(self.queue.aslist(), list(range(100,104)))
+        self.queue.resize(2)
+        self.assertEqual(self.queue.aslist(), [102,103])
+
+    def test_errors(self):
+        """
+        Проверка вызова исключений
+        """
+        with self.assertRaises(QEmptyError):
+            self.queue.pop()
+        with self.assertRaises(QEmptyError):
+            self.queue.snapshot().front()
+        self.queue.push_many(range(10))
+        with self.assertRaises(QFullError):
+            self.queue.push(10)
+        with self.assertRaises(QFullError):
+            self.queue.push_many([10])
+        with self.assertRaises(ValueError):
+            self.queue.pop_many(-1)
+        with self.assertRaises(ValueError):
+            self.queue.resize(0)
+        with self.assertRaises(TypeError):
+            CBQueue[int](3,CDQueue).snapshot()
+        with self.assertRaises(AssertionError):
+            CVQueue[int](3,chunk_size=0)
+
+    def test_pickle_snapshot(self):
+        """
+        Проверка pickle и снимка dump()/load()
+        """
+        self.queue.push_many(range(25),replace=True)
+        view = self.queue.snapshot()
+        self.queue.pop()
+        for protocol in range(2,6):
+            restored = pickle.loads(pickle.dumps(self.queue,protocol))
+            self.assertEqual(restored.aslist(), list(range(16,25)))
+            self.assertEqual((restored._size,restored.snapshots), (4,0))
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp,"queue.snap")
+            self.queue.dump(path)
+            self.assertEqual(CVQueue.load(path).aslist(), list(range(16,25)))
+        self.assertEqual(view.aslist(), list(range(15,25)))
+
+    def test_cbqueue_snapshot(self):
+        """
+        Проверка снимков CBQueue при работающем производителе
+        """
+        queue = CBQueue[int](1000,CVQueue,chunk_size=64)
+        total = 50000
+        def producer():
+            for i in range(total):
+                queue.put(i,replace=True)
+        thread = threading.Thread(target=producer)
+        thread.start()
+        while thread.is_alive():
+            with queue.snapshot() as view:
+                values = list(view)
+                if values:
+                    self.assertEqual(values, list(range(values[0],values[0]+len(values))))
+        thread.join()
+        self.assertEqual(queue.aslist(), list(range(total-1000,total)))
+
+    def test_stress_snapshots(self):
+        """
+        Проверка случайных операций со снимками в сравнении со списками
+        """
+        rnd = random.Random(23)
+        size = 500
+        queue = CVQueue[int](size,chunk_size=16)
+        model:list[int] = []
+        views:list = []
+        counter = 0
+        for _ in range(20000):
+            op = rnd.random()
+            if op<0.4:
+                queue.push(counter,replace=True)
+                model = (model+[counter])[-size:]
+                counter+=1
+            elif op<0.55:
+                k = rnd.randint(1,40)
+                queue.push_many(range(counter,counter+k),replace=True)
+                model = (model+list(range(counter,counter+k)))[-size:]
+                counter+=k
+            elif op<0.75 and model:
+                k = rnd.randint(1,30)
+                self.assertEqual(queue.pop_many(k), model[:k])
+                model = model[k:]
+            elif op<0.8:
+                views.append((queue.snapshot(),list(model)))
+            elif op<0.85 and views:
+                view,expected = views.pop(rnd.randrange(len(views)))
+                self.assertEqual(view.aslist(), expected)
+                view.close()
+            elif op<0.86:
+                size = rnd.randint(100,700)
+                queue.resize(size)
+                model = model[-size:]
+        self.assertEqual(queue.aslist(), model)
+        for view,expected in views:
+            self.assertEqual(list(view), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,221 @@
+"""
+Модуль для тестирования шардированной очереди с перехватом работы CWQueue.
+"""
+import setup
+setup.setup() # доступ к родительскому каталогу
+
+
+import unittest
+import threading
+import time
+import timeit
+
+import numpy as np
+
+from cqueue import CAQueue,CLLQueue,CPLLQueue,CSQueue,CDQueue,CNQueue,CWQueue
+from cqueue import QFullError,QEmptyError
+
+
+class TestCWQueue(unittest.TestCase):
+    """
+    Класс для тестирования функционала CWQueue.
+
+    method:
+    test_local_shard(): Проверка добавления и удаления в шарде потока
+    test_steal(): Проверка перехвата половины элементов чужого шарда
+    test_steal_batch(): Проверка ограничения steal_batch и pop_many() с перехватом
+    test_push_full(): Проверка добавления в заполненный шард
+    test_errors(): Проверка вызова исключений
+    test_threads_shards(): Проверка назначения шардов потокам по кругу
+    test_backends(): Проверка работы поверх всех реализаций очереди
+    test_stress_threads(): Проверка передачи элементов несколькими потоками без потерь и повторов
+    """
+    backends = (CAQueue,CLLQueue,CPLLQueue,CSQueue,CDQueue)
+
+    def setUp(self):
+        """
+        Установка начальных условий перед каждым тестом CWQueue.
+        """
+        self.startTime = timeit.default_timer()
+        self.queue = CWQueue[int](8, shards=3)
+
+    def tearDown(self):
+        """
+        Установка конечных условий после каждого теста CWQueue.
+        """
+        print(f"{self.id()}: { round(timeit.default_timer() - self.startTime,3)}s")
+
+    def test_local_shard(self):
+        """
+        Проверка добавления и удаления в шарде потока
+        """
+        self.assertEqual(self.queue.shards, 3)
+        self.queue.bind(1)
+        self.assertEqual(self.queue.shard(), 1)
+        self.queue.push_many(range(3))
+        self.queue.push(3)
+        self.assertEqual(self.queue.lengths(), [0, 4, 0])
+        self.assertEqual(self.queue.length(), 4)
+        self.assertEqual(self.queue.pop(), 0)
+        self.assertEqual(self.queue.pop_many(2), [1, 2])
+        self.assertEqual(self.queue.steals, 0)
+        self.queue.bind(2)
+        self.queue.push(10)
+        self.assertEqual(self.queue.aslist(), [3, 10])
+        self.queue.clear()
+        self.assertTrue(self.queue.empty())
+
+    def test_steal(self):
+        """
+        Проверка перехвата половины элементов чужого шарда
+        """
+        self.queue.bind(2)
+        self.queue.push_many(range(5))
+        self.queue.bind(0)
+        self.assertEqual(self.queue.pop(), 0) # Перехвачены 0, 1, 2: 0 возвращен, 1 и 2 перенесены
+        self.assertEqual(self.queue.lengths(), [2, 0, 2])
+        self.assertEqual(self.queue.steals, 1)
+        self.assertEqual([self.queue.pop() for _ in range(2)], [1, 2])
+        self.assertEqual(self.queue.steals, 1) # Следующие pop() из своего шарда
+        self.assertEqual(self.queue.pop(), 3)
+        self.assertEqual(self.queue.pop(), 4)
+        self.assertEqual(self.queue.steals, 3)
+        with self.assertRaises(QEmptyError):
+            self.queue.pop()
+
+    def test_steal_batch(self):
+        """
+        Проверка ограничения steal_batch и pop_many() с перехватом
+        """
+        queue = CWQueue[int](16, shards=2, steal_batch=2)
+        queue.bind(0)
+        queue.push_many(range(10))
+        queue.bind(1)
+        self.assertEqual(queue.pop(), 0)
+        self.assertEqual(queue.lengths(), [8, 1])
+        self.assertEqual(queue.pop_many(5), [1])
+        self.assertEqual(queue.pop_many(5), [2, 3, 4, 5, 6]) # Не меньше запрошенного, даже больше steal_batch
+        self.assertEqual(queue.pop_many(0), [])
+        self.assertEqual(queue.lengths(), [3, 0])
+        queue = CWQueue[int](4, shards=2)
+        queue.bind(0)
+        queue.push_many(range(4))
+        queue.bind(1)
+        queue.push_many(range(10, 13))
+        queue.pop_many(3)
+        self.assertEqual(queue.pop(), 0) # Перенесенный элемент помещается в шард потока (размер 4)
+        self.assertEqual(queue.lengths(), [2, 1])
+
+    def test_push_full(self):
+        """
+        Проверка добавления в заполненный шард
+        """
+        queue = CWQueue[int](2, shards=2)
+        queue.bind(1)
+        queue.push_many([1, 2])
+        queue.push(3) # Шард потока заполнен, элемент добавляется в другой шард
+        self.assertEqual(queue.lengths(), [1, 2])
+        queue.push(4, replace=True)
+        self.assertEqual(queue.aslist(), [3, 2, 4])
+        queue.push(5)
+        self.assertTrue(queue.is_full())
+        with self.assertRaises(QFullError):
+            queue.push(6)
+        with self.assertRaises(QFullError):
+            queue.push_many([6])
+
+    def test_errors(self):
+        """
+        Проверка вызова исключений
+        """
+        with self.assertRaises(QEmptyError):
+            self.queue.pop()
+        with self.assertRaises(QEmptyError):
+            self.queue.pop_many(1)
+        with self.assertRaises(ValueError):
+            self.queue.pop_many(-1)
+        with self.assertRaises(IndexError):
+            self.queue.bind(3)
+        with self.assertRaises(AssertionError):
+            CWQueue[int](4, shards=0)
+        with self.assertRaises(AssertionError):
+            CWQueue[int](4, steal_batch=0)
+
+    def test_threads_shards(self):
+        """
+        Проверка назначения шардов потокам по кругу
+        """
+        shards = []
+        lock = threading.Lock()
+
+        def worker():
+            with lock:
+                shards.append(self.queue.shard())
+            self.queue.push(self.queue.shard())
+
+        workers = [threading.Thread(target=worker) for _ in range(6)]
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+        self.assertEqual(sorted(shards), [0, 0, 1, 1, 2, 2])
+        self.assertEqual(self.queue.lengths(), [2, 2, 2])
+
+    def test_backends(self):
+        """
+        Проверка работы поверх всех реализаций очереди
+        """
+        for backend in self.backends:
+            queue = CWQueue[int](4, shards=2, backend=backend)
+            queue.bind(0)
+            queue.push_many(range(4))
+            queue.bind(1)
+            self.assertEqual(queue.pop_many(3), [0, 1, 2])
+            self.assertEqual(queue.pop(), 3)
+        queue = CWQueue[int](4, shards=2, backend=CNQueue, dtype=np.int64)
+        queue.bind(0)
+        queue.push_many(np.arange(4))
+        queue.bind(1)
+        self.assertEqual(queue.pop(), 0)
+        self.assertEqual(queue.pop_many(4), [1])
+
+    def test_stress_threads(self):
+        """
+        Проверка передачи элементов несколькими потоками без потерь и повторов
+        """
+        threads, per_thread = 4, 25000
+        queue = CWQueue[int](threads*per_thread, shards=threads, steal_batch=64)
+        done = threading.Event()
+        received = [[] for _ in range(threads)]
+
+        def producer(index):
+            queue.bind(index)
+            for i in range(per_thread):
+                queue.push(index*per_thread+i)
+
+        def consumer(index):
+            queue.bind((index+1)%threads) # Потребитель i работает с шардом производителя i+1
+            while True:
+                try:
+                    received[index].extend(queue.pop_many(16))
+                except QEmptyError:
+                    if done.is_set() and queue.empty():
+                        break
+                    time.sleep(0)
+
+        producers = [threading.Thread(target=producer, args=(i,)) for i in range(threads)]
+        consumers = [threading.Thread(target=consumer, args=(i,)) for i in range(threads)]
+        for thread in producers+consumers:
+            thread.start()
+        for thread in producers:
+            thread.join()
+        done.set()
+        for thread in consumers:
+            thread.join()
+        values = sorted(value for part in received for value in part)
+        self.assertEqual(values, list(range(threads*per_thread)))
+        self.assertTrue(queue.empty())
+
+
+if __name__ == '__main__':
+    unittest.main()